@@ -22,6 +22,12 @@ set -ex
 # Regenerate webhook conformance fixtures (CHA-2961)
 ( cd $SOURCE_PATH ; ./build/chat-manager openapi generate-webhook-fixtures --output ../stream-py/tests/assets/webhooks --time-format=unix-ns )
 
+# point the generated code at the SDK's runtime: codec mixin, models moved to
+# getstream/models/_generated.py behind the lazy facade, lazy model references
+# in the common REST clients and webhook.py, iter_/aiter_ paginators in every
+# REST client (see scripts/postgenerate.py)
+uv run python scripts/postgenerate.py
+
 # lint + auto-fix, then format generated code with ruff (align with pre-commit)
 uv run ruff check --fix getstream/ tests/
 uv run ruff format getstream/ tests/
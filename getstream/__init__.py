@@ -1,6 +1,16 @@
 import logging
 
-from getstream.config import RetryConfig  # noqa: F401
+from getstream.config import (  # noqa: F401
+    CacheConfig,
+    CircuitBreakerConfig,
+    CoalesceConfig,
+    CompressionConfig,
+    HedgeConfig,
+    RateLimitConfig,
+    RetryConfig,
+    TokenCacheConfig,
+    UserBatchConfig,
+)
 from getstream.exceptions import (  # noqa: F401
     StreamApiException,
     StreamException,
@@ -0,0 +1,92 @@
+"""Webhook decoding and parsing shared by ``webhook_batch`` and
+``webhook_routing``.
+
+``decode_sqs`` / ``decode_sns`` return the same bytes as
+``getstream.webhook.decode_sqs_payload`` / ``decode_sns_payload`` and raise
+the same ``InvalidWebhookError``s, with fast paths for the common bodies: a
+message starting with ``{`` is raw JSON (the uncompressed wire format) and
+skips the base64 attempt, and a gzip body is inflated in one zlib call.
+``parse`` is ``parse_event``, or with ``lazy_models`` a lazy model instance
+(see ``getstream.lazy``) for a known event type.
+
+``getstream.webhook`` is generated; this is the one hand-written module that
+uses its private helpers. scripts/postgenerate.py keeps ``_event_map`` in
+place across regenerations.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import zlib
+from typing import Any
+
+from getstream.lazy import lazy_from_dict
+from getstream.webhook import (
+    InvalidWebhookError,
+    _event_map,
+    _get_event_class,
+    _unwrap_sns_notification_body,
+    decode_sqs_payload,
+    gunzip_payload,
+    parse_event,
+)
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def load_event_classes() -> None:
+    """Import the generated event models now rather than on the first parse."""
+    _event_map()
+
+
+def gunzip(data: bytes) -> bytes:
+    if data[:2] != GZIP_MAGIC:
+        return data
+    inflate = zlib.decompressobj(wbits=31)
+    try:
+        payload = inflate.decompress(data)
+    except zlib.error:
+        payload = None
+    if payload is None or not inflate.eof or inflate.unused_data:
+        # corrupt, truncated or multi-member: gunzip_payload inflates every
+        # member or raises its InvalidWebhookError
+        return gunzip_payload(data)
+    return payload
+
+
+def decode_sqs(message_body: str) -> bytes:
+    if not isinstance(message_body, str):
+        return decode_sqs_payload(message_body)  # raises InvalidWebhookError
+    if message_body[:1] == "{":
+        # raw JSON; "{" is not base64, so decode_sqs_payload would land here
+        return message_body.encode("utf-8")
+    try:
+        decoded = base64.b64decode(message_body, validate=True)
+    except ValueError:
+        decoded = message_body.encode("utf-8")
+    return gunzip(decoded)
+
+
+def decode_sns(notification_body: str) -> bytes:
+    if not isinstance(notification_body, str):
+        raise InvalidWebhookError(
+            InvalidWebhookError.INVALID_JSON + ": notification_body must be str"
+        )
+    return decode_sqs(_unwrap_sns_notification_body(notification_body))
+
+
+def parse(payload: bytes, lazy_models: bool) -> Any:
+    if lazy_models:
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            data = None
+        event_type = data.get("type") if isinstance(data, dict) else None
+        event_class = (
+            _get_event_class(event_type) if isinstance(event_type, str) else None
+        )
+        if event_class is not None:
+            return lazy_from_dict(event_class, data)
+    # unknown types and invalid payloads get parse_event's result or error
+    return parse_event(payload)
@@ -1,12 +1,17 @@
+import gzip
 import json
+from json.encoder import encode_basestring
 import logging
-import mimetypes
-import os
 import random
 import time
 import uuid
 import warnings
 import asyncio
+import contextvars
+import functools
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import is_dataclass
 from typing import Any, Dict, List, Optional, Tuple, Type, cast, get_origin
 
 from getstream.exceptions import (
@@ -16,14 +21,24 @@ from getstream.exceptions import (
     build_api_exception,
     wrap_transport_error,
 )
+from getstream.cache import request_key
+from getstream.lazy import lazy_from_dict
 from getstream.logging_utils import redact_json_body, redact_query
+from getstream.rate_limit import extract_rate_limit
 from getstream.stream_response import StreamResponse
+from getstream.uploads import (
+    AsyncMultipartStream,
+    MultipartStream,
+    ProgressCallback,
+    UploadSource,
+)
 from getstream.generic import T
 import httpx
-from getstream.config import BaseConfig
+from getstream.config import BaseConfig, CompressionConfig
 from getstream.version import VERSION
 from urllib.parse import quote
 from abc import ABC
+from getstream.common import telemetry
 from getstream.common.telemetry import (
     common_attributes,
     record_metrics,
@@ -36,26 +51,59 @@ from getstream.common.telemetry import (
 )
 import ijson
 
+try:
+    import orjson
+except ImportError:  # optional: pip install getstream[orjson]
+    orjson = None
+
+# orjson would encode datetimes and dataclasses itself where json.dumps
+# raises; route them to the stdlib fallback so both backends agree.
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
 
 # ── Connection pool defaults (CHA-2956) ──────────────────────────────
 # Kept in sync with getstream.stream constants; duplicated here so BaseClient/AsyncBaseClient can be instantiated standalone (e.g. by sub-clients constructed directly without going through Stream/AsyncStream).
 DEFAULT_MAX_CONNS_PER_HOST = 5
 DEFAULT_IDLE_TIMEOUT = 55.0
 DEFAULT_CONNECT_TIMEOUT = 10.0
+# Per-connection stream ceiling httpcore applies in HTTP/2 mode (it takes the
+# min of this and the server's SETTINGS_MAX_CONCURRENT_STREAMS). httpcore keeps
+# one multiplexed HTTP/2 connection per origin; requests beyond this many wait
+# for a free stream on it rather than opening another connection. The SDK
+# does not set it, it only reports it (``client.initialized``).
+HTTP2_MAX_CONCURRENT_STREAMS = 100
+# Async client: responses up to this size are parsed on the event loop, where
+# parsing costs less than the worker-thread hop; larger ones go to a
+# dedicated pool of DEFAULT_PARSE_MAX_WORKERS threads.
+DEFAULT_INLINE_PARSE_MAX_BYTES = 64 * 1024
+DEFAULT_PARSE_MAX_WORKERS = 4
 
 
 logger = logging.getLogger("getstream")
 
 
 # ── Retry policy (CHA-2959) ───────────────────────────────────────────
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+# Stands in for a CircuitBreaker call guard when no breaker is configured.
+_NO_CIRCUIT = nullcontext()
+
+
 def _retry_eligible(retry, exc, method: str, attempt: int) -> bool:
     """Whether ``exc`` from the given 0-indexed ``attempt`` should be retried
-    under ``retry`` (a ``RetryConfig`` or ``None``). Only GET/HEAD, only HTTP
-    429 (unless marked unrecoverable) or a transport error, and only while
-    attempts remain."""
+    under ``retry`` (a ``RetryConfig`` or ``None``). Only GET/HEAD (plus
+    writes with ``retry_writes``), only HTTP 429 (unless marked
+    unrecoverable) or a transport error, and only while attempts remain."""
     if retry is None or not retry.enabled:
         return False
-    if method.upper() not in ("GET", "HEAD"):
+    method = method.upper()
+    if method not in _IDEMPOTENT_METHODS and not (
+        retry.retry_writes and method in _WRITE_METHODS
+    ):
         return False
     if attempt + 1 >= retry.max_attempts:
         return False
@@ -75,6 +123,18 @@ def _retry_delay(retry, exc, attempt: int) -> float:
     return random.uniform(0.0, ceil) if ceil > 0 else 0.0
 
 
+def _with_client_request_id(kwargs):
+    """Copy of the request ``kwargs`` whose headers carry an
+    ``x-client-request-id``, generated once here so every attempt of the
+    request sends the same one. That makes a retried write recognisable as
+    the same request on the server and in traces."""
+    kwargs = dict(kwargs or {})
+    headers = dict(kwargs.get("headers") or {})
+    headers.setdefault("x-client-request-id", str(uuid.uuid4()))
+    kwargs["headers"] = headers
+    return kwargs
+
+
 def _resolve_pool_knobs(obj):
     """Pull the 3 pool knobs off ``obj`` if BaseStream has set them, else fall back to spec defaults. Top-level ``Stream``/``AsyncStream`` sets them on ``self`` before calling ``super().__init__()``, so a directly instantiated sub-client (or test fixture) still gets sane values.
 
@@ -92,6 +152,83 @@ def _resolve_pool_knobs(obj):
     )
 
 
+def _resolve_http2(obj) -> bool:
+    """Whether ``obj`` should build an HTTP/2-capable pool. Same getattr
+    plumbing as the pool knobs: only the top-level ``Stream``/``AsyncStream``
+    sets ``http2``, so directly constructed sub-clients stay on HTTP/1.1."""
+    return bool(getattr(obj, "http2", False))
+
+
+def _request_capacity(obj) -> Optional[int]:
+    """How many requests the pool ``obj`` builds carries at once: one per
+    connection over HTTP/1.1, so ``max_conns_per_host``. Over HTTP/2 they
+    share one multiplexed connection, so ``HTTP2_MAX_CONCURRENT_STREAMS``.
+    ``None`` for a caller-supplied ``http_client`` or ``transport``, whose
+    limits are unknown (httpx applies ``Limits`` only to the transport it
+    builds itself)."""
+    if (
+        getattr(obj, "_http_client", None) is not None
+        or getattr(obj, "_transport", None) is not None
+    ):
+        return None
+    if _resolve_http2(obj):
+        return HTTP2_MAX_CONCURRENT_STREAMS
+    return _resolve_pool_knobs(obj)[0]
+
+
+class _CodecOffload:
+    """Where the async client runs CPU-bound codec work (response parsing,
+    large request-body encoding): inline on the event loop when the payload
+    is at most ``inline_max_bytes``, otherwise on a dedicated pool of
+    ``max_workers`` threads, created on first use. Keeping big payloads off
+    the loop's default executor means a burst of them cannot starve the
+    ``to_thread`` work of the rest of the application, and small ones skip
+    the thread hop, which costs more than parsing them."""
+
+    def __init__(
+        self,
+        inline_max_bytes: int = DEFAULT_INLINE_PARSE_MAX_BYTES,
+        max_workers: int = DEFAULT_PARSE_MAX_WORKERS,
+    ):
+        if inline_max_bytes < 0:
+            raise ValueError("inline_parse_max_bytes must be >= 0")
+        if max_workers < 1:
+            raise ValueError("parse_max_workers must be >= 1")
+        self.inline_max_bytes = inline_max_bytes
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def inline(self, size: int) -> bool:
+        return size <= self.inline_max_bytes
+
+    async def run(self, fn, *args):
+        """Run ``fn(*args)`` on the pool in the caller's context (so spans
+        nest as with ``asyncio.to_thread``)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="getstream-parse"
+            )
+        ctx = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(ctx.run, fn, *args)
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def _resolve_codec_offload(obj) -> _CodecOffload:
+    """The ``_CodecOffload`` BaseStream shares with its sub-clients, or a
+    default one owned by a directly constructed client."""
+    offload = getattr(obj, "codec_offload", None)
+    if offload is None:
+        offload = obj.codec_offload = _CodecOffload()
+        obj._owns_codec_offload = True
+    return offload
+
+
 def _resolve_logger(obj) -> logging.Logger:
     """The caller's injected logger (``Stream``/``AsyncStream``'s ``logger=``
     kwarg, plumbed onto ``obj.log`` the same way as the pool knobs), or the
@@ -102,6 +239,14 @@ def _resolve_logger(obj) -> logging.Logger:
 def _log_client_initialized(cfg, *, user_http_client: bool) -> None:
     """Emit the one-shot ``client.initialized`` event, replacing the old
     plain-text pool-config INFO line with the structured logging schema."""
+    # http2 only takes effect on an SDK-built pool; a caller-supplied client
+    # or transport keeps whatever protocol it was configured with.
+    http2 = (
+        _resolve_http2(cfg)
+        and not user_http_client
+        and getattr(cfg, "_transport", None) is None
+    )
+    compression = getattr(cfg, "compression", None)
     _resolve_logger(cfg).info(
         "client.initialized",
         extra={
@@ -111,44 +256,221 @@ def _log_client_initialized(cfg, *, user_http_client: bool) -> None:
             "stream.client.idle_timeout_seconds": cfg.idle_timeout,
             "stream.client.connect_timeout_seconds": cfg.connect_timeout,
             "stream.client.request_timeout_seconds": cfg.timeout,
-            "stream.client.gzip_enabled": not user_http_client,
+            "stream.client.http2": http2,
+            "stream.client.max_concurrent_streams_per_conn": (
+                HTTP2_MAX_CONCURRENT_STREAMS if http2 else 1
+            ),
+            # None when the caller's client or transport sets the limits
+            "stream.client.max_concurrent_requests": _request_capacity(cfg),
+            # gzip of request bodies; responses are always accepted gzipped
+            "stream.client.gzip_enabled": compression is not None
+            and compression.enabled,
             "stream.client.user_http_client": user_http_client,
             "stream.client.log_bodies": bool(getattr(cfg, "log_bodies", False)),
         },
     )
 
 
-def _response_body_for_log(response: httpx.Response):
+def _response_body_for_log(response: httpx.Response, decoded=None):
     """Redact a response body for the ``http.response.body`` log field.
     JSON bodies get the shallow key redaction; anything else (or anything
-    that fails to parse as JSON) is passed through as text."""
+    that fails to parse as JSON) is passed through as text. ``decoded`` is
+    the ``_decode_json_body`` result when the caller already has it."""
     # Media types are case-insensitive; match application/json and any
     # structured +json type (e.g. application/problem+json) so their bodies
     # are redacted, not logged as raw text.
     content_type = response.headers.get("content-type", "").lower()
     if "application/json" in content_type or "+json" in content_type:
-        try:
-            return redact_json_body(json.loads(response.text))
-        except (ValueError, TypeError):
-            return response.text
+        payload, error = decoded or _decode_json_body(response.content)
+        if error is None and response.content:
+            return redact_json_body(payload)
     return response.text
 
 
-def _read_file_bytes(file_path: str) -> bytes:
-    with open(file_path, "rb") as f:
-        return f.read()
+def _decode_json_body(content: bytes) -> Tuple[Any, Optional[ValueError]]:
+    """Decode a response body once for everything that reads it (the
+    ``http.server.duration`` span attribute, the typed model, the error
+    envelope, body logging). Returns ``(payload, error)``; an empty body
+    decodes to ``{}``. orjson is used when installed, falling back to the
+    stdlib for the inputs it rejects and ``json.loads`` accepts (integers
+    beyond 64 bits, NaN, lone surrogates)."""
+    if not content:
+        return {}, None
+    if orjson is not None:
+        try:
+            return orjson.loads(content), None
+        except ValueError:
+            pass
+    try:
+        # decode like ``response.text``; json.loads(bytes) would use the
+        # much slower surrogatepass handler
+        return json.loads(content.decode("utf-8", "replace")), None
+    except ValueError as err:
+        return None, err
+
+
+def _server_duration(payload) -> Optional[str]:
+    """The top-level ``duration`` string every API response carries."""
+    if isinstance(payload, dict):
+        duration = payload.get("duration")
+        if isinstance(duration, str):
+            return duration
+    return None
+
+
+# Exact types the body encoder writes itself; anything else (subclasses,
+# tuples, ...) goes through json.dumps so the output matches it.
+_JSON_SCALARS = frozenset({str, int, float, bool})
+_FLOAT_SPECIALS = frozenset({float("inf"), float("-inf")})
+# Bodies estimated larger than this are encoded on a worker thread by the
+# async client; below it the thread hop costs more than the encoding.
+INLINE_JSON_ENCODE_MAX_BYTES = 32 * 1024
+# allow_nan=False: NaN and Infinity are not JSON, so encoding them raises
+# ValueError instead of sending a body the API cannot parse.
+_json_encoder = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), allow_nan=False
+)
+_encode_str = encode_basestring
 
 
 def _strip_none(obj):
     """Recursively remove None values from dicts so unset optional fields
     are omitted from the JSON body instead of being sent as null."""
     if isinstance(obj, dict):
-        return {k: _strip_none(v) for k, v in obj.items() if v is not None}
+        return {
+            k: v if type(v) in _JSON_SCALARS else _strip_none(v)
+            for k, v in obj.items()
+            if v is not None
+        }
     if isinstance(obj, list):
-        return [_strip_none(item) for item in obj]
+        return [v if type(v) in _JSON_SCALARS else _strip_none(v) for v in obj]
     return obj
 
 
+def _encode_json_body(body) -> bytes:
+    """``json.dumps(_strip_none(body))`` as compact UTF-8 bytes.
+
+    With orjson installed (``pip install getstream[orjson]``) the stripped
+    body is encoded by it; otherwise None values are dropped while the JSON
+    is written, in a single pass with no stripped copy of the body. Either
+    way NaN and Infinity raise ``ValueError``."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(_strip_none(body), option=_ORJSON_OPTIONS)
+        except TypeError:
+            # types orjson does not take (non-str keys, big ints, ...):
+            # the stdlib path below encodes them or raises as json.dumps does
+            pass
+        else:
+            # orjson writes NaN and Infinity as null; a body with a null
+            # anywhere (rare once None is stripped) is re-encoded below,
+            # which gives the same bytes or raises for them
+            if b"null" not in encoded:
+                return encoded
+    parts: List[str] = []
+    _write_json(body, parts)
+    return "".join(parts).encode("utf-8")
+
+
+def _write_json(obj, parts: List[str]) -> None:
+    t = type(obj)
+    if t is str:
+        parts.append(_encode_str(obj))
+    elif t is dict:
+        sep = "{"
+        for k, v in obj.items():
+            if v is None:
+                continue
+            parts.append(sep)
+            # json.dumps stringifies int/float/bool/None keys (and raises
+            # for others); let it do so for anything but a plain str
+            parts.append(
+                _encode_str(k) if type(k) is str else _json_encoder.encode({k: 0})[1:-3]
+            )
+            parts.append(":")
+            if type(v) is str:
+                parts.append(_encode_str(v))
+            else:
+                _write_json(v, parts)
+            sep = ","
+        parts.append("}" if sep == "," else "{}")
+    elif t is list:
+        sep = "["
+        for v in obj:
+            parts.append(sep)
+            _write_json(v, parts)
+            sep = ","
+        parts.append("]" if sep == "," else "[]")
+    elif t is int:
+        parts.append(int.__repr__(obj))
+    elif t is bool:
+        parts.append("true" if obj else "false")
+    elif obj is None:
+        parts.append("null")
+    elif t is float and obj == obj and obj not in _FLOAT_SPECIALS:
+        parts.append(float.__repr__(obj))
+    else:
+        parts.append(_json_encoder.encode(_strip_none(obj)))
+
+
+def _json_body_exceeds(body, limit: int) -> bool:
+    """Whether ``body`` encodes to roughly more than ``limit`` bytes. Stops
+    walking as soon as it is, so the check costs at most ~``limit`` bytes'
+    worth of traversal regardless of the body's size."""
+    size = 0
+    stack = [body]
+    while stack:
+        obj = stack.pop()
+        t = type(obj)
+        if t is str:
+            size += len(obj) + 2
+        elif t is dict:
+            size += 2
+            for k, v in obj.items():
+                size += len(k) + 4 if type(k) is str else 8
+                stack.append(v)
+        elif t is list or t is tuple:
+            size += 2
+            stack.extend(obj)
+        else:
+            size += 8
+        if size > limit:
+            return True
+    return False
+
+
+def _request_compression(obj, endpoint: str) -> Optional[CompressionConfig]:
+    """The ``CompressionConfig`` that applies to ``endpoint``'s request body,
+    or ``None`` when bodies go out uncompressed."""
+    config = getattr(obj, "compression", None)
+    if config is None or not config.enabled:
+        return None
+    names = config.endpoints
+    if names is None or endpoint in names or endpoint.rsplit(".", 1)[-1] in names:
+        return config
+    return None
+
+
+def _encode_request_body(
+    body, compression: Optional[CompressionConfig]
+) -> Tuple[bytes, bool]:
+    """``_encode_json_body(body)``, gzip-compressed when ``compression``
+    applies and the encoded body has at least ``min_bytes``. Returns the
+    content and whether it is compressed."""
+    content = _encode_json_body(body)
+    if compression is None or len(content) < compression.min_bytes:
+        return content, False
+    # mtime=0 keeps the output identical for identical bodies
+    return gzip.compress(content, compresslevel=compression.level, mtime=0), True
+
+
+def _set_body_headers(call_kwargs, compressed: bool) -> None:
+    headers = call_kwargs["headers"] = call_kwargs.get("headers", {})
+    headers["Content-Type"] = "application/json"
+    if compressed:
+        headers["Content-Encoding"] = "gzip"
+
+
 def build_path(path: str, path_params: Optional[Dict[str, Any]]) -> str:
     if path_params is None:
         return path
@@ -160,16 +482,29 @@ def build_path(path: str, path_params: Optional[Dict[str, Any]]) -> str:
 class ResponseParserMixin:
     @with_span("parse_response")
     def _parse_response(
-        self, response: httpx.Response, data_type: Type[T]
+        self, response: httpx.Response, data_type: Type[T], decoded=None
     ) -> StreamResponse[T]:
+        """Build the typed ``StreamResponse`` (or raise the API error) from
+        ``response``. ``decoded`` is its ``_decode_json_body`` result when
+        the request loop has already decoded the body."""
+        parsed_result, decode_error = decoded or _decode_json_body(response.content)
         if response.status_code >= 399:
+            if decode_error is None and response.content:
+                raise build_api_exception(response, parsed_result)
             raise build_api_exception(response)
 
         try:
-            parsed_result = json.loads(response.text) if response.text else {}
+            if decode_error is not None:
+                raise decode_error
 
             data: T
-            if hasattr(data_type, "from_dict"):
+            if (
+                getattr(self, "lazy_models", False)
+                and is_dataclass(data_type)
+                and isinstance(parsed_result, dict)
+            ):
+                data = lazy_from_dict(data_type, parsed_result)
+            elif hasattr(data_type, "from_dict"):
                 from_dict = getattr(data_type, "from_dict")
                 data = from_dict(parsed_result, infer_missing=True)
             elif get_origin(data_type) is not dict:
@@ -178,7 +513,11 @@ class ResponseParserMixin:
                 data = cast(T, parsed_result)
 
         except (ValueError, AttributeError) as err:
-            raise StreamApiException(response=response) from err
+            if decode_error is not None:
+                raise StreamApiException(response=response) from err
+            raise StreamApiException(
+                response=response, parsed_body=parsed_result
+            ) from err
 
         return StreamResponse(response, data)
 
@@ -225,8 +564,14 @@ class TelemetryEndpointMixin(ABC):
         )
         url_full = f"{self.base_url}{url_path}"
         endpoint = self._endpoint_name(path)
-        client_request_id = str(uuid.uuid4())
+        # the retry loop fixes the id for all attempts of a request
+        client_request_id = headers.get("x-client-request-id") or str(uuid.uuid4())
         headers["x-client-request-id"] = client_request_id
+        # clone_for_token views share their parent's httpx client, whose
+        # default headers carry the parent's token
+        token_override = getattr(self, "token_override", None)
+        if token_override is not None:
+            headers["Authorization"] = token_override
         kwargs["headers"] = headers
         span_attrs = common_attributes(
             api_key=self.api_key,
@@ -309,6 +654,7 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
                     params=self.params,
                     timeout=timeout_obj,
                     limits=limits,
+                    http2=_resolve_http2(self),
                 )
             self._owns_http_client = True
         # The pool-config INFO line is emitted once by BaseStream after the
@@ -336,8 +682,6 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
         data_type: Optional[Type[T]] = None,
     ):
         kwargs = kwargs or {}
-        if "json" in kwargs and kwargs["json"] is not None:
-            kwargs["json"] = _strip_none(kwargs["json"])
         url_path, url_full, endpoint, attrs = self._prepare_request(
             method, path, query_params, kwargs
         )
@@ -349,27 +693,59 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
             "url.query": redact_query(query_params) or "",
             "stream.endpoint_name": endpoint,
         }
+        body = kwargs.get("json")
+        # the encoder drops None values itself; the stripped dict is only
+        # built when a log line or span event shows the body
+        shown_body = (
+            _strip_none(body)
+            if body is not None and (log_bodies or telemetry.INCLUDE_BODIES)
+            else None
+        )
         if log_bodies:
-            sent_extra["http.request.body"] = redact_json_body(kwargs.get("json"))
+            sent_extra["http.request.body"] = redact_json_body(shown_body)
         log.debug("http.request.sent", extra=sent_extra)
 
         start = time.perf_counter()
         # Span name uses logical operation (endpoint) rather than raw HTTP
-        with span_request(
-            endpoint, attributes=attrs, request_body=kwargs.get("json")
-        ) as span:
+        with span_request(endpoint, attributes=attrs, request_body=shown_body) as span:
             call_kwargs = dict(kwargs)
             call_kwargs.pop("path_params", None)
+            if call_kwargs.pop("json", None) is not None:
+                content, compressed = _encode_request_body(
+                    body, _request_compression(self, endpoint)
+                )
+                call_kwargs["content"] = content
+                _set_body_headers(call_kwargs, compressed)
+            monitor = getattr(self, "pool_monitor", None)
+            trace = response = None
+            if monitor is not None:
+                trace = monitor.start(
+                    endpoint,
+                    metric_attributes(
+                        api_key=self.api_key, endpoint=endpoint, method=method
+                    ),
+                )
+                call_kwargs["extensions"] = {
+                    **call_kwargs.get("extensions", {}),
+                    "trace": trace.hook,
+                }
             try:
                 response = getattr(self.client, method.lower())(
                     url_path, params=query_params, *args, **call_kwargs
                 )
             except httpx.RequestError as err:
-                # No failed-log here: the retry loop (_request_sync) owns
+                # No failed-log here: the retry loop (_send_sync) owns
                 # http.request.failed so it can log at DEBUG when retrying
                 # and ERROR only on a final failure.
                 raise wrap_transport_error(err) from err
-            duration = parse_duration_from_body(response.content)
+            finally:
+                if trace is not None:
+                    monitor.finish(trace, response)
+            limiter = getattr(self, "rate_limiter", None)
+            if limiter is not None:
+                limiter.update(endpoint, extract_rate_limit(response))
+            decoded = _decode_json_body(response.content)
+            duration = _server_duration(decoded[0])
             if duration:
                 span.set_attribute("http.server.duration", duration)
             try:
@@ -389,7 +765,9 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
                 "duration_ms": int(duration_ms),
             }
             if log_bodies:
-                received_extra["http.response.body"] = _response_body_for_log(response)
+                received_extra["http.response.body"] = _response_body_for_log(
+                    response, decoded
+                )
             log.debug("http.response.received", extra=received_extra)
             # Metrics should be low-cardinality: exclude url/call_cid/channel_cid
             metric_attrs = metric_attributes(
@@ -399,7 +777,7 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
                 status_code=getattr(response, "status_code", None),
             )
             record_metrics(duration_ms, attributes=metric_attrs)
-            return self._parse_response(response, data_type or Dict[str, Any])
+            return self._parse_response(response, data_type or Dict[str, Any], decoded)
 
     def _request_sync(
         self,
@@ -410,6 +788,66 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
         args=(),
         kwargs=None,
         data_type: Optional[Type[T]] = None,
+    ):
+        """Response cache and single-flight around ``_send_sync``. Without
+        either, every request is sent. With a ``ResponseCache``, a cached GET
+        endpoint is answered from the cache when it can and its successful
+        responses are stored, and every request invalidates the cached
+        endpoints it may change. With a ``SingleFlight``, a GET identical to
+        one in flight waits for that one and shares its outcome."""
+        cache = getattr(self, "response_cache", None)
+        flights = getattr(self, "single_flight", None)
+        if cache is None and flights is None:
+            return self._send_sync(
+                method,
+                path,
+                query_params=query_params,
+                args=args,
+                kwargs=kwargs,
+                data_type=data_type,
+            )
+        endpoint = self._endpoint_name(path)
+        path_params = (kwargs or {}).get("path_params")
+        key = None
+        if cache is not None and cache.cached(method, endpoint):
+            key = cache.key(self, endpoint, path, query_params, path_params)
+            hit = cache.get(endpoint, key)
+            if hit is not None:
+                return hit
+        send = functools.partial(
+            self._send_sync,
+            method,
+            path,
+            query_params=query_params,
+            args=args,
+            kwargs=kwargs,
+            data_type=data_type,
+        )
+        try:
+            if flights is not None and flights.applies(method, endpoint):
+                response = flights.run_sync(
+                    endpoint,
+                    request_key(self, endpoint, path, query_params, path_params),
+                    send,
+                )
+            else:
+                response = send()
+        finally:
+            if cache is not None:
+                cache.invalidate(endpoint)
+        if key is not None:
+            cache.put(key, response)
+        return response
+
+    def _send_sync(
+        self,
+        method: str,
+        path: str,
+        *,
+        query_params=None,
+        args=(),
+        kwargs=None,
+        data_type: Optional[Type[T]] = None,
     ):
         """Retry loop around ``_attempt_sync``. Disabled (default) retry
         policy means exactly one attempt, errors surface unchanged. When
@@ -417,25 +855,68 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
         ``_retry_eligible``/``_retry_delay``, owning the ``http.request.failed``
         log level so a retried failure logs at DEBUG and only a final
         transport failure logs at ERROR (a final 429 is already covered by
-        ``http.response.received``)."""
+        ``http.response.received``). With a rate limiter configured, every
+        attempt first waits for the slot it reserved on its endpoint's
+        budget. With hedging configured, an attempt at a hedged GET endpoint
+        runs through the ``Hedger``; its duplicate is only sent if the rate
+        limiter has a slot for it right away. With a circuit breaker configured, an
+        attempt at an endpoint whose circuit is open fails at once with
+        ``StreamTransportException`` (``circuit_open``, never retried) and
+        every other attempt's outcome is recorded. Every attempt sends the same
+        ``x-client-request-id``, and
+        each retry spends a token of the client's ``RetryBudget``; once the
+        budget is spent the error surfaces as if retries were exhausted."""
         retry = getattr(self, "retry", None)
         log = _resolve_logger(self)
         endpoint = self._endpoint_name(path)
+        limiter = getattr(self, "rate_limiter", None)
+        budget = getattr(self, "retry_budget", None)
+        hedger = getattr(self, "hedger", None)
+        breaker = getattr(self, "breaker", None)
+        if budget is not None:
+            budget.deposit()
+        kwargs = _with_client_request_id(kwargs)
         attempt = 0
         while True:
+            if limiter is not None:
+                wait = limiter.reserve(endpoint)
+                if wait > 0:
+                    time.sleep(wait)
+            # raises while the endpoint's circuit is open
+            call = breaker.acquire(endpoint) if breaker is not None else _NO_CIRCUIT
             t0 = time.perf_counter()
             try:
-                return self._attempt_sync(
-                    method,
-                    path,
-                    query_params=query_params,
-                    args=args,
-                    kwargs=kwargs,
-                    data_type=data_type,
-                )
+                with call:
+                    if hedger is not None and hedger.applies(method, endpoint):
+                        return hedger.run_sync(
+                            endpoint,
+                            functools.partial(
+                                self._attempt_sync,
+                                method,
+                                path,
+                                query_params=query_params,
+                                args=args,
+                                kwargs=kwargs,
+                                data_type=data_type,
+                            ),
+                            # the duplicate pays for its own slot, or is not sent
+                            functools.partial(limiter.try_reserve, endpoint)
+                            if limiter is not None
+                            else None,
+                        )
+                    return self._attempt_sync(
+                        method,
+                        path,
+                        query_params=query_params,
+                        args=args,
+                        kwargs=kwargs,
+                        data_type=data_type,
+                    )
             except (StreamRateLimitException, StreamTransportException) as exc:
                 duration_ms = int((time.perf_counter() - t0) * 1000)
-                if _retry_eligible(retry, exc, method, attempt):
+                if _retry_eligible(retry, exc, method, attempt) and (
+                    budget is None or budget.withdraw()
+                ):
                     delay = _retry_delay(retry, exc, attempt)
                     extra = {
                         "http.request.method": method,
@@ -561,32 +1042,29 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
         self,
         path: str,
         data_type: Type[T],
-        file_path: str,
+        file: UploadSource,
         *,
         path_params: Optional[Dict[str, str]] = None,
         query_params: Optional[Dict[str, str]] = None,
         form_fields: Optional[List[Tuple[str, str]]] = None,
+        file_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> StreamResponse[T]:
-        """Send a multipart/form-data upload request, matching Go/PHP SDK behavior."""
-        file_name = os.path.basename(file_path)
-        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
-        with open(file_path, "rb") as f:
-            file_content = f.read()
-
-        files = {"file": (file_name, file_content, content_type)}
-        data: Dict[str, str] = {}
-        for field_name, field_value in form_fields or []:
-            data[field_name] = field_value
-
-        kwargs: Dict[str, Any] = {"files": files}
-        if data:
-            kwargs["data"] = data
-
+        """Send a multipart/form-data upload request, matching Go/PHP SDK
+        behavior. The body is streamed from ``file`` in chunks rather than
+        read into memory first."""
+        body = MultipartStream(
+            file, form_fields, file_name=file_name, progress=progress
+        )
         return self._request_sync(
             "POST",
             path,
             query_params=query_params,
-            kwargs=kwargs | {"path_params": path_params},
+            kwargs={
+                "content": body,
+                "headers": body.headers(),
+                "path_params": path_params,
+            },
             data_type=data_type,
         )
 
@@ -600,6 +1078,8 @@ class BaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
         """
         if getattr(self, "_owns_http_client", True):
             self.client.close()
+        if getattr(self, "_owns_hedger", False) and self.hedger is not None:
+            self.hedger.shutdown()
 
 
 class AsyncBaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, ABC):
@@ -666,6 +1146,7 @@ class AsyncBaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, A
                     params=self.params,
                     timeout=timeout_obj,
                     limits=limits,
+                    http2=_resolve_http2(self),
                 )
             self._owns_http_client = True
         # The pool-config INFO line is emitted once by BaseStream after the
@@ -687,37 +1168,40 @@ class AsyncBaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, A
         """
         if getattr(self, "_owns_http_client", True):
             await self.client.aclose()
+        if getattr(self, "_owns_codec_offload", False):
+            self.codec_offload.shutdown()
 
     async def _upload_multipart(
         self,
         path: str,
         data_type: Type[T],
-        file_path: str,
+        file: UploadSource,
         *,
         path_params: Optional[Dict[str, str]] = None,
         query_params: Optional[Dict[str, str]] = None,
         form_fields: Optional[List[Tuple[str, str]]] = None,
+        file_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> StreamResponse[T]:
-        """Send a multipart/form-data upload request, matching Go/PHP SDK behavior."""
-        file_name = os.path.basename(file_path)
-        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
-
-        file_content = await asyncio.to_thread(_read_file_bytes, file_path)
-
-        files = {"file": (file_name, file_content, content_type)}
-        data: Dict[str, str] = {}
-        for field_name, field_value in form_fields or []:
-            data[field_name] = field_value
-
-        kwargs: Dict[str, Any] = {"files": files}
-        if data:
-            kwargs["data"] = data
-
+        """Send a multipart/form-data upload request, matching Go/PHP SDK
+        behavior. The body is streamed from ``file`` in chunks, read in a
+        worker thread, rather than read into memory first."""
+        body = await asyncio.to_thread(
+            AsyncMultipartStream,
+            file,
+            form_fields,
+            file_name=file_name,
+            progress=progress,
+        )
         return await self._request_async(
             "POST",
             path,
             query_params=query_params,
-            kwargs=kwargs | {"path_params": path_params},
+            kwargs={
+                "content": body,
+                "headers": body.headers(),
+                "path_params": path_params,
+            },
             data_type=data_type,
         )
 
@@ -736,48 +1220,87 @@ class AsyncBaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, A
         data_type: Optional[Type[T]] = None,
     ):
         kwargs = kwargs or {}
-        if "json" in kwargs and kwargs["json"] is not None:
-            kwargs["json"] = _strip_none(kwargs["json"])
         query_params = query_params or {}
         url_path, url_full, endpoint, attrs = self._prepare_request(
             method, path, query_params, kwargs
         )
         log = _resolve_logger(self)
         log_bodies = bool(getattr(self, "log_bodies", False))
+        offload = _resolve_codec_offload(self)
         sent_extra = {
             "http.request.method": method,
             "url.path": path,
             "url.query": redact_query(query_params) or "",
             "stream.endpoint_name": endpoint,
         }
+        body = kwargs.get("json")
+        # the encoder drops None values itself; the stripped dict is only
+        # built when a log line or span event shows the body
+        shown_body = (
+            _strip_none(body)
+            if body is not None and (log_bodies or telemetry.INCLUDE_BODIES)
+            else None
+        )
         if log_bodies:
-            sent_extra["http.request.body"] = redact_json_body(kwargs.get("json"))
+            sent_extra["http.request.body"] = redact_json_body(shown_body)
         log.debug("http.request.sent", extra=sent_extra)
 
         start = time.perf_counter()
-        with span_request(
-            endpoint, attributes=attrs, request_body=kwargs.get("json")
-        ) as span:
+        with span_request(endpoint, attributes=attrs, request_body=shown_body) as span:
             call_kwargs = dict(kwargs)
             call_kwargs.pop("path_params", None)
 
-            if call_kwargs.get("json") is not None:
-                json_body = call_kwargs.pop("json")
-                json_str = await asyncio.to_thread(json.dumps, json_body)
-                call_kwargs["content"] = json_str
-                call_kwargs["headers"] = call_kwargs.get("headers", {})
-                call_kwargs["headers"]["Content-Type"] = "application/json"
-
+            if call_kwargs.pop("json", None) is not None:
+                # small bodies encode (and compress) inline; only large ones
+                # are worth the hop to the codec pool to keep the event loop
+                # responsive
+                compression = _request_compression(self, endpoint)
+                if _json_body_exceeds(body, INLINE_JSON_ENCODE_MAX_BYTES):
+                    content, compressed = await offload.run(
+                        _encode_request_body, body, compression
+                    )
+                else:
+                    content, compressed = _encode_request_body(body, compression)
+                call_kwargs["content"] = content
+                _set_body_headers(call_kwargs, compressed)
+
+            monitor = getattr(self, "pool_monitor", None)
+            trace = response = None
+            if monitor is not None:
+                trace = monitor.start(
+                    endpoint,
+                    metric_attributes(
+                        api_key=self.api_key, endpoint=endpoint, method=method
+                    ),
+                )
+                call_kwargs["extensions"] = {
+                    **call_kwargs.get("extensions", {}),
+                    "trace": trace.ahook,
+                }
             try:
                 response = await getattr(self.client, method.lower())(
                     url_path, params=query_params, *args, **call_kwargs
                 )
             except httpx.RequestError as err:
-                # No failed-log here: the retry loop (_request_async) owns
+                # No failed-log here: the retry loop (_send_async) owns
                 # http.request.failed so it can log at DEBUG when retrying
                 # and ERROR only on a final failure.
                 raise wrap_transport_error(err) from err
-            duration = parse_duration_from_body(response.content)
+            finally:
+                if trace is not None:
+                    monitor.finish(trace, response)
+            limiter = getattr(self, "rate_limiter", None)
+            if limiter is not None:
+                limiter.update(endpoint, extract_rate_limit(response))
+            # one decode (off the loop for large bodies) feeds the span, the
+            # body log and the model or error envelope
+            inline = offload.inline(len(response.content))
+            decoded = (
+                _decode_json_body(response.content)
+                if inline
+                else await offload.run(_decode_json_body, response.content)
+            )
+            duration = _server_duration(decoded[0])
             if duration:
                 span.set_attribute("http.server.duration", duration)
             try:
@@ -797,8 +1320,8 @@ class AsyncBaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, A
                 "duration_ms": int(duration_ms),
             }
             if log_bodies:
-                received_extra["http.response.body"] = await asyncio.to_thread(
-                    _response_body_for_log, response
+                received_extra["http.response.body"] = _response_body_for_log(
+                    response, decoded
                 )
             log.debug("http.response.received", extra=received_extra)
             # Metrics should be low-cardinality: exclude url/call_cid/channel_cid
@@ -809,9 +1332,10 @@ class AsyncBaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, A
                 status_code=getattr(response, "status_code", None),
             )
             record_metrics(duration_ms, attributes=metric_attrs)
-            return await asyncio.to_thread(
-                self._parse_response, response, data_type or Dict[str, Any]
-            )
+            data_type = data_type or Dict[str, Any]
+            if inline:
+                return self._parse_response(response, data_type, decoded)
+            return await offload.run(self._parse_response, response, data_type, decoded)
 
     async def _request_async(
         self,
@@ -824,24 +1348,112 @@ class AsyncBaseClient(TelemetryEndpointMixin, BaseConfig, ResponseParserMixin, A
         data_type: Optional[Type[T]] = None,
     ):
         """Async twin of ``BaseClient._request_sync``; see that docstring."""
+        cache = getattr(self, "response_cache", None)
+        flights = getattr(self, "single_flight", None)
+        if cache is None and flights is None:
+            return await self._send_async(
+                method,
+                path,
+                query_params=query_params,
+                args=args,
+                kwargs=kwargs,
+                data_type=data_type,
+            )
+        endpoint = self._endpoint_name(path)
+        path_params = (kwargs or {}).get("path_params")
+        key = None
+        if cache is not None and cache.cached(method, endpoint):
+            key = cache.key(self, endpoint, path, query_params, path_params)
+            hit = cache.get(endpoint, key)
+            if hit is not None:
+                return hit
+        send = functools.partial(
+            self._send_async,
+            method,
+            path,
+            query_params=query_params,
+            args=args,
+            kwargs=kwargs,
+            data_type=data_type,
+        )
+        try:
+            if flights is not None and flights.applies(method, endpoint):
+                response = await flights.run_async(
+                    endpoint,
+                    request_key(self, endpoint, path, query_params, path_params),
+                    send,
+                )
+            else:
+                response = await send()
+        finally:
+            if cache is not None:
+                cache.invalidate(endpoint)
+        if key is not None:
+            cache.put(key, response)
+        return response
+
+    async def _send_async(
+        self,
+        method: str,
+        path: str,
+        *,
+        query_params=None,
+        args=(),
+        kwargs=None,
+        data_type: Optional[Type[T]] = None,
+    ):
+        """Async twin of ``BaseClient._send_sync``; see that docstring."""
         retry = getattr(self, "retry", None)
         log = _resolve_logger(self)
         endpoint = self._endpoint_name(path)
+        limiter = getattr(self, "rate_limiter", None)
+        budget = getattr(self, "retry_budget", None)
+        hedger = getattr(self, "hedger", None)
+        breaker = getattr(self, "breaker", None)
+        if budget is not None:
+            budget.deposit()
+        kwargs = _with_client_request_id(kwargs)
         attempt = 0
         while True:
+            if limiter is not None:
+                wait = limiter.reserve(endpoint)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            # raises while the endpoint's circuit is open
+            call = breaker.acquire(endpoint) if breaker is not None else _NO_CIRCUIT
             t0 = time.perf_counter()
             try:
-                return await self._attempt_async(
-                    method,
-                    path,
-                    query_params=query_params,
-                    args=args,
-                    kwargs=kwargs,
-                    data_type=data_type,
-                )
+                with call:
+                    if hedger is not None and hedger.applies(method, endpoint):
+                        return await hedger.run_async(
+                            endpoint,
+                            functools.partial(
+                                self._attempt_async,
+                                method,
+                                path,
+                                query_params=query_params,
+                                args=args,
+                                kwargs=kwargs,
+                                data_type=data_type,
+                            ),
+                            # the duplicate pays for its own slot, or is not sent
+                            functools.partial(limiter.try_reserve, endpoint)
+                            if limiter is not None
+                            else None,
+                        )
+                    return await self._attempt_async(
+                        method,
+                        path,
+                        query_params=query_params,
+                        args=args,
+                        kwargs=kwargs,
+                        data_type=data_type,
+                    )
             except (StreamRateLimitException, StreamTransportException) as exc:
                 duration_ms = int((time.perf_counter() - t0) * 1000)
-                if _retry_eligible(retry, exc, method, attempt):
+                if _retry_eligible(retry, exc, method, attempt) and (
+                    budget is None or budget.withdraw()
+                ):
                     delay = _retry_delay(retry, exc, attempt)
                     extra = {
                         "http.request.method": method,
@@ -0,0 +1,193 @@
+"""Micro-batching of single-user upserts (see ``UserBatchConfig``).
+
+``submit`` queues a ``UserRequest`` and returns a future. Queued users are
+sent as one ``update_users`` call once ``max_batch_size`` are waiting or
+the oldest has waited ``max_delay`` seconds, and each future resolves to
+its own ``FullUserResponse`` (or to the call's exception). The sync batcher
+sends from a background thread; the async one from tasks on the caller's
+event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from getstream.config import UserBatchConfig
+
+_Pending = List[Tuple[Any, Any]]
+
+
+def _users_map(batch: _Pending) -> Dict[str, Any]:
+    # a user queued twice in one batch is sent once, with its latest fields
+    return {user.id: user for user, _ in batch}
+
+
+def _resolve(batch: _Pending, response: Any) -> None:
+    users = response.data.users
+    for user, future in batch:
+        if future.done():
+            continue
+        if user.id in users:
+            future.set_result(users[user.id])
+        else:
+            future.set_exception(
+                KeyError(f"user {user.id!r} missing from update_users response")
+            )
+
+
+def _fail(batch: _Pending, exc: BaseException) -> None:
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(exc)
+
+
+class UserBatcher:
+    """Batches users for a sync client's ``update_users``."""
+
+    def __init__(self, config: UserBatchConfig, send: Callable[[Dict[str, Any]], Any]):
+        self.config = config
+        self._send = send
+        self._pending: _Pending = []
+        self._first_at = 0.0
+        self._flush_now = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, user: Any) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("user batcher is closed")
+            if not self._pending:
+                self._first_at = time.monotonic()
+            self._pending.append((user, future))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="getstream-user-batcher", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def flush(self) -> None:
+        """Send everything queued now and wait until it is resolved."""
+        with self._cond:
+            futures = [future for _, future in self._pending]
+            if futures:
+                self._flush_now = True
+                self._cond.notify()
+        wait(futures)
+
+    def close(self) -> None:
+        """Flush and stop the background thread. Later ``submit`` calls
+        raise ``RuntimeError``."""
+        with self._cond:
+            self._closed = True
+            thread = self._thread
+            self._cond.notify()
+        if thread is not None:
+            thread.join()
+
+    def _next_batch(self) -> Optional[_Pending]:
+        max_size = self.config.max_batch_size
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            deadline = self._first_at + self.config.max_delay
+            while len(self._pending) < max_size and not (
+                self._closed or self._flush_now
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            if not self._pending:
+                return None
+            batch = self._pending[:max_size]
+            del self._pending[:max_size]
+            self._first_at = time.monotonic()
+            self._flush_now = bool(self._pending) and self._flush_now
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                response = self._send(_users_map(batch))
+            except BaseException as exc:
+                _fail(batch, exc)
+            else:
+                _resolve(batch, response)
+
+
+class AsyncUserBatcher:
+    """Batches users for an async client's ``update_users``. Batches are
+    sent by tasks on the event loop of the ``submit`` call."""
+
+    def __init__(
+        self,
+        config: UserBatchConfig,
+        send: Callable[[Dict[str, Any]], Awaitable[Any]],
+    ):
+        self.config = config
+        self._send = send
+        self._pending: _Pending = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+        self._closed = False
+
+    def submit(self, user: Any) -> "asyncio.Future[Any]":
+        if self._closed:
+            raise RuntimeError("user batcher is closed")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((user, future))
+        if len(self._pending) >= self.config.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.config.max_delay, self._dispatch)
+        return future
+
+    async def flush(self) -> None:
+        """Send everything queued now and wait until it is resolved."""
+        self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Flush; later ``submit`` calls raise ``RuntimeError``."""
+        self._closed = True
+        await self.flush()
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: _Pending) -> None:
+        try:
+            response = await self._send(_users_map(batch))
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            _fail(batch, exc)
+        else:
+            _resolve(batch, response)
+
+
+__all__ = ["AsyncUserBatcher", "UserBatcher"]
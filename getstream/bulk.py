@@ -0,0 +1,321 @@
+"""Bounded-concurrency execution of many independent API calls.
+
+``Stream.bulk(operations)`` / ``AsyncStream.bulk(operations)`` run each
+operation (a zero-argument callable such as
+``lambda: client.update_users_partial(users=[...])``) with at most
+``concurrency`` of them in flight, which defaults to what the client's
+connection pool can carry. Operations are pulled from the iterable as slots
+free up, so a generator of a million calls is never materialized.
+
+Iterating the returned run yields one ``BulkResult`` per operation, in input
+order (``ordered=True``, the default) or as they complete. Failures are
+captured on the result instead of aborting the run, and ``run.stats`` keeps
+throughput and latency counters that are current while iterating.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from getstream.base import _request_capacity, _resolve_pool_knobs
+
+T = TypeVar("T")
+
+# Default worker threads of a sync run. Its concurrency is one thread per
+# in-flight request, so it stays below what an HTTP/2 pool multiplexes.
+BULK_MAX_THREADS = 32
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """Outcome of one bulk operation. ``index`` is its position in the input;
+    exactly one of ``value``/``error`` is meaningful."""
+
+    index: int
+    value: Optional[T] = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def result(self) -> T:
+        """The operation's return value, or re-raise its error."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+@dataclass
+class BulkStats:
+    """Counters for a bulk run; ``durations`` are per-operation seconds in
+    completion order."""
+
+    concurrency: int
+    started: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    durations: List[float] = field(default_factory=list, repr=False)
+    _start: Optional[float] = field(default=None, repr=False)
+    _end: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def in_flight(self) -> int:
+        return self.started - self.completed
+
+    @property
+    def elapsed(self) -> float:
+        if self._start is None:
+            return 0.0
+        end = self._end if self._end is not None else time.perf_counter()
+        return end - self._start
+
+    @property
+    def throughput(self) -> float:
+        """Completed operations per second."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def latency(self, quantile: float) -> float:
+        """Operation latency in seconds at ``quantile`` (0..1), nearest rank."""
+        if not self.durations:
+            return 0.0
+        ordered = sorted(self.durations)
+        rank = min(len(ordered) - 1, max(0, round(quantile * len(ordered)) - 1))
+        return ordered[rank]
+
+    @property
+    def latency_mean(self) -> float:
+        return sum(self.durations) / len(self.durations) if self.durations else 0.0
+
+    def _record(self, result: BulkResult) -> None:
+        if result.error is None:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.durations.append(result.duration)
+
+
+def _timed(index: int, operation: Callable[[], T]) -> BulkResult[T]:
+    start = time.perf_counter()
+    try:
+        value = operation()
+    except Exception as err:
+        return BulkResult(index, error=err, duration=time.perf_counter() - start)
+    return BulkResult(index, value=value, duration=time.perf_counter() - start)
+
+
+async def _atimed(index: int, operation: Callable[[], Awaitable[T]]) -> BulkResult[T]:
+    start = time.perf_counter()
+    try:
+        value = await operation()
+    except Exception as err:
+        return BulkResult(index, error=err, duration=time.perf_counter() - start)
+    return BulkResult(index, value=value, duration=time.perf_counter() - start)
+
+
+class BulkRun(Generic[T]):
+    """Iterable of ``BulkResult`` for ``Stream.bulk``. Operations run on a
+    pool of ``concurrency`` worker threads; they start when iteration starts.
+    Single-use."""
+
+    def __init__(
+        self,
+        operations: Iterable[Callable[[], T]],
+        *,
+        concurrency: int,
+        ordered: bool = True,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._operations = operations
+        self.ordered = ordered
+        self.stats = BulkStats(concurrency=concurrency)
+        self._consumed = False
+
+    def __iter__(self) -> Iterator[BulkResult[T]]:
+        if self._consumed:
+            raise RuntimeError("a bulk run can only be iterated once")
+        self._consumed = True
+        return self._run()
+
+    def _run(self) -> Iterator[BulkResult[T]]:
+        stats = self.stats
+        concurrency = stats.concurrency
+        # ordered: a few queued operations beyond the worker count keep the
+        # workers busy while the head of the queue is still running
+        window = 2 * concurrency if self.ordered else concurrency
+        operations = enumerate(self._operations)
+        pool = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="getstream-bulk"
+        )
+
+        def submit() -> Optional[Future]:
+            item = next(operations, None)
+            if item is None:
+                return None
+            stats.started += 1
+            # run with the caller's context so tracing spans nest as usual
+            ctx = contextvars.copy_context()
+            return pool.submit(ctx.run, _timed, *item)
+
+        stats._start = time.perf_counter()
+        try:
+            if self.ordered:
+                queue: Deque[Future] = deque()
+                while True:
+                    while len(queue) < window and (future := submit()) is not None:
+                        queue.append(future)
+                    if not queue:
+                        return
+                    result = queue.popleft().result()
+                    stats._record(result)
+                    yield result
+            else:
+                pending: Set[Future] = set()
+                while True:
+                    while len(pending) < window and (future := submit()) is not None:
+                        pending.add(future)
+                    if not pending:
+                        return
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        stats._record(result)
+                        yield result
+        finally:
+            stats._end = time.perf_counter()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncBulkRun(Generic[T]):
+    """Async iterable of ``BulkResult`` for ``AsyncStream.bulk``. Each
+    operation returns an awaitable; at most ``concurrency`` are awaited at
+    once. Single-use."""
+
+    def __init__(
+        self,
+        operations: Iterable[Callable[[], Awaitable[T]]],
+        *,
+        concurrency: int,
+        ordered: bool = True,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._operations = operations
+        self.ordered = ordered
+        self.stats = BulkStats(concurrency=concurrency)
+        self._consumed = False
+
+    def __aiter__(self) -> AsyncIterator[BulkResult[T]]:
+        if self._consumed:
+            raise RuntimeError("a bulk run can only be iterated once")
+        self._consumed = True
+        return self._run()
+
+    async def _run(self) -> AsyncIterator[BulkResult[T]]:
+        stats = self.stats
+        concurrency = stats.concurrency
+        operations = enumerate(self._operations)
+        # ordered runs keep up to 2x tasks around (see BulkRun) but only
+        # ``concurrency`` of them may be awaiting the API at a time
+        window = 2 * concurrency if self.ordered else concurrency
+        slots = asyncio.Semaphore(concurrency)
+
+        async def guarded(item: Tuple[int, Callable[[], Awaitable[T]]]):
+            async with slots:
+                return await _atimed(*item)
+
+        def submit() -> Optional[asyncio.Task]:
+            item = next(operations, None)
+            if item is None:
+                return None
+            stats.started += 1
+            return asyncio.ensure_future(guarded(item))
+
+        tasks: List[asyncio.Task] = []
+        stats._start = time.perf_counter()
+        try:
+            if self.ordered:
+                queue: Deque[asyncio.Task] = deque()
+                while True:
+                    while len(queue) < window and (task := submit()) is not None:
+                        queue.append(task)
+                        tasks.append(task)
+                    if not queue:
+                        return
+                    result = await queue.popleft()
+                    stats._record(result)
+                    yield result
+            else:
+                pending: Set[asyncio.Task] = set()
+                while True:
+                    while len(pending) < window and (task := submit()) is not None:
+                        pending.add(task)
+                        tasks.append(task)
+                    if not pending:
+                        return
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        result = task.result()
+                        stats._record(result)
+                        yield result
+        finally:
+            stats._end = time.perf_counter()
+            for task in tasks:
+                task.cancel()
+
+
+def resolve_concurrency(
+    client: Any, concurrency: Optional[int], *, threads: bool = False
+) -> int:
+    """The concurrency a bulk run on ``client`` uses: what its connection
+    pool can carry at once by default, and never more than that. More would
+    only queue requests on the pool, where they can fail with a pool timeout
+    instead of running sooner. A caller-supplied ``http_client`` or
+    ``transport`` has unknown limits, so an explicit value is taken as is and
+    the default is ``max_conns_per_host``.
+
+    With ``threads`` (a sync run, one worker thread per slot) the default is
+    also capped at ``BULK_MAX_THREADS``: an HTTP/2 connection carries
+    ``HTTP2_MAX_CONCURRENT_STREAMS`` requests, which suits coroutines but not
+    threads. An explicit
+    ``concurrency`` is still allowed up to the pool's capacity."""
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    capacity = _request_capacity(client)
+    if capacity is None:
+        return concurrency or _resolve_pool_knobs(client)[0]
+    if concurrency:
+        return min(concurrency, capacity)
+    return min(capacity, BULK_MAX_THREADS) if threads else capacity
+
+
+__all__ = ["BulkResult", "BulkStats", "BulkRun", "AsyncBulkRun"]
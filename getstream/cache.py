@@ -0,0 +1,246 @@
+"""Response cache for read-mostly GET endpoints (see ``CacheConfig``).
+
+Successful responses of the cached endpoints are kept for ``ttl`` seconds
+in a ``CacheBackend``: by default an in-process LRU (``MemoryCache``),
+optionally any store implementing the same three methods. Calling a
+mutating endpoint through the same client (``update_app``,
+``update_channel_type``, ...) invalidates the endpoints it changes; other
+clients and processes sharing a backend see the change once their entries
+expire.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from getstream.common.telemetry import record_cache_lookup
+from getstream.config import CacheConfig
+
+# Endpoints cached when ``CacheConfig.endpoints`` is None.
+DEFAULT_CACHED_ENDPOINTS = frozenset(
+    {
+        "getstream.api.common.get_app",
+        "getstream.api.common.list_permissions",
+        "getstream.api.common.get_permission",
+        "getstream.api.common.list_roles",
+        "getstream.api.chat.list_channel_types",
+        "getstream.api.chat.get_channel_type",
+        "getstream.api.video.list_call_types",
+        "getstream.api.video.get_call_type",
+        "getstream.api.feeds.list_feed_groups",
+        "getstream.api.feeds.get_feed_group",
+        "getstream.api.moderation.get_config",
+    }
+)
+
+_CHANNEL_TYPES = (
+    "getstream.api.chat.list_channel_types",
+    "getstream.api.chat.get_channel_type",
+)
+_CALL_TYPES = (
+    "getstream.api.video.list_call_types",
+    "getstream.api.video.get_call_type",
+)
+_FEED_GROUPS = (
+    "getstream.api.feeds.list_feed_groups",
+    "getstream.api.feeds.get_feed_group",
+)
+_ROLES = ("getstream.api.common.list_roles",)
+_MODERATION_CONFIG = ("getstream.api.moderation.get_config",)
+# get_app's response embeds the call types, the channel configs and the
+# grants per role, so writes to those change it too.
+_APP = ("getstream.api.common.get_app",)
+
+# Mutating endpoint -> the cached endpoints whose responses it changes.
+INVALIDATES: Mapping[str, Tuple[str, ...]] = {
+    "getstream.api.common.update_app": _APP,
+    "getstream.api.common.create_role": _ROLES + _APP,
+    "getstream.api.common.delete_role": _ROLES + _APP,
+    "getstream.api.chat.create_channel_type": _CHANNEL_TYPES + _APP,
+    "getstream.api.chat.update_channel_type": _CHANNEL_TYPES + _APP,
+    "getstream.api.chat.delete_channel_type": _CHANNEL_TYPES + _APP,
+    "getstream.api.video.create_call_type": _CALL_TYPES + _APP,
+    "getstream.api.video.update_call_type": _CALL_TYPES + _APP,
+    "getstream.api.video.delete_call_type": _CALL_TYPES + _APP,
+    "getstream.api.feeds.create_feed_group": _FEED_GROUPS,
+    "getstream.api.feeds.update_feed_group": _FEED_GROUPS,
+    "getstream.api.feeds.delete_feed_group": _FEED_GROUPS,
+    "getstream.api.feeds.restore_feed_group": _FEED_GROUPS,
+    "getstream.api.feeds.get_or_create_feed_group": _FEED_GROUPS,
+    "getstream.api.moderation.upsert_config": _MODERATION_CONFIG,
+    "getstream.api.moderation.delete_config": _MODERATION_CONFIG,
+}
+
+
+def request_key(
+    client: Any,
+    endpoint: str,
+    path: str,
+    query_params: Optional[Mapping[str, Any]],
+    path_params: Optional[Mapping[str, Any]],
+) -> str:
+    """Identity of a request: app, credentials, endpoint, path and
+    parameters. Requests made with different tokens never share a key."""
+    token = getattr(client, "token", None) or ""
+    identity = hashlib.sha256(f"{client.api_key}:{token}".encode("utf-8")).hexdigest()
+    return (
+        f"{identity[:16]}:{endpoint}:{path}"
+        f":{sorted((path_params or {}).items())!r}"
+        f":{sorted((query_params or {}).items())!r}"
+    )
+
+
+class CacheBackend(ABC):
+    """Storage for cached responses. Values are ``StreamResponse`` objects;
+    a backend shared between processes has to serialize them (they pickle).
+    Methods are called inline by sync and async clients alike, so they
+    should be fast."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """The value stored under ``key``, or ``None`` if missing or
+        expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Drop ``key`` if present."""
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU with a TTL per entry. Thread-safe."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Cache lookups for one endpoint."""
+
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """The cache policy of one client: which requests are cached, under
+    which key, and which calls invalidate them. One instance is shared by a
+    ``Stream`` and its sub-clients."""
+
+    def __init__(self, config: CacheConfig):
+        self.config = config
+        self.backend: CacheBackend = (
+            MemoryCache(config.max_entries)
+            if config.backend is None
+            else config.backend
+        )
+        endpoints = (
+            DEFAULT_CACHED_ENDPOINTS if config.endpoints is None else config.endpoints
+        )
+        self._endpoints = frozenset(endpoints)
+        # Bumped by invalidation: keys embed the generation of their
+        # endpoint, so invalidating never has to find the stale keys, which
+        # age out of the backend on their own.
+        self._generations: Dict[str, int] = {}
+        self._counts: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, method: str, endpoint: str) -> bool:
+        return method.upper() == "GET" and (
+            endpoint in self._endpoints
+            or endpoint.rsplit(".", 1)[-1] in self._endpoints
+        )
+
+    def key(
+        self,
+        client: Any,
+        endpoint: str,
+        path: str,
+        query_params: Optional[Mapping[str, Any]],
+        path_params: Optional[Mapping[str, Any]],
+    ) -> str:
+        """``request_key`` plus the endpoint's invalidation generation."""
+        generation = self._generations.get(endpoint, 0)
+        key = request_key(client, endpoint, path, query_params, path_params)
+        return f"getstream:#{generation}:{key}"
+
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        value = self.backend.get(key)
+        hit = value is not None
+        with self._lock:
+            counts = self._counts.setdefault(endpoint, [0, 0])
+            counts[0 if hit else 1] += 1
+        record_cache_lookup(attributes={"stream.endpoint": endpoint, "cache.hit": hit})
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self.backend.set(key, value, self.config.ttl)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Forget the responses a call to ``endpoint`` may have changed. A
+        no-op for endpoints that change nothing cached."""
+        readers = INVALIDATES.get(endpoint)
+        if readers is None:
+            return
+        with self._lock:
+            for reader in readers:
+                self._generations[reader] = self._generations.get(reader, 0) + 1
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """Current ``CacheStats`` per endpoint name."""
+        with self._lock:
+            return {
+                name: CacheStats(hits=hits, misses=misses)
+                for name, (hits, misses) in self._counts.items()
+            }
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "DEFAULT_CACHED_ENDPOINTS",
+    "MemoryCache",
+    "ResponseCache",
+    "request_key",
+]
@@ -11,6 +11,7 @@ from getstream.models import (
     UploadChannelResponse,
 )
 from getstream.stream_response import StreamResponse
+from getstream.uploads import ProgressCallback, UploadSource
 
 
 class ChatClient(ChatRestClient):
@@ -32,9 +33,13 @@ class ChatClient(ChatRestClient):
         self,
         type: str,
         id: str,
-        file: str,
+        file: UploadSource,
         user: Optional[OnlyUserID] = None,
+        file_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> StreamResponse[UploadChannelFileResponse]:
+        """Upload ``file`` to the channel; ``file``, ``file_name`` and
+        ``progress`` are as for ``upload_file``."""
         form_fields = []
         if user is not None:
             form_fields.append(("user", json.dumps(user.to_dict())))
@@ -44,6 +49,8 @@ class ChatClient(ChatRestClient):
             file,
             path_params={"type": type, "id": id},
             form_fields=form_fields,
+            file_name=file_name,
+            progress=progress,
         )
 
     @telemetry.operation_name("getstream.api.chat.upload_channel_image")
@@ -51,9 +58,11 @@ class ChatClient(ChatRestClient):
         self,
         channel_type: Optional[str] = None,
         id: Optional[str] = None,
-        file: Optional[str] = None,
+        file: Optional[UploadSource] = None,
         upload_sizes: Optional[List[ImageSize]] = None,
         user: Optional[OnlyUserID] = None,
+        file_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
         **kwargs,
     ) -> StreamResponse[UploadChannelResponse]:
         # Backward compatibility for generated wrappers passing `type=...`.
@@ -82,4 +91,6 @@ class ChatClient(ChatRestClient):
             file,
             path_params={"type": channel_type, "id": id},
             form_fields=form_fields,
+            file_name=file_name,
+            progress=progress,
         )
@@ -1,7 +1,10 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from typing import AsyncIterator
+
 from getstream.base import AsyncBaseClient
 from getstream.common import telemetry
 from getstream.models import *
+from getstream.pagination import apaginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
@@ -91,6 +94,24 @@ class ChatRestClient(AsyncBaseClient):
             "/api/v2/chat/campaigns/query", QueryCampaignsResponse, json=json
         )
 
+    def aiter_query_campaigns(
+        self,
+        limit: Optional[int] = None,
+        user_limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[CampaignResponse]:
+        return apaginate(
+            self.query_campaigns,
+            "campaigns",
+            prefetch=prefetch,
+            limit=limit,
+            user_limit=user_limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.chat.delete_campaign")
     async def delete_campaign(self, id: str) -> StreamResponse[DeleteCampaignResponse]:
         path_params = {
@@ -1099,6 +1120,26 @@ class ChatRestClient(AsyncBaseClient):
             "/api/v2/chat/drafts/query", QueryDraftsResponse, json=json
         )
 
+    def aiter_query_drafts(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[DraftResponse]:
+        return apaginate(
+            self.query_drafts,
+            "drafts",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.export_channels")
     async def export_channels(
         self,
@@ -1146,6 +1187,22 @@ class ChatRestClient(AsyncBaseClient):
             "/api/v2/chat/messages/history", QueryMessageHistoryResponse, json=json
         )
 
+    def aiter_query_message_history(
+        self,
+        filter: Dict[str, object],
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[MessageHistoryEntryResponse]:
+        return apaginate(
+            self.query_message_history,
+            "message_history",
+            prefetch=prefetch,
+            filter=filter,
+            limit=limit,
+            sort=sort,
+        )
+
     @telemetry.operation_name("getstream.api.chat.delete_message")
     async def delete_message(
         self,
@@ -1383,6 +1440,28 @@ class ChatRestClient(AsyncBaseClient):
             json=json,
         )
 
+    def aiter_query_reactions(
+        self,
+        id: str,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ReactionResponse]:
+        return apaginate(
+            self.query_reactions,
+            "reactions",
+            prefetch=prefetch,
+            id=id,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.translate_message")
     async def translate_message(
         self, id: str, language: str
@@ -1628,6 +1707,26 @@ class ChatRestClient(AsyncBaseClient):
             "/api/v2/chat/reminders/query", QueryRemindersResponse, json=json
         )
 
+    def aiter_query_reminders(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ReminderResponseData]:
+        return apaginate(
+            self.query_reminders,
+            "reminders",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.get_retention_policy")
     async def get_retention_policy(self) -> StreamResponse[GetRetentionPolicyResponse]:
         return await self.get(
@@ -1678,6 +1777,22 @@ class ChatRestClient(AsyncBaseClient):
             json=json,
         )
 
+    def aiter_get_retention_policy_runs(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[RetentionRunResponse]:
+        return apaginate(
+            self.get_retention_policy_runs,
+            "runs",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.chat.search")
     async def search(
         self, payload: Optional[SearchPayload] = None
@@ -1727,6 +1842,22 @@ class ChatRestClient(AsyncBaseClient):
             "/api/v2/chat/segments/query", QuerySegmentsResponse, json=json
         )
 
+    def aiter_query_segments(
+        self,
+        filter: Dict[str, object],
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[SegmentResponse]:
+        return apaginate(
+            self.query_segments,
+            "segments",
+            prefetch=prefetch,
+            filter=filter,
+            limit=limit,
+            sort=sort,
+        )
+
     @telemetry.operation_name("getstream.api.chat.delete_segment")
     async def delete_segment(self, id: str) -> StreamResponse[Response]:
         path_params = {
@@ -1833,6 +1964,24 @@ class ChatRestClient(AsyncBaseClient):
             json=json,
         )
 
+    def aiter_query_segment_targets(
+        self,
+        id: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[SegmentTargetResponse]:
+        return apaginate(
+            self.query_segment_targets,
+            "targets",
+            prefetch=prefetch,
+            id=id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.chat.query_team_usage_stats")
     async def query_team_usage_stats(
         self,
@@ -1853,6 +2002,24 @@ class ChatRestClient(AsyncBaseClient):
             "/api/v2/chat/stats/team_usage", QueryTeamUsageStatsResponse, json=json
         )
 
+    def aiter_query_team_usage_stats(
+        self,
+        end_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        month: Optional[str] = None,
+        start_date: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[TeamUsageStats]:
+        return apaginate(
+            self.query_team_usage_stats,
+            "teams",
+            prefetch=prefetch,
+            end_date=end_date,
+            limit=limit,
+            month=month,
+            start_date=start_date,
+        )
+
     @telemetry.operation_name("getstream.api.chat.query_threads")
     async def query_threads(
         self,
@@ -1881,6 +2048,32 @@ class ChatRestClient(AsyncBaseClient):
         ).to_dict()
         return await self.post("/api/v2/chat/threads", QueryThreadsResponse, json=json)
 
+    def aiter_query_threads(
+        self,
+        limit: Optional[int] = None,
+        member_limit: Optional[int] = None,
+        participant_limit: Optional[int] = None,
+        reply_limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ThreadStateResponse]:
+        return apaginate(
+            self.query_threads,
+            "threads",
+            prefetch=prefetch,
+            limit=limit,
+            member_limit=member_limit,
+            participant_limit=participant_limit,
+            reply_limit=reply_limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.get_thread")
     async def get_thread(
         self,
@@ -1,7 +1,10 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from typing import Iterator
+
 from getstream.base import BaseClient
 from getstream.common import telemetry
 from getstream.models import *
+from getstream.pagination import paginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
@@ -89,6 +92,24 @@ class ChatRestClient(BaseClient):
             "/api/v2/chat/campaigns/query", QueryCampaignsResponse, json=json
         )
 
+    def iter_query_campaigns(
+        self,
+        limit: Optional[int] = None,
+        user_limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[CampaignResponse]:
+        return paginate(
+            self.query_campaigns,
+            "campaigns",
+            prefetch=prefetch,
+            limit=limit,
+            user_limit=user_limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.chat.delete_campaign")
     def delete_campaign(self, id: str) -> StreamResponse[DeleteCampaignResponse]:
         path_params = {
@@ -1087,6 +1108,26 @@ class ChatRestClient(BaseClient):
         ).to_dict()
         return self.post("/api/v2/chat/drafts/query", QueryDraftsResponse, json=json)
 
+    def iter_query_drafts(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[DraftResponse]:
+        return paginate(
+            self.query_drafts,
+            "drafts",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.export_channels")
     def export_channels(
         self,
@@ -1134,6 +1175,22 @@ class ChatRestClient(BaseClient):
             "/api/v2/chat/messages/history", QueryMessageHistoryResponse, json=json
         )
 
+    def iter_query_message_history(
+        self,
+        filter: Dict[str, object],
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[MessageHistoryEntryResponse]:
+        return paginate(
+            self.query_message_history,
+            "message_history",
+            prefetch=prefetch,
+            filter=filter,
+            limit=limit,
+            sort=sort,
+        )
+
     @telemetry.operation_name("getstream.api.chat.delete_message")
     def delete_message(
         self,
@@ -1371,6 +1428,28 @@ class ChatRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_reactions(
+        self,
+        id: str,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ReactionResponse]:
+        return paginate(
+            self.query_reactions,
+            "reactions",
+            prefetch=prefetch,
+            id=id,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.translate_message")
     def translate_message(
         self, id: str, language: str
@@ -1616,6 +1695,26 @@ class ChatRestClient(BaseClient):
             "/api/v2/chat/reminders/query", QueryRemindersResponse, json=json
         )
 
+    def iter_query_reminders(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ReminderResponseData]:
+        return paginate(
+            self.query_reminders,
+            "reminders",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.get_retention_policy")
     def get_retention_policy(self) -> StreamResponse[GetRetentionPolicyResponse]:
         return self.get("/api/v2/chat/retention_policy", GetRetentionPolicyResponse)
@@ -1664,6 +1763,22 @@ class ChatRestClient(BaseClient):
             json=json,
         )
 
+    def iter_get_retention_policy_runs(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[RetentionRunResponse]:
+        return paginate(
+            self.get_retention_policy_runs,
+            "runs",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.chat.search")
     def search(
         self, payload: Optional[SearchPayload] = None
@@ -1711,6 +1826,22 @@ class ChatRestClient(BaseClient):
             "/api/v2/chat/segments/query", QuerySegmentsResponse, json=json
         )
 
+    def iter_query_segments(
+        self,
+        filter: Dict[str, object],
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[SegmentResponse]:
+        return paginate(
+            self.query_segments,
+            "segments",
+            prefetch=prefetch,
+            filter=filter,
+            limit=limit,
+            sort=sort,
+        )
+
     @telemetry.operation_name("getstream.api.chat.delete_segment")
     def delete_segment(self, id: str) -> StreamResponse[Response]:
         path_params = {
@@ -1817,6 +1948,24 @@ class ChatRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_segment_targets(
+        self,
+        id: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[SegmentTargetResponse]:
+        return paginate(
+            self.query_segment_targets,
+            "targets",
+            prefetch=prefetch,
+            id=id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.chat.query_team_usage_stats")
     def query_team_usage_stats(
         self,
@@ -1837,6 +1986,24 @@ class ChatRestClient(BaseClient):
             "/api/v2/chat/stats/team_usage", QueryTeamUsageStatsResponse, json=json
         )
 
+    def iter_query_team_usage_stats(
+        self,
+        end_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        month: Optional[str] = None,
+        start_date: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> Iterator[TeamUsageStats]:
+        return paginate(
+            self.query_team_usage_stats,
+            "teams",
+            prefetch=prefetch,
+            end_date=end_date,
+            limit=limit,
+            month=month,
+            start_date=start_date,
+        )
+
     @telemetry.operation_name("getstream.api.chat.query_threads")
     def query_threads(
         self,
@@ -1865,6 +2032,32 @@ class ChatRestClient(BaseClient):
         ).to_dict()
         return self.post("/api/v2/chat/threads", QueryThreadsResponse, json=json)
 
+    def iter_query_threads(
+        self,
+        limit: Optional[int] = None,
+        member_limit: Optional[int] = None,
+        participant_limit: Optional[int] = None,
+        reply_limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ThreadStateResponse]:
+        return paginate(
+            self.query_threads,
+            "threads",
+            prefetch=prefetch,
+            limit=limit,
+            member_limit=member_limit,
+            participant_limit=participant_limit,
+            reply_limit=reply_limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.chat.get_thread")
     def get_thread(
         self,
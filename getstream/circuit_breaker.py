@@ -0,0 +1,187 @@
+"""Client-side circuit breaker per endpoint (see ``CircuitBreakerConfig``).
+
+Each endpoint's circuit is ``closed`` (requests flow and their outcomes are
+recorded), ``open`` (requests fail at once with ``StreamTransportException``
+of ``error_type="circuit_open"``) or ``half_open`` (a few probe requests
+decide whether to close or reopen it). State changes are logged as
+``circuit_breaker.state_changed`` and counted by the
+``getstream.client.circuit_breaker.transitions`` OpenTelemetry counter.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from getstream.common.telemetry import record_circuit_transition
+from getstream.config import CircuitBreakerConfig
+from getstream.exceptions import (
+    StreamApiException,
+    StreamRateLimitException,
+    StreamTransportException,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "failures", "opened_at", "probes", "passed")
+
+    def __init__(self, window_size: int):
+        self.state = CLOSED
+        # True for a failed call; ``failures`` counts them
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.passed = 0
+
+
+class _Call:
+    """Context manager around one admitted request: records its outcome on
+    exit. Exceptions pass through unchanged."""
+
+    __slots__ = ("breaker", "endpoint", "probe", "start")
+
+    def __init__(self, breaker: "CircuitBreaker", endpoint: str, probe: bool):
+        self.breaker = breaker
+        self.endpoint = endpoint
+        self.probe = probe
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.breaker._record(self, time.perf_counter() - self.start, exc)
+        return False
+
+
+class CircuitBreaker:
+    """Circuits per endpoint name. One instance is shared by a ``Stream``
+    and its sub-clients."""
+
+    def __init__(self, config: CircuitBreakerConfig, logger: logging.Logger):
+        self.config = config
+        self.log = logger
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, endpoint: str) -> str:
+        """``closed``, ``open`` or ``half_open``."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            return circuit.state if circuit is not None else CLOSED
+
+    def acquire(self, endpoint: str) -> _Call:
+        """Admit one request to ``endpoint``, or raise
+        ``StreamTransportException`` while its circuit is open. Use the
+        returned context manager around the request."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                circuit = self._circuits[endpoint] = _Circuit(self.config.window_size)
+            if circuit.state == OPEN:
+                remaining = self.config.open_duration - (
+                    time.monotonic() - circuit.opened_at
+                )
+                if remaining > 0:
+                    raise StreamTransportException(
+                        "circuit_open",
+                        f"circuit open for {endpoint}; retry in {remaining:.1f}s",
+                    )
+                self._transition(endpoint, circuit, HALF_OPEN)
+            if circuit.state == HALF_OPEN:
+                if circuit.probes >= self.config.half_open_calls:
+                    raise StreamTransportException(
+                        "circuit_open", f"circuit half-open for {endpoint}"
+                    )
+                circuit.probes += 1
+                return _Call(self, endpoint, probe=True)
+        return _Call(self, endpoint, probe=False)
+
+    def _record(self, call: _Call, elapsed: float, exc: Optional[BaseException]):
+        failed = _is_failure(exc)
+        slow = self.config.slow_call_duration
+        if failed is False and slow is not None and elapsed >= slow:
+            failed = True
+        endpoint = call.endpoint
+        with self._lock:
+            circuit = self._circuits[endpoint]
+            # outcomes only count in the state the call was admitted in; a
+            # call that outlived its circuit's state says nothing new
+            if call.probe:
+                if circuit.state != HALF_OPEN:
+                    return
+                circuit.probes -= 1
+                if failed:
+                    self._transition(endpoint, circuit, OPEN)
+                elif failed is False:
+                    circuit.passed += 1
+                    if circuit.passed >= self.config.half_open_calls:
+                        self._transition(endpoint, circuit, CLOSED)
+                return
+            if circuit.state != CLOSED or failed is None:
+                return
+            outcomes = circuit.outcomes
+            if len(outcomes) == outcomes.maxlen and outcomes[0]:
+                circuit.failures -= 1
+            outcomes.append(failed)
+            circuit.failures += failed
+            if (
+                len(outcomes) >= self.config.min_calls
+                and circuit.failures >= self.config.failure_rate * len(outcomes)
+            ):
+                self._transition(endpoint, circuit, OPEN)
+
+    def _transition(self, endpoint: str, circuit: _Circuit, state: str) -> None:
+        # called with the lock held
+        previous = circuit.state
+        failure_rate = (
+            circuit.failures / len(circuit.outcomes) if circuit.outcomes else 0.0
+        )
+        circuit.state = state
+        circuit.probes = 0
+        circuit.passed = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.failures = 0
+        self.log.log(
+            logging.WARNING if state == OPEN else logging.INFO,
+            "circuit_breaker.state_changed",
+            extra={
+                "stream.endpoint_name": endpoint,
+                "circuit.state": state,
+                "circuit.previous_state": previous,
+                "circuit.failure_rate": round(failure_rate, 3),
+            },
+        )
+        record_circuit_transition(
+            attributes={"stream.endpoint": endpoint, "circuit.state": state}
+        )
+
+
+def _is_failure(exc: Optional[BaseException]) -> Optional[bool]:
+    """Whether a call ending in ``exc`` counts against the circuit: ``True``
+    for transport errors and 5xx responses, ``False`` for success and other
+    API errors (the backend answered), ``None`` when it says nothing about
+    the backend (cancellation, errors raised by the SDK itself)."""
+    if exc is None:
+        return False
+    if isinstance(exc, StreamTransportException):
+        return True
+    if isinstance(exc, StreamRateLimitException):
+        return False
+    if isinstance(exc, StreamApiException):
+        return (exc.status_code or 0) >= 500
+    return None
+
+
+__all__ = ["CircuitBreaker"]
@@ -0,0 +1,129 @@
+"""Single-flight GET requests (see ``CoalesceConfig``).
+
+While a GET is in flight, identical GETs made through the same client (same
+credentials, endpoint, path and parameters) wait for it instead of sending
+their own request, and all receive its ``StreamResponse`` or its exception.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from getstream.common.telemetry import record_coalesced
+from getstream.config import CoalesceConfig
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CoalesceStats:
+    """Single-flight counters for one endpoint: requests made, and how many
+    of them joined a request already in flight instead of being sent."""
+
+    requests: int
+    coalesced: int
+
+    @property
+    def coalesced_rate(self) -> float:
+        return self.coalesced / self.requests if self.requests else 0.0
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """In-flight GETs by request key. One instance is shared by a
+    ``Stream`` and its sub-clients."""
+
+    def __init__(self, config: CoalesceConfig):
+        self.config = config
+        self._flights: Dict[str, _Flight] = {}
+        self._tasks: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._counts: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def applies(self, method: str, endpoint: str) -> bool:
+        if method.upper() != "GET":
+            return False
+        names = self.config.endpoints
+        return (
+            names is None or endpoint in names or endpoint.rsplit(".", 1)[-1] in names
+        )
+
+    def _count(self, endpoint: str, joined: bool) -> None:
+        # called with the lock held
+        counts = self._counts.setdefault(endpoint, [0, 0])
+        counts[0] += 1
+        if joined:
+            counts[1] += 1
+
+    def stats(self) -> Dict[str, CoalesceStats]:
+        """Current ``CoalesceStats`` per endpoint name."""
+        with self._lock:
+            return {
+                name: CoalesceStats(requests=requests, coalesced=coalesced)
+                for name, (requests, coalesced) in self._counts.items()
+            }
+
+    def run_sync(self, endpoint: str, key: str, send: Callable[[], T]) -> T:
+        """``send()``, unless an identical request is in flight: then wait
+        for it and share its outcome."""
+        with self._lock:
+            flight = self._flights.get(key)
+            joined = flight is not None
+            if not joined:
+                flight = self._flights[key] = _Flight()
+            self._count(endpoint, joined)
+        if joined:
+            record_coalesced(attributes={"stream.endpoint": endpoint})
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = send()
+            return flight.result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def run_async(
+        self, endpoint: str, key: str, send: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Async twin of ``run_sync``. The request runs as a task of its
+        own, so cancelling one waiter does not cancel it for the others."""
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            joined = task is not None
+            if not joined:
+                task = self._tasks[task_key] = loop.create_task(send())
+                task.add_done_callback(lambda t: self._forget(task_key, t))
+            self._count(endpoint, joined)
+        if joined:
+            record_coalesced(attributes={"stream.endpoint": endpoint})
+        return await asyncio.shield(task)
+
+    def _forget(self, task_key: Hashable, task: "asyncio.Task[Any]") -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+        # mark the error retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+__all__ = ["CoalesceStats", "SingleFlight"]
@@ -0,0 +1,372 @@
+"""Compiled ``from_dict``/``to_dict`` for the generated models.
+
+dataclasses_json resolves type hints, field overrides and its collection
+machinery by reflection on every ``from_dict``/``to_dict`` call, for every
+nested object. The generated models inherit ``DataClassJsonMixin`` from this
+module instead, which does that work once per model class on first use and
+keeps the result as a list of per-field decode/encode functions.
+
+The compiled functions follow dataclasses_json's own code paths branch for
+branch (``dc_config(field_name=...)`` renames, the field-level
+``decoder``/``encoder`` hooks, Optional/List/Dict nesting, the
+``infer_missing`` warnings), with a fast path for the JSON shapes the API
+actually returns. Any other input falls back to the dataclasses_json routine
+for that value, and so does everything while a ``dataclasses_json.cfg``
+global encoder/decoder is registered, so results are identical either way.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import typing
+import warnings
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type, TypeVar
+
+import dataclasses_json
+from dataclasses_json import cfg
+from dataclasses_json.core import (
+    _asdict,
+    _decode_dataclass,
+    _decode_generic,
+    _decode_type,
+    _is_supported_generic,
+    _support_extended_types,
+)
+from dataclasses_json.utils import _is_new_type, _is_optional
+
+A = TypeVar("A", bound="DataClassJsonMixin")
+
+# (value, infer_missing) -> decoded value
+Decoder = Callable[[Any, bool], Any]
+# nested dataclass type -> decoder for it; eager here, lazy in getstream.lazy
+ModelDecoder = Callable[[type], Decoder]
+
+_MISSING = dataclasses.MISSING
+_PRIMITIVES = (str, int, float, bool)
+_JSON_TYPES = frozenset({str, int, float, bool, type(None), list, dict})
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+_decoders: Dict[type, Callable[[Any, bool], Any]] = {}
+_encoders: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+_lock = threading.Lock()
+
+
+class DataClassJsonMixin(dataclasses_json.DataClassJsonMixin):
+    """``dataclasses_json.DataClassJsonMixin`` with compiled ``from_dict`` and
+    ``to_dict``. Output is identical to the reflective implementation."""
+
+    @classmethod
+    def from_dict(cls: Type[A], kvs, *, infer_missing=False) -> A:
+        if _has_global_overrides():
+            return _decode_dataclass(cls, kvs, infer_missing)
+        return decoder_for(cls)(kvs, infer_missing)
+
+    def to_dict(self, encode_json=False) -> Dict[str, Any]:
+        if encode_json or _has_global_overrides():
+            return _asdict(self, encode_json=encode_json)
+        return encoder_for(type(self))(self)
+
+
+def decoder_for(cls: type) -> Callable[[Any, bool], Any]:
+    """The compiled equivalent of ``_decode_dataclass(cls, kvs, infer_missing)``."""
+    decoder = _decoders.get(cls)
+    if decoder is None:
+        with _lock:
+            decoder = _decoders.get(cls)
+            if decoder is None:
+                decoder = _compile_decoder(cls)
+                _decoders[cls] = decoder
+    return decoder
+
+
+def encoder_for(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """The compiled equivalent of ``_asdict(obj)`` for instances of ``cls``."""
+    encoder = _encoders.get(cls)
+    if encoder is None:
+        with _lock:
+            encoder = _encoders.get(cls)
+            if encoder is None:
+                encoder = _compile_encoder(cls)
+                _encoders[cls] = encoder
+    return encoder
+
+
+def _has_global_overrides() -> bool:
+    # Type-wide hooks registered through dataclasses_json.cfg apply to every
+    # value, which the compiled functions do not model.
+    config = cfg.global_config
+    return bool(config.encoders or config.decoders)
+
+
+# ── field specs ─────────────────────────────────────────────────────
+
+
+class FieldSpec(NamedTuple):
+    name: str
+    key: str
+    default: Any
+    default_factory: Any
+    optional: bool
+    encoder: Optional[Callable[[Any], Any]]
+    decode: Decoder
+
+
+def field_specs(cls: type, model: ModelDecoder) -> Optional[List[FieldSpec]]:
+    """Per-field decode/encode plan for ``cls``, or ``None`` when the class
+    uses a dataclasses_json feature the compiled path does not cover (class
+    config, ``exclude``, ``init=False`` or clashing JSON keys)."""
+    if getattr(cls, "dataclass_json_config", None) is not None:
+        return None
+    hints = typing.get_type_hints(cls)
+    fields = dataclasses.fields(cls)
+    names = {f.name for f in fields}
+    specs = []
+    for f in fields:
+        config = f.metadata.get("dataclasses_json", {})
+        if not f.init or config.get("exclude") is not None:
+            return None
+        letter_case = config.get("letter_case")
+        key = letter_case(f.name) if letter_case is not None else f.name
+        if key != f.name and key in names:
+            return None
+        field_type = hints[f.name]
+        specs.append(
+            FieldSpec(
+                name=f.name,
+                key=key,
+                default=f.default,
+                default_factory=f.default_factory,
+                optional=_is_optional(field_type),
+                encoder=config.get("encoder"),
+                decode=_field_decoder(field_type, config.get("decoder"), model),
+            )
+        )
+    if len({s.key for s in specs}) != len(specs):
+        return None
+    return specs
+
+
+def _eager_model(tp: type) -> Decoder:
+    # Looked up at call time so self-referencing models compile lazily.
+    def decode(value, infer_missing):
+        return decoder_for(tp)(value, infer_missing)
+
+    return decode
+
+
+# ── decoding ────────────────────────────────────────────────────────
+
+
+def _compile_decoder(cls: type) -> Callable[[Any, bool], Any]:
+    specs = field_specs(cls, _eager_model)
+    if specs is None:
+        return lambda kvs, infer_missing: _decode_dataclass(cls, kvs, infer_missing)
+
+    plan = tuple(
+        (s.name, s.key, s.default, s.default_factory, s.optional, s.decode)
+        for s in specs
+    )
+    # dataclasses_json also accepts a renamed field under its Python name;
+    # such input takes the reflective path, which resolves the precedence.
+    renamed = tuple(s.name for s in specs if s.key != s.name)
+    cls_name = cls.__name__
+
+    def decode(kvs, infer_missing):
+        if type(kvs) is not dict:
+            if _isinstance_safe(kvs, cls):
+                return kvs
+            if kvs is not None or not infer_missing:
+                return _decode_dataclass(cls, kvs, infer_missing)
+            kvs = {}
+        elif renamed and any(name in kvs for name in renamed):
+            return _decode_dataclass(cls, kvs, infer_missing)
+
+        init = {}
+        for name, key, default, default_factory, optional, decode_value in plan:
+            if key in kvs:
+                value = kvs[key]
+            elif default is not _MISSING:
+                value = default
+            elif default_factory is not _MISSING:
+                value = default_factory()
+            elif infer_missing:
+                value = None
+            else:
+                raise KeyError(name)
+
+            if value is None:
+                if not optional:
+                    _warn_none(name, cls_name, infer_missing)
+                init[name] = None
+            else:
+                init[name] = decode_value(value, infer_missing)
+        return cls(**init)
+
+    return decode
+
+
+def _warn_none(name: str, cls_name: str, infer_missing: bool) -> None:
+    warning = f"value of non-optional type {name} detected when decoding {cls_name}"
+    if infer_missing:
+        warnings.warn(
+            f"Missing {warning} and was defaulted to None by "
+            f"infer_missing=True. "
+            f"Set infer_missing=False (the default) to prevent "
+            f"this behavior.",
+            RuntimeWarning,
+        )
+    else:
+        warnings.warn(f"'NoneType' object {warning}.", RuntimeWarning)
+
+
+def _field_decoder(
+    field_type: Any, decoder: Optional[Callable[[Any], Any]], model: ModelDecoder
+) -> Decoder:
+    """Decoder for a non-None value of a model field (the per-field branch of
+    ``_decode_dataclass``)."""
+    while _is_new_type(field_type):
+        field_type = field_type.__supertype__
+
+    if decoder is not None:
+
+        def decode_override(value, infer_missing):
+            # dataclasses_json skips the field decoder for values that already
+            # have the declared type
+            if field_type is type(value):
+                return value
+            return decoder(value)
+
+        return decode_override
+
+    if dataclasses.is_dataclass(field_type):
+        nested = model(field_type)
+
+        def decode_model(value, infer_missing):
+            if dataclasses.is_dataclass(value):
+                return value
+            return nested(value, infer_missing)
+
+        return decode_model
+
+    if _is_supported_generic(field_type) and field_type is not str:
+        return _generic_decoder(field_type, model)
+
+    if field_type in _PRIMITIVES:
+        return lambda value, infer_missing: (
+            value
+            if type(value) is field_type
+            else _support_extended_types(field_type, value)
+        )
+    if field_type is object:
+        return lambda value, infer_missing: value
+    return lambda value, infer_missing: _support_extended_types(field_type, value)
+
+
+def _type_decoder(tp: Any, model: ModelDecoder) -> Decoder:
+    """Decoder for a collection item or Optional payload (``_decode_type``)."""
+    if _is_supported_generic(tp):
+        return _generic_decoder(tp, model)
+    if tp in _PRIMITIVES:
+        return lambda value, infer_missing: (
+            value if type(value) is tp else _decode_type(tp, value, infer_missing)
+        )
+    if tp is object:
+        return lambda value, infer_missing: (
+            value
+            if type(value) in _JSON_TYPES
+            else _decode_type(tp, value, infer_missing)
+        )
+    return lambda value, infer_missing: _decode_type(tp, value, infer_missing)
+
+
+def _generic_decoder(tp: Any, model: ModelDecoder) -> Decoder:
+    """Decoder for Optional/List/Dict and nested model types
+    (``_decode_generic``)."""
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if dataclasses.is_dataclass(tp):
+        # unlike a model-typed field, a null list item or Optional payload
+        # decodes to None rather than to an all-None instance
+        nested = model(tp)
+        return lambda value, infer_missing: (
+            None if value is None else nested(value, infer_missing)
+        )
+
+    if origin is list and len(args) == 1:
+        item = _type_decoder(args[0], model)
+
+        def decode_list(value, infer_missing):
+            if type(value) is not list:
+                return _decode_generic(tp, value, infer_missing)
+            return [item(x, infer_missing) for x in value]
+
+        return decode_list
+
+    if origin is dict and len(args) == 2 and args[0] is str:
+        item = _type_decoder(args[1], model)
+
+        def decode_dict(value, infer_missing):
+            if type(value) is not dict:
+                return _decode_generic(tp, value, infer_missing)
+            return {
+                (k if type(k) is str else str(k)): item(x, infer_missing)
+                for k, x in value.items()
+            }
+
+        return decode_dict
+
+    if origin is typing.Union and len(args) == 2 and type(None) in args:
+        inner = _type_decoder(args[0], model)
+        return lambda value, infer_missing: (
+            None if value is None else inner(value, infer_missing)
+        )
+
+    return lambda value, infer_missing: _decode_generic(tp, value, infer_missing)
+
+
+def _isinstance_safe(o, t) -> bool:
+    try:
+        return isinstance(o, t)
+    except Exception:
+        return False
+
+
+# ── encoding ────────────────────────────────────────────────────────
+
+
+def _compile_encoder(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    specs = field_specs(cls, _eager_model)
+    if specs is None:
+        return _asdict
+    plan = tuple((s.name, s.key, s.encoder) for s in specs)
+
+    def encode(obj):
+        result = {}
+        for name, key, encoder in plan:
+            value = getattr(obj, name)
+            if encoder is not None:
+                result[key] = encoder(value)
+            else:
+                result[key] = _encode_value(value)
+        return result
+
+    return encode
+
+
+def _encode_value(value: Any) -> Any:
+    """``_asdict(value)`` for a field value without an encoder hook."""
+    t = type(value)
+    if t in _SCALARS:
+        return value
+    if t is list:
+        return [_encode_value(v) for v in value]
+    if t is dict:
+        return {_encode_value(k): _encode_value(v) for k, v in value.items()}
+    if dataclasses.is_dataclass(t):
+        return encoder_for(t)(value)
+    return _asdict(value)
+
+
+__all__ = ["DataClassJsonMixin", "decoder_for", "encoder_for"]
@@ -1,10 +1,20 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional
+
+from getstream import models
 from getstream.base import AsyncBaseClient
 from getstream.common import telemetry
-from getstream.models import *
+from getstream.pagination import apaginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from getstream.models import *
+
 
 class CommonRestClient(AsyncBaseClient):
     def __init__(
@@ -33,7 +43,7 @@ class CommonRestClient(AsyncBaseClient):
 
     @telemetry.operation_name("getstream.api.common.get_app")
     async def get_app(self) -> StreamResponse[GetApplicationResponse]:
-        return await self.get("/api/v2/app", GetApplicationResponse)
+        return await self.get("/api/v2/app", models.GetApplicationResponse)
 
     @telemetry.operation_name("getstream.api.common.update_app")
     async def update_app(
@@ -97,7 +107,7 @@ class CommonRestClient(AsyncBaseClient):
         push_config: Optional[PushConfig] = None,
         xiaomi_config: Optional[XiaomiConfig] = None,
     ) -> StreamResponse[Response]:
-        json = UpdateAppRequest(
+        json = models.UpdateAppRequest(
             async_url_enrich_enabled=async_url_enrich_enabled,
             auto_translation_enabled=auto_translation_enabled,
             before_message_send_hook_attempt_timeout_ms=before_message_send_hook_attempt_timeout_ms,
@@ -155,7 +165,7 @@ class CommonRestClient(AsyncBaseClient):
             push_config=push_config,
             xiaomi_config=xiaomi_config,
         ).to_dict()
-        return await self.patch("/api/v2/app", Response, json=json)
+        return await self.patch("/api/v2/app", models.Response, json=json)
 
     @telemetry.operation_name("getstream.api.common.list_block_lists")
     async def list_block_lists(
@@ -163,7 +173,9 @@ class CommonRestClient(AsyncBaseClient):
     ) -> StreamResponse[ListBlockListResponse]:
         query_params = build_query_param(**{"team": team})
         return await self.get(
-            "/api/v2/blocklists", ListBlockListResponse, query_params=query_params
+            "/api/v2/blocklists",
+            models.ListBlockListResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.create_block_list")
@@ -178,7 +190,7 @@ class CommonRestClient(AsyncBaseClient):
         team: Optional[str] = None,
         type: Optional[str] = None,
     ) -> StreamResponse[CreateBlockListResponse]:
-        json = CreateBlockListRequest(
+        json = models.CreateBlockListRequest(
             name=name,
             words=words,
             is_confusable_folding_enabled=is_confusable_folding_enabled,
@@ -188,7 +200,9 @@ class CommonRestClient(AsyncBaseClient):
             team=team,
             type=type,
         ).to_dict()
-        return await self.post("/api/v2/blocklists", CreateBlockListResponse, json=json)
+        return await self.post(
+            "/api/v2/blocklists", models.CreateBlockListResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.delete_block_list")
     async def delete_block_list(
@@ -200,7 +214,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.delete(
             "/api/v2/blocklists/{name}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -215,7 +229,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.get(
             "/api/v2/blocklists/{name}",
-            GetBlockListResponse,
+            models.GetBlockListResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -234,7 +248,7 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "name": name,
         }
-        json = UpdateBlockListRequest(
+        json = models.UpdateBlockListRequest(
             is_confusable_folding_enabled=is_confusable_folding_enabled,
             is_leet_check_enabled=is_leet_check_enabled,
             is_plural_check_enabled=is_plural_check_enabled,
@@ -244,7 +258,7 @@ class CommonRestClient(AsyncBaseClient):
         ).to_dict()
         return await self.put(
             "/api/v2/blocklists/{name}",
-            UpdateBlockListResponse,
+            models.UpdateBlockListResponse,
             path_params=path_params,
             json=json,
         )
@@ -263,7 +277,7 @@ class CommonRestClient(AsyncBaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[CheckPushResponse]:
-        json = CheckPushRequest(
+        json = models.CheckPushRequest(
             apn_template=apn_template,
             event_type=event_type,
             firebase_data_template=firebase_data_template,
@@ -275,7 +289,9 @@ class CommonRestClient(AsyncBaseClient):
             user_id=user_id,
             user=user,
         ).to_dict()
-        return await self.post("/api/v2/check_push", CheckPushResponse, json=json)
+        return await self.post(
+            "/api/v2/check_push", models.CheckPushResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.check_sns")
     async def check_sns(
@@ -284,10 +300,10 @@ class CommonRestClient(AsyncBaseClient):
         sns_secret: Optional[str] = None,
         sns_topic_arn: Optional[str] = None,
     ) -> StreamResponse[CheckSNSResponse]:
-        json = CheckSNSRequest(
+        json = models.CheckSNSRequest(
             sns_key=sns_key, sns_secret=sns_secret, sns_topic_arn=sns_topic_arn
         ).to_dict()
-        return await self.post("/api/v2/check_sns", CheckSNSResponse, json=json)
+        return await self.post("/api/v2/check_sns", models.CheckSNSResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.check_sqs")
     async def check_sqs(
@@ -296,17 +312,19 @@ class CommonRestClient(AsyncBaseClient):
         sqs_secret: Optional[str] = None,
         sqs_url: Optional[str] = None,
     ) -> StreamResponse[CheckSQSResponse]:
-        json = CheckSQSRequest(
+        json = models.CheckSQSRequest(
             sqs_key=sqs_key, sqs_secret=sqs_secret, sqs_url=sqs_url
         ).to_dict()
-        return await self.post("/api/v2/check_sqs", CheckSQSResponse, json=json)
+        return await self.post("/api/v2/check_sqs", models.CheckSQSResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.delete_device")
     async def delete_device(
         self, id: str, user_id: Optional[str] = None
     ) -> StreamResponse[Response]:
         query_params = build_query_param(**{"id": id, "user_id": user_id})
-        return await self.delete("/api/v2/devices", Response, query_params=query_params)
+        return await self.delete(
+            "/api/v2/devices", models.Response, query_params=query_params
+        )
 
     @telemetry.operation_name("getstream.api.common.list_devices")
     async def list_devices(
@@ -314,7 +332,7 @@ class CommonRestClient(AsyncBaseClient):
     ) -> StreamResponse[ListDevicesResponse]:
         query_params = build_query_param(**{"user_id": user_id})
         return await self.get(
-            "/api/v2/devices", ListDevicesResponse, query_params=query_params
+            "/api/v2/devices", models.ListDevicesResponse, query_params=query_params
         )
 
     @telemetry.operation_name("getstream.api.common.create_device")
@@ -328,7 +346,7 @@ class CommonRestClient(AsyncBaseClient):
         voip_token: Optional[bool] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[Response]:
-        json = CreateDeviceRequest(
+        json = models.CreateDeviceRequest(
             id=id,
             push_provider=push_provider,
             hardware_id=hardware_id,
@@ -337,20 +355,24 @@ class CommonRestClient(AsyncBaseClient):
             voip_token=voip_token,
             user=user,
         ).to_dict()
-        return await self.post("/api/v2/devices", Response, json=json)
+        return await self.post("/api/v2/devices", models.Response, json=json)
 
     @telemetry.operation_name("getstream.api.common.export_users")
     async def export_users(
         self, user_ids: List[str]
     ) -> StreamResponse[ExportUsersResponse]:
-        json = ExportUsersRequest(user_ids=user_ids).to_dict()
-        return await self.post("/api/v2/export/users", ExportUsersResponse, json=json)
+        json = models.ExportUsersRequest(user_ids=user_ids).to_dict()
+        return await self.post(
+            "/api/v2/export/users", models.ExportUsersResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.list_external_storage")
     async def list_external_storage(
         self,
     ) -> StreamResponse[ListExternalStorageResponse]:
-        return await self.get("/api/v2/external_storage", ListExternalStorageResponse)
+        return await self.get(
+            "/api/v2/external_storage", models.ListExternalStorageResponse
+        )
 
     @telemetry.operation_name("getstream.api.common.create_external_storage")
     async def create_external_storage(
@@ -363,7 +385,7 @@ class CommonRestClient(AsyncBaseClient):
         aws_s3: Optional[S3Request] = None,
         azure_blob: Optional[AzureRequest] = None,
     ) -> StreamResponse[CreateExternalStorageResponse]:
-        json = CreateExternalStorageRequest(
+        json = models.CreateExternalStorageRequest(
             bucket=bucket,
             name=name,
             storage_type=storage_type,
@@ -373,7 +395,7 @@ class CommonRestClient(AsyncBaseClient):
             azure_blob=azure_blob,
         ).to_dict()
         return await self.post(
-            "/api/v2/external_storage", CreateExternalStorageResponse, json=json
+            "/api/v2/external_storage", models.CreateExternalStorageResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.delete_external_storage")
@@ -385,7 +407,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.delete(
             "/api/v2/external_storage/{name}",
-            DeleteExternalStorageResponse,
+            models.DeleteExternalStorageResponse,
             path_params=path_params,
         )
 
@@ -403,7 +425,7 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "name": name,
         }
-        json = UpdateExternalStorageRequest(
+        json = models.UpdateExternalStorageRequest(
             bucket=bucket,
             storage_type=storage_type,
             gcs_credentials=gcs_credentials,
@@ -413,7 +435,7 @@ class CommonRestClient(AsyncBaseClient):
         ).to_dict()
         return await self.put(
             "/api/v2/external_storage/{name}",
-            UpdateExternalStorageResponse,
+            models.UpdateExternalStorageResponse,
             path_params=path_params,
             json=json,
         )
@@ -427,7 +449,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.get(
             "/api/v2/external_storage/{name}/check",
-            CheckExternalStorageResponse,
+            models.CheckExternalStorageResponse,
             path_params=path_params,
         )
 
@@ -435,30 +457,32 @@ class CommonRestClient(AsyncBaseClient):
     async def create_guest(
         self, user: UserRequest
     ) -> StreamResponse[CreateGuestResponse]:
-        json = CreateGuestRequest(user=user).to_dict()
-        return await self.post("/api/v2/guest", CreateGuestResponse, json=json)
+        json = models.CreateGuestRequest(user=user).to_dict()
+        return await self.post("/api/v2/guest", models.CreateGuestResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.create_import_url")
     async def create_import_url(
         self, filename: Optional[str] = None
     ) -> StreamResponse[CreateImportURLResponse]:
-        json = CreateImportURLRequest(filename=filename).to_dict()
+        json = models.CreateImportURLRequest(filename=filename).to_dict()
         return await self.post(
-            "/api/v2/import_urls", CreateImportURLResponse, json=json
+            "/api/v2/import_urls", models.CreateImportURLResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.list_imports")
     async def list_imports(self) -> StreamResponse[ListImportsResponse]:
-        return await self.get("/api/v2/imports", ListImportsResponse)
+        return await self.get("/api/v2/imports", models.ListImportsResponse)
 
     @telemetry.operation_name("getstream.api.common.create_import")
     async def create_import(
         self, mode: str, path: str, merge_custom: Optional[bool] = None
     ) -> StreamResponse[CreateImportResponse]:
-        json = CreateImportRequest(
+        json = models.CreateImportRequest(
             mode=mode, path=path, merge_custom=merge_custom
         ).to_dict()
-        return await self.post("/api/v2/imports", CreateImportResponse, json=json)
+        return await self.post(
+            "/api/v2/imports", models.CreateImportResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.list_import_v2_tasks")
     async def list_import_v2_tasks(
@@ -466,7 +490,9 @@ class CommonRestClient(AsyncBaseClient):
     ) -> StreamResponse[ListImportV2TasksResponse]:
         query_params = build_query_param(**{"state": state})
         return await self.get(
-            "/api/v2/imports/v2", ListImportV2TasksResponse, query_params=query_params
+            "/api/v2/imports/v2",
+            models.ListImportV2TasksResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.create_import_v2_task")
@@ -477,11 +503,11 @@ class CommonRestClient(AsyncBaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[CreateImportV2TaskResponse]:
-        json = CreateImportV2TaskRequest(
+        json = models.CreateImportV2TaskRequest(
             product=product, settings=settings, user_id=user_id, user=user
         ).to_dict()
         return await self.post(
-            "/api/v2/imports/v2", CreateImportV2TaskResponse, json=json
+            "/api/v2/imports/v2", models.CreateImportV2TaskResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.delete_importer_external_storage")
@@ -489,7 +515,7 @@ class CommonRestClient(AsyncBaseClient):
         self,
     ) -> StreamResponse[DeleteExternalStorageResponse]:
         return await self.delete(
-            "/api/v2/imports/v2/external-storage", DeleteExternalStorageResponse
+            "/api/v2/imports/v2/external-storage", models.DeleteExternalStorageResponse
         )
 
     @telemetry.operation_name("getstream.api.common.get_importer_external_storage")
@@ -497,17 +523,17 @@ class CommonRestClient(AsyncBaseClient):
         self,
     ) -> StreamResponse[GetExternalStorageResponse]:
         return await self.get(
-            "/api/v2/imports/v2/external-storage", GetExternalStorageResponse
+            "/api/v2/imports/v2/external-storage", models.GetExternalStorageResponse
         )
 
     @telemetry.operation_name("getstream.api.common.upsert_importer_external_storage")
     async def upsert_importer_external_storage(
         self, type: str, aws_s3: Optional[UpsertExternalStorageAWSS3Request] = None
     ) -> StreamResponse[UpsertExternalStorageResponse]:
-        json = UpsertExternalStorageRequest(type=type, aws_s3=aws_s3).to_dict()
+        json = models.UpsertExternalStorageRequest(type=type, aws_s3=aws_s3).to_dict()
         return await self.put(
             "/api/v2/imports/v2/external-storage",
-            UpsertExternalStorageResponse,
+            models.UpsertExternalStorageResponse,
             json=json,
         )
 
@@ -517,7 +543,7 @@ class CommonRestClient(AsyncBaseClient):
     ) -> StreamResponse[ValidateExternalStorageResponse]:
         return await self.post(
             "/api/v2/imports/v2/external-storage/validate",
-            ValidateExternalStorageResponse,
+            models.ValidateExternalStorageResponse,
         )
 
     @telemetry.operation_name("getstream.api.common.delete_import_v2_task")
@@ -529,7 +555,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.delete(
             "/api/v2/imports/v2/{id}",
-            DeleteImportV2TaskResponse,
+            models.DeleteImportV2TaskResponse,
             path_params=path_params,
         )
 
@@ -541,7 +567,9 @@ class CommonRestClient(AsyncBaseClient):
             "id": id,
         }
         return await self.get(
-            "/api/v2/imports/v2/{id}", GetImportV2TaskResponse, path_params=path_params
+            "/api/v2/imports/v2/{id}",
+            models.GetImportV2TaskResponse,
+            path_params=path_params,
         )
 
     @telemetry.operation_name("getstream.api.common.cancel_import_v2_task")
@@ -553,7 +581,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.post(
             "/api/v2/imports/v2/{id}/cancel",
-            CancelImportV2TaskResponse,
+            models.CancelImportV2TaskResponse,
             path_params=path_params,
         )
 
@@ -563,17 +591,19 @@ class CommonRestClient(AsyncBaseClient):
             "id": id,
         }
         return await self.get(
-            "/api/v2/imports/{id}", GetImportResponse, path_params=path_params
+            "/api/v2/imports/{id}", models.GetImportResponse, path_params=path_params
         )
 
     @telemetry.operation_name("getstream.api.common.get_og")
     async def get_og(self, url: str) -> StreamResponse[GetOGResponse]:
         query_params = build_query_param(**{"url": url})
-        return await self.get("/api/v2/og", GetOGResponse, query_params=query_params)
+        return await self.get(
+            "/api/v2/og", models.GetOGResponse, query_params=query_params
+        )
 
     @telemetry.operation_name("getstream.api.common.list_permissions")
     async def list_permissions(self) -> StreamResponse[ListPermissionsResponse]:
-        return await self.get("/api/v2/permissions", ListPermissionsResponse)
+        return await self.get("/api/v2/permissions", models.ListPermissionsResponse)
 
     @telemetry.operation_name("getstream.api.common.get_permission")
     async def get_permission(
@@ -584,7 +614,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.get(
             "/api/v2/permissions/{id}",
-            GetCustomPermissionResponse,
+            models.GetCustomPermissionResponse,
             path_params=path_params,
         )
 
@@ -605,7 +635,7 @@ class CommonRestClient(AsyncBaseClient):
         custom: Optional[Dict[str, object]] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[PollResponse]:
-        json = CreatePollRequest(
+        json = models.CreatePollRequest(
             name=name,
             allow_answers=allow_answers,
             allow_user_suggested_options=allow_user_suggested_options,
@@ -620,7 +650,7 @@ class CommonRestClient(AsyncBaseClient):
             custom=custom,
             user=user,
         ).to_dict()
-        return await self.post("/api/v2/polls", PollResponse, json=json)
+        return await self.post("/api/v2/polls", models.PollResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.update_poll")
     async def update_poll(
@@ -639,7 +669,7 @@ class CommonRestClient(AsyncBaseClient):
         custom: Optional[Dict[str, object]] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[PollResponse]:
-        json = UpdatePollRequest(
+        json = models.UpdatePollRequest(
             id=id,
             name=name,
             allow_answers=allow_answers,
@@ -654,7 +684,7 @@ class CommonRestClient(AsyncBaseClient):
             custom=custom,
             user=user,
         ).to_dict()
-        return await self.put("/api/v2/polls", PollResponse, json=json)
+        return await self.put("/api/v2/polls", models.PollResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.query_polls")
     async def query_polls(
@@ -667,16 +697,34 @@ class CommonRestClient(AsyncBaseClient):
         filter: Optional[Dict[str, object]] = None,
     ) -> StreamResponse[QueryPollsResponse]:
         query_params = build_query_param(**{"user_id": user_id})
-        json = QueryPollsRequest(
+        json = models.QueryPollsRequest(
             limit=limit, next=next, prev=prev, sort=sort, filter=filter
         ).to_dict()
         return await self.post(
             "/api/v2/polls/query",
-            QueryPollsResponse,
+            models.QueryPollsResponse,
             query_params=query_params,
             json=json,
         )
 
+    def aiter_query_polls(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[PollResponseData]:
+        return apaginate(
+            self.query_polls,
+            "polls",
+            prefetch=prefetch,
+            user_id=user_id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.common.delete_poll")
     async def delete_poll(
         self, poll_id: str, user_id: Optional[str] = None
@@ -687,7 +735,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.delete(
             "/api/v2/polls/{poll_id}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -702,7 +750,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.get(
             "/api/v2/polls/{poll_id}",
-            PollResponse,
+            models.PollResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -719,11 +767,14 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = UpdatePollPartialRequest(
+        json = models.UpdatePollPartialRequest(
             user_id=user_id, unset=unset, set=set, user=user
         ).to_dict()
         return await self.patch(
-            "/api/v2/polls/{poll_id}", PollResponse, path_params=path_params, json=json
+            "/api/v2/polls/{poll_id}",
+            models.PollResponse,
+            path_params=path_params,
+            json=json,
         )
 
     @telemetry.operation_name("getstream.api.common.create_poll_option")
@@ -738,12 +789,12 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = CreatePollOptionRequest(
+        json = models.CreatePollOptionRequest(
             text=text, user_id=user_id, custom=custom, user=user
         ).to_dict()
         return await self.post(
             "/api/v2/polls/{poll_id}/options",
-            PollOptionResponse,
+            models.PollOptionResponse,
             path_params=path_params,
             json=json,
         )
@@ -761,12 +812,12 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = UpdatePollOptionRequest(
+        json = models.UpdatePollOptionRequest(
             id=id, text=text, user_id=user_id, custom=custom, user=user
         ).to_dict()
         return await self.put(
             "/api/v2/polls/{poll_id}/options",
-            PollOptionResponse,
+            models.PollOptionResponse,
             path_params=path_params,
             json=json,
         )
@@ -782,7 +833,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.delete(
             "/api/v2/polls/{poll_id}/options/{option_id}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -798,7 +849,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.get(
             "/api/v2/polls/{poll_id}/options/{option_id}",
-            PollOptionResponse,
+            models.PollOptionResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -818,39 +869,61 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = QueryPollVotesRequest(
+        json = models.QueryPollVotesRequest(
             limit=limit, next=next, prev=prev, sort=sort, filter=filter
         ).to_dict()
         return await self.post(
             "/api/v2/polls/{poll_id}/votes",
-            PollVotesResponse,
+            models.PollVotesResponse,
             query_params=query_params,
             path_params=path_params,
             json=json,
         )
 
+    def aiter_query_poll_votes(
+        self,
+        poll_id: str,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[PollVoteResponseData]:
+        return apaginate(
+            self.query_poll_votes,
+            "votes",
+            prefetch=prefetch,
+            poll_id=poll_id,
+            user_id=user_id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name(
         "getstream.api.common.update_push_notification_preferences"
     )
     async def update_push_notification_preferences(
         self, preferences: List[PushPreferenceInput]
     ) -> StreamResponse[UpsertPushPreferencesResponse]:
-        json = UpsertPushPreferencesRequest(preferences=preferences).to_dict()
+        json = models.UpsertPushPreferencesRequest(preferences=preferences).to_dict()
         return await self.post(
-            "/api/v2/push_preferences", UpsertPushPreferencesResponse, json=json
+            "/api/v2/push_preferences", models.UpsertPushPreferencesResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.list_push_providers")
     async def list_push_providers(self) -> StreamResponse[ListPushProvidersResponse]:
-        return await self.get("/api/v2/push_providers", ListPushProvidersResponse)
+        return await self.get(
+            "/api/v2/push_providers", models.ListPushProvidersResponse
+        )
 
     @telemetry.operation_name("getstream.api.common.upsert_push_provider")
     async def upsert_push_provider(
         self, push_provider: Optional[PushProviderRequest] = None
     ) -> StreamResponse[UpsertPushProviderResponse]:
-        json = UpsertPushProviderRequest(push_provider=push_provider).to_dict()
+        json = models.UpsertPushProviderRequest(push_provider=push_provider).to_dict()
         return await self.post(
-            "/api/v2/push_providers", UpsertPushProviderResponse, json=json
+            "/api/v2/push_providers", models.UpsertPushProviderResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.delete_push_provider")
@@ -862,7 +935,9 @@ class CommonRestClient(AsyncBaseClient):
             "name": name,
         }
         return await self.delete(
-            "/api/v2/push_providers/{type}/{name}", Response, path_params=path_params
+            "/api/v2/push_providers/{type}/{name}",
+            models.Response,
+            path_params=path_params,
         )
 
     @telemetry.operation_name("getstream.api.common.get_push_templates")
@@ -877,7 +952,7 @@ class CommonRestClient(AsyncBaseClient):
         )
         return await self.get(
             "/api/v2/push_templates",
-            GetPushTemplatesResponse,
+            models.GetPushTemplatesResponse,
             query_params=query_params,
         )
 
@@ -890,7 +965,7 @@ class CommonRestClient(AsyncBaseClient):
         push_provider_name: Optional[str] = None,
         template: Optional[str] = None,
     ) -> StreamResponse[UpsertPushTemplateResponse]:
-        json = UpsertPushTemplateRequest(
+        json = models.UpsertPushTemplateRequest(
             event_type=event_type,
             push_provider_type=push_provider_type,
             enable_push=enable_push,
@@ -898,7 +973,7 @@ class CommonRestClient(AsyncBaseClient):
             template=template,
         ).to_dict()
         return await self.post(
-            "/api/v2/push_templates", UpsertPushTemplateResponse, json=json
+            "/api/v2/push_templates", models.UpsertPushTemplateResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.get_rate_limits")
@@ -920,17 +995,19 @@ class CommonRestClient(AsyncBaseClient):
             }
         )
         return await self.get(
-            "/api/v2/rate_limits", GetRateLimitsResponse, query_params=query_params
+            "/api/v2/rate_limits",
+            models.GetRateLimitsResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.list_roles")
     async def list_roles(self) -> StreamResponse[ListRolesResponse]:
-        return await self.get("/api/v2/roles", ListRolesResponse)
+        return await self.get("/api/v2/roles", models.ListRolesResponse)
 
     @telemetry.operation_name("getstream.api.common.create_role")
     async def create_role(self, name: str) -> StreamResponse[CreateRoleResponse]:
-        json = CreateRoleRequest(name=name).to_dict()
-        return await self.post("/api/v2/roles", CreateRoleResponse, json=json)
+        json = models.CreateRoleRequest(name=name).to_dict()
+        return await self.post("/api/v2/roles", models.CreateRoleResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.search_roles")
     async def search_roles(
@@ -951,7 +1028,9 @@ class CommonRestClient(AsyncBaseClient):
             }
         )
         return await self.get(
-            "/api/v2/roles/search", SearchRolesResponse, query_params=query_params
+            "/api/v2/roles/search",
+            models.SearchRolesResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.delete_role")
@@ -960,7 +1039,7 @@ class CommonRestClient(AsyncBaseClient):
             "name": name,
         }
         return await self.delete(
-            "/api/v2/roles/{name}", Response, path_params=path_params
+            "/api/v2/roles/{name}", models.Response, path_params=path_params
         )
 
     @telemetry.operation_name("getstream.api.common.get_task")
@@ -969,28 +1048,30 @@ class CommonRestClient(AsyncBaseClient):
             "id": id,
         }
         return await self.get(
-            "/api/v2/tasks/{id}", GetTaskResponse, path_params=path_params
+            "/api/v2/tasks/{id}", models.GetTaskResponse, path_params=path_params
         )
 
     @telemetry.operation_name("getstream.api.common.delete_file")
     async def delete_file(self, url: Optional[str] = None) -> StreamResponse[Response]:
         query_params = build_query_param(**{"url": url})
         return await self.delete(
-            "/api/v2/uploads/file", Response, query_params=query_params
+            "/api/v2/uploads/file", models.Response, query_params=query_params
         )
 
     @telemetry.operation_name("getstream.api.common.upload_file")
     async def upload_file(
         self, file: Optional[str] = None, user: Optional[OnlyUserID] = None
     ) -> StreamResponse[FileUploadResponse]:
-        json = FileUploadRequest(file=file, user=user).to_dict()
-        return await self.post("/api/v2/uploads/file", FileUploadResponse, json=json)
+        json = models.FileUploadRequest(file=file, user=user).to_dict()
+        return await self.post(
+            "/api/v2/uploads/file", models.FileUploadResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.delete_image")
     async def delete_image(self, url: Optional[str] = None) -> StreamResponse[Response]:
         query_params = build_query_param(**{"url": url})
         return await self.delete(
-            "/api/v2/uploads/image", Response, query_params=query_params
+            "/api/v2/uploads/image", models.Response, query_params=query_params
         )
 
     @telemetry.operation_name("getstream.api.common.upload_image")
@@ -1000,10 +1081,12 @@ class CommonRestClient(AsyncBaseClient):
         upload_sizes: Optional[List[ImageSize]] = None,
         user: Optional[OnlyUserID] = None,
     ) -> StreamResponse[ImageUploadResponse]:
-        json = ImageUploadRequest(
+        json = models.ImageUploadRequest(
             file=file, upload_sizes=upload_sizes, user=user
         ).to_dict()
-        return await self.post("/api/v2/uploads/image", ImageUploadResponse, json=json)
+        return await self.post(
+            "/api/v2/uploads/image", models.ImageUploadResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.list_user_groups")
     async def list_user_groups(
@@ -1022,7 +1105,9 @@ class CommonRestClient(AsyncBaseClient):
             }
         )
         return await self.get(
-            "/api/v2/usergroups", ListUserGroupsResponse, query_params=query_params
+            "/api/v2/usergroups",
+            models.ListUserGroupsResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.create_user_group")
@@ -1034,14 +1119,16 @@ class CommonRestClient(AsyncBaseClient):
         team_id: Optional[str] = None,
         member_ids: Optional[List[str]] = None,
     ) -> StreamResponse[CreateUserGroupResponse]:
-        json = CreateUserGroupRequest(
+        json = models.CreateUserGroupRequest(
             name=name,
             description=description,
             id=id,
             team_id=team_id,
             member_ids=member_ids,
         ).to_dict()
-        return await self.post("/api/v2/usergroups", CreateUserGroupResponse, json=json)
+        return await self.post(
+            "/api/v2/usergroups", models.CreateUserGroupResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.search_user_groups")
     async def search_user_groups(
@@ -1063,7 +1150,7 @@ class CommonRestClient(AsyncBaseClient):
         )
         return await self.get(
             "/api/v2/usergroups/search",
-            SearchUserGroupsResponse,
+            models.SearchUserGroupsResponse,
             query_params=query_params,
         )
 
@@ -1077,7 +1164,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.delete(
             "/api/v2/usergroups/{id}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -1092,7 +1179,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.get(
             "/api/v2/usergroups/{id}",
-            GetUserGroupResponse,
+            models.GetUserGroupResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -1108,12 +1195,12 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "id": id,
         }
-        json = UpdateUserGroupRequest(
+        json = models.UpdateUserGroupRequest(
             description=description, name=name, team_id=team_id
         ).to_dict()
         return await self.put(
             "/api/v2/usergroups/{id}",
-            UpdateUserGroupResponse,
+            models.UpdateUserGroupResponse,
             path_params=path_params,
             json=json,
         )
@@ -1129,12 +1216,12 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "id": id,
         }
-        json = AddUserGroupMembersRequest(
+        json = models.AddUserGroupMembersRequest(
             member_ids=member_ids, as_admin=as_admin, team_id=team_id
         ).to_dict()
         return await self.post(
             "/api/v2/usergroups/{id}/members",
-            AddUserGroupMembersResponse,
+            models.AddUserGroupMembersResponse,
             path_params=path_params,
             json=json,
         )
@@ -1146,12 +1233,12 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "id": id,
         }
-        json = RemoveUserGroupMembersRequest(
+        json = models.RemoveUserGroupMembersRequest(
             member_ids=member_ids, team_id=team_id
         ).to_dict()
         return await self.post(
             "/api/v2/usergroups/{id}/members/delete",
-            RemoveUserGroupMembersResponse,
+            models.RemoveUserGroupMembersResponse,
             path_params=path_params,
             json=json,
         )
@@ -1162,22 +1249,22 @@ class CommonRestClient(AsyncBaseClient):
     ) -> StreamResponse[QueryUsersResponse]:
         query_params = build_query_param(**{"payload": payload})
         return await self.get(
-            "/api/v2/users", QueryUsersResponse, query_params=query_params
+            "/api/v2/users", models.QueryUsersResponse, query_params=query_params
         )
 
     @telemetry.operation_name("getstream.api.common.update_users_partial")
     async def update_users_partial(
         self, users: List[UpdateUserPartialRequest]
     ) -> StreamResponse[UpdateUsersResponse]:
-        json = UpdateUsersPartialRequest(users=users).to_dict()
-        return await self.patch("/api/v2/users", UpdateUsersResponse, json=json)
+        json = models.UpdateUsersPartialRequest(users=users).to_dict()
+        return await self.patch("/api/v2/users", models.UpdateUsersResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.update_users")
     async def update_users(
         self, users: Dict[str, UserRequest]
     ) -> StreamResponse[UpdateUsersResponse]:
-        json = UpdateUsersRequest(users=users).to_dict()
-        return await self.post("/api/v2/users", UpdateUsersResponse, json=json)
+        json = models.UpdateUsersRequest(users=users).to_dict()
+        return await self.post("/api/v2/users", models.UpdateUsersResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.get_blocked_users")
     async def get_blocked_users(
@@ -1185,7 +1272,9 @@ class CommonRestClient(AsyncBaseClient):
     ) -> StreamResponse[GetBlockedUsersResponse]:
         query_params = build_query_param(**{"user_id": user_id})
         return await self.get(
-            "/api/v2/users/block", GetBlockedUsersResponse, query_params=query_params
+            "/api/v2/users/block",
+            models.GetBlockedUsersResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.block_users")
@@ -1195,10 +1284,12 @@ class CommonRestClient(AsyncBaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[BlockUsersResponse]:
-        json = BlockUsersRequest(
+        json = models.BlockUsersRequest(
             blocked_user_id=blocked_user_id, user_id=user_id, user=user
         ).to_dict()
-        return await self.post("/api/v2/users/block", BlockUsersResponse, json=json)
+        return await self.post(
+            "/api/v2/users/block", models.BlockUsersResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.deactivate_users")
     async def deactivate_users(
@@ -1208,14 +1299,14 @@ class CommonRestClient(AsyncBaseClient):
         mark_channels_deleted: Optional[bool] = None,
         mark_messages_deleted: Optional[bool] = None,
     ) -> StreamResponse[DeactivateUsersResponse]:
-        json = DeactivateUsersRequest(
+        json = models.DeactivateUsersRequest(
             user_ids=user_ids,
             created_by_id=created_by_id,
             mark_channels_deleted=mark_channels_deleted,
             mark_messages_deleted=mark_messages_deleted,
         ).to_dict()
         return await self.post(
-            "/api/v2/users/deactivate", DeactivateUsersResponse, json=json
+            "/api/v2/users/deactivate", models.DeactivateUsersResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.delete_users")
@@ -1230,7 +1321,7 @@ class CommonRestClient(AsyncBaseClient):
         new_channel_owner_id: Optional[str] = None,
         user: Optional[str] = None,
     ) -> StreamResponse[DeleteUsersResponse]:
-        json = DeleteUsersRequest(
+        json = models.DeleteUsersRequest(
             user_ids=user_ids,
             calls=calls,
             conversations=conversations,
@@ -1240,7 +1331,9 @@ class CommonRestClient(AsyncBaseClient):
             new_channel_owner_id=new_channel_owner_id,
             user=user,
         ).to_dict()
-        return await self.post("/api/v2/users/delete", DeleteUsersResponse, json=json)
+        return await self.post(
+            "/api/v2/users/delete", models.DeleteUsersResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.get_user_live_locations")
     async def get_user_live_locations(
@@ -1249,7 +1342,7 @@ class CommonRestClient(AsyncBaseClient):
         query_params = build_query_param(**{"user_id": user_id})
         return await self.get(
             "/api/v2/users/live_locations",
-            SharedLocationsResponse,
+            models.SharedLocationsResponse,
             query_params=query_params,
         )
 
@@ -1263,12 +1356,12 @@ class CommonRestClient(AsyncBaseClient):
         user_id: Optional[str] = None,
     ) -> StreamResponse[SharedLocationResponse]:
         query_params = build_query_param(**{"user_id": user_id})
-        json = UpdateLiveLocationRequest(
+        json = models.UpdateLiveLocationRequest(
             message_id=message_id, end_at=end_at, latitude=latitude, longitude=longitude
         ).to_dict()
         return await self.put(
             "/api/v2/users/live_locations",
-            SharedLocationResponse,
+            models.SharedLocationResponse,
             query_params=query_params,
             json=json,
         )
@@ -1281,20 +1374,20 @@ class CommonRestClient(AsyncBaseClient):
         restore_channels: Optional[bool] = None,
         restore_messages: Optional[bool] = None,
     ) -> StreamResponse[ReactivateUsersResponse]:
-        json = ReactivateUsersRequest(
+        json = models.ReactivateUsersRequest(
             user_ids=user_ids,
             created_by_id=created_by_id,
             restore_channels=restore_channels,
             restore_messages=restore_messages,
         ).to_dict()
         return await self.post(
-            "/api/v2/users/reactivate", ReactivateUsersResponse, json=json
+            "/api/v2/users/reactivate", models.ReactivateUsersResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.restore_users")
     async def restore_users(self, user_ids: List[str]) -> StreamResponse[Response]:
-        json = RestoreUsersRequest(user_ids=user_ids).to_dict()
-        return await self.post("/api/v2/users/restore", Response, json=json)
+        json = models.RestoreUsersRequest(user_ids=user_ids).to_dict()
+        return await self.post("/api/v2/users/restore", models.Response, json=json)
 
     @telemetry.operation_name("getstream.api.common.unblock_users")
     async def unblock_users(
@@ -1303,10 +1396,12 @@ class CommonRestClient(AsyncBaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[UnblockUsersResponse]:
-        json = UnblockUsersRequest(
+        json = models.UnblockUsersRequest(
             blocked_user_id=blocked_user_id, user_id=user_id, user=user
         ).to_dict()
-        return await self.post("/api/v2/users/unblock", UnblockUsersResponse, json=json)
+        return await self.post(
+            "/api/v2/users/unblock", models.UnblockUsersResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.deactivate_user")
     async def deactivate_user(
@@ -1318,12 +1413,12 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "user_id": user_id,
         }
-        json = DeactivateUserRequest(
+        json = models.DeactivateUserRequest(
             created_by_id=created_by_id, mark_messages_deleted=mark_messages_deleted
         ).to_dict()
         return await self.post(
             "/api/v2/users/{user_id}/deactivate",
-            DeactivateUserResponse,
+            models.DeactivateUserResponse,
             path_params=path_params,
             json=json,
         )
@@ -1335,7 +1430,7 @@ class CommonRestClient(AsyncBaseClient):
         }
         return await self.get(
             "/api/v2/users/{user_id}/export",
-            ExportUserResponse,
+            models.ExportUserResponse,
             path_params=path_params,
         )
 
@@ -1350,12 +1445,12 @@ class CommonRestClient(AsyncBaseClient):
         path_params = {
             "user_id": user_id,
         }
-        json = ReactivateUserRequest(
+        json = models.ReactivateUserRequest(
             created_by_id=created_by_id, name=name, restore_messages=restore_messages
         ).to_dict()
         return await self.post(
             "/api/v2/users/{user_id}/reactivate",
-            ReactivateUserResponse,
+            models.ReactivateUserResponse,
             path_params=path_params,
             json=json,
         )
@@ -1,16 +1,22 @@
+from __future__ import annotations
+
 import json
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
+from getstream import models
 from getstream.common import telemetry
 from getstream.common.rest_client import CommonRestClient
-from getstream.models import (
-    FileUploadResponse,
-    ImageSize,
-    ImageUploadResponse,
-    OnlyUserID,
-)
 from getstream.stream_response import StreamResponse
 
+if TYPE_CHECKING:
+    from getstream.models import (
+        FileUploadResponse,
+        ImageSize,
+        ImageUploadResponse,
+        OnlyUserID,
+    )
+    from getstream.uploads import ProgressCallback, UploadSource
+
 
 class CommonClient(CommonRestClient):
     def __init__(self, api_key: str, base_url, token, timeout, user_agent=None):
@@ -24,25 +30,39 @@ class CommonClient(CommonRestClient):
 
     @telemetry.operation_name("getstream.api.common.upload_file")
     def upload_file(
-        self, file: str, user: Optional[OnlyUserID] = None
+        self,
+        file: UploadSource,
+        user: Optional[OnlyUserID] = None,
+        file_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> StreamResponse[FileUploadResponse]:
+        """Upload ``file`` (a path, bytes, a binary file object or, on async
+        clients, an async iterable of bytes), streamed in chunks. ``file_name``
+        overrides the name sent, which defaults to the file's own name;
+        ``progress(sent, total)`` is called as the file is sent."""
         form_fields = []
         if user is not None:
             form_fields.append(("user", json.dumps(user.to_dict())))
         return self._upload_multipart(
             "/api/v2/uploads/file",
-            FileUploadResponse,
+            models.FileUploadResponse,
             file,
             form_fields=form_fields,
+            file_name=file_name,
+            progress=progress,
         )
 
     @telemetry.operation_name("getstream.api.common.upload_image")
     def upload_image(
         self,
-        file: str,
+        file: UploadSource,
         upload_sizes: Optional[List[ImageSize]] = None,
         user: Optional[OnlyUserID] = None,
+        file_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> StreamResponse[ImageUploadResponse]:
+        """Upload an image; ``file``, ``file_name`` and ``progress`` are as
+        for ``upload_file``."""
         form_fields = []
         if user is not None:
             form_fields.append(("user", json.dumps(user.to_dict())))
@@ -52,7 +72,9 @@ class CommonClient(CommonRestClient):
             )
         return self._upload_multipart(
             "/api/v2/uploads/image",
-            ImageUploadResponse,
+            models.ImageUploadResponse,
             file,
             form_fields=form_fields,
+            file_name=file_name,
+            progress=progress,
         )
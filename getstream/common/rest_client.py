@@ -1,10 +1,20 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Dict, List, Optional
+
+from getstream import models
 from getstream.base import BaseClient
 from getstream.common import telemetry
-from getstream.models import *
+from getstream.pagination import paginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from getstream.models import *
+
 
 class CommonRestClient(BaseClient):
     def __init__(
@@ -33,7 +43,7 @@ class CommonRestClient(BaseClient):
 
     @telemetry.operation_name("getstream.api.common.get_app")
     def get_app(self) -> StreamResponse[GetApplicationResponse]:
-        return self.get("/api/v2/app", GetApplicationResponse)
+        return self.get("/api/v2/app", models.GetApplicationResponse)
 
     @telemetry.operation_name("getstream.api.common.update_app")
     def update_app(
@@ -97,7 +107,7 @@ class CommonRestClient(BaseClient):
         push_config: Optional[PushConfig] = None,
         xiaomi_config: Optional[XiaomiConfig] = None,
     ) -> StreamResponse[Response]:
-        json = UpdateAppRequest(
+        json = models.UpdateAppRequest(
             async_url_enrich_enabled=async_url_enrich_enabled,
             auto_translation_enabled=auto_translation_enabled,
             before_message_send_hook_attempt_timeout_ms=before_message_send_hook_attempt_timeout_ms,
@@ -155,7 +165,7 @@ class CommonRestClient(BaseClient):
             push_config=push_config,
             xiaomi_config=xiaomi_config,
         ).to_dict()
-        return self.patch("/api/v2/app", Response, json=json)
+        return self.patch("/api/v2/app", models.Response, json=json)
 
     @telemetry.operation_name("getstream.api.common.list_block_lists")
     def list_block_lists(
@@ -163,7 +173,9 @@ class CommonRestClient(BaseClient):
     ) -> StreamResponse[ListBlockListResponse]:
         query_params = build_query_param(**{"team": team})
         return self.get(
-            "/api/v2/blocklists", ListBlockListResponse, query_params=query_params
+            "/api/v2/blocklists",
+            models.ListBlockListResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.create_block_list")
@@ -178,7 +190,7 @@ class CommonRestClient(BaseClient):
         team: Optional[str] = None,
         type: Optional[str] = None,
     ) -> StreamResponse[CreateBlockListResponse]:
-        json = CreateBlockListRequest(
+        json = models.CreateBlockListRequest(
             name=name,
             words=words,
             is_confusable_folding_enabled=is_confusable_folding_enabled,
@@ -188,7 +200,9 @@ class CommonRestClient(BaseClient):
             team=team,
             type=type,
         ).to_dict()
-        return self.post("/api/v2/blocklists", CreateBlockListResponse, json=json)
+        return self.post(
+            "/api/v2/blocklists", models.CreateBlockListResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.delete_block_list")
     def delete_block_list(
@@ -200,7 +214,7 @@ class CommonRestClient(BaseClient):
         }
         return self.delete(
             "/api/v2/blocklists/{name}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -215,7 +229,7 @@ class CommonRestClient(BaseClient):
         }
         return self.get(
             "/api/v2/blocklists/{name}",
-            GetBlockListResponse,
+            models.GetBlockListResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -234,7 +248,7 @@ class CommonRestClient(BaseClient):
         path_params = {
             "name": name,
         }
-        json = UpdateBlockListRequest(
+        json = models.UpdateBlockListRequest(
             is_confusable_folding_enabled=is_confusable_folding_enabled,
             is_leet_check_enabled=is_leet_check_enabled,
             is_plural_check_enabled=is_plural_check_enabled,
@@ -244,7 +258,7 @@ class CommonRestClient(BaseClient):
         ).to_dict()
         return self.put(
             "/api/v2/blocklists/{name}",
-            UpdateBlockListResponse,
+            models.UpdateBlockListResponse,
             path_params=path_params,
             json=json,
         )
@@ -263,7 +277,7 @@ class CommonRestClient(BaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[CheckPushResponse]:
-        json = CheckPushRequest(
+        json = models.CheckPushRequest(
             apn_template=apn_template,
             event_type=event_type,
             firebase_data_template=firebase_data_template,
@@ -275,7 +289,7 @@ class CommonRestClient(BaseClient):
             user_id=user_id,
             user=user,
         ).to_dict()
-        return self.post("/api/v2/check_push", CheckPushResponse, json=json)
+        return self.post("/api/v2/check_push", models.CheckPushResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.check_sns")
     def check_sns(
@@ -284,10 +298,10 @@ class CommonRestClient(BaseClient):
         sns_secret: Optional[str] = None,
         sns_topic_arn: Optional[str] = None,
     ) -> StreamResponse[CheckSNSResponse]:
-        json = CheckSNSRequest(
+        json = models.CheckSNSRequest(
             sns_key=sns_key, sns_secret=sns_secret, sns_topic_arn=sns_topic_arn
         ).to_dict()
-        return self.post("/api/v2/check_sns", CheckSNSResponse, json=json)
+        return self.post("/api/v2/check_sns", models.CheckSNSResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.check_sqs")
     def check_sqs(
@@ -296,17 +310,19 @@ class CommonRestClient(BaseClient):
         sqs_secret: Optional[str] = None,
         sqs_url: Optional[str] = None,
     ) -> StreamResponse[CheckSQSResponse]:
-        json = CheckSQSRequest(
+        json = models.CheckSQSRequest(
             sqs_key=sqs_key, sqs_secret=sqs_secret, sqs_url=sqs_url
         ).to_dict()
-        return self.post("/api/v2/check_sqs", CheckSQSResponse, json=json)
+        return self.post("/api/v2/check_sqs", models.CheckSQSResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.delete_device")
     def delete_device(
         self, id: str, user_id: Optional[str] = None
     ) -> StreamResponse[Response]:
         query_params = build_query_param(**{"id": id, "user_id": user_id})
-        return self.delete("/api/v2/devices", Response, query_params=query_params)
+        return self.delete(
+            "/api/v2/devices", models.Response, query_params=query_params
+        )
 
     @telemetry.operation_name("getstream.api.common.list_devices")
     def list_devices(
@@ -314,7 +330,7 @@ class CommonRestClient(BaseClient):
     ) -> StreamResponse[ListDevicesResponse]:
         query_params = build_query_param(**{"user_id": user_id})
         return self.get(
-            "/api/v2/devices", ListDevicesResponse, query_params=query_params
+            "/api/v2/devices", models.ListDevicesResponse, query_params=query_params
         )
 
     @telemetry.operation_name("getstream.api.common.create_device")
@@ -328,7 +344,7 @@ class CommonRestClient(BaseClient):
         voip_token: Optional[bool] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[Response]:
-        json = CreateDeviceRequest(
+        json = models.CreateDeviceRequest(
             id=id,
             push_provider=push_provider,
             hardware_id=hardware_id,
@@ -337,16 +353,16 @@ class CommonRestClient(BaseClient):
             voip_token=voip_token,
             user=user,
         ).to_dict()
-        return self.post("/api/v2/devices", Response, json=json)
+        return self.post("/api/v2/devices", models.Response, json=json)
 
     @telemetry.operation_name("getstream.api.common.export_users")
     def export_users(self, user_ids: List[str]) -> StreamResponse[ExportUsersResponse]:
-        json = ExportUsersRequest(user_ids=user_ids).to_dict()
-        return self.post("/api/v2/export/users", ExportUsersResponse, json=json)
+        json = models.ExportUsersRequest(user_ids=user_ids).to_dict()
+        return self.post("/api/v2/export/users", models.ExportUsersResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.list_external_storage")
     def list_external_storage(self) -> StreamResponse[ListExternalStorageResponse]:
-        return self.get("/api/v2/external_storage", ListExternalStorageResponse)
+        return self.get("/api/v2/external_storage", models.ListExternalStorageResponse)
 
     @telemetry.operation_name("getstream.api.common.create_external_storage")
     def create_external_storage(
@@ -359,7 +375,7 @@ class CommonRestClient(BaseClient):
         aws_s3: Optional[S3Request] = None,
         azure_blob: Optional[AzureRequest] = None,
     ) -> StreamResponse[CreateExternalStorageResponse]:
-        json = CreateExternalStorageRequest(
+        json = models.CreateExternalStorageRequest(
             bucket=bucket,
             name=name,
             storage_type=storage_type,
@@ -369,7 +385,7 @@ class CommonRestClient(BaseClient):
             azure_blob=azure_blob,
         ).to_dict()
         return self.post(
-            "/api/v2/external_storage", CreateExternalStorageResponse, json=json
+            "/api/v2/external_storage", models.CreateExternalStorageResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.delete_external_storage")
@@ -381,7 +397,7 @@ class CommonRestClient(BaseClient):
         }
         return self.delete(
             "/api/v2/external_storage/{name}",
-            DeleteExternalStorageResponse,
+            models.DeleteExternalStorageResponse,
             path_params=path_params,
         )
 
@@ -399,7 +415,7 @@ class CommonRestClient(BaseClient):
         path_params = {
             "name": name,
         }
-        json = UpdateExternalStorageRequest(
+        json = models.UpdateExternalStorageRequest(
             bucket=bucket,
             storage_type=storage_type,
             gcs_credentials=gcs_credentials,
@@ -409,7 +425,7 @@ class CommonRestClient(BaseClient):
         ).to_dict()
         return self.put(
             "/api/v2/external_storage/{name}",
-            UpdateExternalStorageResponse,
+            models.UpdateExternalStorageResponse,
             path_params=path_params,
             json=json,
         )
@@ -423,34 +439,36 @@ class CommonRestClient(BaseClient):
         }
         return self.get(
             "/api/v2/external_storage/{name}/check",
-            CheckExternalStorageResponse,
+            models.CheckExternalStorageResponse,
             path_params=path_params,
         )
 
     @telemetry.operation_name("getstream.api.common.create_guest")
     def create_guest(self, user: UserRequest) -> StreamResponse[CreateGuestResponse]:
-        json = CreateGuestRequest(user=user).to_dict()
-        return self.post("/api/v2/guest", CreateGuestResponse, json=json)
+        json = models.CreateGuestRequest(user=user).to_dict()
+        return self.post("/api/v2/guest", models.CreateGuestResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.create_import_url")
     def create_import_url(
         self, filename: Optional[str] = None
     ) -> StreamResponse[CreateImportURLResponse]:
-        json = CreateImportURLRequest(filename=filename).to_dict()
-        return self.post("/api/v2/import_urls", CreateImportURLResponse, json=json)
+        json = models.CreateImportURLRequest(filename=filename).to_dict()
+        return self.post(
+            "/api/v2/import_urls", models.CreateImportURLResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.list_imports")
     def list_imports(self) -> StreamResponse[ListImportsResponse]:
-        return self.get("/api/v2/imports", ListImportsResponse)
+        return self.get("/api/v2/imports", models.ListImportsResponse)
 
     @telemetry.operation_name("getstream.api.common.create_import")
     def create_import(
         self, mode: str, path: str, merge_custom: Optional[bool] = None
     ) -> StreamResponse[CreateImportResponse]:
-        json = CreateImportRequest(
+        json = models.CreateImportRequest(
             mode=mode, path=path, merge_custom=merge_custom
         ).to_dict()
-        return self.post("/api/v2/imports", CreateImportResponse, json=json)
+        return self.post("/api/v2/imports", models.CreateImportResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.list_import_v2_tasks")
     def list_import_v2_tasks(
@@ -458,7 +476,9 @@ class CommonRestClient(BaseClient):
     ) -> StreamResponse[ListImportV2TasksResponse]:
         query_params = build_query_param(**{"state": state})
         return self.get(
-            "/api/v2/imports/v2", ListImportV2TasksResponse, query_params=query_params
+            "/api/v2/imports/v2",
+            models.ListImportV2TasksResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.create_import_v2_task")
@@ -469,17 +489,19 @@ class CommonRestClient(BaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[CreateImportV2TaskResponse]:
-        json = CreateImportV2TaskRequest(
+        json = models.CreateImportV2TaskRequest(
             product=product, settings=settings, user_id=user_id, user=user
         ).to_dict()
-        return self.post("/api/v2/imports/v2", CreateImportV2TaskResponse, json=json)
+        return self.post(
+            "/api/v2/imports/v2", models.CreateImportV2TaskResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.delete_importer_external_storage")
     def delete_importer_external_storage(
         self,
     ) -> StreamResponse[DeleteExternalStorageResponse]:
         return self.delete(
-            "/api/v2/imports/v2/external-storage", DeleteExternalStorageResponse
+            "/api/v2/imports/v2/external-storage", models.DeleteExternalStorageResponse
         )
 
     @telemetry.operation_name("getstream.api.common.get_importer_external_storage")
@@ -487,17 +509,17 @@ class CommonRestClient(BaseClient):
         self,
     ) -> StreamResponse[GetExternalStorageResponse]:
         return self.get(
-            "/api/v2/imports/v2/external-storage", GetExternalStorageResponse
+            "/api/v2/imports/v2/external-storage", models.GetExternalStorageResponse
         )
 
     @telemetry.operation_name("getstream.api.common.upsert_importer_external_storage")
     def upsert_importer_external_storage(
         self, type: str, aws_s3: Optional[UpsertExternalStorageAWSS3Request] = None
     ) -> StreamResponse[UpsertExternalStorageResponse]:
-        json = UpsertExternalStorageRequest(type=type, aws_s3=aws_s3).to_dict()
+        json = models.UpsertExternalStorageRequest(type=type, aws_s3=aws_s3).to_dict()
         return self.put(
             "/api/v2/imports/v2/external-storage",
-            UpsertExternalStorageResponse,
+            models.UpsertExternalStorageResponse,
             json=json,
         )
 
@@ -507,7 +529,7 @@ class CommonRestClient(BaseClient):
     ) -> StreamResponse[ValidateExternalStorageResponse]:
         return self.post(
             "/api/v2/imports/v2/external-storage/validate",
-            ValidateExternalStorageResponse,
+            models.ValidateExternalStorageResponse,
         )
 
     @telemetry.operation_name("getstream.api.common.delete_import_v2_task")
@@ -519,7 +541,7 @@ class CommonRestClient(BaseClient):
         }
         return self.delete(
             "/api/v2/imports/v2/{id}",
-            DeleteImportV2TaskResponse,
+            models.DeleteImportV2TaskResponse,
             path_params=path_params,
         )
 
@@ -529,7 +551,9 @@ class CommonRestClient(BaseClient):
             "id": id,
         }
         return self.get(
-            "/api/v2/imports/v2/{id}", GetImportV2TaskResponse, path_params=path_params
+            "/api/v2/imports/v2/{id}",
+            models.GetImportV2TaskResponse,
+            path_params=path_params,
         )
 
     @telemetry.operation_name("getstream.api.common.cancel_import_v2_task")
@@ -541,7 +565,7 @@ class CommonRestClient(BaseClient):
         }
         return self.post(
             "/api/v2/imports/v2/{id}/cancel",
-            CancelImportV2TaskResponse,
+            models.CancelImportV2TaskResponse,
             path_params=path_params,
         )
 
@@ -551,17 +575,17 @@ class CommonRestClient(BaseClient):
             "id": id,
         }
         return self.get(
-            "/api/v2/imports/{id}", GetImportResponse, path_params=path_params
+            "/api/v2/imports/{id}", models.GetImportResponse, path_params=path_params
         )
 
     @telemetry.operation_name("getstream.api.common.get_og")
     def get_og(self, url: str) -> StreamResponse[GetOGResponse]:
         query_params = build_query_param(**{"url": url})
-        return self.get("/api/v2/og", GetOGResponse, query_params=query_params)
+        return self.get("/api/v2/og", models.GetOGResponse, query_params=query_params)
 
     @telemetry.operation_name("getstream.api.common.list_permissions")
     def list_permissions(self) -> StreamResponse[ListPermissionsResponse]:
-        return self.get("/api/v2/permissions", ListPermissionsResponse)
+        return self.get("/api/v2/permissions", models.ListPermissionsResponse)
 
     @telemetry.operation_name("getstream.api.common.get_permission")
     def get_permission(self, id: str) -> StreamResponse[GetCustomPermissionResponse]:
@@ -570,7 +594,7 @@ class CommonRestClient(BaseClient):
         }
         return self.get(
             "/api/v2/permissions/{id}",
-            GetCustomPermissionResponse,
+            models.GetCustomPermissionResponse,
             path_params=path_params,
         )
 
@@ -591,7 +615,7 @@ class CommonRestClient(BaseClient):
         custom: Optional[Dict[str, object]] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[PollResponse]:
-        json = CreatePollRequest(
+        json = models.CreatePollRequest(
             name=name,
             allow_answers=allow_answers,
             allow_user_suggested_options=allow_user_suggested_options,
@@ -606,7 +630,7 @@ class CommonRestClient(BaseClient):
             custom=custom,
             user=user,
         ).to_dict()
-        return self.post("/api/v2/polls", PollResponse, json=json)
+        return self.post("/api/v2/polls", models.PollResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.update_poll")
     def update_poll(
@@ -625,7 +649,7 @@ class CommonRestClient(BaseClient):
         custom: Optional[Dict[str, object]] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[PollResponse]:
-        json = UpdatePollRequest(
+        json = models.UpdatePollRequest(
             id=id,
             name=name,
             allow_answers=allow_answers,
@@ -640,7 +664,7 @@ class CommonRestClient(BaseClient):
             custom=custom,
             user=user,
         ).to_dict()
-        return self.put("/api/v2/polls", PollResponse, json=json)
+        return self.put("/api/v2/polls", models.PollResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.query_polls")
     def query_polls(
@@ -653,16 +677,34 @@ class CommonRestClient(BaseClient):
         filter: Optional[Dict[str, object]] = None,
     ) -> StreamResponse[QueryPollsResponse]:
         query_params = build_query_param(**{"user_id": user_id})
-        json = QueryPollsRequest(
+        json = models.QueryPollsRequest(
             limit=limit, next=next, prev=prev, sort=sort, filter=filter
         ).to_dict()
         return self.post(
             "/api/v2/polls/query",
-            QueryPollsResponse,
+            models.QueryPollsResponse,
             query_params=query_params,
             json=json,
         )
 
+    def iter_query_polls(
+        self,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[PollResponseData]:
+        return paginate(
+            self.query_polls,
+            "polls",
+            prefetch=prefetch,
+            user_id=user_id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.common.delete_poll")
     def delete_poll(
         self, poll_id: str, user_id: Optional[str] = None
@@ -673,7 +715,7 @@ class CommonRestClient(BaseClient):
         }
         return self.delete(
             "/api/v2/polls/{poll_id}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -688,7 +730,7 @@ class CommonRestClient(BaseClient):
         }
         return self.get(
             "/api/v2/polls/{poll_id}",
-            PollResponse,
+            models.PollResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -705,11 +747,14 @@ class CommonRestClient(BaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = UpdatePollPartialRequest(
+        json = models.UpdatePollPartialRequest(
             user_id=user_id, unset=unset, set=set, user=user
         ).to_dict()
         return self.patch(
-            "/api/v2/polls/{poll_id}", PollResponse, path_params=path_params, json=json
+            "/api/v2/polls/{poll_id}",
+            models.PollResponse,
+            path_params=path_params,
+            json=json,
         )
 
     @telemetry.operation_name("getstream.api.common.create_poll_option")
@@ -724,12 +769,12 @@ class CommonRestClient(BaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = CreatePollOptionRequest(
+        json = models.CreatePollOptionRequest(
             text=text, user_id=user_id, custom=custom, user=user
         ).to_dict()
         return self.post(
             "/api/v2/polls/{poll_id}/options",
-            PollOptionResponse,
+            models.PollOptionResponse,
             path_params=path_params,
             json=json,
         )
@@ -747,12 +792,12 @@ class CommonRestClient(BaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = UpdatePollOptionRequest(
+        json = models.UpdatePollOptionRequest(
             id=id, text=text, user_id=user_id, custom=custom, user=user
         ).to_dict()
         return self.put(
             "/api/v2/polls/{poll_id}/options",
-            PollOptionResponse,
+            models.PollOptionResponse,
             path_params=path_params,
             json=json,
         )
@@ -768,7 +813,7 @@ class CommonRestClient(BaseClient):
         }
         return self.delete(
             "/api/v2/polls/{poll_id}/options/{option_id}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -784,7 +829,7 @@ class CommonRestClient(BaseClient):
         }
         return self.get(
             "/api/v2/polls/{poll_id}/options/{option_id}",
-            PollOptionResponse,
+            models.PollOptionResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -804,39 +849,59 @@ class CommonRestClient(BaseClient):
         path_params = {
             "poll_id": poll_id,
         }
-        json = QueryPollVotesRequest(
+        json = models.QueryPollVotesRequest(
             limit=limit, next=next, prev=prev, sort=sort, filter=filter
         ).to_dict()
         return self.post(
             "/api/v2/polls/{poll_id}/votes",
-            PollVotesResponse,
+            models.PollVotesResponse,
             query_params=query_params,
             path_params=path_params,
             json=json,
         )
 
+    def iter_query_poll_votes(
+        self,
+        poll_id: str,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[PollVoteResponseData]:
+        return paginate(
+            self.query_poll_votes,
+            "votes",
+            prefetch=prefetch,
+            poll_id=poll_id,
+            user_id=user_id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name(
         "getstream.api.common.update_push_notification_preferences"
     )
     def update_push_notification_preferences(
         self, preferences: List[PushPreferenceInput]
     ) -> StreamResponse[UpsertPushPreferencesResponse]:
-        json = UpsertPushPreferencesRequest(preferences=preferences).to_dict()
+        json = models.UpsertPushPreferencesRequest(preferences=preferences).to_dict()
         return self.post(
-            "/api/v2/push_preferences", UpsertPushPreferencesResponse, json=json
+            "/api/v2/push_preferences", models.UpsertPushPreferencesResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.list_push_providers")
     def list_push_providers(self) -> StreamResponse[ListPushProvidersResponse]:
-        return self.get("/api/v2/push_providers", ListPushProvidersResponse)
+        return self.get("/api/v2/push_providers", models.ListPushProvidersResponse)
 
     @telemetry.operation_name("getstream.api.common.upsert_push_provider")
     def upsert_push_provider(
         self, push_provider: Optional[PushProviderRequest] = None
     ) -> StreamResponse[UpsertPushProviderResponse]:
-        json = UpsertPushProviderRequest(push_provider=push_provider).to_dict()
+        json = models.UpsertPushProviderRequest(push_provider=push_provider).to_dict()
         return self.post(
-            "/api/v2/push_providers", UpsertPushProviderResponse, json=json
+            "/api/v2/push_providers", models.UpsertPushProviderResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.delete_push_provider")
@@ -846,7 +911,9 @@ class CommonRestClient(BaseClient):
             "name": name,
         }
         return self.delete(
-            "/api/v2/push_providers/{type}/{name}", Response, path_params=path_params
+            "/api/v2/push_providers/{type}/{name}",
+            models.Response,
+            path_params=path_params,
         )
 
     @telemetry.operation_name("getstream.api.common.get_push_templates")
@@ -861,7 +928,7 @@ class CommonRestClient(BaseClient):
         )
         return self.get(
             "/api/v2/push_templates",
-            GetPushTemplatesResponse,
+            models.GetPushTemplatesResponse,
             query_params=query_params,
         )
 
@@ -874,7 +941,7 @@ class CommonRestClient(BaseClient):
         push_provider_name: Optional[str] = None,
         template: Optional[str] = None,
     ) -> StreamResponse[UpsertPushTemplateResponse]:
-        json = UpsertPushTemplateRequest(
+        json = models.UpsertPushTemplateRequest(
             event_type=event_type,
             push_provider_type=push_provider_type,
             enable_push=enable_push,
@@ -882,7 +949,7 @@ class CommonRestClient(BaseClient):
             template=template,
         ).to_dict()
         return self.post(
-            "/api/v2/push_templates", UpsertPushTemplateResponse, json=json
+            "/api/v2/push_templates", models.UpsertPushTemplateResponse, json=json
         )
 
     @telemetry.operation_name("getstream.api.common.get_rate_limits")
@@ -904,17 +971,19 @@ class CommonRestClient(BaseClient):
             }
         )
         return self.get(
-            "/api/v2/rate_limits", GetRateLimitsResponse, query_params=query_params
+            "/api/v2/rate_limits",
+            models.GetRateLimitsResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.list_roles")
     def list_roles(self) -> StreamResponse[ListRolesResponse]:
-        return self.get("/api/v2/roles", ListRolesResponse)
+        return self.get("/api/v2/roles", models.ListRolesResponse)
 
     @telemetry.operation_name("getstream.api.common.create_role")
     def create_role(self, name: str) -> StreamResponse[CreateRoleResponse]:
-        json = CreateRoleRequest(name=name).to_dict()
-        return self.post("/api/v2/roles", CreateRoleResponse, json=json)
+        json = models.CreateRoleRequest(name=name).to_dict()
+        return self.post("/api/v2/roles", models.CreateRoleResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.search_roles")
     def search_roles(
@@ -935,7 +1004,9 @@ class CommonRestClient(BaseClient):
             }
         )
         return self.get(
-            "/api/v2/roles/search", SearchRolesResponse, query_params=query_params
+            "/api/v2/roles/search",
+            models.SearchRolesResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.delete_role")
@@ -943,31 +1014,39 @@ class CommonRestClient(BaseClient):
         path_params = {
             "name": name,
         }
-        return self.delete("/api/v2/roles/{name}", Response, path_params=path_params)
+        return self.delete(
+            "/api/v2/roles/{name}", models.Response, path_params=path_params
+        )
 
     @telemetry.operation_name("getstream.api.common.get_task")
     def get_task(self, id: str) -> StreamResponse[GetTaskResponse]:
         path_params = {
             "id": id,
         }
-        return self.get("/api/v2/tasks/{id}", GetTaskResponse, path_params=path_params)
+        return self.get(
+            "/api/v2/tasks/{id}", models.GetTaskResponse, path_params=path_params
+        )
 
     @telemetry.operation_name("getstream.api.common.delete_file")
     def delete_file(self, url: Optional[str] = None) -> StreamResponse[Response]:
         query_params = build_query_param(**{"url": url})
-        return self.delete("/api/v2/uploads/file", Response, query_params=query_params)
+        return self.delete(
+            "/api/v2/uploads/file", models.Response, query_params=query_params
+        )
 
     @telemetry.operation_name("getstream.api.common.upload_file")
     def upload_file(
         self, file: Optional[str] = None, user: Optional[OnlyUserID] = None
     ) -> StreamResponse[FileUploadResponse]:
-        json = FileUploadRequest(file=file, user=user).to_dict()
-        return self.post("/api/v2/uploads/file", FileUploadResponse, json=json)
+        json = models.FileUploadRequest(file=file, user=user).to_dict()
+        return self.post("/api/v2/uploads/file", models.FileUploadResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.delete_image")
     def delete_image(self, url: Optional[str] = None) -> StreamResponse[Response]:
         query_params = build_query_param(**{"url": url})
-        return self.delete("/api/v2/uploads/image", Response, query_params=query_params)
+        return self.delete(
+            "/api/v2/uploads/image", models.Response, query_params=query_params
+        )
 
     @telemetry.operation_name("getstream.api.common.upload_image")
     def upload_image(
@@ -976,10 +1055,10 @@ class CommonRestClient(BaseClient):
         upload_sizes: Optional[List[ImageSize]] = None,
         user: Optional[OnlyUserID] = None,
     ) -> StreamResponse[ImageUploadResponse]:
-        json = ImageUploadRequest(
+        json = models.ImageUploadRequest(
             file=file, upload_sizes=upload_sizes, user=user
         ).to_dict()
-        return self.post("/api/v2/uploads/image", ImageUploadResponse, json=json)
+        return self.post("/api/v2/uploads/image", models.ImageUploadResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.list_user_groups")
     def list_user_groups(
@@ -998,7 +1077,9 @@ class CommonRestClient(BaseClient):
             }
         )
         return self.get(
-            "/api/v2/usergroups", ListUserGroupsResponse, query_params=query_params
+            "/api/v2/usergroups",
+            models.ListUserGroupsResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.create_user_group")
@@ -1010,14 +1091,16 @@ class CommonRestClient(BaseClient):
         team_id: Optional[str] = None,
         member_ids: Optional[List[str]] = None,
     ) -> StreamResponse[CreateUserGroupResponse]:
-        json = CreateUserGroupRequest(
+        json = models.CreateUserGroupRequest(
             name=name,
             description=description,
             id=id,
             team_id=team_id,
             member_ids=member_ids,
         ).to_dict()
-        return self.post("/api/v2/usergroups", CreateUserGroupResponse, json=json)
+        return self.post(
+            "/api/v2/usergroups", models.CreateUserGroupResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.search_user_groups")
     def search_user_groups(
@@ -1039,7 +1122,7 @@ class CommonRestClient(BaseClient):
         )
         return self.get(
             "/api/v2/usergroups/search",
-            SearchUserGroupsResponse,
+            models.SearchUserGroupsResponse,
             query_params=query_params,
         )
 
@@ -1053,7 +1136,7 @@ class CommonRestClient(BaseClient):
         }
         return self.delete(
             "/api/v2/usergroups/{id}",
-            Response,
+            models.Response,
             query_params=query_params,
             path_params=path_params,
         )
@@ -1068,7 +1151,7 @@ class CommonRestClient(BaseClient):
         }
         return self.get(
             "/api/v2/usergroups/{id}",
-            GetUserGroupResponse,
+            models.GetUserGroupResponse,
             query_params=query_params,
             path_params=path_params,
         )
@@ -1084,12 +1167,12 @@ class CommonRestClient(BaseClient):
         path_params = {
             "id": id,
         }
-        json = UpdateUserGroupRequest(
+        json = models.UpdateUserGroupRequest(
             description=description, name=name, team_id=team_id
         ).to_dict()
         return self.put(
             "/api/v2/usergroups/{id}",
-            UpdateUserGroupResponse,
+            models.UpdateUserGroupResponse,
             path_params=path_params,
             json=json,
         )
@@ -1105,12 +1188,12 @@ class CommonRestClient(BaseClient):
         path_params = {
             "id": id,
         }
-        json = AddUserGroupMembersRequest(
+        json = models.AddUserGroupMembersRequest(
             member_ids=member_ids, as_admin=as_admin, team_id=team_id
         ).to_dict()
         return self.post(
             "/api/v2/usergroups/{id}/members",
-            AddUserGroupMembersResponse,
+            models.AddUserGroupMembersResponse,
             path_params=path_params,
             json=json,
         )
@@ -1122,12 +1205,12 @@ class CommonRestClient(BaseClient):
         path_params = {
             "id": id,
         }
-        json = RemoveUserGroupMembersRequest(
+        json = models.RemoveUserGroupMembersRequest(
             member_ids=member_ids, team_id=team_id
         ).to_dict()
         return self.post(
             "/api/v2/usergroups/{id}/members/delete",
-            RemoveUserGroupMembersResponse,
+            models.RemoveUserGroupMembersResponse,
             path_params=path_params,
             json=json,
         )
@@ -1137,21 +1220,23 @@ class CommonRestClient(BaseClient):
         self, payload: Optional[QueryUsersPayload] = None
     ) -> StreamResponse[QueryUsersResponse]:
         query_params = build_query_param(**{"payload": payload})
-        return self.get("/api/v2/users", QueryUsersResponse, query_params=query_params)
+        return self.get(
+            "/api/v2/users", models.QueryUsersResponse, query_params=query_params
+        )
 
     @telemetry.operation_name("getstream.api.common.update_users_partial")
     def update_users_partial(
         self, users: List[UpdateUserPartialRequest]
     ) -> StreamResponse[UpdateUsersResponse]:
-        json = UpdateUsersPartialRequest(users=users).to_dict()
-        return self.patch("/api/v2/users", UpdateUsersResponse, json=json)
+        json = models.UpdateUsersPartialRequest(users=users).to_dict()
+        return self.patch("/api/v2/users", models.UpdateUsersResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.update_users")
     def update_users(
         self, users: Dict[str, UserRequest]
     ) -> StreamResponse[UpdateUsersResponse]:
-        json = UpdateUsersRequest(users=users).to_dict()
-        return self.post("/api/v2/users", UpdateUsersResponse, json=json)
+        json = models.UpdateUsersRequest(users=users).to_dict()
+        return self.post("/api/v2/users", models.UpdateUsersResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.get_blocked_users")
     def get_blocked_users(
@@ -1159,7 +1244,9 @@ class CommonRestClient(BaseClient):
     ) -> StreamResponse[GetBlockedUsersResponse]:
         query_params = build_query_param(**{"user_id": user_id})
         return self.get(
-            "/api/v2/users/block", GetBlockedUsersResponse, query_params=query_params
+            "/api/v2/users/block",
+            models.GetBlockedUsersResponse,
+            query_params=query_params,
         )
 
     @telemetry.operation_name("getstream.api.common.block_users")
@@ -1169,10 +1256,10 @@ class CommonRestClient(BaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[BlockUsersResponse]:
-        json = BlockUsersRequest(
+        json = models.BlockUsersRequest(
             blocked_user_id=blocked_user_id, user_id=user_id, user=user
         ).to_dict()
-        return self.post("/api/v2/users/block", BlockUsersResponse, json=json)
+        return self.post("/api/v2/users/block", models.BlockUsersResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.deactivate_users")
     def deactivate_users(
@@ -1182,13 +1269,15 @@ class CommonRestClient(BaseClient):
         mark_channels_deleted: Optional[bool] = None,
         mark_messages_deleted: Optional[bool] = None,
     ) -> StreamResponse[DeactivateUsersResponse]:
-        json = DeactivateUsersRequest(
+        json = models.DeactivateUsersRequest(
             user_ids=user_ids,
             created_by_id=created_by_id,
             mark_channels_deleted=mark_channels_deleted,
             mark_messages_deleted=mark_messages_deleted,
         ).to_dict()
-        return self.post("/api/v2/users/deactivate", DeactivateUsersResponse, json=json)
+        return self.post(
+            "/api/v2/users/deactivate", models.DeactivateUsersResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.delete_users")
     def delete_users(
@@ -1202,7 +1291,7 @@ class CommonRestClient(BaseClient):
         new_channel_owner_id: Optional[str] = None,
         user: Optional[str] = None,
     ) -> StreamResponse[DeleteUsersResponse]:
-        json = DeleteUsersRequest(
+        json = models.DeleteUsersRequest(
             user_ids=user_ids,
             calls=calls,
             conversations=conversations,
@@ -1212,7 +1301,7 @@ class CommonRestClient(BaseClient):
             new_channel_owner_id=new_channel_owner_id,
             user=user,
         ).to_dict()
-        return self.post("/api/v2/users/delete", DeleteUsersResponse, json=json)
+        return self.post("/api/v2/users/delete", models.DeleteUsersResponse, json=json)
 
     @telemetry.operation_name("getstream.api.common.get_user_live_locations")
     def get_user_live_locations(
@@ -1221,7 +1310,7 @@ class CommonRestClient(BaseClient):
         query_params = build_query_param(**{"user_id": user_id})
         return self.get(
             "/api/v2/users/live_locations",
-            SharedLocationsResponse,
+            models.SharedLocationsResponse,
             query_params=query_params,
         )
 
@@ -1235,12 +1324,12 @@ class CommonRestClient(BaseClient):
         user_id: Optional[str] = None,
     ) -> StreamResponse[SharedLocationResponse]:
         query_params = build_query_param(**{"user_id": user_id})
-        json = UpdateLiveLocationRequest(
+        json = models.UpdateLiveLocationRequest(
             message_id=message_id, end_at=end_at, latitude=latitude, longitude=longitude
         ).to_dict()
         return self.put(
             "/api/v2/users/live_locations",
-            SharedLocationResponse,
+            models.SharedLocationResponse,
             query_params=query_params,
             json=json,
         )
@@ -1253,18 +1342,20 @@ class CommonRestClient(BaseClient):
         restore_channels: Optional[bool] = None,
         restore_messages: Optional[bool] = None,
     ) -> StreamResponse[ReactivateUsersResponse]:
-        json = ReactivateUsersRequest(
+        json = models.ReactivateUsersRequest(
             user_ids=user_ids,
             created_by_id=created_by_id,
             restore_channels=restore_channels,
             restore_messages=restore_messages,
         ).to_dict()
-        return self.post("/api/v2/users/reactivate", ReactivateUsersResponse, json=json)
+        return self.post(
+            "/api/v2/users/reactivate", models.ReactivateUsersResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.restore_users")
     def restore_users(self, user_ids: List[str]) -> StreamResponse[Response]:
-        json = RestoreUsersRequest(user_ids=user_ids).to_dict()
-        return self.post("/api/v2/users/restore", Response, json=json)
+        json = models.RestoreUsersRequest(user_ids=user_ids).to_dict()
+        return self.post("/api/v2/users/restore", models.Response, json=json)
 
     @telemetry.operation_name("getstream.api.common.unblock_users")
     def unblock_users(
@@ -1273,10 +1364,12 @@ class CommonRestClient(BaseClient):
         user_id: Optional[str] = None,
         user: Optional[UserRequest] = None,
     ) -> StreamResponse[UnblockUsersResponse]:
-        json = UnblockUsersRequest(
+        json = models.UnblockUsersRequest(
             blocked_user_id=blocked_user_id, user_id=user_id, user=user
         ).to_dict()
-        return self.post("/api/v2/users/unblock", UnblockUsersResponse, json=json)
+        return self.post(
+            "/api/v2/users/unblock", models.UnblockUsersResponse, json=json
+        )
 
     @telemetry.operation_name("getstream.api.common.deactivate_user")
     def deactivate_user(
@@ -1288,12 +1381,12 @@ class CommonRestClient(BaseClient):
         path_params = {
             "user_id": user_id,
         }
-        json = DeactivateUserRequest(
+        json = models.DeactivateUserRequest(
             created_by_id=created_by_id, mark_messages_deleted=mark_messages_deleted
         ).to_dict()
         return self.post(
             "/api/v2/users/{user_id}/deactivate",
-            DeactivateUserResponse,
+            models.DeactivateUserResponse,
             path_params=path_params,
             json=json,
         )
@@ -1305,7 +1398,7 @@ class CommonRestClient(BaseClient):
         }
         return self.get(
             "/api/v2/users/{user_id}/export",
-            ExportUserResponse,
+            models.ExportUserResponse,
             path_params=path_params,
         )
 
@@ -1320,12 +1413,12 @@ class CommonRestClient(BaseClient):
         path_params = {
             "user_id": user_id,
         }
-        json = ReactivateUserRequest(
+        json = models.ReactivateUserRequest(
             created_by_id=created_by_id, name=name, restore_messages=restore_messages
         ).to_dict()
         return self.post(
             "/api/v2/users/{user_id}/reactivate",
-            ReactivateUserResponse,
+            models.ReactivateUserResponse,
             path_params=path_params,
             json=json,
         )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import weakref
 from contextlib import contextmanager
 from typing import Any, Dict, Optional, Callable, Awaitable, TYPE_CHECKING
 from contextvars import ContextVar
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
 # Optional OpenTelemetry imports with graceful fallback
 try:
     from opentelemetry import context as otel_context, metrics, trace
+    from opentelemetry.metrics import Observation
     from opentelemetry.trace import SpanKind, Status, StatusCode
     from opentelemetry.trace.span import Span
     from opentelemetry.context.context import Context
@@ -28,6 +30,7 @@ except Exception:  # pragma: no cover - fallback when OTel not installed
     Status = object  # type: ignore
     StatusCode = object  # type: ignore
     Context = object  # type: ignore
+    Observation = None  # type: ignore
     _HAS_OTEL = False
 
 
@@ -47,6 +50,25 @@ REDACT_KEYS = {
 }
 
 
+# PoolMonitors whose connection counts the pool.connections gauge reports
+_POOL_MONITORS: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _observe_pool_connections(_options) -> list:
+    observations = []
+    for monitor in list(_POOL_MONITORS):
+        counts = monitor.connection_counts()
+        if counts is None:
+            continue
+        for state, count in zip(("active", "idle"), counts):
+            observations.append(
+                Observation(
+                    count, attributes={**monitor.attributes, "stream.pool.state": state}
+                )
+            )
+    return observations
+
+
 def _noop_cm():  # pragma: no cover - used when OTel missing
     @contextmanager
     def _inner(*_args, **_kwargs):
@@ -71,6 +93,61 @@ if _HAS_OTEL:
         name="getstream.client.request.count",
         description="SDK client requests",
     )
+    HEDGE_COUNT = _METER.create_counter(
+        name="getstream.client.request.hedged",
+        description="Duplicate requests sent by request hedging",
+    )
+    CIRCUIT_COUNT = _METER.create_counter(
+        name="getstream.client.circuit_breaker.transitions",
+        description="Circuit breaker state changes",
+    )
+    CACHE_COUNT = _METER.create_counter(
+        name="getstream.client.cache.lookups",
+        description="Response cache lookups, by cache.hit",
+    )
+    COALESCED_COUNT = _METER.create_counter(
+        name="getstream.client.request.coalesced",
+        description="GET requests that joined an identical request in flight",
+    )
+    POOL_WAIT_HIST = _METER.create_histogram(
+        name="getstream.client.pool.wait_time",
+        unit="ms",
+        description="Time a request waited for a pooled connection",
+    )
+    CONNECT_HIST = _METER.create_histogram(
+        name="getstream.client.connection.connect_time",
+        unit="ms",
+        description="TCP connect time of new connections",
+    )
+    TLS_HIST = _METER.create_histogram(
+        name="getstream.client.connection.tls_time",
+        unit="ms",
+        description="TLS handshake time of new connections",
+    )
+    TTFB_HIST = _METER.create_histogram(
+        name="getstream.client.request.time_to_first_byte",
+        unit="ms",
+        description="Time from sending a request to receiving the response headers",
+    )
+    BYTES_SENT = _METER.create_counter(
+        name="getstream.client.bytes_sent",
+        unit="By",
+        description="Request body bytes sent",
+    )
+    BYTES_RECEIVED = _METER.create_counter(
+        name="getstream.client.bytes_received",
+        unit="By",
+        description="Response body bytes received, as sent on the wire",
+    )
+    IN_FLIGHT = _METER.create_up_down_counter(
+        name="getstream.client.request.in_flight",
+        description="Requests sent and awaiting their response",
+    )
+    POOL_CONNECTIONS = _METER.create_observable_gauge(
+        name="getstream.client.pool.connections",
+        callbacks=[_observe_pool_connections],
+        description="Pooled connections, by stream.pool.state (active or idle)",
+    )
 else:  # pragma: no cover - no-op instruments
 
     def _get_tracer():  # pragma: no cover - no-op
@@ -78,6 +155,18 @@ else:  # pragma: no cover - no-op instruments
 
     REQ_HIST = None
     REQ_COUNT = None
+    HEDGE_COUNT = None
+    CIRCUIT_COUNT = None
+    CACHE_COUNT = None
+    COALESCED_COUNT = None
+    POOL_WAIT_HIST = None
+    CONNECT_HIST = None
+    TLS_HIST = None
+    TTFB_HIST = None
+    BYTES_SENT = None
+    BYTES_RECEIVED = None
+    IN_FLIGHT = None
+    POOL_CONNECTIONS = None
 
 
 def safe_dump(payload: Any, max_chars: int | None = None) -> str:
@@ -155,6 +244,71 @@ def record_metrics(duration_ms: float, *, attributes: Dict[str, Any]) -> None:
     REQ_COUNT.add(1, attributes=attributes)
 
 
+def record_hedge(*, attributes: Dict[str, Any]) -> None:
+    if not _HAS_OTEL or HEDGE_COUNT is None:
+        return
+    HEDGE_COUNT.add(1, attributes=attributes)
+
+
+def record_circuit_transition(*, attributes: Dict[str, Any]) -> None:
+    if not _HAS_OTEL or CIRCUIT_COUNT is None:
+        return
+    CIRCUIT_COUNT.add(1, attributes=attributes)
+
+
+def record_cache_lookup(*, attributes: Dict[str, Any]) -> None:
+    if not _HAS_OTEL or CACHE_COUNT is None:
+        return
+    CACHE_COUNT.add(1, attributes=attributes)
+
+
+def record_coalesced(*, attributes: Dict[str, Any]) -> None:
+    if not _HAS_OTEL or COALESCED_COUNT is None:
+        return
+    COALESCED_COUNT.add(1, attributes=attributes)
+
+
+def record_in_flight(delta: int, *, attributes: Dict[str, Any]) -> None:
+    if not _HAS_OTEL or IN_FLIGHT is None:
+        return
+    IN_FLIGHT.add(delta, attributes=attributes)
+
+
+def record_transport_metrics(
+    *,
+    pool_wait_ms: Optional[float],
+    connect_ms: Optional[float],
+    tls_ms: Optional[float],
+    ttfb_ms: Optional[float],
+    bytes_sent: int,
+    bytes_received: int,
+    attributes: Dict[str, Any],
+) -> None:
+    """Record one request's transport timings; ``None`` timings did not
+    happen (no new connection, or no response)."""
+    if not _HAS_OTEL or POOL_WAIT_HIST is None:
+        return
+    for hist, value in (
+        (POOL_WAIT_HIST, pool_wait_ms),
+        (CONNECT_HIST, connect_ms),
+        (TLS_HIST, tls_ms),
+        (TTFB_HIST, ttfb_ms),
+    ):
+        if value is not None:
+            hist.record(value, attributes=attributes)
+    if bytes_sent:
+        BYTES_SENT.add(bytes_sent, attributes=attributes)
+    if bytes_received:
+        BYTES_RECEIVED.add(bytes_received, attributes=attributes)
+
+
+def observe_pool(monitor: Any) -> None:
+    """Report ``monitor.connection_counts()`` on the pool.connections gauge
+    for as long as ``monitor`` is alive."""
+    if _HAS_OTEL:
+        _POOL_MONITORS.add(monitor)
+
+
 @contextmanager
 def span_request(
     name: str,
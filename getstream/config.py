@@ -1,24 +1,261 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, FrozenSet, Optional
 
 from getstream.version import VERSION
 
+if TYPE_CHECKING:
+    from getstream.cache import CacheBackend
+
 
 @dataclass(frozen=True)
 class RetryConfig:
     """Opt-in auto-retry policy. Disabled by default: the client performs
-    exactly one attempt and surfaces errors unchanged. When enabled, only
-    GET/HEAD requests failing with HTTP 429 or a transport error are retried,
-    and never when the backend marked the error unrecoverable."""
+    exactly one attempt and surfaces errors unchanged. When enabled, requests
+    failing with HTTP 429 or a transport error are retried, never when the
+    backend marked the error unrecoverable. Only GET/HEAD are retried unless
+    ``retry_writes`` also opts in POST/PUT/PATCH/DELETE; every attempt of a
+    request carries the same ``x-client-request-id``.
+
+    Setting ``budget_ratio`` (e.g. ``0.1``) also caps retries with a token
+    bucket shared by the client and its sub-clients: it holds up to
+    ``budget_burst`` retries and each request adds ``budget_ratio`` of one,
+    so sustained retries stay under that fraction of traffic and a failing
+    backend is not hit by a retry storm. Once the bucket is empty, errors
+    surface without retrying. With the default ``budget_ratio=None`` there
+    is no budget."""
 
     enabled: bool = False
     max_attempts: int = 3
     max_backoff: float = 30.0
+    retry_writes: bool = False
+    budget_ratio: Optional[float] = None
+    budget_burst: float = 10.0
 
     def __post_init__(self):
         if self.max_attempts < 1:
             raise ValueError("max_attempts must be >= 1")
         if self.max_backoff < 0:
             raise ValueError("max_backoff must be >= 0")
+        if self.budget_ratio is not None and self.budget_ratio < 0:
+            raise ValueError("budget_ratio must be >= 0")
+        if self.budget_burst < 0:
+            raise ValueError("budget_burst must be >= 0")
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Opt-in client-side rate limiting. Disabled by default. When enabled,
+    the client tracks the ``x-ratelimit-*`` budget the API reports for each
+    endpoint and holds requests back before that budget runs out, instead of
+    sending them into HTTP 429s.
+
+    ``pace`` spreads the remaining budget evenly over the rest of the
+    window; without it requests go out immediately until the budget is spent
+    and then queue for the next window. ``headroom`` requests per window are
+    left unused, for other processes sharing the same API key."""
+
+    enabled: bool = False
+    pace: bool = True
+    headroom: int = 0
+
+    def __post_init__(self):
+        if self.headroom < 0:
+            raise ValueError("headroom must be >= 0")
+
+
+@dataclass(frozen=True)
+class HedgeConfig:
+    """Opt-in hedging of GET requests. Disabled by default. When enabled, a
+    GET that has not returned after the endpoint's recent ``percentile``
+    latency is sent a second time, over another pooled connection. The
+    first response wins and the other request is abandoned.
+
+    ``endpoints`` limits hedging to the named endpoints. Names can be full
+    operation names (``getstream.api.video.get_call``) or method names
+    (``get_call``). ``None`` hedges every GET. Until ``min_samples``
+    latencies are known, ``initial_delay`` is used, and the delay is never
+    below ``min_delay``. Hedges per endpoint are capped at
+    ``max_hedge_ratio`` of its requests, so a slow backend sees at most that
+    much extra load."""
+
+    enabled: bool = False
+    endpoints: Optional[FrozenSet[str]] = None
+    percentile: float = 0.95
+    initial_delay: float = 0.1
+    min_delay: float = 0.005
+    min_samples: int = 20
+    max_hedge_ratio: float = 0.1
+
+    def __post_init__(self):
+        if self.endpoints is not None:
+            object.__setattr__(self, "endpoints", frozenset(self.endpoints))
+        if not 0 < self.percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if self.initial_delay < 0 or self.min_delay < 0:
+            raise ValueError("hedge delays must be >= 0")
+        if self.min_samples < 1:
+            raise ValueError("min_samples must be >= 1")
+        if not 0 <= self.max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be between 0 and 1")
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """Opt-in circuit breaker per endpoint. Disabled by default. When
+    enabled, the client tracks the outcome of the last ``window_size`` calls
+    to each endpoint. Once at least ``min_calls`` are known and the share of
+    failures reaches ``failure_rate``, the endpoint's circuit opens and its
+    requests fail at once with ``StreamTransportException``
+    (``error_type="circuit_open"``) instead of waiting on a degraded backend.
+
+    A failure is a transport error or an HTTP 5xx response, or, with
+    ``slow_call_duration`` set, a call that took at least that many seconds.
+    After ``open_duration`` seconds the circuit is half-open: up to
+    ``half_open_calls`` probe requests go through, and it closes again once
+    they all succeed or reopens on the first failure."""
+
+    enabled: bool = False
+    failure_rate: float = 0.5
+    slow_call_duration: Optional[float] = None
+    window_size: int = 20
+    min_calls: int = 10
+    open_duration: float = 30.0
+    half_open_calls: int = 1
+
+    def __post_init__(self):
+        if not 0 < self.failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if self.slow_call_duration is not None and self.slow_call_duration <= 0:
+            raise ValueError("slow_call_duration must be > 0")
+        if self.window_size < 1:
+            raise ValueError("window_size must be >= 1")
+        if not 1 <= self.min_calls <= self.window_size:
+            raise ValueError("min_calls must be between 1 and window_size")
+        if self.open_duration < 0:
+            raise ValueError("open_duration must be >= 0")
+        if self.half_open_calls < 1:
+            raise ValueError("half_open_calls must be >= 1")
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """Opt-in response cache for read-mostly GET endpoints. Disabled by
+    default. When enabled, successful responses of the cached endpoints are
+    reused for ``ttl`` seconds, and calling a mutating endpoint through the
+    same client (``update_app``, ``update_channel_type``, ...) invalidates
+    the endpoints it changes.
+
+    ``endpoints`` replaces the default allow-list
+    (``getstream.cache.DEFAULT_CACHED_ENDPOINTS``); names can be full
+    operation names or method names. Entries live in ``backend``, by
+    default an in-process LRU of ``max_entries``. Cached responses are
+    shared objects: do not mutate them."""
+
+    enabled: bool = False
+    ttl: float = 60.0
+    max_entries: int = 256
+    endpoints: Optional[FrozenSet[str]] = None
+    backend: Optional["CacheBackend"] = None
+
+    def __post_init__(self):
+        if self.endpoints is not None:
+            object.__setattr__(self, "endpoints", frozenset(self.endpoints))
+        if self.ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+
+@dataclass(frozen=True)
+class CoalesceConfig:
+    """Opt-in single-flight GETs. Disabled by default. When enabled, a GET
+    made while an identical one (same credentials, endpoint, path and
+    parameters) is in flight through the same client is not sent: it waits
+    for the request in flight and receives the same ``StreamResponse``, or
+    the same exception.
+
+    ``endpoints`` limits coalescing to the named endpoints (full operation
+    names or method names); ``None`` coalesces every GET."""
+
+    enabled: bool = False
+    endpoints: Optional[FrozenSet[str]] = None
+
+    def __post_init__(self):
+        if self.endpoints is not None:
+            object.__setattr__(self, "endpoints", frozenset(self.endpoints))
+
+
+@dataclass(frozen=True)
+class UserBatchConfig:
+    """Opt-in micro-batching of single-user upserts (``create_user``,
+    ``upsert_user``, ``submit_user``). Disabled by default. When enabled,
+    users are queued and sent together as one ``update_users`` call once
+    ``max_batch_size`` are waiting or the oldest has waited ``max_delay``
+    seconds; each caller receives its own user from the response.
+    ``max_batch_size`` defaults to the API's limit of 100 users per call."""
+
+    enabled: bool = False
+    max_delay: float = 0.005
+    max_batch_size: int = 100
+
+    def __post_init__(self):
+        if self.max_delay < 0:
+            raise ValueError("max_delay must be >= 0")
+        if not 1 <= self.max_batch_size <= 100:
+            raise ValueError("max_batch_size must be between 1 and 100")
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    """Opt-in gzip compression of JSON request bodies. Disabled by default.
+    When enabled, bodies of at least ``min_bytes`` encoded bytes are sent
+    gzip-compressed at ``level`` with ``Content-Encoding: gzip``; smaller
+    bodies gain too little to pay for it. Level 1 already gets most of
+    level 9's size reduction on API payloads at a fraction of the CPU. The
+    async client compresses large bodies on its codec thread pool, off the
+    event loop.
+
+    ``endpoints`` limits compression to the named endpoints (full operation
+    names or method names); ``None`` compresses every JSON body."""
+
+    enabled: bool = False
+    min_bytes: int = 1024
+    level: int = 1
+    endpoints: Optional[FrozenSet[str]] = None
+
+    def __post_init__(self):
+        if self.min_bytes < 0:
+            raise ValueError("min_bytes must be >= 0")
+        if not 1 <= self.level <= 9:
+            raise ValueError("level must be between 1 and 9")
+        if self.endpoints is not None:
+            object.__setattr__(self, "endpoints", frozenset(self.endpoints))
+
+
+@dataclass(frozen=True)
+class TokenCacheConfig:
+    """Opt-in reuse of minted user tokens. Disabled by default. When
+    enabled, ``create_token``, ``create_call_token`` and ``create_tokens``
+    return the token minted earlier for the same ``user_id``, ``role``,
+    ``call_cids``, ``channel_cids`` and ``expiration`` until
+    ``refresh_margin`` seconds before its ``exp``; tokens without an
+    expiration are reused until evicted. Up to ``max_entries`` tokens are
+    kept, least recently used evicted first.
+
+    A reused token was minted earlier, so it expires sooner than
+    ``expiration`` seconds from the call, but never within
+    ``refresh_margin`` seconds. Tokens with an ``expiration`` of at most
+    ``refresh_margin`` are never reused."""
+
+    enabled: bool = False
+    max_entries: int = 100_000
+    refresh_margin: float = 300.0
+
+    def __post_init__(self):
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if self.refresh_margin < 0:
+            raise ValueError("refresh_margin must be >= 0")
 
 
 class BaseConfig:
@@ -14,13 +14,16 @@ import json
 import socket
 import ssl
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 import httpx
 
-from getstream.models import APIError
+from getstream import models
 from getstream.rate_limit import RateLimitInfo, extract_rate_limit
 
+if TYPE_CHECKING:
+    from getstream.models import APIError
+
 
 TRANSPORT_ERROR_CONNECTION_RESET = "connection_reset"
 TRANSPORT_ERROR_TIMEOUT = "timeout"
@@ -28,6 +31,9 @@ TRANSPORT_ERROR_DNS_FAILURE = "dns_failure"
 TRANSPORT_ERROR_TLS_HANDSHAKE_FAILED = "tls_handshake_failed"
 TRANSPORT_ERROR_UNKNOWN = "unknown"
 
+# Default for ``parsed_body``: the response body has not been decoded yet.
+_NOT_PARSED: Any = object()
+
 
 class StreamException(Exception):
     """Abstract base for all Stream SDK errors."""
@@ -40,12 +46,16 @@ class StreamApiException(StreamException):
     HTTP response was received but the body could not be parsed as an
     APIError envelope; in that case ``__cause__`` carries the underlying
     parse error.
+
+    ``parsed_body`` is the JSON already decoded from ``response``, if the
+    caller has it, so the body is not parsed a second time.
     """
 
     def __init__(
         self,
         response: Optional[httpx.Response] = None,
         *,
+        parsed_body: Any = _NOT_PARSED,
         status_code: Optional[int] = None,
         code: int = 0,
         message: str = "",
@@ -59,7 +69,7 @@ class StreamApiException(StreamException):
     ) -> None:
         body_parse_err: Optional[BaseException] = None
         if response is not None:
-            parsed, body_parse_err = _fields_from_response(response)
+            parsed, body_parse_err = _fields_from_response(response, parsed_body)
             status_code = parsed["status_code"]
             code = parsed["code"]
             message = parsed["message"]
@@ -124,7 +134,8 @@ class StreamTransportException(StreamException):
     """Network-layer failure: connection reset, timeout, TLS, DNS, etc.
 
     No HTTP response was received. ``__cause__`` carries the original httpx
-    exception.
+    exception. ``error_type="circuit_open"`` means the request was not sent
+    because the endpoint's circuit breaker is open.
     """
 
     def __init__(self, error_type: str, message: str = "") -> None:
@@ -157,8 +168,10 @@ class StreamTaskException(StreamException):
 
 def _fields_from_response(
     response: httpx.Response,
+    parsed_body: Any = _NOT_PARSED,
 ) -> Tuple[Dict[str, Any], Optional[BaseException]]:
-    """Pull the APIError envelope fields out of an httpx response.
+    """Pull the APIError envelope fields out of an httpx response, decoding
+    its body unless ``parsed_body`` already holds it.
 
     Returns ``(fields, parse_error)``; ``parse_error`` is None when the body
     parsed cleanly or was empty.
@@ -173,8 +186,12 @@ def _fields_from_response(
     parse_error: Optional[BaseException] = None
     if response.content:
         try:
-            parsed_json: Any = json.loads(response.content)
-            api_error = APIError.from_dict(parsed_json)
+            parsed_json: Any = (
+                json.loads(response.content)
+                if parsed_body is _NOT_PARSED
+                else parsed_body
+            )
+            api_error = models.APIError.from_dict(parsed_json)
         except (ValueError, AttributeError, TypeError) as e:
             api_error = None
             parse_error = e
@@ -262,16 +279,18 @@ def parse_retry_after(
     return delta
 
 
-def build_api_exception(response: httpx.Response) -> StreamApiException:
+def build_api_exception(
+    response: httpx.Response, parsed_body: Any = _NOT_PARSED
+) -> StreamApiException:
     """Build the right ``StreamApiException`` subclass from an httpx response.
 
     Returns ``StreamRateLimitException`` for 429, else base
     ``StreamApiException``. ``__cause__`` is set when the body could not be
-    parsed.
+    parsed. Pass ``parsed_body`` when the JSON body is already decoded.
     """
     if response.status_code == 429:
-        return StreamRateLimitException(response=response)
-    return StreamApiException(response=response)
+        return StreamRateLimitException(response=response, parsed_body=parsed_body)
+    return StreamApiException(response=response, parsed_body=parsed_body)
 
 
 def classify_transport_error(exc: BaseException) -> str:
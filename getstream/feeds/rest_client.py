@@ -1,7 +1,10 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from typing import Iterator
+
 from getstream.base import BaseClient
 from getstream.common import telemetry
 from getstream.models import *
+from getstream.pagination import paginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
@@ -200,6 +203,38 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_activities(
+        self,
+        language: Optional[str] = None,
+        translate_text: Optional[bool] = None,
+        enrich_own_fields: Optional[bool] = None,
+        include_expired_activities: Optional[bool] = None,
+        include_private_activities: Optional[bool] = None,
+        include_soft_deleted_activities: Optional[bool] = None,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ActivityResponse]:
+        return paginate(
+            self.query_activities,
+            "activities",
+            prefetch=prefetch,
+            language=language,
+            translate_text=translate_text,
+            enrich_own_fields=enrich_own_fields,
+            include_expired_activities=include_expired_activities,
+            include_private_activities=include_private_activities,
+            include_soft_deleted_activities=include_soft_deleted_activities,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.batch_query_activity_reactions")
     def batch_query_activity_reactions(
         self,
@@ -228,6 +263,28 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_batch_query_activity_reactions(
+        self,
+        activity_ids: List[str],
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[FeedsReactionResponse]:
+        return paginate(
+            self.batch_query_activity_reactions,
+            "reactions",
+            prefetch=prefetch,
+            activity_ids=activity_ids,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_bookmark")
     def delete_bookmark(
         self,
@@ -431,6 +488,24 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_activity_reactions(
+        self,
+        activity_id: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[FeedsReactionResponse]:
+        return paginate(
+            self.query_activity_reactions,
+            "reactions",
+            prefetch=prefetch,
+            activity_id=activity_id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_activity_reaction")
     def delete_activity_reaction(
         self,
@@ -475,6 +550,20 @@ class FeedsRestClient(BaseClient):
             path_params=path_params,
         )
 
+    def iter_query_activity_shares(
+        self,
+        activity_id: str,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ShareResponse]:
+        return paginate(
+            self.query_activity_shares,
+            "shares",
+            prefetch=prefetch,
+            activity_id=activity_id,
+            limit=limit,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_activity")
     def delete_activity(
         self,
@@ -679,6 +768,22 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_bookmark_folders(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[BookmarkFolderResponse]:
+        return paginate(
+            self.query_bookmark_folders,
+            "bookmark_folders",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_bookmark_folder")
     def delete_bookmark_folder(
         self, folder_id: str
@@ -748,6 +853,32 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_bookmarks(
+        self,
+        language: Optional[str] = None,
+        translate_text: Optional[bool] = None,
+        enrich_own_fields: Optional[bool] = None,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[BookmarkResponse]:
+        return paginate(
+            self.query_bookmarks,
+            "bookmarks",
+            prefetch=prefetch,
+            language=language,
+            translate_text=translate_text,
+            enrich_own_fields=enrich_own_fields,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_collections")
     def delete_collections(
         self, collection_refs: List[str]
@@ -833,6 +964,26 @@ class FeedsRestClient(BaseClient):
             "/api/v2/feeds/collections/query", QueryCollectionsResponse, json=json
         )
 
+    def iter_query_collections(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[CollectionResponse]:
+        return paginate(
+            self.query_collections,
+            "collections",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.get_comments")
     def get_comments(
         self,
@@ -869,6 +1020,36 @@ class FeedsRestClient(BaseClient):
             "/api/v2/feeds/comments", GetCommentsResponse, query_params=query_params
         )
 
+    def iter_get_comments(
+        self,
+        object_id: str,
+        object_type: str,
+        depth: Optional[int] = None,
+        sort: Optional[str] = None,
+        replies_limit: Optional[int] = None,
+        id_around: Optional[str] = None,
+        language: Optional[str] = None,
+        translate_text: Optional[bool] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ThreadedCommentResponse]:
+        return paginate(
+            self.get_comments,
+            "comments",
+            prefetch=prefetch,
+            object_id=object_id,
+            object_type=object_type,
+            depth=depth,
+            sort=sort,
+            replies_limit=replies_limit,
+            id_around=id_around,
+            language=language,
+            translate_text=translate_text,
+            user_id=user_id,
+            limit=limit,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.add_comment")
     def add_comment(
         self,
@@ -950,6 +1131,32 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_comments(
+        self,
+        filter: Dict[str, object],
+        id_around: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort: Optional[str] = None,
+        user_id: Optional[str] = None,
+        user: Optional[UserRequest] = None,
+        language: Optional[str] = None,
+        translate_text: Optional[bool] = None,
+        prefetch: bool = False,
+    ) -> Iterator[CommentResponse]:
+        return paginate(
+            self.query_comments,
+            "comments",
+            prefetch=prefetch,
+            filter=filter,
+            id_around=id_around,
+            limit=limit,
+            sort=sort,
+            user_id=user_id,
+            user=user,
+            language=language,
+            translate_text=translate_text,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.batch_query_comment_reactions")
     def batch_query_comment_reactions(
         self,
@@ -978,6 +1185,28 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_batch_query_comment_reactions(
+        self,
+        comment_ids: List[str],
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[FeedsReactionResponse]:
+        return paginate(
+            self.batch_query_comment_reactions,
+            "reactions",
+            prefetch=prefetch,
+            comment_ids=comment_ids,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_comment_bookmark")
     def delete_comment_bookmark(
         self,
@@ -1232,6 +1461,24 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_comment_reactions(
+        self,
+        id: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[FeedsReactionResponse]:
+        return paginate(
+            self.query_comment_reactions,
+            "reactions",
+            prefetch=prefetch,
+            id=id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_comment_reaction")
     def delete_comment_reaction(
         self,
@@ -1296,6 +1543,34 @@ class FeedsRestClient(BaseClient):
             path_params=path_params,
         )
 
+    def iter_get_comment_replies(
+        self,
+        id: str,
+        depth: Optional[int] = None,
+        sort: Optional[str] = None,
+        replies_limit: Optional[int] = None,
+        id_around: Optional[str] = None,
+        language: Optional[str] = None,
+        translate_text: Optional[bool] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ThreadedCommentResponse]:
+        return paginate(
+            self.get_comment_replies,
+            "comments",
+            prefetch=prefetch,
+            id=id,
+            depth=depth,
+            sort=sort,
+            replies_limit=replies_limit,
+            id_around=id_around,
+            language=language,
+            translate_text=translate_text,
+            user_id=user_id,
+            limit=limit,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.restore_comment")
     def restore_comment(
         self, id: str, user_id: Optional[str] = None, user: Optional[UserRequest] = None
@@ -1666,6 +1941,26 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_feed_members(
+        self,
+        feed_group_id: str,
+        feed_id: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[FeedMemberResponse]:
+        return paginate(
+            self.query_feed_members,
+            "members",
+            prefetch=prefetch,
+            feed_group_id=feed_group_id,
+            feed_id=feed_id,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.reject_feed_member_invite")
     def reject_feed_member_invite(
         self,
@@ -1723,6 +2018,32 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_pinned_activities(
+        self,
+        feed_group_id: str,
+        feed_id: str,
+        language: Optional[str] = None,
+        translate_text: Optional[bool] = None,
+        enrich_own_fields: Optional[bool] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ActivityPinResponse]:
+        return paginate(
+            self.query_pinned_activities,
+            "pinned_activities",
+            prefetch=prefetch,
+            feed_group_id=feed_group_id,
+            feed_id=feed_id,
+            language=language,
+            translate_text=translate_text,
+            enrich_own_fields=enrich_own_fields,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.get_follow_suggestions")
     def get_follow_suggestions(
         self,
@@ -2042,6 +2363,26 @@ class FeedsRestClient(BaseClient):
         ).to_dict()
         return self.post("/api/v2/feeds/feeds/query", QueryFeedsResponse, json=json)
 
+    def iter_query_feeds(
+        self,
+        enrich_own_fields: Optional[bool] = None,
+        limit: Optional[int] = None,
+        watch: Optional[bool] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[FeedResponse]:
+        return paginate(
+            self.query_feeds,
+            "feeds",
+            prefetch=prefetch,
+            enrich_own_fields=enrich_own_fields,
+            limit=limit,
+            watch=watch,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.get_feeds_rate_limits")
     def get_feeds_rate_limits(
         self,
@@ -2183,6 +2524,22 @@ class FeedsRestClient(BaseClient):
         ).to_dict()
         return self.post("/api/v2/feeds/follows/query", QueryFollowsResponse, json=json)
 
+    def iter_query_follows(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[FollowResponse]:
+        return paginate(
+            self.query_follows,
+            "follows",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.reject_follow")
     def reject_follow(
         self, source: str, target: str
@@ -2291,6 +2648,22 @@ class FeedsRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_membership_levels(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[MembershipLevelResponse]:
+        return paginate(
+            self.query_membership_levels,
+            "membership_levels",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.delete_membership_level")
     def delete_membership_level(self, id: str) -> StreamResponse[Response]:
         path_params = {
@@ -2343,6 +2716,22 @@ class FeedsRestClient(BaseClient):
             "/api/v2/feeds/revisions/query", QueryRevisionHistoryResponse, json=json
         )
 
+    def iter_query_revision_history(
+        self,
+        filter: Dict[str, object],
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[RevisionHistoryResponse]:
+        return paginate(
+            self.query_revision_history,
+            "revisions",
+            prefetch=prefetch,
+            filter=filter,
+            limit=limit,
+            sort=sort,
+        )
+
     @telemetry.operation_name("getstream.api.feeds.query_feeds_usage_stats")
     def query_feeds_usage_stats(
         self, _from: Optional[str] = None, to: Optional[str] = None
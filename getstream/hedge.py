@@ -0,0 +1,267 @@
+"""Hedged GET requests (see ``HedgeConfig``).
+
+When the network rather than the server causes a slow response (a stalled
+connection, a lost packet), sending the request again on another connection
+usually answers sooner than waiting. The ``Hedger`` keeps a window of recent
+latencies per endpoint. A GET still pending after the window's
+``percentile`` latency is duplicated, and the first response is used.
+
+The async client cancels the losing request. The sync client cannot
+interrupt a blocking request: the loser's worker thread finishes in the
+background and its result is discarded. Over HTTP/2 the duplicate can share
+the primary's connection, which makes hedging less useful; it is aimed at
+the default HTTP/1.1 pool, where an in-flight connection is never reused.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from getstream.common.telemetry import record_hedge
+from getstream.config import HedgeConfig
+from getstream.exceptions import StreamTransportException
+
+T = TypeVar("T")
+
+# Latencies kept per endpoint for the delay percentile.
+LATENCY_WINDOW = 200
+# Hedges an endpoint can save up while it is fast, for a burst of slow
+# requests later.
+HEDGE_BURST = 10.0
+# Concurrent requests assumed for a caller-supplied ``http_client`` or
+# ``transport``, whose limits are unknown: httpx's default
+# ``max_connections``.
+UNKNOWN_POOL_CAPACITY = 100
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Hedging counters for one endpoint. ``delay`` is the current hedge
+    delay in seconds."""
+
+    requests: int
+    hedged: int
+    hedge_wins: int
+    delay: float
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests that were duplicated."""
+        return self.hedged / self.requests if self.requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of hedges that answered before the original request."""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class _Endpoint:
+    __slots__ = ("latencies", "requests", "hedged", "hedge_wins", "tokens")
+
+    def __init__(self):
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.tokens = 0.0
+
+
+class Hedger:
+    """Per-client hedging state: latency windows, hedge budgets and
+    counters per endpoint. One instance is shared by a ``Stream`` and its
+    sub-clients.
+
+    The sync client runs both copies of a hedged request on worker threads,
+    so the caller can take whichever finishes first (a blocking request
+    cannot be interrupted, so the caller's thread cannot run one of them).
+    ``capacity`` is how many requests the connection pool carries at once
+    (``None`` if unknown); the workers are capped at two per request, so
+    hedging never limits concurrency below what the pool allows. Threads
+    are started only as concurrent requests need them."""
+
+    def __init__(self, config: HedgeConfig, capacity: Optional[int] = None):
+        self.config = config
+        self.max_workers = 2 * (capacity or UNKNOWN_POOL_CAPACITY)
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._workers_of: Optional[Hedger] = None
+
+    def sibling(self) -> "Hedger":
+        """A ``Hedger`` with the same config and its own latency windows,
+        budgets and counters that runs on this one's worker threads."""
+        sibling = Hedger(self.config)
+        sibling.max_workers = self.max_workers
+        sibling._workers_of = self._workers_of or self
+        return sibling
+
+    def applies(self, method: str, endpoint: str) -> bool:
+        if method.upper() != "GET":
+            return False
+        names = self.config.endpoints
+        return (
+            names is None or endpoint in names or endpoint.rsplit(".", 1)[-1] in names
+        )
+
+    def _delay(self, state: _Endpoint) -> float:
+        config = self.config
+        if len(state.latencies) < config.min_samples:
+            return max(config.initial_delay, config.min_delay)
+        ordered = sorted(state.latencies)
+        index = min(len(ordered) - 1, int(config.percentile * len(ordered)))
+        return max(ordered[index], config.min_delay)
+
+    def _begin(self, endpoint: str) -> float:
+        with self._lock:
+            state = self._endpoints.get(endpoint)
+            if state is None:
+                state = self._endpoints[endpoint] = _Endpoint()
+            state.requests += 1
+            state.tokens = min(HEDGE_BURST, state.tokens + self.config.max_hedge_ratio)
+            return self._delay(state)
+
+    def _take_token(self, endpoint: str, admit: Optional[Callable[[], bool]]) -> bool:
+        with self._lock:
+            state = self._endpoints[endpoint]
+            if state.tokens < 1 or (admit is not None and not admit()):
+                return False
+            state.tokens -= 1
+            state.hedged += 1
+        record_hedge(attributes={"stream.endpoint": endpoint})
+        return True
+
+    def _finish(self, endpoint: str, start: float, hedge_won: bool) -> None:
+        # For a hedged request this is the time until the first response,
+        # which is at least the hedge delay. Recording it keeps the slow tail
+        # in the window, so the delay does not drift down as hedging
+        # shortens requests.
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            state = self._endpoints[endpoint]
+            state.latencies.append(elapsed)
+            if hedge_won:
+                state.hedge_wins += 1
+
+    def stats(self) -> Dict[str, HedgeStats]:
+        """Current ``HedgeStats`` per endpoint name."""
+        with self._lock:
+            return {
+                name: HedgeStats(
+                    requests=state.requests,
+                    hedged=state.hedged,
+                    hedge_wins=state.hedge_wins,
+                    delay=self._delay(state),
+                )
+                for name, state in self._endpoints.items()
+            }
+
+    # ── sync ──────────────────────────────────────────────────────────
+
+    def _workers(self) -> ThreadPoolExecutor:
+        if self._workers_of is not None:
+            return self._workers_of._workers()
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="getstream-hedge",
+                    )
+        return self._executor
+
+    def run_sync(
+        self,
+        endpoint: str,
+        attempt: Callable[[], T],
+        admit: Optional[Callable[[], bool]] = None,
+    ) -> T:
+        """Run ``attempt`` (one request), duplicating it if it is still
+        pending after the endpoint's hedge delay. ``admit`` is asked before
+        sending the duplicate (the client reserves it on its rate limiter);
+        when it returns ``False`` the request is not hedged."""
+        delay = self._begin(endpoint)
+        start = time.perf_counter()
+        pool = self._workers()
+        primary = pool.submit(contextvars.copy_context().run, attempt)
+        hedge_won = False
+        try:
+            done, _ = wait([primary], timeout=delay)
+            if done or not self._take_token(endpoint, admit):
+                return primary.result()
+            hedge = pool.submit(contextvars.copy_context().run, attempt)
+            winner = _first_outcome_sync(primary, hedge)
+            hedge_won = winner is hedge
+            return winner.result()
+        finally:
+            self._finish(endpoint, start, hedge_won)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    # ── async ─────────────────────────────────────────────────────────
+
+    async def run_async(
+        self,
+        endpoint: str,
+        attempt: Callable[[], Awaitable[T]],
+        admit: Optional[Callable[[], bool]] = None,
+    ) -> T:
+        """Async twin of ``run_sync``; the losing request is cancelled."""
+        delay = self._begin(endpoint)
+        start = time.perf_counter()
+        tasks = [asyncio.ensure_future(attempt())]
+        hedge_won = False
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._take_token(endpoint, admit):
+                return await tasks[0]
+            tasks.append(asyncio.ensure_future(attempt()))
+            winner = await _first_outcome_async(*tasks)
+            hedge_won = winner is tasks[1]
+            return winner.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._finish(endpoint, start, hedge_won)
+
+
+def _first_outcome_sync(primary: Future, hedge: Future) -> Future:
+    """The first of the two to finish. A transport failure does not count
+    if the other can still answer."""
+    pending = {primary, hedge}
+    failed = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in sorted(done, key=lambda f: f is not primary):
+            if not isinstance(future.exception(), StreamTransportException):
+                for other in pending:
+                    other.cancel()
+                return future
+            failed = failed or future
+    return failed
+
+
+async def _first_outcome_async(
+    primary: "asyncio.Future[Any]", hedge: "asyncio.Future[Any]"
+) -> "asyncio.Future[Any]":
+    pending = {primary, hedge}
+    failed = None
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in sorted(done, key=lambda t: t is not primary):
+            if not isinstance(task.exception(), StreamTransportException):
+                return task
+            failed = failed or task
+    return failed
+
+
+__all__ = ["HedgeStats", "Hedger"]
@@ -0,0 +1,144 @@
+"""Lazy, field-selective decoding of generated models.
+
+``Stream(..., lazy_models=True)`` makes ``ResponseParserMixin`` hand back
+model instances that keep the parsed JSON dict and only decode a field the
+first time it is read, instead of decoding the whole payload up front. Nested models are lazy too, so reading
+``response.data.channels[0].channel.cid`` decodes exactly that path.
+
+The instances are real subclasses of the requested model (``isinstance``,
+``dataclasses.fields``, ``to_dict``, ``==`` and ``repr`` all behave as for an
+eagerly decoded instance), so the ``StreamResponse[T]`` contract is unchanged.
+Decoded values match ``from_dict(..., infer_missing=True)``; the differences
+are that a malformed field only raises when it is read, and the
+missing-required-field ``RuntimeWarning`` is not emitted. Field decoding
+reuses the per-field plans compiled by ``getstream.codec``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+from typing import Any, Dict, Type, TypeVar
+
+from getstream.codec import Decoder, FieldSpec, decoder_for, field_specs
+
+T = TypeVar("T")
+
+# Key in an instance ``__dict__`` holding the undecoded JSON object.
+_RAW = "__stream_raw__"
+
+_lazy_classes: Dict[type, type] = {}
+_lock = threading.Lock()
+
+
+def lazy_from_dict(data_type: Type[T], data: Dict[str, Any]) -> T:
+    """Wrap ``data`` in a lazy instance of the generated model ``data_type``.
+
+    No field is decoded until it is first accessed; the decoded value is then
+    cached on the instance. ``data`` must be a JSON object; it is kept by
+    reference, so callers should not mutate it afterwards.
+    """
+    obj = object.__new__(_lazy_class(data_type))
+    obj.__dict__[_RAW] = data
+    return obj
+
+
+def is_lazy(obj: Any) -> bool:
+    """Whether ``obj`` is a lazily decoded model instance."""
+    return _RAW in getattr(obj, "__dict__", ())
+
+
+def _lazy_class(cls: type) -> type:
+    lazy = _lazy_classes.get(cls)
+    if lazy is not None:
+        return lazy
+    with _lock:
+        lazy = _lazy_classes.get(cls)
+        if lazy is None:
+            lazy = _build_lazy_class(cls)
+            _lazy_classes[cls] = lazy
+    return lazy
+
+
+def _build_lazy_class(cls: type) -> type:
+    specs = field_specs(cls, _lazy_model)
+    if specs is None:
+        raise TypeError(f"{cls.__name__} cannot be decoded lazily")
+    namespace: Dict[str, Any] = {
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__doc__": cls.__doc__,
+        "__eq__": _lazy_eq,
+        "__reduce__": _lazy_reduce,
+        "_lazy_base": cls,
+    }
+    for spec in specs:
+        namespace[spec.name] = _LazyField(spec)
+    return type(cls.__name__, (cls,), namespace)
+
+
+def _lazy_model(tp: type) -> Decoder:
+    # Nested models stay lazy; anything that is not a JSON object takes the
+    # eager path, which handles it exactly as from_dict would.
+    def decode(value, infer_missing):
+        if type(value) is dict:
+            return lazy_from_dict(tp, value)
+        return decoder_for(tp)(value, infer_missing)
+
+    return decode
+
+
+class _LazyField:
+    """Non-data descriptor that decodes one field on first read and caches the
+    result in the instance ``__dict__``, which then shadows the descriptor so
+    later reads are plain attribute lookups."""
+
+    __slots__ = ("spec",)
+
+    def __init__(self, spec: FieldSpec):
+        self.spec = spec
+
+    def __get__(self, obj, owner=None):
+        spec = self.spec
+        if obj is None:
+            if spec.default is dataclasses.MISSING:
+                raise AttributeError(spec.name)
+            return spec.default
+        raw = obj.__dict__[_RAW]
+        if spec.key in raw:
+            value = raw[spec.key]
+        elif spec.default is not dataclasses.MISSING:
+            value = spec.default
+        elif spec.default_factory is not dataclasses.MISSING:
+            value = spec.default_factory()
+        else:
+            value = None
+        if value is not None:
+            value = spec.decode(value, True)
+        obj.__dict__[spec.name] = value
+        return value
+
+
+def _lazy_eq(self, other):
+    base = type(self)._lazy_base
+    if not isinstance(other, base):
+        return NotImplemented
+    names = [f.name for f in dataclasses.fields(base)]
+    return [getattr(self, n) for n in names] == [getattr(other, n) for n in names]
+
+
+def _lazy_reduce(self):
+    # Lazy classes are built at runtime and cannot be pickled by reference, so
+    # pickling (and copy) materializes an instance of the generated model.
+    base = type(self)._lazy_base
+    return (
+        _rebuild,
+        (base, {f.name: getattr(self, f.name) for f in dataclasses.fields(base)}),
+    )
+
+
+def _rebuild(cls: type, kwargs: Dict[str, Any]):
+    return cls(**kwargs)
+
+
+__all__ = ["lazy_from_dict", "is_lazy"]
@@ -1,7 +1,10 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from typing import AsyncIterator
+
 from getstream.base import AsyncBaseClient
 from getstream.common import telemetry
 from getstream.models import *
+from getstream.pagination import apaginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
@@ -243,6 +246,26 @@ class ModerationRestClient(AsyncBaseClient):
             "/api/v2/moderation/appeals", QueryAppealsResponse, json=json
         )
 
+    def aiter_query_appeals(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[AppealItemResponse]:
+        return apaginate(
+            self.query_appeals,
+            "items",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.bulk_action_appeals")
     async def bulk_action_appeals(
         self,
@@ -468,6 +491,26 @@ class ModerationRestClient(AsyncBaseClient):
             "/api/v2/moderation/configs", QueryModerationConfigsResponse, json=json
         )
 
+    def aiter_query_moderation_configs(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ConfigResponse]:
+        return apaginate(
+            self.query_moderation_configs,
+            "configs",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.custom_check")
     async def custom_check(
         self,
@@ -572,6 +615,22 @@ class ModerationRestClient(AsyncBaseClient):
             "/api/v2/moderation/flags", QueryModerationFlagsResponse, json=json
         )
 
+    def aiter_query_moderation_flags(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ModerationFlagResponse]:
+        return apaginate(
+            self.query_moderation_flags,
+            "flags",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.labels")
     async def labels(
         self,
@@ -618,6 +677,26 @@ class ModerationRestClient(AsyncBaseClient):
             "/api/v2/moderation/labels/results", QueryLabelResultsResponse, json=json
         )
 
+    def aiter_query_label_results(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[LabelResultResponse]:
+        return apaginate(
+            self.query_label_results,
+            "label_results",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.query_moderation_logs")
     async def query_moderation_logs(
         self,
@@ -642,6 +721,26 @@ class ModerationRestClient(AsyncBaseClient):
             "/api/v2/moderation/logs", QueryModerationLogsResponse, json=json
         )
 
+    def aiter_query_moderation_logs(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ActionLogResponse]:
+        return apaginate(
+            self.query_moderation_logs,
+            "logs",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.upsert_moderation_rule")
     async def upsert_moderation_rule(
         self,
@@ -725,6 +824,26 @@ class ModerationRestClient(AsyncBaseClient):
             json=json,
         )
 
+    def aiter_query_moderation_rules(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ModerationRuleV2Response]:
+        return apaginate(
+            self.query_moderation_rules,
+            "rules",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.mute")
     async def mute(
         self,
@@ -857,6 +976,36 @@ class ModerationRestClient(AsyncBaseClient):
             "/api/v2/moderation/review_queue", QueryReviewQueueResponse, json=json
         )
 
+    def aiter_query_review_queue(
+        self,
+        exclude_default_action_config: Optional[bool] = None,
+        limit: Optional[int] = None,
+        lock_count: Optional[int] = None,
+        lock_duration: Optional[int] = None,
+        lock_items: Optional[bool] = None,
+        stats_only: Optional[bool] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ReviewQueueItemResponse]:
+        return apaginate(
+            self.query_review_queue,
+            "items",
+            prefetch=prefetch,
+            exclude_default_action_config=exclude_default_action_config,
+            limit=limit,
+            lock_count=lock_count,
+            lock_duration=lock_duration,
+            lock_items=lock_items,
+            stats_only=stats_only,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.get_review_queue_item")
     async def get_review_queue_item(
         self, id: str
@@ -1,7 +1,10 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from typing import Iterator
+
 from getstream.base import BaseClient
 from getstream.common import telemetry
 from getstream.models import *
+from getstream.pagination import paginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
@@ -241,6 +244,26 @@ class ModerationRestClient(BaseClient):
         ).to_dict()
         return self.post("/api/v2/moderation/appeals", QueryAppealsResponse, json=json)
 
+    def iter_query_appeals(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[AppealItemResponse]:
+        return paginate(
+            self.query_appeals,
+            "items",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.bulk_action_appeals")
     def bulk_action_appeals(
         self,
@@ -462,6 +485,26 @@ class ModerationRestClient(BaseClient):
             "/api/v2/moderation/configs", QueryModerationConfigsResponse, json=json
         )
 
+    def iter_query_moderation_configs(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ConfigResponse]:
+        return paginate(
+            self.query_moderation_configs,
+            "configs",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.custom_check")
     def custom_check(
         self,
@@ -564,6 +607,22 @@ class ModerationRestClient(BaseClient):
             "/api/v2/moderation/flags", QueryModerationFlagsResponse, json=json
         )
 
+    def iter_query_moderation_flags(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ModerationFlagResponse]:
+        return paginate(
+            self.query_moderation_flags,
+            "flags",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter=filter,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.labels")
     def labels(
         self,
@@ -610,6 +669,26 @@ class ModerationRestClient(BaseClient):
             "/api/v2/moderation/labels/results", QueryLabelResultsResponse, json=json
         )
 
+    def iter_query_label_results(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[LabelResultResponse]:
+        return paginate(
+            self.query_label_results,
+            "label_results",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.query_moderation_logs")
     def query_moderation_logs(
         self,
@@ -634,6 +713,26 @@ class ModerationRestClient(BaseClient):
             "/api/v2/moderation/logs", QueryModerationLogsResponse, json=json
         )
 
+    def iter_query_moderation_logs(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ActionLogResponse]:
+        return paginate(
+            self.query_moderation_logs,
+            "logs",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.upsert_moderation_rule")
     def upsert_moderation_rule(
         self,
@@ -717,6 +816,26 @@ class ModerationRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_moderation_rules(
+        self,
+        limit: Optional[int] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ModerationRuleV2Response]:
+        return paginate(
+            self.query_moderation_rules,
+            "rules",
+            prefetch=prefetch,
+            limit=limit,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.mute")
     def mute(
         self,
@@ -849,6 +968,36 @@ class ModerationRestClient(BaseClient):
             "/api/v2/moderation/review_queue", QueryReviewQueueResponse, json=json
         )
 
+    def iter_query_review_queue(
+        self,
+        exclude_default_action_config: Optional[bool] = None,
+        limit: Optional[int] = None,
+        lock_count: Optional[int] = None,
+        lock_duration: Optional[int] = None,
+        lock_items: Optional[bool] = None,
+        stats_only: Optional[bool] = None,
+        user_id: Optional[str] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter: Optional[Dict[str, object]] = None,
+        user: Optional[UserRequest] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ReviewQueueItemResponse]:
+        return paginate(
+            self.query_review_queue,
+            "items",
+            prefetch=prefetch,
+            exclude_default_action_config=exclude_default_action_config,
+            limit=limit,
+            lock_count=lock_count,
+            lock_duration=lock_duration,
+            lock_items=lock_items,
+            stats_only=stats_only,
+            user_id=user_id,
+            sort=sort,
+            filter=filter,
+            user=user,
+        )
+
     @telemetry.operation_name("getstream.api.moderation.get_review_queue_item")
     def get_review_queue_item(
         self, id: str
@@ -0,0 +1,107 @@
+"""Cursor pagination behind the generated ``iter_*``/``aiter_*`` methods.
+
+Cursor-paginated endpoints take a ``next`` argument and return a response
+whose ``next`` field is the cursor of the following page (``None`` on the
+last one). ``paginate``/``apaginate`` walk those pages and yield the items
+of one list field, holding a single page in memory at a time.
+
+With ``prefetch=True`` the request for the following page is started as soon
+as a page arrives (on a worker thread for sync clients, as a task for async
+ones), so its round trip overlaps with the caller consuming the current page.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from getstream.stream_response import StreamResponse
+
+
+def paginate(
+    fetch: Callable[..., "StreamResponse[Any]"],
+    items: str,
+    *,
+    prefetch: bool = False,
+    **params: Any,
+) -> Iterator[Any]:
+    """Yield ``getattr(page, items)`` for every page of ``fetch(**params)``.
+
+    ``fetch`` is called with ``next=<cursor>`` for each page after the first
+    (or the first too when ``params`` carries ``next``). Iteration stops when
+    a page has no ``next`` cursor. Pages are requested as the iterator is
+    consumed, so abandoning it early issues no further requests beyond an
+    already prefetched one.
+    """
+    cursor: Optional[str] = params.pop("next", None)
+    pool = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="getstream-paginate")
+        if prefetch
+        else None
+    )
+    try:
+        page = fetch(next=cursor, **params).data
+        while True:
+            cursor = page.next
+            pending = None
+            if pool is not None and cursor:
+                # copy the context so tracing spans parent the same way as
+                # for requests made on the caller's thread
+                ctx = contextvars.copy_context()
+                pending = pool.submit(ctx.run, fetch, next=cursor, **params)
+            yield from getattr(page, items) or ()
+            if not cursor:
+                return
+            if pending is not None:
+                page = pending.result().data
+            else:
+                page = fetch(next=cursor, **params).data
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    fetch: Callable[..., Awaitable["StreamResponse[Any]"]],
+    items: str,
+    *,
+    prefetch: bool = False,
+    **params: Any,
+) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`paginate` for async clients."""
+    cursor: Optional[str] = params.pop("next", None)
+    page = (await fetch(next=cursor, **params)).data
+    while True:
+        cursor = page.next
+        pending: Optional[asyncio.Task] = None
+        if prefetch and cursor:
+            pending = asyncio.ensure_future(fetch(next=cursor, **params))
+        try:
+            for item in getattr(page, items) or ():
+                yield item
+        except BaseException:
+            # closed early (or the consumer raised into us): drop the
+            # prefetched page rather than leaving the request running
+            if pending is not None:
+                pending.cancel()
+            raise
+        if not cursor:
+            return
+        if pending is not None:
+            page = (await pending).data
+        else:
+            page = (await fetch(next=cursor, **params)).data
+
+
+__all__ = ["paginate", "apaginate"]
@@ -0,0 +1,432 @@
+"""Connection pool warm-up and metrics.
+
+``PoolMonitor`` (``Stream.pool_stats()``) follows every request through
+httpcore's ``trace`` extension: how long it waited for a pooled connection,
+the TCP connect and TLS handshake of any connection opened for it, its time
+to first byte and its body sizes, plus the requests in flight per endpoint
+and the pool's active and idle connections. The same figures are recorded as
+OpenTelemetry instruments (see ``getstream.common.telemetry``). Timings come
+from the transport, so requests sent through a custom ``transport=`` that
+bypasses httpcore only count towards ``in_flight`` and the byte totals.
+
+Warming (``Stream.warmup`` / ``AsyncStream.warmup``) opens ``n`` pooled connections to ``base_url`` ahead of traffic, so
+the first requests after start-up (or after connections idled out) do not
+pay for DNS, TCP and TLS. It sends ``n`` ``HEAD /`` requests at once and
+keeps each response unread until all of them have one, which forces the
+pool to use ``n`` distinct connections; reading the responses then returns
+the connections to the pool, idle. With HTTP/2 the requests share connections,
+so fewer are opened.
+
+A keep-alive warms the pool again every ``keep_alive_interval(idle_timeout)``
+seconds, before idle connections expire, until it is stopped. A refresh
+skips the connections busy with a request (they are not about to expire)
+and reads each response as soon as it arrives, so it never holds a
+connection that live traffic is waiting for. Its requests are sent together,
+so over any real round trip they still land on distinct idle connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from getstream.common.telemetry import (
+    observe_pool,
+    record_in_flight,
+    record_transport_metrics,
+)
+
+WARMUP_PATH = "/"
+# how long before ``idle_timeout`` the keep-alive refreshes the pool
+KEEP_ALIVE_MARGIN = 5.0
+
+
+def keep_alive_interval(idle_timeout: float) -> float:
+    return max(idle_timeout - KEEP_ALIVE_MARGIN, idle_timeout / 2)
+
+
+class _Gate:
+    """Holds every warm-up response open until all ``n`` requests have
+    either a response or an error. Refreshes do not wait on it."""
+
+    def __init__(self, n: int):
+        self.pending = n
+        self.opened = 0
+
+
+def _log_warmed(
+    log: logging.Logger, requested: int, opened: int, start: float, *, refresh: bool
+) -> None:
+    log.log(
+        logging.DEBUG if refresh else logging.INFO,
+        "pool.warmed",
+        extra={
+            "stream.pool.requested": requested,
+            "stream.pool.warmed": opened,
+            "stream.pool.keep_alive": refresh,
+            "duration_ms": int((time.perf_counter() - start) * 1000.0),
+        },
+    )
+
+
+def _pool_of(client: Any) -> Any:
+    """The httpcore pool behind an ``httpx`` client, if it has one."""
+    return getattr(getattr(client, "_transport", None), "_pool", None)
+
+
+def _connection_counts(client: Any) -> Optional[Tuple[int, int]]:
+    """(active, idle) connections in ``client``'s pool, or ``None``."""
+    connections = getattr(_pool_of(client), "connections", None)
+    if connections is None:
+        return None
+    idle = sum(1 for c in connections if c.is_idle())
+    return len(connections) - idle, idle
+
+
+def _refresh_size(client: Any, n: int) -> int:
+    counts = _connection_counts(client)
+    return n - counts[0] if counts else n
+
+
+def warm_sync(
+    client: httpx.Client, n: int, log: logging.Logger, *, refresh: bool = False
+) -> int:
+    """Open up to ``n`` connections in ``client``'s pool; returns how many
+    warm-up requests got a response. Failures are counted, not raised.
+    A ``refresh`` sends one request fewer per active connection and does
+    not hold the responses."""
+    if refresh:
+        n = _refresh_size(client, n)
+    if n < 1:
+        return 0
+    gate = _Gate(n)
+    cond = threading.Condition()
+
+    def arrive(opened: bool) -> None:
+        with cond:
+            gate.pending -= 1
+            gate.opened += opened
+            cond.notify_all()
+
+    def open_one() -> None:
+        arrived = False
+        try:
+            with client.stream("HEAD", WARMUP_PATH) as response:
+                arrive(True)
+                arrived = True
+                if not refresh:
+                    with cond:
+                        cond.wait_for(lambda: gate.pending == 0)
+                # a response closed unread takes its connection with it
+                response.read()
+        except Exception:
+            # best effort: a failed request (or a closed client) only means
+            # one connection fewer
+            if not arrived:
+                arrive(False)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(
+        max_workers=n, thread_name_prefix="getstream-warmup"
+    ) as pool:
+        for _ in range(n):
+            pool.submit(open_one)
+    _log_warmed(log, n, gate.opened, start, refresh=refresh)
+    return gate.opened
+
+
+async def warm_async(
+    client: httpx.AsyncClient,
+    n: int,
+    log: logging.Logger,
+    *,
+    refresh: bool = False,
+) -> int:
+    """Async twin of ``warm_sync``."""
+    if refresh:
+        n = _refresh_size(client, n)
+    if n < 1:
+        return 0
+    gate = _Gate(n)
+    done = asyncio.Event()
+
+    def arrive(opened: bool) -> None:
+        gate.pending -= 1
+        gate.opened += opened
+        if gate.pending == 0:
+            done.set()
+
+    async def open_one() -> None:
+        arrived = False
+        try:
+            async with client.stream("HEAD", WARMUP_PATH) as response:
+                arrive(True)
+                arrived = True
+                if not refresh:
+                    await done.wait()
+                await response.aread()
+        except Exception:
+            if not arrived:
+                arrive(False)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(open_one() for _ in range(n)))
+    _log_warmed(log, n, gate.opened, start, refresh=refresh)
+    return gate.opened
+
+
+class KeepAlive:
+    """Re-warms a sync client's pool from a daemon thread."""
+
+    def __init__(
+        self, client: httpx.Client, n: int, interval: float, log: logging.Logger
+    ):
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(client, n, interval, log),
+            name="getstream-keep-alive",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(
+        self, client: httpx.Client, n: int, interval: float, log: logging.Logger
+    ) -> None:
+        while not self._stop.wait(interval):
+            warm_sync(client, n, log, refresh=True)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class AsyncKeepAlive:
+    """Re-warms an async client's pool from a task on the current loop."""
+
+    def __init__(
+        self, client: httpx.AsyncClient, n: int, interval: float, log: logging.Logger
+    ):
+        self._task: Optional[asyncio.Task] = asyncio.get_running_loop().create_task(
+            self._run(client, n, interval, log)
+        )
+
+    async def _run(
+        self, client: httpx.AsyncClient, n: int, interval: float, log: logging.Logger
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await warm_async(client, n, log, refresh=True)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    """Count, total and maximum of one transport timing, in milliseconds."""
+
+    count: int
+    total_ms: float
+    max_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of a client's connection pool and transport timings since
+    the client was built. Connection counts are ``None`` when the pool
+    cannot be inspected (a custom ``transport=``)."""
+
+    active_connections: Optional[int]
+    idle_connections: Optional[int]
+    max_connections: Optional[int]
+    in_flight: Dict[str, int]
+    requests: int
+    connections_opened: int
+    pool_wait: TimingStats
+    connect: TimingStats
+    tls: TimingStats
+    time_to_first_byte: TimingStats
+    bytes_sent: int
+    bytes_received: int
+
+
+class _Timing:
+    __slots__ = ("count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: Optional[float]) -> None:
+        if ms is None:
+            return
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def snapshot(self) -> TimingStats:
+        return TimingStats(self.count, self.total_ms, self.max_ms)
+
+
+class RequestTrace:
+    """httpcore trace events of one request; ``hook`` (sync) or
+    ``ahook`` (async) is its ``trace`` extension."""
+
+    __slots__ = ("endpoint", "attributes", "start", "acquired", "marks")
+
+    def __init__(self, endpoint: str, attributes: Dict[str, Any]):
+        self.endpoint = endpoint
+        self.attributes = attributes
+        self.start = time.perf_counter()
+        self.acquired: Optional[float] = None
+        self.marks: Dict[str, float] = {}
+
+    def hook(self, name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if self.acquired is None:
+            # the first event is the pool handing over (or opening) a
+            # connection
+            self.acquired = now
+        # "connection.connect_tcp.started" -> "connect_tcp.started"
+        self.marks.setdefault(name.split(".", 1)[-1], now)
+
+    async def ahook(self, name: str, info: Dict[str, Any]) -> None:
+        self.hook(name, info)
+
+    def _span(self, started: str, complete: str) -> Optional[float]:
+        begin, end = self.marks.get(started), self.marks.get(complete)
+        if begin is None or end is None:
+            return None
+        return (end - begin) * 1000.0
+
+    def timings(self) -> Tuple[Optional[float], ...]:
+        """(pool wait, TCP connect, TLS, time to first byte) in ms."""
+        pool_wait = (
+            (self.acquired - self.start) * 1000.0 if self.acquired is not None else None
+        )
+        return (
+            pool_wait,
+            self._span("connect_tcp.started", "connect_tcp.complete"),
+            self._span("start_tls.started", "start_tls.complete"),
+            self._span(
+                "send_request_headers.started", "receive_response_headers.complete"
+            ),
+        )
+
+
+class PoolMonitor:
+    """Transport metrics of one ``Stream``/``AsyncStream``. Shared by the
+    client and its sub-clients, like the connection pool it watches."""
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.client: Any = None
+        self.attributes: Dict[str, Any] = {"stream.api_key": api_key} if api_key else {}
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._requests = 0
+        self._connections_opened = 0
+        self._pool_wait = _Timing()
+        self._connect = _Timing()
+        self._tls = _Timing()
+        self._ttfb = _Timing()
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        observe_pool(self)
+
+    def start(self, endpoint: str, attributes: Dict[str, Any]) -> RequestTrace:
+        """Count a request in flight and return its trace."""
+        with self._lock:
+            self._in_flight[endpoint] = self._in_flight.get(endpoint, 0) + 1
+        record_in_flight(1, attributes=attributes)
+        return RequestTrace(endpoint, attributes)
+
+    def finish(self, trace: RequestTrace, response: Optional[httpx.Response]) -> None:
+        """Record a request started with ``start``; ``response`` is ``None``
+        when it failed."""
+        pool_wait, connect, tls, ttfb = trace.timings()
+        bytes_sent = bytes_received = 0
+        if response is not None:
+            bytes_sent = int(response.request.headers.get("content-length") or 0)
+            bytes_received = response.num_bytes_downloaded
+        with self._lock:
+            count = self._in_flight[trace.endpoint] - 1
+            if count:
+                self._in_flight[trace.endpoint] = count
+            else:
+                del self._in_flight[trace.endpoint]
+            self._requests += 1
+            self._connections_opened += connect is not None
+            self._pool_wait.add(pool_wait)
+            self._connect.add(connect)
+            self._tls.add(tls)
+            self._ttfb.add(ttfb)
+            self._bytes_sent += bytes_sent
+            self._bytes_received += bytes_received
+        record_in_flight(-1, attributes=trace.attributes)
+        record_transport_metrics(
+            pool_wait_ms=pool_wait,
+            connect_ms=connect,
+            tls_ms=tls,
+            ttfb_ms=ttfb,
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            attributes=trace.attributes,
+        )
+
+    def connection_counts(self) -> Optional[Tuple[int, int]]:
+        """(active, idle) connections in the pool, or ``None``."""
+        return _connection_counts(self.client)
+
+    def stats(self) -> PoolStats:
+        counts = self.connection_counts()
+        with self._lock:
+            return PoolStats(
+                active_connections=counts[0] if counts else None,
+                idle_connections=counts[1] if counts else None,
+                max_connections=getattr(
+                    _pool_of(self.client), "_max_connections", None
+                ),
+                in_flight=dict(self._in_flight),
+                requests=self._requests,
+                connections_opened=self._connections_opened,
+                pool_wait=self._pool_wait.snapshot(),
+                connect=self._connect.snapshot(),
+                tls=self._tls.snapshot(),
+                time_to_first_byte=self._ttfb.snapshot(),
+                bytes_sent=self._bytes_sent,
+                bytes_received=self._bytes_received,
+            )
+
+
+__all__ = [
+    "AsyncKeepAlive",
+    "KeepAlive",
+    "PoolMonitor",
+    "PoolStats",
+    "RequestTrace",
+    "TimingStats",
+    "keep_alive_interval",
+    "warm_async",
+    "warm_sync",
+]
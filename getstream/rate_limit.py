@@ -1,8 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Optional
+import threading
+import time
+from typing import Any, Dict, Optional
 import httpx
 
+from getstream.config import RateLimitConfig
+
 
 @dataclass(frozen=True)
 class RateLimitInfo:
@@ -36,3 +40,112 @@ def extract_rate_limit(response: httpx.Response) -> Optional[RateLimitInfo]:
         except ValueError:
             return None
     return None
+
+
+# Stream rate limits are counted over one-minute windows; used to roll a
+# budget forward when its window ends before a response reports the next one.
+RATE_LIMIT_WINDOW = 60.0
+
+
+class _Budget:
+    __slots__ = ("limit", "remaining", "reset", "next_at")
+
+    def __init__(self, limit: int, remaining: int, reset: float):
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        # earliest time the next request may be sent
+        self.next_at = 0.0
+
+    def roll(self, at: float) -> None:
+        if at >= self.reset:
+            windows = (at - self.reset) // RATE_LIMIT_WINDOW + 1
+            self.reset += windows * RATE_LIMIT_WINDOW
+            self.remaining = self.limit
+
+
+class RateLimiter:
+    """Per-endpoint request budget built from ``x-ratelimit-*`` headers.
+
+    One instance is shared by a ``Stream``/``AsyncStream`` and all of its
+    sub-clients; requests are keyed by their ``stream.endpoint_name``. Before
+    a request, ``reserve`` takes one request from that endpoint's budget and
+    returns how long to wait before sending it; ``update`` replaces the
+    local estimate with what the API reported. Endpoints without a reported
+    budget are never delayed. Safe to use from several threads and from
+    sync and async clients at once: waiting happens outside the lock.
+    """
+
+    def __init__(self, config: RateLimitConfig):
+        self.config = config
+        self._budgets: Dict[str, _Budget] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve one request on ``endpoint``; return the seconds to wait
+        before sending it."""
+        with self._lock:
+            budget = self._budgets.get(endpoint)
+            if budget is None:
+                return 0.0
+            now = time.time()
+            at = max(now, budget.next_at)
+            budget.roll(at)
+            headroom = self._headroom(budget)
+            while budget.remaining - headroom <= 0:
+                # spent: queue behind the window reset
+                at = max(at, budget.reset)
+                budget.roll(at)
+            self._take(budget, at, headroom)
+            return at - now
+
+    def try_reserve(self, endpoint: str) -> bool:
+        """Reserve one request on ``endpoint`` only if it can be sent now,
+        without waiting; return whether it was reserved."""
+        with self._lock:
+            budget = self._budgets.get(endpoint)
+            if budget is None:
+                return True
+            now = time.time()
+            if budget.next_at > now:
+                return False
+            budget.roll(now)
+            headroom = self._headroom(budget)
+            if budget.remaining - headroom <= 0:
+                return False
+            self._take(budget, now, headroom)
+            return True
+
+    def _headroom(self, budget: _Budget) -> int:
+        # never hold back more than limit - 1, or nothing could be sent
+        return min(self.config.headroom, budget.limit - 1)
+
+    def _take(self, budget: _Budget, at: float, headroom: int) -> None:
+        # later requests queue behind this one, spaced out when pacing
+        budget.next_at = at
+        if self.config.pace:
+            usable = budget.remaining - headroom
+            budget.next_at += (budget.reset - at) / usable
+        budget.remaining -= 1
+
+    def update(self, endpoint: str, info: Optional[RateLimitInfo]) -> None:
+        """Record the budget reported by a response to ``endpoint``."""
+        if info is None or info.limit <= 0:
+            return
+        reset = info.reset.timestamp()
+        with self._lock:
+            budget = self._budgets.get(endpoint)
+            if budget is None:
+                self._budgets[endpoint] = _Budget(info.limit, info.remaining, reset)
+                return
+            budget.limit = info.limit
+            if reset > budget.reset:
+                # a window the local estimate had not reached: start over
+                budget.reset = reset
+                budget.remaining = info.remaining
+                budget.next_at = 0.0
+            elif reset == budget.reset:
+                # responses can arrive out of order, and requests reserved
+                # since are not counted by the server yet
+                budget.remaining = min(budget.remaining, info.remaining)
+            # an older window than the local estimate: stale, ignore
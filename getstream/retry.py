@@ -0,0 +1,29 @@
+import threading
+
+from getstream.config import RetryConfig
+
+
+class RetryBudget:
+    """Token bucket that caps retries at a fraction of the requests sent
+    (see ``RetryConfig``). Each request deposits ``budget_ratio`` of a token
+    and each retry takes a whole one. The bucket starts full, so a client
+    that has sent little traffic can still retry a short burst of failures.
+    One instance is shared by a ``Stream`` and its sub-clients."""
+
+    def __init__(self, config: RetryConfig):
+        self.ratio = config.budget_ratio or 0.0
+        self.capacity = config.budget_burst
+        self.tokens = config.budget_burst
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take the token for one retry; ``False`` if the budget is spent."""
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
@@ -1,32 +1,88 @@
 from __future__ import annotations
 
 from contextlib import AsyncExitStack
-from functools import cached_property
+from functools import cached_property, wraps
+import asyncio
+from concurrent.futures import Executor, Future
 import logging
 import time
-from typing import List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
 from uuid import uuid4
 
 import httpx
-import jwt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from getstream.base import _log_client_initialized, _resolve_logger
+from getstream.base import (
+    DEFAULT_INLINE_PARSE_MAX_BYTES,
+    DEFAULT_PARSE_MAX_WORKERS,
+    _CodecOffload,
+    _log_client_initialized,
+    _request_capacity,
+    _resolve_logger,
+)
 from getstream.common import telemetry
-from getstream.config import RetryConfig
-from getstream.chat.client import ChatClient
-from getstream.chat.async_client import ChatClient as AsyncChatClient
+from getstream.config import (
+    CacheConfig,
+    CircuitBreakerConfig,
+    CoalesceConfig,
+    CompressionConfig,
+    HedgeConfig,
+    RateLimitConfig,
+    RetryConfig,
+    TokenCacheConfig,
+    UserBatchConfig,
+)
+from getstream import models
 from getstream.common.async_client import CommonClient as AsyncCommonClient
 from getstream.common.client import CommonClient
-from getstream.feeds.client import FeedsClient
-from getstream.models import FullUserResponse, UserRequest
-from getstream.moderation.client import ModerationClient
-from getstream.moderation.async_client import ModerationClient as AsyncModerationClient
+from getstream.batching import AsyncUserBatcher, UserBatcher
+from getstream.cache import CacheStats, ResponseCache
+from getstream.circuit_breaker import CircuitBreaker
+from getstream.coalesce import CoalesceStats, SingleFlight
+from getstream.hedge import Hedger, HedgeStats
+from getstream.pool import (
+    AsyncKeepAlive,
+    KeepAlive,
+    PoolMonitor,
+    PoolStats,
+    keep_alive_interval,
+    warm_async,
+    warm_sync,
+)
+from getstream.rate_limit import RateLimiter
+from getstream.retry import RetryBudget
+from getstream.tokens import TokenCache, TokenMinter, token_key
 from getstream.utils import validate_and_clean_url
-from getstream.video.client import VideoClient
-from getstream.video.async_client import VideoClient as AsyncVideoClient
 from typing_extensions import deprecated
 
+if TYPE_CHECKING:
+    from getstream.bulk import AsyncBulkRun, BulkRun
+
+    # The product clients (and the generated models they use) are imported
+    # on first access of the matching property, not with getstream.
+    from getstream.chat.async_client import ChatClient as AsyncChatClient
+    from getstream.chat.client import ChatClient
+    from getstream.feeds.client import FeedsClient
+    from getstream.models import FullUserResponse, UserRequest
+    from getstream.moderation.async_client import (
+        ModerationClient as AsyncModerationClient,
+    )
+    from getstream.moderation.client import ModerationClient
+    from getstream.video.async_client import VideoClient as AsyncVideoClient
+    from getstream.video.client import VideoClient
+    from getstream.webhook_batch import Delivery
+    from getstream.webhook_routing import PeekedEvent
+
 
 BASE_URL = "https://chat.stream-io-api.com/"
 
@@ -39,10 +95,12 @@ DEFAULT_MAX_CONNS_PER_HOST = 5
 DEFAULT_IDLE_TIMEOUT = 55.0
 # DEFAULT_CONNECT_TIMEOUT caps TCP + TLS handshake duration.
 DEFAULT_CONNECT_TIMEOUT = 10.0
+# DEFAULT_HTTP2 keeps the plain HTTP/1.1 transport unless the caller opts in.
+DEFAULT_HTTP2 = False
 
 
 class Settings(BaseSettings):
-    # Env names: STREAM_API_KEY, STREAM_API_SECRET, STREAM_BASE_URL, STREAM_TIMEOUT, STREAM_REQUEST_TIMEOUT, STREAM_MAX_CONNS_PER_HOST, STREAM_IDLE_TIMEOUT, STREAM_CONNECT_TIMEOUT
+    # Env names: STREAM_API_KEY, STREAM_API_SECRET, STREAM_BASE_URL, STREAM_TIMEOUT, STREAM_REQUEST_TIMEOUT, STREAM_MAX_CONNS_PER_HOST, STREAM_IDLE_TIMEOUT, STREAM_CONNECT_TIMEOUT, STREAM_HTTP2
     api_key: str
     api_secret: Optional[str] = None
     base_url: Optional[str] = None
@@ -52,12 +110,26 @@ class Settings(BaseSettings):
     max_conns_per_host: int = DEFAULT_MAX_CONNS_PER_HOST
     idle_timeout: float = DEFAULT_IDLE_TIMEOUT
     connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    http2: bool = DEFAULT_HTTP2
 
     model_config = SettingsConfigDict(
         env_prefix="STREAM_",
     )
 
 
+def _require_h2() -> None:
+    """Fail fast with an install hint when HTTP/2 is requested without the
+    optional ``h2`` dependency, instead of surfacing httpx's generic error
+    from deep inside client construction."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "The `http2` optional dependency is required to use `http2=True`. "
+            "Please install it using the following command: `pip install getstream[http2]`"
+        ) from None
+
+
 class _PoolSettings(BaseSettings):
     """Env-only view of the pool knobs and request timeout.
 
@@ -73,12 +145,65 @@ class _PoolSettings(BaseSettings):
     max_conns_per_host: int = DEFAULT_MAX_CONNS_PER_HOST
     idle_timeout: float = DEFAULT_IDLE_TIMEOUT
     connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    http2: bool = DEFAULT_HTTP2
 
     model_config = SettingsConfigDict(
         env_prefix="STREAM_",
     )
 
 
+# Attributes a clone_for_token view does not take over from its parent:
+# its own product clients, user batcher and keep-alive.
+_VIEW_OWN_STATE = (
+    "video",
+    "chat",
+    "moderation",
+    "feeds",
+    "_user_batcher",
+    "_keep_alive",
+)
+
+# Runtime state a clone_for_token view gets fresh rather than sharing, and
+# hands to its product clients. Stream counts rate limits per user for
+# user-token requests, and one user's retries, failures or slow requests
+# must not throttle, trip or hedge the other views. The pool, the codec
+# offload and the caches (keyed by token) stay shared.
+_VIEW_RUNTIME = ("rate_limiter", "breaker", "retry_budget", "hedger")
+
+
+def _with_token(client, token: str, **attrs):
+    """Shallow copy of ``client`` that authenticates with ``token``. It
+    shares the httpx client and everything else with ``client`` and sends
+    its own ``Authorization`` header on each request."""
+    view = object.__new__(type(client))
+    view.__dict__.update(client.__dict__)
+    view.token = token
+    view.token_override = token
+    view.headers = {**client.headers, "Authorization": token}
+    view.__dict__.update(attrs)
+    return view
+
+
+def _sub_client(build):
+    """``cached_property`` for the product clients (``video``, ``chat``,
+    ...). On a ``clone_for_token`` view it returns the parent's product
+    client authenticated with the view's token, instead of building a new
+    one and a throwaway httpx client."""
+
+    @wraps(build)
+    def get(self):
+        parent = self.__dict__.get("_token_parent")
+        if parent is None:
+            return build(self)
+        sub_client = getattr(parent, build.__name__)
+        attrs = {name: getattr(self, name) for name in _VIEW_RUNTIME}
+        if "stream" in sub_client.__dict__:
+            attrs["stream"] = self
+        return _with_token(sub_client, self.token, **attrs)
+
+    return cached_property(get)
+
+
 class BaseStream:
     def __init__(
         self,
@@ -97,6 +222,18 @@ class BaseStream:
         logger: Optional[logging.Logger] = None,
         log_bodies: bool = False,
         retry: Optional[RetryConfig] = None,
+        http2: Optional[bool] = None,
+        lazy_models: bool = False,
+        rate_limit: Optional[RateLimitConfig] = None,
+        inline_parse_max_bytes: Optional[int] = None,
+        parse_max_workers: Optional[int] = None,
+        hedge: Optional[HedgeConfig] = None,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        cache: Optional[CacheConfig] = None,
+        coalesce: Optional[CoalesceConfig] = None,
+        user_batch: Optional[UserBatchConfig] = None,
+        compression: Optional[CompressionConfig] = None,
+        token_cache: Optional[TokenCacheConfig] = None,
     ):
         """Build a Stream client.
 
@@ -121,10 +258,24 @@ class BaseStream:
             connect_timeout: TCP + TLS handshake timeout in seconds. Default 10.0. Ignored when ``http_client`` is set.
             logger: Optional stdlib ``logging.Logger`` for the SDK's structured log events (``client.initialized``, ``http.request.sent``, ``http.response.received``, ``http.request.failed``). Defaults to ``logging.getLogger("getstream")``, which is a no-op until the caller attaches a handler.
             log_bodies: When ``True``, adds redacted request/response bodies to the request/response log events. Off by default. Emits one WARNING at construction when enabled.
-            retry: Optional ``RetryConfig`` enabling auto-retry of GET/HEAD requests on HTTP 429 or transport errors. Disabled by default (a single attempt; errors surface unchanged).
+            retry: Optional ``RetryConfig`` enabling auto-retry of GET/HEAD requests (and, with ``retry_writes``, POST/PUT/PATCH/DELETE) on HTTP 429 or transport errors, within a retry budget shared by this client and its sub-clients. Disabled by default (a single attempt; errors surface unchanged).
+            http2: When ``True``, negotiate HTTP/2 and multiplex concurrent requests over one connection per origin (up to ``HTTP2_MAX_CONCURRENT_STREAMS`` in flight; further requests wait for a free stream) instead of one request per HTTP/1.1 connection. Default ``False``. Requires the ``http2`` extra (``pip install getstream[http2]``). Ignored when ``http_client`` or ``transport`` is set.
+            lazy_models: When ``True``, response models keep the parsed JSON and decode each field on first access (nested models included) instead of decoding the whole payload up front. The returned objects are still instances of the documented model classes. Default ``False``.
+            rate_limit: Optional ``RateLimitConfig`` enabling a client-side limiter that tracks the ``x-ratelimit-*`` budget of each endpoint and delays requests before it runs out, instead of letting them fail with HTTP 429. Shared by this client and its sub-clients. Disabled by default.
+            inline_parse_max_bytes: Async client only. Responses up to this many bytes are parsed on the event loop; larger ones (and request bodies over ``INLINE_JSON_ENCODE_MAX_BYTES``) are handed to a dedicated thread pool. Default 65536; ``0`` offloads every non-empty response.
+            parse_max_workers: Async client only. Size of that thread pool, shared by this client and its sub-clients and created on first use. Default 4.
+            hedge: Optional ``HedgeConfig`` enabling hedged GET requests: a GET still pending after its endpoint's recent percentile latency is sent again on another pooled connection and the first response wins. Shared by this client and its sub-clients; ``hedge_stats()`` reports hedge rates. Disabled by default.
+            circuit_breaker: Optional ``CircuitBreakerConfig`` enabling a circuit breaker per endpoint: once an endpoint's recent failure rate crosses the threshold, its requests fail fast with ``StreamTransportException`` (``error_type="circuit_open"``) until probe requests succeed again. State changes are logged and counted in OpenTelemetry. Shared by this client and its sub-clients. Disabled by default.
+            cache: Optional ``CacheConfig`` enabling a TTL/LRU cache of read-mostly GET endpoints (``get_app``, ``list_channel_types``, ``get_call_type``, ...). Calling a mutating endpoint such as ``update_app`` through this client invalidates the endpoints it changes; ``cache_stats()`` reports hits and misses. Shared by this client and its sub-clients. Disabled by default.
+            coalesce: Optional ``CoalesceConfig`` enabling single-flight GETs: a GET identical to one already in flight through this client (or its sub-clients) waits for it and receives the same ``StreamResponse`` instead of sending another request. ``coalesce_stats()`` counts the requests collapsed. Disabled by default.
+            user_batch: Optional ``UserBatchConfig`` enabling micro-batching of ``create_user``/``upsert_user``/``submit_user``: users queued within ``max_delay`` seconds (up to ``max_batch_size``) are sent as one ``update_users`` call and each caller receives its own user. ``close()``/``aclose()`` flush the queue. Disabled by default.
+            compression: Optional ``CompressionConfig`` enabling gzip compression of JSON request bodies of at least ``min_bytes`` (sent with ``Content-Encoding: gzip``). The async client compresses large bodies on its codec thread pool. Shared by this client and its sub-clients. Disabled by default.
+            token_cache: Optional ``TokenCacheConfig`` enabling reuse of minted tokens: ``create_token``, ``create_call_token`` and ``create_tokens`` return the token minted earlier for the same user and claims until ``refresh_margin`` seconds before it expires. Disabled by default.
 
         Raises:
             ValueError: If both ``transport`` and ``http_client`` are set; if neither ``api_secret`` nor ``token`` can be resolved; if both are provided; if either is the empty string; if ``api_key`` is missing; or if ``request_timeout`` is not a positive number.
+            ValueError: If ``inline_parse_max_bytes`` is negative or ``parse_max_workers`` is less than 1.
+            ImportError: If ``http2`` is enabled but the ``h2`` package is not installed.
         """
         if transport is not None and http_client is not None:
             raise ValueError("Cannot specify both 'transport' and 'http_client'")
@@ -171,6 +322,10 @@ class BaseStream:
             idle_timeout = _settings().idle_timeout
         if connect_timeout is None:
             connect_timeout = _settings().connect_timeout
+        if http2 is None:
+            http2 = _settings().http2
+        if http2:
+            _require_h2()
 
         if not api_key:
             raise ValueError("api_key is required")
@@ -191,11 +346,21 @@ class BaseStream:
         self.max_conns_per_host = max_conns_per_host
         self.idle_timeout = idle_timeout
         self.connect_timeout = connect_timeout
+        self.http2 = bool(http2)
 
         self.base_url = validate_and_clean_url(base_url)
         self.user_agent = user_agent
         self._transport = transport
         self._http_client = http_client
+        # token_cache: tokens minted by _create_token, reused per claim set.
+        # Set before the server token below is minted through it.
+        self.token_cache = token_cache
+        self._token_cache = (
+            TokenCache(token_cache)
+            if token_cache is not None and token_cache.enabled
+            else None
+        )
+        self._token_minter: Optional[TokenMinter] = None
         self.token = token or self._create_token()
         # log / log_bodies are read by BaseClient via getattr(self, ...), same
         # plumbing as the pool knobs below: the intermediate generated REST
@@ -209,6 +374,81 @@ class BaseStream:
         # not forward this kwarg either. Read by BaseClient/AsyncBaseClient's
         # request loop and copied onto sub-clients in _apply_shared_client.
         self.retry = retry
+        # retry_budget: one token bucket per Stream, shared with sub-clients
+        # in _apply_shared_client like rate_limiter below.
+        self.retry_budget = (
+            RetryBudget(retry)
+            if retry is not None and retry.enabled and retry.budget_ratio is not None
+            else None
+        )
+        # lazy_models: read by ResponseParserMixin via getattr(self, ...) and
+        # copied onto sub-clients in _apply_shared_client, like retry.
+        self.lazy_models = lazy_models
+        # rate_limiter: one RateLimiter per Stream, read by the request loop
+        # via getattr(self, ...) and handed to every sub-client in
+        # _apply_shared_client so they all draw on the same budgets.
+        self.rate_limit = rate_limit
+        self.rate_limiter = (
+            RateLimiter(rate_limit)
+            if rate_limit is not None and rate_limit.enabled
+            else None
+        )
+        # codec_offload: the async request loop's inline-vs-thread-pool
+        # policy for parsing responses, read via getattr(self, ...) and
+        # shared with sub-clients in _apply_shared_client like rate_limiter.
+        # Its pool is shut down by this client's aclose().
+        self.inline_parse_max_bytes = (
+            DEFAULT_INLINE_PARSE_MAX_BYTES
+            if inline_parse_max_bytes is None
+            else inline_parse_max_bytes
+        )
+        self.parse_max_workers = (
+            DEFAULT_PARSE_MAX_WORKERS
+            if parse_max_workers is None
+            else parse_max_workers
+        )
+        self.codec_offload = _CodecOffload(
+            self.inline_parse_max_bytes, self.parse_max_workers
+        )
+        self._owns_codec_offload = True
+        # hedger: same plumbing as rate_limiter; its sync worker pool, sized
+        # from what the connection pool carries, is shut down by close().
+        self.hedge = hedge
+        self.hedger = (
+            Hedger(hedge, _request_capacity(self))
+            if hedge is not None and hedge.enabled
+            else None
+        )
+        self._owns_hedger = True
+        # breaker: same plumbing as rate_limiter. It logs its state changes
+        # to this client's logger.
+        self.circuit_breaker = circuit_breaker
+        self.breaker = (
+            CircuitBreaker(circuit_breaker, _resolve_logger(self))
+            if circuit_breaker is not None and circuit_breaker.enabled
+            else None
+        )
+        # response_cache: same plumbing as rate_limiter.
+        self.cache = cache
+        self.response_cache = (
+            ResponseCache(cache) if cache is not None and cache.enabled else None
+        )
+        # user_batch: read by Stream/AsyncStream's lazily built user batcher;
+        # unlike the settings above, it is not shared with sub-clients.
+        self.user_batch = user_batch
+        # single_flight: same plumbing as rate_limiter.
+        self.coalesce = coalesce
+        self.single_flight = (
+            SingleFlight(coalesce)
+            if coalesce is not None and coalesce.enabled
+            else None
+        )
+        # compression: same plumbing as retry; the config is read per request.
+        self.compression = compression
+        # pool_monitor: same plumbing as rate_limiter. It follows requests
+        # through the transport's trace hooks and is pointed at the shared
+        # httpx client below to count its connections.
+        self.pool_monitor = PoolMonitor(self.api_key)
         # Pool knobs are read by BaseClient via getattr(self, ...) since the intermediate generated REST clients (CommonRestClient etc.) do not forward these kwargs. self.max_conns_per_host / idle_timeout / connect_timeout were set above before super().__init__().
         super().__init__(
             self.api_key, self.base_url, self.token, self.timeout, self.user_agent
@@ -222,6 +462,7 @@ class BaseStream:
         # per-sub-client client would silently fall back to defaults; sharing
         # the parent's client avoids that and keeps one pool per Stream.
         self._shared_client = self.client
+        self.pool_monitor.client = self.client
 
         # Emit the client.initialized event exactly once per Stream, reflecting
         # the resolved knobs on the top-level client. Sub-clients no longer log
@@ -254,6 +495,41 @@ class BaseStream:
         """
         return self._api_secret is not None
 
+    def hedge_stats(self) -> Dict[str, HedgeStats]:
+        """Hedging counters per endpoint name, covering this client and its
+        sub-clients. Empty unless ``hedge`` is enabled."""
+        return self.hedger.stats() if self.hedger is not None else {}
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """Response cache hits and misses per endpoint name, covering this
+        client and its sub-clients. Empty unless ``cache`` is enabled."""
+        cache = self.response_cache
+        return cache.stats() if cache is not None else {}
+
+    def coalesce_stats(self) -> Dict[str, CoalesceStats]:
+        """Single-flight counters per endpoint name, covering this client
+        and its sub-clients. Empty unless ``coalesce`` is enabled."""
+        flights = self.single_flight
+        return flights.stats() if flights is not None else {}
+
+    def pool_stats(self) -> PoolStats:
+        """Connection pool snapshot plus pool wait, connect, TLS and
+        time-to-first-byte timings, bytes sent and received, and requests
+        in flight per endpoint name, covering this client and its
+        sub-clients."""
+        return self.pool_monitor.stats()
+
+    def _warmup_size(self, n: Optional[int]) -> int:
+        if n is None:
+            return self.max_conns_per_host
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        if self._http_client is None:
+            # requests beyond the pool's size would wait for a connection
+            # instead of opening one
+            return min(n, self.max_conns_per_host)
+        return n
+
     def _apply_shared_client(self, sub_client):
         """Replace a sub-client's auto-created httpx client with the shared
         one built from user-provided transport/http_client config."""
@@ -268,6 +544,16 @@ class BaseStream:
         sub_client.log = getattr(self, "log", None)
         sub_client.log_bodies = getattr(self, "log_bodies", False)
         sub_client.retry = getattr(self, "retry", None)
+        sub_client.retry_budget = getattr(self, "retry_budget", None)
+        sub_client.lazy_models = getattr(self, "lazy_models", False)
+        sub_client.rate_limiter = getattr(self, "rate_limiter", None)
+        sub_client.codec_offload = getattr(self, "codec_offload", None)
+        sub_client.hedger = getattr(self, "hedger", None)
+        sub_client.breaker = getattr(self, "breaker", None)
+        sub_client.response_cache = getattr(self, "response_cache", None)
+        sub_client.single_flight = getattr(self, "single_flight", None)
+        sub_client.compression = getattr(self, "compression", None)
+        sub_client.pool_monitor = getattr(self, "pool_monitor", None)
         return sub_client
 
     def create_token(
@@ -306,21 +592,47 @@ class BaseStream:
     def clone_for_token(self, token: str):
         """Return a sibling client authenticated with the given user token.
 
-        Keeps this client's ``api_key`` and ``base_url``. The clone is
-        token-only; it cannot mint further tokens.
+        The clone is a lightweight view of this client: it sends its
+        requests through this client's connection pool, with this client's
+        settings and caches, and authenticates each one with ``token``. It
+        has its own rate limiter, circuit breaker, retry budget and hedging
+        state, since Stream counts rate limits per user. Its
+        ``video``/``chat``/... clients are views of this client's, built on
+        first use. Creating one copies a few attributes and opens nothing,
+        so a clone per end user is cheap.
+
+        The clone is token-only; it cannot mint further tokens. Closing it
+        leaves the pool open; it stays usable until this client is closed.
         """
-        return self.__class__(
-            api_key=self.api_key,
-            token=token,
-            base_url=self.base_url,
-            request_timeout=self.request_timeout,
-            max_conns_per_host=self.max_conns_per_host,
-            idle_timeout=self.idle_timeout,
-            connect_timeout=self.connect_timeout,
-            user_agent=self.user_agent,
-            logger=self.log,
-            log_bodies=self.log_bodies,
+        if not token:
+            raise ValueError("token is required")
+        parent = self.__dict__.get("_token_parent") or self
+        view = _with_token(
+            self,
+            token,
+            _token_parent=parent,
+            _api_secret=None,
+            _token_cache=None,
+            _token_minter=None,
+            _owns_http_client=False,
+            _owns_codec_offload=False,
+            _owns_hedger=False,
+            rate_limiter=(
+                RateLimiter(self.rate_limit) if self.rate_limiter is not None else None
+            ),
+            breaker=(
+                CircuitBreaker(self.circuit_breaker, _resolve_logger(self))
+                if self.breaker is not None
+                else None
+            ),
+            retry_budget=(
+                RetryBudget(self.retry) if self.retry_budget is not None else None
+            ),
+            hedger=self.hedger.sibling() if self.hedger is not None else None,
         )
+        for name in _VIEW_OWN_STATE:
+            view.__dict__.pop(name, None)
+        return view
 
     def create_call_token(
         self,
@@ -337,6 +649,40 @@ class BaseStream:
             iat=int(time.time() - 5),
         )
 
+    def create_tokens(
+        self,
+        user_ids: Iterable[str],
+        expiration: int = None,
+    ) -> Dict[str, str]:
+        """
+        Generates tokens for many users at once, with an optional expiration time.
+
+        Same tokens as ``create_token`` for each user, but the issue and
+        expiry times are read once for the whole batch.
+
+        Args:
+            user_ids: The users to create tokens for.
+            expiration (int, optional): The duration in seconds after which the tokens should expire.
+
+        Returns:
+            Dict[str, str]: The token of each user, keyed by user id.
+
+        Example:
+            >>> client = Stream(api_key="key", api_secret="secret")
+            >>> tokens = client.create_tokens(["alice", "bob"], expiration=3600)
+            >>> sorted(tokens)
+            ['alice', 'bob']
+        """
+        now = int(time.time())
+        tokens = {}
+        for user_id in user_ids:
+            if user_id is None or user_id == "":
+                raise ValueError("user_id is required")
+            tokens[user_id] = self._create_token(
+                user_id=user_id, expiration=expiration, iat=now - 5, now=now
+            )
+        return tokens
+
     def _create_token(
         self,
         user_id: str = None,
@@ -345,8 +691,17 @@ class BaseStream:
         role: str = None,
         expiration=None,
         iat: int = None,
+        now: int = None,
     ):
-        now = int(time.time())
+        cache = self._token_cache
+        if cache is not None:
+            key = token_key(user_id, role, call_cids, channel_cids, expiration)
+            token = cache.get(key)
+            if token is not None:
+                return token
+
+        if now is None:
+            now = int(time.time())
 
         claims = {}
 
@@ -368,7 +723,14 @@ class BaseStream:
         if expiration is not None:
             claims["exp"] = now + expiration
 
-        token = jwt.encode(claims, self.api_secret, algorithm="HS256")
+        minter = self._token_minter
+        if minter is None:
+            # built on first use; self.api_secret raises ValueError on
+            # token-only clients
+            minter = self._token_minter = TokenMinter(self.api_secret)
+        token = minter.mint(claims)
+        if cache is not None:
+            cache.put(key, token, claims.get("exp"))
         return token
 
 
@@ -379,12 +741,14 @@ class AsyncStream(BaseStream, AsyncCommonClient):
     Contains methods to interact with Video and Chat modules of Stream API.
     """
 
-    @cached_property
+    @_sub_client
     def video(self) -> AsyncVideoClient:
         """
         Video stream client.
 
         """
+        from getstream.video.async_client import VideoClient as AsyncVideoClient
+
         return self._apply_shared_client(
             AsyncVideoClient(
                 api_key=self.api_key,
@@ -396,12 +760,14 @@ class AsyncStream(BaseStream, AsyncCommonClient):
             )
         )
 
-    @cached_property
+    @_sub_client
     def chat(self) -> AsyncChatClient:
         """
         Chat stream client.
 
         """
+        from getstream.chat.async_client import ChatClient as AsyncChatClient
+
         return self._apply_shared_client(
             AsyncChatClient(
                 api_key=self.api_key,
@@ -413,12 +779,16 @@ class AsyncStream(BaseStream, AsyncCommonClient):
             )
         )
 
-    @cached_property
+    @_sub_client
     def moderation(self) -> AsyncModerationClient:
         """
         Moderation stream client.
 
         """
+        from getstream.moderation.async_client import (
+            ModerationClient as AsyncModerationClient,
+        )
+
         return self._apply_shared_client(
             AsyncModerationClient(
                 api_key=self.api_key,
@@ -443,6 +813,11 @@ class AsyncStream(BaseStream, AsyncCommonClient):
             if "moderation" in cached:
                 stack.push_async_callback(self.moderation.aclose)
             stack.push_async_callback(super().aclose)
+            # callbacks run last-in first-out: queued users go out before
+            # any client closes
+            if cached.get("_user_batcher") is not None:
+                stack.push_async_callback(self._user_batcher.aclose)
+            stack.push_async_callback(self._stop_keep_alive)
 
     async def wait_for_task(
         self,
@@ -462,6 +837,31 @@ class AsyncStream(BaseStream, AsyncCommonClient):
             self, task_id, poll_interval=poll_interval, timeout=timeout
         )
 
+    def bulk(
+        self,
+        operations: Iterable[Callable[[], Awaitable[Any]]],
+        *,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncBulkRun:
+        """Run many independent calls with bounded concurrency.
+
+        ``operations`` yields zero-argument callables returning an awaitable,
+        e.g. ``lambda: client.chat.send_message(...)``; it is consumed lazily.
+        At most ``concurrency`` run at once, by default (and at most) as many
+        requests as the connection pool carries. ``async for`` over the
+        result yields a ``BulkResult`` per operation, in input order or, with
+        ``ordered=False``, as they complete; an operation's exception is
+        captured on its result. ``run.stats`` holds throughput and latency.
+        """
+        from .bulk import AsyncBulkRun, resolve_concurrency
+
+        return AsyncBulkRun(
+            operations,
+            concurrency=resolve_concurrency(self, concurrency),
+            ordered=ordered,
+        )
+
     @cached_property
     def feeds(self):
         raise NotImplementedError("Feeds not supported for async client")
@@ -476,11 +876,65 @@ class AsyncStream(BaseStream, AsyncCommonClient):
         if they do, or creates a new user entry if they do not.
         """
         id = id or str(uuid4())
-        user = UserRequest(name=name, id=id, image=image)
-        users_map = {user.id: user}
-        response = await self.update_users(users_map)
-        user = response.data.users[user.id]
-        return user
+        user = models.UserRequest(name=name, id=id, image=image)
+        return await self.upsert_user(user)
+
+    @cached_property
+    def _user_batcher(self) -> Optional[AsyncUserBatcher]:
+        config = self.user_batch
+        if config is None or not config.enabled:
+            return None
+        return AsyncUserBatcher(config, self.update_users)
+
+    async def upsert_user(self, user: UserRequest) -> FullUserResponse:
+        """Create or update one user and return it. With ``user_batch``
+        enabled the user goes out in a batched ``update_users`` call together
+        with the other users queued meanwhile."""
+        batcher = self._user_batcher
+        if batcher is not None:
+            return await batcher.submit(user)
+        response = await self.update_users({user.id: user})
+        return response.data.users[user.id]
+
+    def submit_user(self, user: UserRequest) -> "asyncio.Future[FullUserResponse]":
+        """Queue ``user`` like ``upsert_user`` without waiting for it: the
+        returned future resolves to the user once its batch is sent. Must be
+        called from a running event loop."""
+        batcher = self._user_batcher
+        if batcher is not None:
+            return batcher.submit(user)
+        return asyncio.ensure_future(self.upsert_user(user))
+
+    async def flush_users(self) -> None:
+        """Send the users queued by ``user_batch`` now and wait for them."""
+        batcher = self.__dict__.get("_user_batcher")
+        if batcher is not None:
+            await batcher.flush()
+
+    async def warmup(self, n: Optional[int] = None, *, keep_alive: bool = False) -> int:
+        """Open ``n`` pooled connections to ``base_url`` (default and at
+        most ``max_conns_per_host``) before traffic arrives, so early
+        requests skip DNS, TCP and TLS setup. Returns how many connections
+        were warmed; failures are logged, not raised.
+
+        With ``keep_alive=True`` the pool is warmed again from a task on the
+        current event loop shortly before ``idle_timeout`` expires the idle
+        connections, until ``aclose()``."""
+        n = self._warmup_size(n)
+        log = _resolve_logger(self)
+        warmed = await warm_async(self.client, n, log)
+        if keep_alive:
+            await self._stop_keep_alive()
+            self._keep_alive = AsyncKeepAlive(
+                self.client, n, keep_alive_interval(self.idle_timeout), log
+            )
+        return warmed
+
+    async def _stop_keep_alive(self) -> None:
+        keep_alive = getattr(self, "_keep_alive", None)
+        if keep_alive is not None:
+            self._keep_alive = None
+            await keep_alive.stop()
 
     @telemetry.operation_name("getstream.api.common.upsert_users")
     async def upsert_users(self, *users: UserRequest):
@@ -519,6 +973,28 @@ class AsyncStream(BaseStream, AsyncCommonClient):
 
         return _verify_and_parse_webhook(body, signature, self.api_secret)
 
+    async def verify_and_parse_webhooks(
+        self,
+        deliveries: Iterable[Delivery],
+        *,
+        executor: Optional[Executor] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[Any]:
+        """Verify and parse many ``(body, signature)`` webhook deliveries
+        off the event loop, using this client's API secret.
+
+        Returns, in input order, each delivery's typed event or the
+        ``InvalidWebhookError`` it raised. Chunks of ``chunk_size``
+        (default ``DEFAULT_CHUNK_SIZE``) deliveries run on ``executor`` (see
+        ``getstream.webhook_batch.create_webhook_executor``), or on the
+        loop's default executor when it is ``None``.
+        """
+        from .webhook_batch import averify_and_parse_webhooks
+
+        return await averify_and_parse_webhooks(
+            deliveries, self.api_secret, executor=executor, chunk_size=chunk_size
+        )
+
     def parse_sqs(self, message_body):
         """Decode + parse a Stream-delivered SQS message body.
 
@@ -540,6 +1016,55 @@ class AsyncStream(BaseStream, AsyncCommonClient):
 
         return _parse_sns(notification_body)
 
+    def parse_sqs_batch(self, message_bodies: Iterable[str]) -> Iterator[Any]:
+        """Decode + parse many SQS message bodies.
+
+        Wrapper around getstream.webhook_batch.parse_sqs_batch: yields each
+        message's event, or the InvalidWebhookError it raised, as the result
+        is iterated. Events are lazy models when the client has
+        ``lazy_models`` enabled.
+        """
+        from .webhook_batch import parse_sqs_batch
+
+        return parse_sqs_batch(message_bodies, lazy_models=self.lazy_models)
+
+    def parse_sns_batch(self, notification_bodies: Iterable[str]) -> Iterator[Any]:
+        """Decode + parse many SNS notification bodies; see ``parse_sqs_batch``."""
+        from .webhook_batch import parse_sns_batch
+
+        return parse_sns_batch(notification_bodies, lazy_models=self.lazy_models)
+
+    def verify_and_peek_webhook(
+        self, body, signature, fields: Iterable[str] = ()
+    ) -> PeekedEvent:
+        """Verify a webhook payload using this client's API secret and read
+        only its ``type`` and top-level ``fields``.
+
+        Wrapper around getstream.webhook_routing.verify_and_peek_webhook:
+        the typed event is decoded on first access to ``.event`` (a lazy
+        model when the client has ``lazy_models`` enabled), so events routed
+        on their type alone are never decoded.
+        """
+        from .webhook_routing import verify_and_peek_webhook
+
+        return verify_and_peek_webhook(
+            body, signature, self.api_secret, fields, lazy_models=self.lazy_models
+        )
+
+    def peek_sqs(self, message_body, fields: Iterable[str] = ()) -> PeekedEvent:
+        """Decode an SQS message body and peek at it; see
+        ``verify_and_peek_webhook``."""
+        from .webhook_routing import peek_sqs
+
+        return peek_sqs(message_body, fields, lazy_models=self.lazy_models)
+
+    def peek_sns(self, notification_body, fields: Iterable[str] = ()) -> PeekedEvent:
+        """Decode an SNS notification body and peek at it; see
+        ``verify_and_peek_webhook``."""
+        from .webhook_routing import peek_sns
+
+        return peek_sns(notification_body, fields, lazy_models=self.lazy_models)
+
 
 class Stream(BaseStream, CommonClient):
     """
@@ -577,18 +1102,32 @@ class Stream(BaseStream, CommonClient):
             max_conns_per_host=self.max_conns_per_host,
             idle_timeout=self.idle_timeout,
             connect_timeout=self.connect_timeout,
+            http2=self.http2,
+            lazy_models=self.lazy_models,
+            rate_limit=self.rate_limit,
+            inline_parse_max_bytes=self.inline_parse_max_bytes,
+            parse_max_workers=self.parse_max_workers,
+            hedge=self.hedge,
+            circuit_breaker=self.circuit_breaker,
+            cache=self.cache,
+            coalesce=self.coalesce,
+            user_batch=self.user_batch,
+            compression=self.compression,
+            token_cache=self.token_cache,
             base_url=self.base_url,
             user_agent=self.user_agent,
             logger=self.log,
             log_bodies=self.log_bodies,
         )
 
-    @cached_property
+    @_sub_client
     def video(self) -> VideoClient:
         """
         Video stream client.
 
         """
+        from getstream.video.client import VideoClient
+
         return self._apply_shared_client(
             VideoClient(
                 api_key=self.api_key,
@@ -600,12 +1139,14 @@ class Stream(BaseStream, CommonClient):
             )
         )
 
-    @cached_property
+    @_sub_client
     def chat(self) -> ChatClient:
         """
         Chat stream client.
 
         """
+        from getstream.chat.client import ChatClient
+
         return self._apply_shared_client(
             ChatClient(
                 api_key=self.api_key,
@@ -617,12 +1158,14 @@ class Stream(BaseStream, CommonClient):
             )
         )
 
-    @cached_property
+    @_sub_client
     def moderation(self) -> ModerationClient:
         """
         Moderation stream client.
 
         """
+        from getstream.moderation.client import ModerationClient
+
         return self._apply_shared_client(
             ModerationClient(
                 api_key=self.api_key,
@@ -634,12 +1177,14 @@ class Stream(BaseStream, CommonClient):
             )
         )
 
-    @cached_property
+    @_sub_client
     def feeds(self) -> FeedsClient:
         """
         Feeds stream client.
 
         """
+        from getstream.feeds.client import FeedsClient
+
         return self._apply_shared_client(
             FeedsClient(
                 api_key=self.api_key,
@@ -661,11 +1206,81 @@ class Stream(BaseStream, CommonClient):
         if they do, or creates a new user entry if they do not.
         """
         id = id or str(uuid4())
-        user = UserRequest(name=name, id=id, image=image)
-        users_map = {user.id: user}
-        response = self.update_users(users_map)
-        user = response.data.users[user.id]
-        return user
+        user = models.UserRequest(name=name, id=id, image=image)
+        return self.upsert_user(user)
+
+    @cached_property
+    def _user_batcher(self) -> Optional[UserBatcher]:
+        config = self.user_batch
+        if config is None or not config.enabled:
+            return None
+        return UserBatcher(config, self.update_users)
+
+    def upsert_user(self, user: UserRequest) -> FullUserResponse:
+        """Create or update one user and return it. With ``user_batch``
+        enabled the user goes out in a batched ``update_users`` call together
+        with the users other threads queue meanwhile, and this call blocks
+        until that batch returns."""
+        batcher = self._user_batcher
+        if batcher is not None:
+            return batcher.submit(user).result()
+        response = self.update_users({user.id: user})
+        return response.data.users[user.id]
+
+    def submit_user(self, user: UserRequest) -> "Future[FullUserResponse]":
+        """Queue ``user`` like ``upsert_user`` without waiting for it: the
+        returned future resolves to the user once its batch is sent. Without
+        ``user_batch`` the user is sent right away."""
+        batcher = self._user_batcher
+        if batcher is not None:
+            return batcher.submit(user)
+        future: "Future[FullUserResponse]" = Future()
+        try:
+            future.set_result(self.upsert_user(user))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def flush_users(self) -> None:
+        """Send the users queued by ``user_batch`` now and wait for them."""
+        batcher = self.__dict__.get("_user_batcher")
+        if batcher is not None:
+            batcher.flush()
+
+    def warmup(self, n: Optional[int] = None, *, keep_alive: bool = False) -> int:
+        """Open ``n`` pooled connections to ``base_url`` (default and at
+        most ``max_conns_per_host``) before traffic arrives, so early
+        requests skip DNS, TCP and TLS setup. Returns how many connections
+        were warmed; failures are logged, not raised.
+
+        With ``keep_alive=True`` a background thread warms the pool again
+        shortly before ``idle_timeout`` expires the idle connections, until
+        ``close()``."""
+        n = self._warmup_size(n)
+        log = _resolve_logger(self)
+        warmed = warm_sync(self.client, n, log)
+        if keep_alive:
+            self._stop_keep_alive()
+            self._keep_alive = KeepAlive(
+                self.client, n, keep_alive_interval(self.idle_timeout), log
+            )
+        return warmed
+
+    def _stop_keep_alive(self) -> None:
+        keep_alive = getattr(self, "_keep_alive", None)
+        if keep_alive is not None:
+            self._keep_alive = None
+            keep_alive.stop()
+
+    def close(self):
+        """Stop the ``warmup`` keep-alive and send the users still queued by
+        ``user_batch``, then close the HTTPX client (see
+        ``BaseClient.close``)."""
+        self._stop_keep_alive()
+        batcher = self.__dict__.get("_user_batcher")
+        if batcher is not None:
+            batcher.close()
+        super().close()
 
     @telemetry.operation_name("getstream.api.common.upsert_users")
     def upsert_users(self, *users: UserRequest):
@@ -695,6 +1310,32 @@ class Stream(BaseStream, CommonClient):
             self, task_id, poll_interval=poll_interval, timeout=timeout
         )
 
+    def bulk(
+        self,
+        operations: Iterable[Callable[[], Any]],
+        *,
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> BulkRun:
+        """Run many independent calls with bounded concurrency.
+
+        ``operations`` yields zero-argument callables, e.g.
+        ``lambda: client.update_users_partial(users=[...])``; it is consumed
+        lazily. At most ``concurrency`` run at once on worker threads: at
+        most as many requests as the connection pool carries, and by default
+        also no more than ``BULK_MAX_THREADS`` (32). Iterating the result yields a ``BulkResult`` per operation,
+        in input order or, with ``ordered=False``, as they complete; an
+        operation's exception is captured on its result. ``run.stats`` holds
+        throughput and latency.
+        """
+        from .bulk import BulkRun, resolve_concurrency
+
+        return BulkRun(
+            operations,
+            concurrency=resolve_concurrency(self, concurrency, threads=True),
+            ordered=ordered,
+        )
+
     def verify_signature(self, body, signature):
         """Verify a webhook signature using this client's API secret.
 
@@ -718,6 +1359,28 @@ class Stream(BaseStream, CommonClient):
 
         return _verify_and_parse_webhook(body, signature, self.api_secret)
 
+    def verify_and_parse_webhooks(
+        self,
+        deliveries: Iterable[Delivery],
+        *,
+        executor: Optional[Executor] = None,
+        chunk_size: Optional[int] = None,
+    ) -> List[Any]:
+        """Verify and parse many ``(body, signature)`` webhook deliveries,
+        using this client's API secret.
+
+        Returns, in input order, each delivery's typed event or the
+        ``InvalidWebhookError`` it raised. Chunks of ``chunk_size``
+        (default ``DEFAULT_CHUNK_SIZE``) deliveries run on ``executor`` (see
+        ``getstream.webhook_batch.create_webhook_executor``), or in the
+        calling thread when it is ``None``.
+        """
+        from .webhook_batch import verify_and_parse_webhooks
+
+        return verify_and_parse_webhooks(
+            deliveries, self.api_secret, executor=executor, chunk_size=chunk_size
+        )
+
     def parse_sqs(self, message_body):
         """Decode + parse a Stream-delivered SQS message body.
 
@@ -738,3 +1401,52 @@ class Stream(BaseStream, CommonClient):
         from .webhook import parse_sns as _parse_sns
 
         return _parse_sns(notification_body)
+
+    def parse_sqs_batch(self, message_bodies: Iterable[str]) -> Iterator[Any]:
+        """Decode + parse many SQS message bodies.
+
+        Wrapper around getstream.webhook_batch.parse_sqs_batch: yields each
+        message's event, or the InvalidWebhookError it raised, as the result
+        is iterated. Events are lazy models when the client has
+        ``lazy_models`` enabled.
+        """
+        from .webhook_batch import parse_sqs_batch
+
+        return parse_sqs_batch(message_bodies, lazy_models=self.lazy_models)
+
+    def parse_sns_batch(self, notification_bodies: Iterable[str]) -> Iterator[Any]:
+        """Decode + parse many SNS notification bodies; see ``parse_sqs_batch``."""
+        from .webhook_batch import parse_sns_batch
+
+        return parse_sns_batch(notification_bodies, lazy_models=self.lazy_models)
+
+    def verify_and_peek_webhook(
+        self, body, signature, fields: Iterable[str] = ()
+    ) -> PeekedEvent:
+        """Verify a webhook payload using this client's API secret and read
+        only its ``type`` and top-level ``fields``.
+
+        Wrapper around getstream.webhook_routing.verify_and_peek_webhook:
+        the typed event is decoded on first access to ``.event`` (a lazy
+        model when the client has ``lazy_models`` enabled), so events routed
+        on their type alone are never decoded.
+        """
+        from .webhook_routing import verify_and_peek_webhook
+
+        return verify_and_peek_webhook(
+            body, signature, self.api_secret, fields, lazy_models=self.lazy_models
+        )
+
+    def peek_sqs(self, message_body, fields: Iterable[str] = ()) -> PeekedEvent:
+        """Decode an SQS message body and peek at it; see
+        ``verify_and_peek_webhook``."""
+        from .webhook_routing import peek_sqs
+
+        return peek_sqs(message_body, fields, lazy_models=self.lazy_models)
+
+    def peek_sns(self, notification_body, fields: Iterable[str] = ()) -> PeekedEvent:
+        """Decode an SNS notification body and peek at it; see
+        ``verify_and_peek_webhook``."""
+        from .webhook_routing import peek_sns
+
+        return peek_sns(notification_body, fields, lazy_models=self.lazy_models)
@@ -0,0 +1,103 @@
+"""User token minting for ``Stream.create_token`` and friends.
+
+``TokenMinter`` signs HS256 JWTs for one API secret. The header segment and
+the keyed HMAC state are computed once, so each token only costs encoding
+its claims and finishing a copy of the HMAC; the output is byte-for-byte
+what ``jwt.encode(claims, secret, algorithm="HS256")`` returns.
+
+``TokenCache`` (see ``TokenCacheConfig``) keeps minted tokens per claim set
+and hands them out again until shortly before they expire.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from getstream.config import TokenCacheConfig
+
+_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+
+def _b64(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+class TokenMinter:
+    """HS256 JWT signer for one secret. Thread-safe."""
+
+    def __init__(self, secret: str):
+        header = json.dumps(_HEADER, separators=(",", ":"), sort_keys=True)
+        self._header = _b64(header.encode("utf-8")) + b"."
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def mint(self, claims: Dict[str, Any]) -> str:
+        payload = json.dumps(claims, separators=(",", ":")).encode("utf-8")
+        signing_input = self._header + _b64(payload)
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64(mac.digest())).decode("ascii")
+
+
+def token_key(
+    user_id: Optional[str],
+    role: Optional[str],
+    call_cids: Optional[Iterable[str]],
+    channel_cids: Optional[Iterable[str]],
+    expiration: Optional[int],
+) -> Tuple[Hashable, ...]:
+    """Cache key of the token minted for these arguments."""
+    return (
+        user_id,
+        role,
+        tuple(call_cids) if call_cids is not None else None,
+        tuple(channel_cids) if channel_cids is not None else None,
+        expiration,
+    )
+
+
+class TokenCache:
+    """LRU of minted tokens with the time each stops being handed out.
+    Thread-safe."""
+
+    def __init__(self, config: TokenCacheConfig):
+        self.config = config
+        self._entries: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """The token stored under ``key``, or ``None`` if missing or too
+        close to its expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, token: str, exp: Optional[int]) -> None:
+        """Store ``token``; ``exp`` is its ``exp`` claim (``None`` if it
+        never expires)."""
+        refresh_at = float("inf") if exp is None else exp - self.config.refresh_margin
+        if refresh_at <= time.time():
+            return
+        with self._lock:
+            self._entries[key] = (refresh_at, token)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["TokenCache", "TokenMinter", "token_key"]
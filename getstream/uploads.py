@@ -0,0 +1,250 @@
+"""Streaming multipart/form-data bodies for the upload endpoints.
+
+``upload_file``, ``upload_image``, ``upload_channel_file`` and
+``upload_channel_image`` send their file as a ``MultipartStream`` (sync
+clients) or ``AsyncMultipartStream`` (async clients): the multipart body is
+written as it is sent, ``UPLOAD_CHUNK_SIZE`` bytes of the file at a time, so
+an upload holds one chunk in memory however large the file is.
+
+The file can be given as a path, a binary file-like object, ``bytes``, or
+(async clients only) an async iterator of ``bytes``. An optional
+``progress(sent, total)`` callback is called after each chunk with the file
+bytes sent so far and the file size (``None`` when it is not known up front,
+in which case the body is sent with chunked transfer encoding).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import mimetypes
+import os
+import re
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+UploadSource = Union[str, "os.PathLike[str]", bytes, IO[bytes], AsyncIterable[bytes]]
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+# the escaping httpx (and browsers) apply to multipart parameter values
+_PARAM_ESCAPES = {'"': "%22", "\\": "\\\\", "\r": "%0D", "\n": "%0A"}
+_PARAM_ESCAPE_RE = re.compile("|".join(re.escape(c) for c in _PARAM_ESCAPES))
+
+
+def _param(name: str, value: str) -> str:
+    value = _PARAM_ESCAPE_RE.sub(lambda m: _PARAM_ESCAPES[m.group(0)], value)
+    return f'{name}="{value}"'
+
+
+def _file_size(fileobj: IO[bytes]) -> Optional[int]:
+    """Bytes left to read in ``fileobj``, or ``None`` if it cannot seek."""
+    try:
+        if not fileobj.seekable():
+            return None
+        position = fileobj.tell()
+        end = fileobj.seek(0, io.SEEK_END)
+        fileobj.seek(position)
+        return end - position
+    except (AttributeError, OSError):
+        return None
+
+
+class _MultipartBody:
+    """One ``file`` part plus form fields, with the framing precomputed so
+    the length is known whenever the file's size is."""
+
+    def __init__(
+        self,
+        source: UploadSource,
+        form_fields: Optional[List[Tuple[str, str]]] = None,
+        *,
+        file_name: Optional[str] = None,
+        content_type: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        self._path: Optional[str] = None
+        self._fileobj: Optional[IO[bytes]] = None
+        self._aiter: Optional[AsyncIterable[bytes]] = None
+        self._start = 0
+        if isinstance(source, (str, os.PathLike)):
+            self._path = os.fspath(source)
+            self.size: Optional[int] = os.path.getsize(self._path)
+            default_name = os.path.basename(self._path)
+        elif hasattr(source, "read"):
+            self._fileobj = source
+            self.size = _file_size(source)
+            if self.size is not None:
+                self._start = source.tell()
+            name = getattr(source, "name", None)
+            default_name = os.path.basename(name) if isinstance(name, str) else ""
+        elif isinstance(source, AsyncIterable):
+            self._aiter = source
+            self.size = None
+            default_name = ""
+        else:
+            raise TypeError(
+                "file must be a path, bytes, a binary file object or an async "
+                f"iterable of bytes, got {type(source).__name__}"
+            )
+        file_name = file_name or default_name or "file"
+        content_type = (
+            content_type
+            or mimetypes.guess_type(file_name)[0]
+            or "application/octet-stream"
+        )
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self._consumed = False
+
+        boundary = os.urandom(16).hex()
+        head = []
+        for name, value in form_fields or []:
+            head.append(
+                f"--{boundary}\r\nContent-Disposition: form-data; "
+                f"{_param('name', name)}\r\n\r\n{value}\r\n"
+            )
+        head.append(
+            f"--{boundary}\r\nContent-Disposition: form-data; "
+            f"{_param('name', 'file')}; {_param('filename', file_name)}\r\n"
+            f"Content-Type: {content_type}\r\n\r\n"
+        )
+        self._head = "".join(head).encode("utf-8")
+        self._tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+    @property
+    def content_length(self) -> Optional[int]:
+        if self.size is None:
+            return None
+        return len(self._head) + self.size + len(self._tail)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": self.content_type}
+        length = self.content_length
+        if length is not None:
+            headers["Content-Length"] = str(length)
+        return headers
+
+    def _rewind(self) -> None:
+        # paths are reopened and seekable files rewound on every pass, so a
+        # retried request sends the whole file again; other sources are
+        # single-use
+        if self._path is None and self.size is None:
+            if self._consumed:
+                raise httpx.StreamConsumed()
+            self._consumed = True
+        elif self._fileobj is not None:
+            self._fileobj.seek(self._start)
+
+    def _report(self, sent: int) -> None:
+        if self.progress is not None:
+            self.progress(sent, self.size)
+
+
+class MultipartStream(_MultipartBody):
+    """Sync multipart body; pass as ``content=`` with ``headers()``."""
+
+    def __init__(self, source: UploadSource, *args: Any, **kwargs: Any):
+        if isinstance(source, AsyncIterable) and not hasattr(source, "read"):
+            raise TypeError("async iterables can only be uploaded by async clients")
+        super().__init__(source, *args, **kwargs)
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._rewind()
+        yield self._head
+        sent = 0
+        self._report(sent)
+        with (
+            open(self._path, "rb")
+            if self._path is not None
+            else _NotClosing(self._fileobj)
+        ) as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+                sent += len(chunk)
+                self._report(sent)
+        yield self._tail
+
+
+class AsyncMultipartStream(_MultipartBody):
+    """Async multipart body. File reads run in a worker thread so a slow
+    disk does not block the event loop."""
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._chunks()
+
+    async def _chunks(self) -> AsyncIterator[bytes]:
+        self._rewind()
+        yield self._head
+        sent = 0
+        self._report(sent)
+        async for chunk in self._file_chunks():
+            yield chunk
+            sent += len(chunk)
+            self._report(sent)
+        yield self._tail
+
+    async def _file_chunks(self) -> AsyncIterator[bytes]:
+        if self._aiter is not None:
+            async for chunk in self._aiter:
+                if chunk:
+                    yield bytes(chunk)
+            return
+        if self._path is not None:
+            f = await asyncio.to_thread(open, self._path, "rb")
+        else:
+            f = _NotClosing(self._fileobj)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(f.read, self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            f.close()
+
+
+class _NotClosing:
+    """A caller's file object, left open when the upload is done."""
+
+    def __init__(self, fileobj: IO[bytes]):
+        self.read = fileobj.read
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NotClosing":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        pass
+
+
+__all__ = [
+    "AsyncMultipartStream",
+    "MultipartStream",
+    "ProgressCallback",
+    "UPLOAD_CHUNK_SIZE",
+    "UploadSource",
+]
@@ -141,7 +141,10 @@ def build_query_param(**kwargs):
 
 async def build_query_param_async(**kwargs):
     """
-    Async version that offloads CPU-bound JSON serialization to thread pool.
+    Async version of :func:`build_query_param`, kept for compatibility.
+
+    Runs inline: the work is a few string conversions per parameter, far
+    cheaper than a thread-pool round trip.
 
     Constructs a dictionary of query parameters from keyword arguments.
 
@@ -157,8 +160,7 @@ async def build_query_param_async(**kwargs):
     Returns:
         dict: A dictionary where keys are parameter names and values are URL-ready strings.
     """
-    # Use sync version in thread pool to avoid blocking event loop
-    return await asyncio.to_thread(build_query_param, **kwargs)
+    return build_query_param(**kwargs)
 
 
 def build_body_dict(**kwargs):
@@ -190,7 +192,9 @@ def build_body_dict(**kwargs):
 
 async def build_body_dict_async(**kwargs):
     """
-    Async version that offloads CPU-bound to_dict() calls to thread pool.
+    Async version of :func:`build_body_dict`, kept for compatibility.
+
+    Runs inline, like :func:`build_query_param_async`.
 
     Constructs a dictionary for the body of a request, handling nested structures.
     If an object has a `to_dict` method, it calls this method to serialize the object.
@@ -202,8 +206,7 @@ async def build_body_dict_async(**kwargs):
     Returns:
         dict: A dictionary with keys corresponding to kwargs keys and values processed, potentially recursively.
     """
-    # Use sync version in thread pool to avoid blocking event loop
-    return await asyncio.to_thread(build_body_dict, **kwargs)
+    return build_body_dict(**kwargs)
 
 
 def configure_logging(level=None, handler=None, format=None):
@@ -1,7 +1,10 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from typing import AsyncIterator
+
 from getstream.base import AsyncBaseClient
 from getstream.common import telemetry
 from getstream.models import *
+from getstream.pagination import apaginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
@@ -64,6 +67,24 @@ class VideoRestClient(AsyncBaseClient):
             json=json,
         )
 
+    def aiter_query_user_feedback(
+        self,
+        full: Optional[bool] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[UserFeedbackResponse]:
+        return apaginate(
+            self.query_user_feedback,
+            "user_feedback",
+            prefetch=prefetch,
+            full=full,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.query_call_members")
     async def query_call_members(
         self,
@@ -88,6 +109,26 @@ class VideoRestClient(AsyncBaseClient):
             "/api/v2/video/call/members", QueryCallMembersResponse, json=json
         )
 
+    def aiter_query_call_members(
+        self,
+        id: str,
+        type: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[MemberResponse]:
+        return apaginate(
+            self.query_call_members,
+            "members",
+            prefetch=prefetch,
+            id=id,
+            type=type,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.query_call_stats")
     async def query_call_stats(
         self,
@@ -108,6 +149,22 @@ class VideoRestClient(AsyncBaseClient):
             "/api/v2/video/call/stats", QueryCallStatsResponse, json=json
         )
 
+    def aiter_query_call_stats(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[CallStatsReportSummaryResponse]:
+        return apaginate(
+            self.query_call_stats,
+            "reports",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.get_call")
     async def get_call(
         self,
@@ -682,6 +739,26 @@ class VideoRestClient(AsyncBaseClient):
             path_params=path_params,
         )
 
+    def aiter_query_call_participant_sessions(
+        self,
+        type: str,
+        id: str,
+        session: str,
+        limit: Optional[int] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[ParticipantSessionDetails]:
+        return apaginate(
+            self.query_call_participant_sessions,
+            "participants_sessions",
+            prefetch=prefetch,
+            type=type,
+            id=id,
+            session=session,
+            limit=limit,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.start_hls_broadcasting")
     async def start_hls_broadcasting(
         self, type: str, id: str
@@ -997,6 +1074,22 @@ class VideoRestClient(AsyncBaseClient):
             "/api/v2/video/call_stats", QueryCallSessionStatsResponse, json=json
         )
 
+    def aiter_query_call_session_stats(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[CallStatsSessionResponse]:
+        return apaginate(
+            self.query_call_session_stats,
+            "call_stats",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.get_call_stats_map")
     async def get_call_stats_map(
         self,
@@ -1096,6 +1189,28 @@ class VideoRestClient(AsyncBaseClient):
             path_params=path_params,
         )
 
+    def aiter_query_call_session_participant_stats(
+        self,
+        call_type: str,
+        call_id: str,
+        session: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[CallStatsParticipant]:
+        return apaginate(
+            self.query_call_session_participant_stats,
+            "participants",
+            prefetch=prefetch,
+            call_type=call_type,
+            call_id=call_id,
+            session=session,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name(
         "getstream.api.video.get_call_session_participant_stats_timeline"
     )
@@ -1145,6 +1260,22 @@ class VideoRestClient(AsyncBaseClient):
         ).to_dict()
         return await self.post("/api/v2/video/calls", QueryCallsResponse, json=json)
 
+    def aiter_query_calls(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[CallStateResponseFields]:
+        return apaginate(
+            self.query_calls,
+            "calls",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.list_call_types")
     async def list_call_types(self) -> StreamResponse[ListCallTypeResponse]:
         return await self.get("/api/v2/video/calltypes", ListCallTypeResponse)
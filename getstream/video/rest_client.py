@@ -1,7 +1,10 @@
 # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+from typing import Iterator
+
 from getstream.base import BaseClient
 from getstream.common import telemetry
 from getstream.models import *
+from getstream.pagination import paginate
 from getstream.stream_response import StreamResponse
 from getstream.utils import build_query_param
 
@@ -62,6 +65,24 @@ class VideoRestClient(BaseClient):
             json=json,
         )
 
+    def iter_query_user_feedback(
+        self,
+        full: Optional[bool] = None,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[UserFeedbackResponse]:
+        return paginate(
+            self.query_user_feedback,
+            "user_feedback",
+            prefetch=prefetch,
+            full=full,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.query_call_members")
     def query_call_members(
         self,
@@ -86,6 +107,26 @@ class VideoRestClient(BaseClient):
             "/api/v2/video/call/members", QueryCallMembersResponse, json=json
         )
 
+    def iter_query_call_members(
+        self,
+        id: str,
+        type: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[MemberResponse]:
+        return paginate(
+            self.query_call_members,
+            "members",
+            prefetch=prefetch,
+            id=id,
+            type=type,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.query_call_stats")
     def query_call_stats(
         self,
@@ -104,6 +145,22 @@ class VideoRestClient(BaseClient):
         ).to_dict()
         return self.post("/api/v2/video/call/stats", QueryCallStatsResponse, json=json)
 
+    def iter_query_call_stats(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[CallStatsReportSummaryResponse]:
+        return paginate(
+            self.query_call_stats,
+            "reports",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.get_call")
     def get_call(
         self,
@@ -678,6 +735,26 @@ class VideoRestClient(BaseClient):
             path_params=path_params,
         )
 
+    def iter_query_call_participant_sessions(
+        self,
+        type: str,
+        id: str,
+        session: str,
+        limit: Optional[int] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[ParticipantSessionDetails]:
+        return paginate(
+            self.query_call_participant_sessions,
+            "participants_sessions",
+            prefetch=prefetch,
+            type=type,
+            id=id,
+            session=session,
+            limit=limit,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.start_hls_broadcasting")
     def start_hls_broadcasting(
         self, type: str, id: str
@@ -993,6 +1070,22 @@ class VideoRestClient(BaseClient):
             "/api/v2/video/call_stats", QueryCallSessionStatsResponse, json=json
         )
 
+    def iter_query_call_session_stats(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[CallStatsSessionResponse]:
+        return paginate(
+            self.query_call_session_stats,
+            "call_stats",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.get_call_stats_map")
     def get_call_stats_map(
         self,
@@ -1092,6 +1185,28 @@ class VideoRestClient(BaseClient):
             path_params=path_params,
         )
 
+    def iter_query_call_session_participant_stats(
+        self,
+        call_type: str,
+        call_id: str,
+        session: str,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[CallStatsParticipant]:
+        return paginate(
+            self.query_call_session_participant_stats,
+            "participants",
+            prefetch=prefetch,
+            call_type=call_type,
+            call_id=call_id,
+            session=session,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name(
         "getstream.api.video.get_call_session_participant_stats_timeline"
     )
@@ -1141,6 +1256,22 @@ class VideoRestClient(BaseClient):
         ).to_dict()
         return self.post("/api/v2/video/calls", QueryCallsResponse, json=json)
 
+    def iter_query_calls(
+        self,
+        limit: Optional[int] = None,
+        sort: Optional[List[SortParamRequest]] = None,
+        filter_conditions: Optional[Dict[str, object]] = None,
+        prefetch: bool = False,
+    ) -> Iterator[CallStateResponseFields]:
+        return paginate(
+            self.query_calls,
+            "calls",
+            prefetch=prefetch,
+            limit=limit,
+            sort=sort,
+            filter_conditions=filter_conditions,
+        )
+
     @telemetry.operation_name("getstream.api.video.list_call_types")
     def list_call_types(self) -> StreamResponse[ListCallTypeResponse]:
         return self.get("/api/v2/video/calltypes", ListCallTypeResponse)
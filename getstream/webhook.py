@@ -8,176 +8,8 @@ import json
 import zlib
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
-from .models import (
-    CustomEvent,
-    AppealAcceptedEvent,
-    AppealCreatedEvent,
-    AppealRejectedEvent,
-    CallAcceptedEvent,
-    BlockedUserEvent,
-    ClosedCaptionEvent,
-    CallClosedCaptionsFailedEvent,
-    CallClosedCaptionsStartedEvent,
-    CallClosedCaptionsStoppedEvent,
-    CallCreatedEvent,
-    CallDeletedEvent,
-    CallDTMFEvent,
-    CallEndedEvent,
-    CallFrameRecordingFailedEvent,
-    CallFrameRecordingFrameReadyEvent,
-    CallFrameRecordingStartedEvent,
-    CallFrameRecordingStoppedEvent,
-    CallHLSBroadcastingFailedEvent,
-    CallHLSBroadcastingStartedEvent,
-    CallHLSBroadcastingStoppedEvent,
-    KickedUserEvent,
-    CallLiveStartedEvent,
-    CallMemberAddedEvent,
-    CallMemberRemovedEvent,
-    CallMemberUpdatedEvent,
-    CallMemberUpdatedPermissionEvent,
-    CallMissedEvent,
-    CallModerationBlurEvent,
-    CallModerationWarningEvent,
-    CallNotificationEvent,
-    PermissionRequestEvent,
-    UpdatedCallPermissionsEvent,
-    CallReactionEvent,
-    CallRecordingFailedEvent,
-    CallRecordingReadyEvent,
-    CallRecordingStartedEvent,
-    CallRecordingStoppedEvent,
-    CallRejectedEvent,
-    CallRingEvent,
-    CallRtmpBroadcastFailedEvent,
-    CallRtmpBroadcastStartedEvent,
-    CallRtmpBroadcastStoppedEvent,
-    CallSessionEndedEvent,
-    CallSessionParticipantCountsUpdatedEvent,
-    CallSessionParticipantJoinedEvent,
-    CallSessionParticipantLeftEvent,
-    CallSessionStartedEvent,
-    CallStatsReportReadyEvent,
-    CallTranscriptionFailedEvent,
-    CallTranscriptionReadyEvent,
-    CallTranscriptionStartedEvent,
-    CallTranscriptionStoppedEvent,
-    UnblockedUserEvent,
-    CallUpdatedEvent,
-    CallUserFeedbackSubmittedEvent,
-    CallUserMutedEvent,
-    CampaignCompletedEvent,
-    CampaignStartedEvent,
-    ChannelCreatedEvent,
-    ChannelDeletedEvent,
-    ChannelFrozenEvent,
-    ChannelHiddenEvent,
-    MaxStreakChangedEvent,
-    ChannelMutedEvent,
-    ChannelTruncatedEvent,
-    ChannelUnFrozenEvent,
-    ChannelUnmutedEvent,
-    ChannelUpdatedEvent,
-    ChannelVisibleEvent,
-    ChannelBatchCompletedEvent,
-    ChannelBatchStartedEvent,
-    CustomVideoEvent,
-    AsyncBulkImageModerationEvent,
-    AsyncExportChannelsEvent,
-    AsyncExportModerationLogsEvent,
-    AsyncExportReviewQueueEvent,
-    AsyncExportErrorEvent,
-    AsyncExportUsersEvent,
-    ActivityAddedEvent,
-    ActivityDeletedEvent,
-    ActivityFeedbackEvent,
-    ActivityMarkEvent,
-    ActivityPinnedEvent,
-    ActivityReactionAddedEvent,
-    ActivityReactionDeletedEvent,
-    ActivityReactionUpdatedEvent,
-    ActivityRemovedFromFeedEvent,
-    ActivityRestoredEvent,
-    ActivityUnpinnedEvent,
-    ActivityUpdatedEvent,
-    BookmarkAddedEvent,
-    BookmarkDeletedEvent,
-    BookmarkUpdatedEvent,
-    BookmarkFolderDeletedEvent,
-    BookmarkFolderUpdatedEvent,
-    CommentAddedEvent,
-    CommentDeletedEvent,
-    CommentReactionAddedEvent,
-    CommentReactionDeletedEvent,
-    CommentReactionUpdatedEvent,
-    CommentRestoredEvent,
-    CommentUpdatedEvent,
-    FeedCreatedEvent,
-    FeedDeletedEvent,
-    FeedUpdatedEvent,
-    FeedGroupChangedEvent,
-    FeedGroupDeletedEvent,
-    FeedGroupRestoredEvent,
-    FeedMemberAddedEvent,
-    FeedMemberRemovedEvent,
-    FeedMemberUpdatedEvent,
-    FollowCreatedEvent,
-    FollowDeletedEvent,
-    FollowUpdatedEvent,
-    NotificationFeedUpdatedEvent,
-    StoriesFeedUpdatedEvent,
-    FlagUpdatedEvent,
-    IngressErrorEvent,
-    IngressStartedEvent,
-    IngressStoppedEvent,
-    MemberAddedEvent,
-    MemberRemovedEvent,
-    MemberUpdatedEvent,
-    MessageDeletedEvent,
-    MessageFlaggedEvent,
-    MessageNewEvent,
-    PendingMessageEvent,
-    MessageReadEvent,
-    MessageUnblockedEvent,
-    MessageUndeletedEvent,
-    MessageUpdatedEvent,
-    ModerationCustomActionEvent,
-    ModerationFlaggedEvent,
-    ModerationImageAnalysisCompleteEvent,
-    ModerationMarkReviewedEvent,
-    ModerationTextAnalysisCompleteEvent,
-    ModerationCheckCompletedEvent,
-    ModerationRulesTriggeredEvent,
-    NotificationMarkUnreadEvent,
-    ReminderNotificationEvent,
-    NotificationThreadMessageNewEvent,
-    ReactionDeletedEvent,
-    ReactionNewEvent,
-    ReactionUpdatedEvent,
-    ReminderCreatedEvent,
-    ReminderDeletedEvent,
-    ReminderUpdatedEvent,
-    ReviewQueueItemNewEvent,
-    ReviewQueueItemUpdatedEvent,
-    ThreadUpdatedEvent,
-    UserBannedEvent,
-    UserDeactivatedEvent,
-    UserDeletedEvent,
-    UserFlaggedEvent,
-    UserMessagesDeletedEvent,
-    UserMutedEvent,
-    UserReactivatedEvent,
-    UserUnbannedEvent,
-    UserUnmutedEvent,
-    UserUnreadReminderEvent,
-    UserUpdatedEvent,
-    UserGroupCreatedEvent,
-    UserGroupDeletedEvent,
-    UserGroupMemberAddedEvent,
-    UserGroupMemberRemovedEvent,
-    UserGroupUpdatedEvent,
-)
 
 
 # Webhook event type constants
@@ -449,7 +281,184 @@ def parse_webhook_event(raw_event: Union[bytes, str, Dict[str, Any]]) -> Any:
 
 def _get_event_class(event_type: str):
     """Map event type to event class."""
-    event_map = {
+    return _event_map().get(event_type)
+
+
+@lru_cache(maxsize=None)
+def _event_map() -> Dict[str, Any]:
+    # The event classes live in the generated models, which are only loaded
+    # once an event is actually parsed (verify-only callers never need them).
+    from .models import (
+        CustomEvent,
+        AppealAcceptedEvent,
+        AppealCreatedEvent,
+        AppealRejectedEvent,
+        CallAcceptedEvent,
+        BlockedUserEvent,
+        ClosedCaptionEvent,
+        CallClosedCaptionsFailedEvent,
+        CallClosedCaptionsStartedEvent,
+        CallClosedCaptionsStoppedEvent,
+        CallCreatedEvent,
+        CallDeletedEvent,
+        CallDTMFEvent,
+        CallEndedEvent,
+        CallFrameRecordingFailedEvent,
+        CallFrameRecordingFrameReadyEvent,
+        CallFrameRecordingStartedEvent,
+        CallFrameRecordingStoppedEvent,
+        CallHLSBroadcastingFailedEvent,
+        CallHLSBroadcastingStartedEvent,
+        CallHLSBroadcastingStoppedEvent,
+        KickedUserEvent,
+        CallLiveStartedEvent,
+        CallMemberAddedEvent,
+        CallMemberRemovedEvent,
+        CallMemberUpdatedEvent,
+        CallMemberUpdatedPermissionEvent,
+        CallMissedEvent,
+        CallModerationBlurEvent,
+        CallModerationWarningEvent,
+        CallNotificationEvent,
+        PermissionRequestEvent,
+        UpdatedCallPermissionsEvent,
+        CallReactionEvent,
+        CallRecordingFailedEvent,
+        CallRecordingReadyEvent,
+        CallRecordingStartedEvent,
+        CallRecordingStoppedEvent,
+        CallRejectedEvent,
+        CallRingEvent,
+        CallRtmpBroadcastFailedEvent,
+        CallRtmpBroadcastStartedEvent,
+        CallRtmpBroadcastStoppedEvent,
+        CallSessionEndedEvent,
+        CallSessionParticipantCountsUpdatedEvent,
+        CallSessionParticipantJoinedEvent,
+        CallSessionParticipantLeftEvent,
+        CallSessionStartedEvent,
+        CallStatsReportReadyEvent,
+        CallTranscriptionFailedEvent,
+        CallTranscriptionReadyEvent,
+        CallTranscriptionStartedEvent,
+        CallTranscriptionStoppedEvent,
+        UnblockedUserEvent,
+        CallUpdatedEvent,
+        CallUserFeedbackSubmittedEvent,
+        CallUserMutedEvent,
+        CampaignCompletedEvent,
+        CampaignStartedEvent,
+        ChannelCreatedEvent,
+        ChannelDeletedEvent,
+        ChannelFrozenEvent,
+        ChannelHiddenEvent,
+        MaxStreakChangedEvent,
+        ChannelMutedEvent,
+        ChannelTruncatedEvent,
+        ChannelUnFrozenEvent,
+        ChannelUnmutedEvent,
+        ChannelUpdatedEvent,
+        ChannelVisibleEvent,
+        ChannelBatchCompletedEvent,
+        ChannelBatchStartedEvent,
+        CustomVideoEvent,
+        AsyncBulkImageModerationEvent,
+        AsyncExportChannelsEvent,
+        AsyncExportModerationLogsEvent,
+        AsyncExportReviewQueueEvent,
+        AsyncExportErrorEvent,
+        AsyncExportUsersEvent,
+        ActivityAddedEvent,
+        ActivityDeletedEvent,
+        ActivityFeedbackEvent,
+        ActivityMarkEvent,
+        ActivityPinnedEvent,
+        ActivityReactionAddedEvent,
+        ActivityReactionDeletedEvent,
+        ActivityReactionUpdatedEvent,
+        ActivityRemovedFromFeedEvent,
+        ActivityRestoredEvent,
+        ActivityUnpinnedEvent,
+        ActivityUpdatedEvent,
+        BookmarkAddedEvent,
+        BookmarkDeletedEvent,
+        BookmarkUpdatedEvent,
+        BookmarkFolderDeletedEvent,
+        BookmarkFolderUpdatedEvent,
+        CommentAddedEvent,
+        CommentDeletedEvent,
+        CommentReactionAddedEvent,
+        CommentReactionDeletedEvent,
+        CommentReactionUpdatedEvent,
+        CommentRestoredEvent,
+        CommentUpdatedEvent,
+        FeedCreatedEvent,
+        FeedDeletedEvent,
+        FeedUpdatedEvent,
+        FeedGroupChangedEvent,
+        FeedGroupDeletedEvent,
+        FeedGroupRestoredEvent,
+        FeedMemberAddedEvent,
+        FeedMemberRemovedEvent,
+        FeedMemberUpdatedEvent,
+        FollowCreatedEvent,
+        FollowDeletedEvent,
+        FollowUpdatedEvent,
+        NotificationFeedUpdatedEvent,
+        StoriesFeedUpdatedEvent,
+        FlagUpdatedEvent,
+        IngressErrorEvent,
+        IngressStartedEvent,
+        IngressStoppedEvent,
+        MemberAddedEvent,
+        MemberRemovedEvent,
+        MemberUpdatedEvent,
+        MessageDeletedEvent,
+        MessageFlaggedEvent,
+        MessageNewEvent,
+        PendingMessageEvent,
+        MessageReadEvent,
+        MessageUnblockedEvent,
+        MessageUndeletedEvent,
+        MessageUpdatedEvent,
+        ModerationCustomActionEvent,
+        ModerationFlaggedEvent,
+        ModerationImageAnalysisCompleteEvent,
+        ModerationMarkReviewedEvent,
+        ModerationTextAnalysisCompleteEvent,
+        ModerationCheckCompletedEvent,
+        ModerationRulesTriggeredEvent,
+        NotificationMarkUnreadEvent,
+        ReminderNotificationEvent,
+        NotificationThreadMessageNewEvent,
+        ReactionDeletedEvent,
+        ReactionNewEvent,
+        ReactionUpdatedEvent,
+        ReminderCreatedEvent,
+        ReminderDeletedEvent,
+        ReminderUpdatedEvent,
+        ReviewQueueItemNewEvent,
+        ReviewQueueItemUpdatedEvent,
+        ThreadUpdatedEvent,
+        UserBannedEvent,
+        UserDeactivatedEvent,
+        UserDeletedEvent,
+        UserFlaggedEvent,
+        UserMessagesDeletedEvent,
+        UserMutedEvent,
+        UserReactivatedEvent,
+        UserUnbannedEvent,
+        UserUnmutedEvent,
+        UserUnreadReminderEvent,
+        UserUpdatedEvent,
+        UserGroupCreatedEvent,
+        UserGroupDeletedEvent,
+        UserGroupMemberAddedEvent,
+        UserGroupMemberRemovedEvent,
+        UserGroupUpdatedEvent,
+    )
+
+    return {
         "*": CustomEvent,
         "appeal.accepted": AppealAcceptedEvent,
         "appeal.created": AppealCreatedEvent,
@@ -622,7 +631,16 @@ def _get_event_class(event_type: str):
         "user_group.member_removed": UserGroupMemberRemovedEvent,
         "user_group.updated": UserGroupUpdatedEvent,
     }
-    return event_map.get(event_type)
+
+
+def __getattr__(name: str) -> Any:
+    # The event classes used to be imported into this module; keep
+    # ``from getstream.webhook import CallCreatedEvent`` working.
+    if not name.startswith("__"):
+        for event_class in _event_map().values():
+            if event_class.__name__ == name:
+                return event_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def verify_webhook_signature(
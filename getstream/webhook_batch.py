@@ -0,0 +1,169 @@
+"""Batch webhook verification and parsing.
+
+``verify_and_parse_webhooks(deliveries, secret)`` runs
+``getstream.webhook.verify_and_parse_webhook`` over many ``(body,
+signature)`` pairs and returns one result per delivery, in input order: the
+typed event, or the ``InvalidWebhookError`` that delivery raised. One bad
+delivery does not fail the batch.
+
+Deliveries are split into chunks of ``chunk_size`` and handed to
+``executor``, a ``concurrent.futures`` executor. Decoding large events is
+CPU-bound Python, so a process pool (``create_webhook_executor()``) spreads
+it over cores; a thread pool only moves the work off the calling thread.
+Each chunk crosses the process boundary once, and results come back
+pickled.
+
+``averify_and_parse_webhooks`` is the same for asyncio. It always runs the
+chunks on an executor, the loop's default one when none is given, so the
+event loop never decodes a payload itself.
+
+``parse_sqs_batch`` / ``parse_sns_batch`` are the batch forms of
+``parse_sqs`` / ``parse_sns``: generators yielding each message's event or
+``InvalidWebhookError`` as the batch is iterated. A message starting with
+``{`` is raw JSON (the uncompressed wire format) and skips the base64
+attempt; gzip bodies are inflated in one zlib call. With
+``lazy_models=True`` events are lazy model instances (see
+``getstream.lazy``) that decode a field when it is first read, which is
+most of the cost of parsing a large event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from getstream._webhook_decode import decode_sns, decode_sqs, load_event_classes, parse
+from getstream.webhook import InvalidWebhookError, verify_and_parse_webhook
+
+# (raw HTTP body, X-Signature header)
+Delivery = Tuple[Union[bytes, bytearray], str]
+
+DEFAULT_CHUNK_SIZE = 32
+
+
+def _warm_worker() -> None:
+    # load the generated event models once per worker process, not on the
+    # first event it parses
+    load_event_classes()
+
+
+def create_webhook_executor(
+    max_workers: Optional[int] = None, *, processes: bool = True
+) -> Executor:
+    """An executor for ``verify_and_parse_webhooks``: a process pool of
+    ``max_workers`` (default: one per CPU) whose workers load the event
+    models up front, or with ``processes=False`` a thread pool. The caller
+    shuts it down."""
+    if processes:
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_worker)
+    return ThreadPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        thread_name_prefix="getstream-webhook",
+    )
+
+
+def _verify_and_parse_chunk(chunk: Sequence[Delivery], secret: str) -> List[Any]:
+    results: List[Any] = []
+    for body, signature in chunk:
+        try:
+            results.append(verify_and_parse_webhook(body, signature, secret))
+        except InvalidWebhookError as e:
+            results.append(e)
+    return results
+
+
+def _chunks(
+    deliveries: Iterable[Delivery], size: Optional[int]
+) -> List[List[Delivery]]:
+    if size is None:
+        size = DEFAULT_CHUNK_SIZE
+    if size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    items = [(body, signature) for body, signature in deliveries]
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def verify_and_parse_webhooks(
+    deliveries: Iterable[Delivery],
+    secret: str,
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: Optional[int] = None,
+) -> List[Any]:
+    """Verify and parse ``(body, signature)`` pairs.
+
+    Returns, in input order, the typed event (or ``UnknownEvent``) of each
+    delivery or the ``InvalidWebhookError`` it raised. Chunks of
+    ``chunk_size`` (default ``DEFAULT_CHUNK_SIZE``) deliveries run on
+    ``executor``, or in the calling thread when it is ``None``.
+    """
+    chunks = _chunks(deliveries, chunk_size)
+    if executor is None:
+        parsed = [_verify_and_parse_chunk(chunk, secret) for chunk in chunks]
+    else:
+        parsed = executor.map(_verify_and_parse_chunk, chunks, repeat(secret))
+    return [result for chunk in parsed for result in chunk]
+
+
+async def averify_and_parse_webhooks(
+    deliveries: Iterable[Delivery],
+    secret: str,
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: Optional[int] = None,
+) -> List[Any]:
+    """Async ``verify_and_parse_webhooks``. Chunks run on ``executor``, or
+    on the loop's default executor when it is ``None``."""
+    loop = asyncio.get_running_loop()
+    parsed = await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, _verify_and_parse_chunk, chunk, secret)
+            for chunk in _chunks(deliveries, chunk_size)
+        )
+    )
+    return [result for chunk in parsed for result in chunk]
+
+
+def _parse_batch(decode, bodies: Iterable[str], lazy_models: bool) -> Iterator[Any]:
+    for body in bodies:
+        try:
+            result = parse(decode(body), lazy_models)
+        except InvalidWebhookError as e:
+            result = e
+        yield result
+
+
+def parse_sqs_batch(
+    message_bodies: Iterable[str], *, lazy_models: bool = False
+) -> Iterator[Any]:
+    """Decode and parse SQS message bodies, as ``parse_sqs`` does one.
+
+    Yields, in order and as the result is iterated, each message's typed
+    event (or ``UnknownEvent``) or the ``InvalidWebhookError`` it raised.
+    With ``lazy_models`` known events are decoded field by field on first
+    access, so a malformed field only raises when it is read.
+    """
+    return _parse_batch(decode_sqs, message_bodies, lazy_models)
+
+
+def parse_sns_batch(
+    notification_bodies: Iterable[str], *, lazy_models: bool = False
+) -> Iterator[Any]:
+    """Decode and parse SNS notification bodies (envelopes or extracted
+    ``Message`` strings), as ``parse_sns`` does one. Yields like
+    ``parse_sqs_batch``."""
+    return _parse_batch(decode_sns, notification_bodies, lazy_models)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "Delivery",
+    "averify_and_parse_webhooks",
+    "create_webhook_executor",
+    "parse_sns_batch",
+    "parse_sqs_batch",
+    "verify_and_parse_webhooks",
+]
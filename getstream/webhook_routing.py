@@ -0,0 +1,219 @@
+"""Routing webhooks on their type without decoding them.
+
+``parse_event`` decodes the whole payload into the typed event before a
+handler can look at it. When most events are dropped or forwarded on their
+``type`` (and maybe a ``cid``), that work is wasted. ``peek_event(payload,
+fields=("cid",))`` reads top-level keys in order and stops as soon as it
+has ``type`` and the requested fields; keys inside nested objects are
+skipped over, never matched. Stream puts ``type`` first, so this often
+reads only the start of the payload. It returns a ``PeekedEvent``: the
+peeked values, and the typed event, decoded on first access.
+
+    peeked = peek_event(payload, fields=("cid",))
+    if peeked.type not in HANDLED:
+        return
+    handle(peeked.event)
+
+``verify_and_peek_webhook``, ``peek_sqs`` and ``peek_sns`` are the
+peeking forms of ``verify_and_parse_webhook``, ``parse_sqs`` and
+``parse_sns``.
+
+The scan only checks the part of the payload it reads. A payload that
+is malformed after the peeked keys raises ``InvalidWebhookError`` from
+``PeekedEvent.event``, not from ``peek_event``. For the same reason a
+top-level key that appears twice, which Stream never sends, peeks as its
+first value, where ``json.loads`` (and so ``parse_event``) keeps the last.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Dict, Iterable, Union
+
+from getstream._webhook_decode import decode_sns, decode_sqs, parse
+from getstream.webhook import (
+    InvalidWebhookError,
+    gunzip_payload,
+    verify_signature,
+)
+
+_scan_value = json.JSONDecoder().scan_once
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_UNSET = object()
+
+
+def _invalid(reason: str) -> InvalidWebhookError:
+    return InvalidWebhookError(f"{InvalidWebhookError.INVALID_JSON}: {reason}")
+
+
+def _scan_top_level(text: str, wanted: frozenset) -> Dict[str, Any]:
+    """The values of the ``wanted`` top-level keys of the JSON object in
+    ``text``, reading keys in order until all of them are found."""
+    ws = _WHITESPACE.match
+    idx = ws(text).end()
+    if text[idx : idx + 1] != "{":
+        raise _invalid("webhook payload must be a JSON object")
+    idx = ws(text, idx + 1).end()
+    found: Dict[str, Any] = {}
+    if text[idx : idx + 1] == "}":
+        return found
+    while True:
+        if text[idx : idx + 1] != '"':
+            raise _invalid(f"expected a key at offset {idx}")
+        key, idx = scanstring(text, idx + 1)
+        idx = ws(text, idx).end()
+        if text[idx : idx + 1] != ":":
+            raise _invalid(f"expected ':' at offset {idx}")
+        # values of other keys are decoded too (by the C scanner) only to
+        # find where they end; stopping early is what saves the work
+        value, idx = _scan_value(text, ws(text, idx + 1).end())
+        if key in wanted and key not in found:
+            found[key] = value
+            if len(found) == len(wanted):
+                return found
+        idx = ws(text, idx).end()
+        separator = text[idx : idx + 1]
+        if separator == "}":
+            return found
+        if separator != ",":
+            raise _invalid(f"expected ',' or '}}' at offset {idx}")
+        idx = ws(text, idx + 1).end()
+
+
+def _peek(payload: Union[bytes, bytearray, str], fields: Iterable[str]):
+    if isinstance(payload, (bytes, bytearray)):
+        payload = gunzip_payload(payload)
+        try:
+            text = payload.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise _invalid(f"failed to parse webhook payload: {e}") from e
+    elif isinstance(payload, str):
+        text = payload
+    else:
+        raise _invalid("payload must be bytes or str")
+    try:
+        wanted = frozenset(("type", *fields))
+        found = _scan_top_level(text, wanted)
+    except StopIteration as e:
+        # scan_once's "no JSON value here"
+        raise _invalid(f"failed to parse webhook payload at offset {e.value}") from e
+    except json.JSONDecodeError as e:
+        raise _invalid(f"failed to parse webhook payload: {e}") from e
+    event_type = found.pop("type", None)
+    if not isinstance(event_type, str) or event_type == "":
+        raise _invalid("webhook payload missing 'type' string field")
+    return payload, event_type, found
+
+
+class PeekedEvent:
+    """A webhook event whose ``type`` and requested top-level ``fields``
+    were read without decoding the rest.
+
+    ``fields`` holds the raw JSON values of the requested keys that are
+    present. ``event`` decodes the payload as ``parse_event`` does (lazy
+    models with ``lazy_models``) on first access and caches it, raising
+    ``InvalidWebhookError`` if that fails. Any other attribute is read from
+    ``event``, so ``peeked.message.text`` works, but ``isinstance`` checks
+    need ``peeked.event``.
+    """
+
+    __slots__ = ("type", "fields", "payload", "_lazy_models", "_event")
+
+    def __init__(
+        self,
+        payload: Union[bytes, str],
+        type: str,
+        fields: Dict[str, Any],
+        *,
+        lazy_models: bool = False,
+    ):
+        self.payload = payload
+        self.type = type
+        self.fields = fields
+        self._lazy_models = lazy_models
+        self._event = _UNSET
+
+    @property
+    def event(self) -> Any:
+        if self._event is _UNSET:
+            payload = self.payload
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            self._event = parse(payload, self._lazy_models)
+        return self._event
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.event, name)
+
+    def __repr__(self) -> str:
+        return f"PeekedEvent(type={self.type!r}, fields={self.fields!r})"
+
+
+def peek_event_type(payload: Union[bytes, bytearray, str]) -> str:
+    """The ``type`` of a webhook payload (gzip-compressed or not), read
+    without decoding the rest of it.
+
+    Unlike ``get_event_type``, raises ``InvalidWebhookError`` where
+    ``parse_event`` would for a bad or missing ``type``.
+    """
+    return _peek(payload, ())[1]
+
+
+def peek_event(
+    payload: Union[bytes, bytearray, str],
+    fields: Iterable[str] = (),
+    *,
+    lazy_models: bool = False,
+) -> PeekedEvent:
+    """Read the ``type`` and the top-level ``fields`` of a webhook payload
+    (gzip-compressed or not) and defer decoding the event.
+
+    Raises ``InvalidWebhookError`` if the part of the payload it reads is
+    not a JSON object or has no string ``type``.
+    """
+    payload, event_type, found = _peek(payload, fields)
+    return PeekedEvent(payload, event_type, found, lazy_models=lazy_models)
+
+
+def verify_and_peek_webhook(
+    body: bytes,
+    signature: str,
+    secret: str,
+    fields: Iterable[str] = (),
+    *,
+    lazy_models: bool = False,
+) -> PeekedEvent:
+    """``verify_and_parse_webhook`` that returns a ``PeekedEvent``. The
+    signature is checked over the whole body before anything is read."""
+    payload = gunzip_payload(body)
+    if not verify_signature(payload, signature, secret):
+        raise InvalidWebhookError(InvalidWebhookError.SIGNATURE_MISMATCH)
+    return peek_event(payload, fields, lazy_models=lazy_models)
+
+
+def peek_sqs(
+    message_body: str, fields: Iterable[str] = (), *, lazy_models: bool = False
+) -> PeekedEvent:
+    """``parse_sqs`` that returns a ``PeekedEvent``."""
+    return peek_event(decode_sqs(message_body), fields, lazy_models=lazy_models)
+
+
+def peek_sns(
+    notification_body: str, fields: Iterable[str] = (), *, lazy_models: bool = False
+) -> PeekedEvent:
+    """``parse_sns`` that returns a ``PeekedEvent``."""
+    return peek_event(decode_sns(notification_body), fields, lazy_models=lazy_models)
+
+
+__all__ = [
+    "PeekedEvent",
+    "peek_event",
+    "peek_event_type",
+    "peek_sns",
+    "peek_sqs",
+    "verify_and_peek_webhook",
+]
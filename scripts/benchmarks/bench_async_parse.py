@@ -0,0 +1,105 @@
+"""Async client latency: inline parsing of small responses vs the thread hop.
+
+The async client used to parse every response with ``asyncio.to_thread``.
+It now parses responses up to ``inline_parse_max_bytes`` on the event loop
+and only hands larger ones to its own bounded pool. Fires ``--requests``
+concurrent ``get_app``-sized requests at a mock transport and reports the
+p50/p99 per-request latency and total wall time for both policies.
+
+    uv run python scripts/benchmarks/bench_async_parse.py [--requests N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+from getstream import AsyncStream
+from getstream.base import _CodecOffload
+
+BODY = json.dumps(
+    {
+        "duration": "1.2ms",
+        "app": {
+            "name": "bench",
+            "organization": "stream",
+            "file_upload_config": {"allowed_file_extensions": [], "size_limit": 0},
+            "image_upload_config": {"allowed_file_extensions": [], "size_limit": 0},
+        },
+    }
+).encode()
+
+
+class ToThread(_CodecOffload):
+    """The previous policy: every response goes through asyncio.to_thread."""
+
+    def inline(self, size):
+        return False
+
+    async def run(self, fn, *args):
+        return await asyncio.to_thread(fn, *args)
+
+
+async def handler(request):
+    await asyncio.sleep(0.002)
+    return httpx.Response(
+        200, content=BODY, headers={"content-type": "application/json"}
+    )
+
+
+async def run(offload, requests):
+    client = AsyncStream(
+        api_key="key", api_secret="s" * 32, transport=httpx.MockTransport(handler)
+    )
+    if offload is not None:
+        client.codec_offload = offload
+    latencies = []
+
+    async def one():
+        start = time.perf_counter()
+        await client.get("/api/v2/app")
+        latencies.append(time.perf_counter() - start)
+
+    await one()  # warm up imports and the connection
+    latencies.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    wall = time.perf_counter() - start
+    await client.aclose()
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return statistics.median(latencies), p99, wall
+
+
+def best_of(offload_factory, requests, rounds):
+    results = [asyncio.run(run(offload_factory(), requests)) for _ in range(rounds)]
+    return min(results, key=lambda r: r[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.requests} concurrent requests, {len(BODY)} byte responses")
+    before = best_of(ToThread, args.requests, args.rounds)
+    after = best_of(lambda: None, args.requests, args.rounds)
+    for name, (p50, p99, wall) in (("to_thread", before), ("inline", after)):
+        print(
+            f"  {name:10s} p50 {p50 * 1e3:7.2f} ms   p99 {p99 * 1e3:7.2f} ms   "
+            f"wall {wall * 1e3:7.1f} ms"
+        )
+    print(
+        f"  speedup    p50 {before[0] / after[0]:.1f}x   p99 {before[1] / after[1]:.1f}x"
+        f"   wall {before[2] / after[2]:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Reflective dataclasses_json vs compiled ``from_dict``/``to_dict``.
+
+Decodes and re-encodes a populated ``QueryChannelsResponse`` with the
+dataclasses_json functions the models used to call directly
+(``_decode_dataclass``/``_asdict``) and with the compiled per-model codec
+the generated models now inherit, and checks both produce the same output.
+
+    uv run python scripts/benchmarks/bench_codec.py [--channels N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import warnings
+
+from dataclasses_json.core import _asdict, _decode_dataclass
+
+from bench_lazy_models import build_body
+from getstream.models import QueryChannelsResponse
+
+
+def best_of(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    data = json.loads(build_body(args.channels))
+    # Synthetic payloads leave some required fields unset; silence the
+    # infer_missing warnings so they don't dominate the timings.
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    reflective = _decode_dataclass(QueryChannelsResponse, data, True)
+    compiled = QueryChannelsResponse.from_dict(data, infer_missing=True)
+    assert repr(reflective) == repr(compiled)
+    assert json.dumps(_asdict(compiled)) == json.dumps(compiled.to_dict())
+
+    rows = [
+        (
+            "decode",
+            lambda: _decode_dataclass(QueryChannelsResponse, data, True),
+            lambda: QueryChannelsResponse.from_dict(data, infer_missing=True),
+        ),
+        ("encode", lambda: _asdict(compiled), compiled.to_dict),
+    ]
+    print(f"payload: {len(json.dumps(data)) / 1024:.0f} KiB")
+    for label, before, after in rows:
+        t_before = best_of(before, args.rounds)
+        t_after = best_of(after, args.rounds)
+        print(
+            f"{label}: dataclasses_json {t_before * 1000:8.2f} ms   "
+            f"compiled {t_after * 1000:8.2f} ms   ({t_before / t_after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
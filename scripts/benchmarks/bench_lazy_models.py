@@ -0,0 +1,116 @@
+"""Eager vs lazy decoding of a large ``QueryChannelsResponse``.
+
+Builds a ~1 MB response (every field of every nested model populated), then
+decodes it both ways and reads a single field (``channels[i].channel.cid``)
+from each channel, reporting CPU time and peak allocation.
+
+    uv run python scripts/benchmarks/bench_lazy_models.py [--channels N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import time
+import tracemalloc
+import typing
+import warnings
+from datetime import datetime
+
+from getstream.lazy import lazy_from_dict
+from getstream.models import ChannelStateResponseFields, QueryChannelsResponse
+
+TS_NS = 1_700_000_000_123_456_000
+
+
+def sample(cls, depth=0):
+    hints = typing.get_type_hints(cls)
+    out = {}
+    for f in dataclasses.fields(cls):
+        key = f.metadata["dataclasses_json"]["letter_case"](f.name)
+        value = _value(hints[f.name], depth)
+        if value is not None:
+            out[key] = value
+    return out
+
+
+def _value(tp, depth):
+    while hasattr(tp, "__supertype__"):
+        tp = tp.__supertype__
+    origin, args = typing.get_origin(tp), typing.get_args(tp)
+    if origin is typing.Union:
+        return _value(args[0], depth)
+    if dataclasses.is_dataclass(tp):
+        return sample(tp, depth + 1) if depth < 2 else None
+    if origin is list:
+        item = _value(args[0], depth)
+        return [] if item is None else [item, item]
+    if origin is dict:
+        item = _value(args[1], depth)
+        return {} if item is None else {"k": item}
+    if tp is datetime:
+        return TS_NS
+    return {str: "value", int: 7, float: 1.5, bool: True}.get(tp, {"x": 1})
+
+
+def build_body(channels: int) -> str:
+    state = sample(ChannelStateResponseFields)
+    items = []
+    for i in range(channels):
+        item = json.loads(json.dumps(state))
+        item["channel"]["cid"] = f"messaging:{i}"
+        items.append(item)
+    return json.dumps({"duration": "1.00ms", "channels": items})
+
+
+def measure(label, decode, body, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        parsed = json.loads(body)
+        start = time.process_time()
+        resp = decode(parsed)
+        cids = [c.channel.cid for c in resp.channels]
+        best = min(best, time.process_time() - start)
+
+    parsed = json.loads(body)
+    tracemalloc.start()
+    resp = decode(parsed)
+    cids = [c.channel.cid for c in resp.channels]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<6} cpu {best * 1000:8.2f} ms   peak {peak / 1024:9.1f} KiB"
+        f"   ({len(cids)} cids)"
+    )
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=15)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    body = build_body(args.channels)
+    print(f"payload: {len(body) / 1024:.0f} KiB, {args.channels} channels")
+    # Synthetic payloads leave some required fields unset; silence the
+    # dataclasses_json infer_missing warnings so they don't skew timing.
+    warnings.simplefilter("ignore", RuntimeWarning)
+    eager_t, eager_m = measure(
+        "eager",
+        lambda d: QueryChannelsResponse.from_dict(d, infer_missing=True),
+        body,
+        args.rounds,
+    )
+    lazy_t, lazy_m = measure(
+        "lazy",
+        lambda d: lazy_from_dict(QueryChannelsResponse, d),
+        body,
+        args.rounds,
+    )
+    print(f"lazy: {eager_t / lazy_t:.1f}x less CPU, {eager_m / lazy_m:.1f}x less peak")
+
+
+if __name__ == "__main__":
+    main()
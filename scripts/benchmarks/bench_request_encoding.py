@@ -0,0 +1,125 @@
+"""JSON request-body encoding: previous path vs ``_encode_json_body``.
+
+The async client used to strip None values into a copy of the body, then
+``json.dumps`` it to a ``str`` on a worker thread for every request. Now the
+body is encoded to bytes in one pass (or by orjson when installed), inline
+unless it is larger than ``INLINE_JSON_ENCODE_MAX_BYTES``. Times a small
+``update_users_partial``-sized body and a ~1 MiB ``update_users`` body, both
+bare and as the async client runs it (including the thread hop).
+
+    uv run python scripts/benchmarks/bench_request_encoding.py [--users N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from getstream import base
+from getstream.base import (
+    INLINE_JSON_ENCODE_MAX_BYTES,
+    _encode_json_body,
+    _json_body_exceeds,
+    _strip_none,
+)
+from getstream.models import UpdateUsersPartialRequest, UpdateUsersRequest, UserRequest
+
+
+def best_of(fn, rounds, number):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def abest_of(fn, rounds, number):
+    async def run():
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                await fn()
+            best = min(best, (time.perf_counter() - start) / number)
+        return best
+
+    return asyncio.run(run())
+
+
+def previous(body):
+    # _strip_none copy, json.dumps to str; httpx then encodes the str
+    return json.dumps(_strip_none(body)).encode("utf-8")
+
+
+async def previous_async(body):
+    return (await asyncio.to_thread(json.dumps, _strip_none(body))).encode("utf-8")
+
+
+async def current_async(body):
+    if _json_body_exceeds(body, INLINE_JSON_ENCODE_MAX_BYTES):
+        return await asyncio.to_thread(_encode_json_body, body)
+    return _encode_json_body(body)
+
+
+def bodies(users):
+    small = UpdateUsersPartialRequest(
+        users=[{"id": "u1", "set": {"name": "Ada", "role": "admin"}}]
+    ).to_dict()
+    large = UpdateUsersRequest(
+        users={
+            f"user-{i}": UserRequest(
+                id=f"user-{i}",
+                name=f"User {i}",
+                role="user",
+                teams=["blue", "green"],
+                custom={"score": i, "bio": "x" * 200, "tags": ["a", "b", "c"]},
+            )
+            for i in range(users)
+        }
+    ).to_dict()
+    return {"small": (small, 2000), "large": (large, 5)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    orjson = base.orjson
+    for name, (body, number) in bodies(args.users).items():
+        assert json.loads(previous(body)) == json.loads(_encode_json_body(body))
+        size = len(_encode_json_body(body))
+        print(f"{name} body: {size / 1024:.1f} KiB")
+
+        base.orjson = None
+        t_prev = best_of(lambda: previous(body), args.rounds, number)
+        t_std = best_of(lambda: _encode_json_body(body), args.rounds, number)
+        t_std_async = abest_of(lambda: current_async(body), args.rounds, number)
+        base.orjson = orjson
+        t_prev_async = abest_of(lambda: previous_async(body), args.rounds, number)
+        print(
+            f"  encode        previous {t_prev * 1e6:10.1f} us   "
+            f"one-pass {t_std * 1e6:10.1f} us   ({t_prev / t_std:.1f}x)"
+        )
+        print(
+            f"  async client  previous {t_prev_async * 1e6:10.1f} us   "
+            f"one-pass {t_std_async * 1e6:10.1f} us   "
+            f"({t_prev_async / t_std_async:.1f}x)"
+        )
+        if orjson is not None:
+            t_or = best_of(lambda: _encode_json_body(body), args.rounds, number)
+            t_or_async = abest_of(lambda: current_async(body), args.rounds, number)
+            print(
+                f"  orjson        encode {t_or * 1e6:10.1f} us ({t_prev / t_or:.1f}x)   "
+                f"async client {t_or_async * 1e6:10.1f} us "
+                f"({t_prev_async / t_or_async:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
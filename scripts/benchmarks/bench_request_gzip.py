@@ -0,0 +1,97 @@
+"""Plain vs gzip-compressed request bodies (``CompressionConfig``).
+
+Builds ``update_users`` and ``upsert_activities``-shaped bodies of a few
+sizes and, for each gzip level, reports the bytes on the wire, the CPU time
+to encode (and compress) the body, and the estimated time to send it as
+encoding plus upload over links of the given bandwidths.
+
+    uv run python scripts/benchmarks/bench_request_gzip.py [--mbps 10 100 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from getstream.base import _encode_request_body
+from getstream.config import CompressionConfig
+from getstream.models import UpdateUsersRequest, UserRequest
+
+
+def best_of(fn, rounds, number):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def users_body(n):
+    return UpdateUsersRequest(
+        users={
+            f"user-{i}": UserRequest(
+                id=f"user-{i}",
+                name=f"User {i}",
+                role="user",
+                teams=["blue", "green"],
+                custom={"score": i, "bio": f"bio of user {i} " * 10},
+            )
+            for i in range(n)
+        }
+    ).to_dict()
+
+
+def activities_body(n):
+    return {
+        "activities": [
+            {
+                "type": "post",
+                "feeds": [f"user:{i % 97}", "timeline:global"],
+                "text": f"activity {i}: " + "lorem ipsum dolor sit amet " * 8,
+                "custom": {"likes": i * 3, "tags": ["news", "sports"]},
+                "visibility": "public",
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mbps", type=float, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    bodies = {
+        "update_users x100": users_body(100),
+        "update_users x5000": users_body(5000),
+        "upsert_activities x10000": activities_body(10000),
+    }
+    configs = [("plain", None)] + [
+        (f"gzip-{level}", CompressionConfig(enabled=True, min_bytes=0, level=level))
+        for level in (1, 6, 9)
+    ]
+    links = "".join(f"{f'@{m:g} Mbit/s':>15}" for m in args.mbps)
+    for name, body in bodies.items():
+        plain_size = len(_encode_request_body(body, None)[0])
+        number = max(1, 2_000_000 // plain_size)
+        print(f"{name}: {plain_size / 1024:.1f} KiB")
+        print(f"  {'':8}{'bytes':>12}{'ratio':>8}{'encode':>12}{links}")
+        for label, config in configs:
+            size = len(_encode_request_body(body, config)[0])
+            cpu = best_of(
+                lambda: _encode_request_body(body, config), args.rounds, number
+            )
+            sends = "".join(
+                f"{(cpu + size * 8 / (m * 1e6)) * 1e3:12.2f} ms" for m in args.mbps
+            )
+            print(
+                f"  {label:8}{size:12d}{plain_size / size:7.1f}x"
+                f"{cpu * 1e3:9.2f} ms{sends}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Response handling: ijson ``duration`` scan + ``json.loads`` vs one decode.
+
+The request loop used to scan every body with ijson for the ``duration``
+span attribute and then decode it again with ``json.loads`` to build the
+model (and a third time for the error envelope). Now ``_decode_json_body``
+decodes it once and everything reads that. Times the JSON work alone and
+the full path to a ``QueryChannelsResponse`` (eager and lazy models) for a
+large list response, with the stdlib and, when installed, orjson.
+
+    uv run python scripts/benchmarks/bench_response_decoding.py [--channels N] [--duration-first]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import warnings
+
+from bench_lazy_models import build_body
+from getstream import base
+from getstream.base import _decode_json_body, _server_duration, parse_duration_from_body
+from getstream.lazy import lazy_from_dict
+from getstream.models import QueryChannelsResponse
+
+
+def best_of(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def before(content, build):
+    parse_duration_from_body(content)
+    return build(json.loads(content.decode("utf-8")))
+
+
+def after(content, build):
+    payload, _ = _decode_json_body(content)
+    _server_duration(payload)
+    return build(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--duration-first", action="store_true")
+    args = parser.parse_args()
+
+    body = json.loads(build_body(args.channels))
+    if not args.duration_first:
+        # ijson reads up to ``duration``: placing it after the channels is
+        # the full double decode; --duration-first is the cheap case
+        body["duration"] = body.pop("duration")
+    content = json.dumps(body).encode("utf-8")
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    builders = {
+        "json only": lambda payload: payload,
+        "eager model": lambda payload: QueryChannelsResponse.from_dict(
+            payload, infer_missing=True
+        ),
+        "lazy model": lambda payload: lazy_from_dict(QueryChannelsResponse, payload),
+    }
+    backends = [("stdlib", None)]
+    if base.orjson is not None:
+        backends.append(("orjson", base.orjson))
+
+    print(f"payload: {len(content) / 1024:.0f} KiB")
+    orjson = base.orjson
+    try:
+        for backend, module in backends:
+            base.orjson = module
+            for label, build in builders.items():
+                t_before = best_of(lambda: before(content, build), args.rounds)
+                t_after = best_of(lambda: after(content, build), args.rounds)
+                print(
+                    f"{backend:6s} {label:11s}: ijson + json.loads "
+                    f"{t_before * 1000:8.2f} ms   one decode {t_after * 1000:8.2f} ms"
+                    f"   ({t_before / t_after:.1f}x)"
+                )
+    finally:
+        base.orjson = orjson
+
+
+if __name__ == "__main__":
+    main()
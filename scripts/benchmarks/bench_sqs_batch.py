@@ -0,0 +1,91 @@
+"""SQS/SNS batch decoding: ``parse_sqs`` per message vs ``parse_sqs_batch``.
+
+Builds ``--messages`` ``message.new`` SQS bodies in each wire format (raw
+JSON, and base64 of gzip) and reports messages per second for:
+
+- ``parse_sqs``: one message at a time
+- ``parse_sqs_batch``: the batch generator, events decoded up front
+- ``parse_sqs_batch lazy``: the same with ``lazy_models=True``
+- ``parse_sqs_batch lazy + read``: lazy, then reading ``event.message.text``
+
+plus the decode step alone (``decode_sqs_payload`` vs the batch decoder),
+and the same for SNS envelopes.
+
+    uv run python scripts/benchmarks/bench_sqs_batch.py [--messages 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import json
+import time
+import warnings
+
+from getstream._webhook_decode import decode_sqs
+from getstream.webhook import decode_sqs_payload, parse_sns, parse_sqs
+from getstream.webhook_batch import parse_sns_batch, parse_sqs_batch
+
+from bench_webhook_batch import message_new
+
+
+def best_of(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    # the trimmed payloads leave fields the models warn about
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    payloads = [json.dumps(message_new(i, args.members)) for i in range(args.messages)]
+    formats = {
+        "raw": payloads,
+        "base64+gzip": [
+            base64.b64encode(gzip.compress(p.encode("utf-8"))).decode("ascii")
+            for p in payloads
+        ],
+    }
+    n = args.messages
+    print(f"{n} message.new bodies, {sum(map(len, payloads)) / n / 1024:.1f} KiB each")
+    for name, bodies in formats.items():
+        envelopes = [json.dumps({"Type": "Notification", "Message": b}) for b in bodies]
+        runs = [
+            ("decode_sqs_payload", lambda: [decode_sqs_payload(b) for b in bodies]),
+            ("batch decode", lambda: [decode_sqs(b) for b in bodies]),
+            ("parse_sqs", lambda: [parse_sqs(b) for b in bodies]),
+            ("parse_sqs_batch", lambda: list(parse_sqs_batch(bodies))),
+            (
+                "parse_sqs_batch lazy",
+                lambda: list(parse_sqs_batch(bodies, lazy_models=True)),
+            ),
+            (
+                "  + read text",
+                lambda: [
+                    e.message.text for e in parse_sqs_batch(bodies, lazy_models=True)
+                ],
+            ),
+            ("parse_sns", lambda: [parse_sns(b) for b in envelopes]),
+            (
+                "parse_sns_batch lazy",
+                lambda: list(parse_sns_batch(envelopes, lazy_models=True)),
+            ),
+        ]
+        print(f"{name}:")
+        for label, fn in runs:
+            elapsed = best_of(fn, args.rounds)
+            print(f"  {label:22}{n / elapsed:12.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""User token minting: PyJWT vs ``TokenMinter`` vs ``TokenCacheConfig``.
+
+Mints ``--tokens`` user tokens (default 100k) drawn from ``--users``
+distinct users and reports the time per token for:
+
+- ``jwt.encode``: what ``create_token`` did before ``TokenMinter``
+- ``create_token``: the precomputed header and HMAC key, no cache
+- ``create_tokens``: the same, minted as one batch
+- ``create_token`` with a token cache, warm (every user minted once before)
+
+    uv run python scripts/benchmarks/bench_token_minting.py [--tokens 100000] [--users 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import jwt
+
+from getstream import Stream, TokenCacheConfig
+
+SECRET = "bench-secret-" + "x" * 32
+
+
+def best_of(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--expiration", type=int, default=3600)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    user_ids = [f"user-{i % args.users}" for i in range(args.tokens)]
+    expiration = args.expiration
+    plain = Stream(api_key="key", api_secret=SECRET)
+    cached = Stream(
+        api_key="key",
+        api_secret=SECRET,
+        token_cache=TokenCacheConfig(enabled=True, max_entries=args.users),
+    )
+    cached.create_tokens(user_ids[: args.users], expiration=expiration)
+
+    def pyjwt():
+        for user_id in user_ids:
+            now = int(time.time())
+            jwt.encode(
+                {"iat": now - 5, "user_id": user_id, "exp": now + expiration},
+                SECRET,
+                algorithm="HS256",
+            )
+
+    def minted():
+        for user_id in user_ids:
+            plain.create_token(user_id, expiration=expiration)
+
+    def batch():
+        plain.create_tokens(user_ids, expiration=expiration)
+
+    def warm_cache():
+        for user_id in user_ids:
+            cached.create_token(user_id, expiration=expiration)
+
+    runs = [
+        ("jwt.encode", pyjwt),
+        ("create_token", minted),
+        ("create_tokens", batch),
+        ("create_token, cached", warm_cache),
+    ]
+    print(f"{args.tokens} tokens for {args.users} users")
+    baseline = None
+    for label, fn in runs:
+        elapsed = best_of(fn, args.rounds)
+        baseline = baseline or elapsed
+        print(
+            f"  {label:22}{elapsed * 1e3:10.1f} ms"
+            f"{elapsed / args.tokens * 1e6:8.2f} us/token"
+            f"{baseline / elapsed:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
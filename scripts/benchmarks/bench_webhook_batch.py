@@ -0,0 +1,121 @@
+"""Batch webhook verification and parsing: inline vs thread pool vs process pool.
+
+Signs ``--events`` ``message.new`` deliveries carrying ``--members`` channel
+members each, then reports events per second for
+``verify_and_parse_webhooks`` run inline, on a thread pool and on a process
+pool of ``--workers``. For the async wrapper it also reports the longest the
+event loop went without running a 1 ms ticker while a batch was parsed.
+
+    uv run python scripts/benchmarks/bench_webhook_batch.py [--events 2000] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+import warnings
+
+from getstream.webhook_batch import (
+    averify_and_parse_webhooks,
+    create_webhook_executor,
+    verify_and_parse_webhooks,
+)
+
+SECRET = "bench-webhook-secret"
+
+
+def message_new(i, members):
+    user = {"id": "user-1", "name": "User 1", "role": "user", "custom": {}}
+    return {
+        "type": "message.new",
+        "created_at": 1767225600000000000,
+        "cid": f"messaging:channel-{i}",
+        "channel_id": f"channel-{i}",
+        "channel_type": "messaging",
+        "message": {
+            "id": f"message-{i}",
+            "text": "lorem ipsum dolor sit amet " * 20,
+            "user": user,
+            "attachments": [],
+            "latest_reactions": [],
+            "own_reactions": [],
+            "mentioned_users": [],
+        },
+        "user": user,
+        "members": [
+            {"user_id": f"user-{m}", "user": {**user, "id": f"user-{m}"}}
+            for m in range(members)
+        ],
+    }
+
+
+def deliveries(n, members):
+    out = []
+    for i in range(n):
+        body = json.dumps(message_new(i, members)).encode("utf-8")
+        signature = hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+        out.append((body, signature))
+    return out
+
+
+async def loop_stall(batch, executor):
+    """Longest gap between ticks of a 1 ms ticker while the batch parses."""
+    worst = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            worst = max(worst, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await averify_and_parse_webhooks(batch, SECRET, executor=executor)
+    done = True
+    await task
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    # the trimmed payloads leave fields the models warn about
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    batch = deliveries(args.events, args.members)
+    size = sum(len(body) for body, _ in batch) / len(batch)
+    print(f"{args.events} message.new events, {size / 1024:.1f} KiB each")
+    verify_and_parse_webhooks(batch[:10], SECRET)  # load the event models
+
+    with (
+        create_webhook_executor(args.workers, processes=False) as threads,
+        create_webhook_executor(args.workers) as processes,
+    ):
+        verify_and_parse_webhooks(batch, SECRET, executor=processes)  # warm up
+        for label, executor in (
+            ("inline", None),
+            (f"{args.workers} threads", threads),
+            (f"{args.workers} processes", processes),
+        ):
+            start = time.perf_counter()
+            verify_and_parse_webhooks(batch, SECRET, executor=executor)
+            elapsed = time.perf_counter() - start
+            stall = asyncio.run(loop_stall(batch, executor or threads))
+            print(
+                f"  {label:14}{args.events / elapsed:10.0f} events/s"
+                f"   async loop stall {stall * 1e3:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Routing webhooks on their type: full ``parse_event`` vs peeking.
+
+Builds ``message.new`` payloads carrying ``--members`` channel members (with
+a nested ``message.type`` and message text that needs escaping, as in real
+traffic) and reports microseconds per event for ``parse_event``, ``get_event_type``
+(``json.loads`` of the whole payload), ``peek_event_type`` and
+``peek_event`` with a ``cid`` field. It then runs a router that keeps
+``--keep`` percent of the events (decoding only those) with
+``parse_event`` and with ``peek_event``.
+
+    uv run python scripts/benchmarks/bench_webhook_routing.py [--members 20] [--keep 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import warnings
+
+from getstream.webhook import get_event_type, parse_event
+from getstream.webhook_routing import peek_event, peek_event_type
+
+from bench_webhook_batch import message_new
+
+
+def best_of(fn, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--keep", type=int, default=10, help="percent routed on")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    # the trimmed payloads leave fields the models warn about
+    warnings.simplefilter("ignore", RuntimeWarning)
+
+    payloads = []
+    for i in range(args.events):
+        event = message_new(i, args.members)
+        event["message"]["type"] = "regular"
+        event["message"]["text"] = 'line one\nlígne "two" \U0001f600'
+        if i % 100 >= args.keep:
+            event["type"] = "message.read"
+        payloads.append(json.dumps(event).encode("utf-8"))
+    n = len(payloads)
+    print(f"{n} events, {sum(map(len, payloads)) / n / 1024:.1f} KiB each")
+
+    def route_parsed():
+        for payload in payloads:
+            event = parse_event(payload)
+            if event.type == "message.new":
+                event.message.text
+
+    def route_peeked():
+        for payload in payloads:
+            peeked = peek_event(payload)
+            if peeked.type == "message.new":
+                peeked.event.message.text
+
+    for label, fn in (
+        ("parse_event", lambda: [parse_event(p) for p in payloads]),
+        ("get_event_type", lambda: [get_event_type(p) for p in payloads]),
+        ("peek_event_type", lambda: [peek_event_type(p) for p in payloads]),
+        ("peek_event cid", lambda: [peek_event(p, ("cid",)) for p in payloads]),
+        (f"route {args.keep}% parsed", route_parsed),
+        (f"route {args.keep}% peeked", route_peeked),
+    ):
+        elapsed = best_of(fn, args.rounds)
+        print(f"  {label:20}{elapsed / n * 1e6:10.1f} us/event")
+
+
+if __name__ == "__main__":
+    main()
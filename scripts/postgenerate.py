@@ -0,0 +1,410 @@
+"""Adjust the code the OpenAPI generator writes to this SDK's runtime.
+
+Run by generate.sh after the generator; safe to run more than once.
+
+- The generated models inherit ``getstream.codec.DataClassJsonMixin``
+  (compiled ``from_dict``/``to_dict``) instead of dataclasses_json's.
+- The generator writes the models to ``getstream/models/__init__.py``. They
+  move to ``getstream/models/_generated.py`` and the hand-written package
+  facade, which imports them on first use, is restored from git.
+- The common REST clients are imported by ``import getstream`` (``Stream``
+  inherits them), so they must not import the models up front: they refer
+  to them as ``models.X`` at runtime and import them for annotations only
+  under ``TYPE_CHECKING``.
+- ``getstream.webhook`` (imported for signature checks alone) imports the
+  event models inside ``_event_map``, on the first parse, rather than at
+  module import; a module ``__getattr__`` still serves
+  ``from getstream.webhook import CallCreatedEvent``.
+- Every cursor-paginated REST client method gets an ``iter_<method>``
+  (sync) or ``aiter_<method>`` (async) companion built on
+  ``getstream.pagination``; ``missing_paginators`` lists the ones a client
+  lacks.
+"""
+
+from __future__ import annotations
+
+import ast
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+GETSTREAM = ROOT / "getstream"
+MODELS = GETSTREAM / "models" / "__init__.py"
+GENERATED_MODELS = GETSTREAM / "models" / "_generated.py"
+WEBHOOK = GETSTREAM / "webhook.py"
+COMMON_REST_CLIENTS = [
+    GETSTREAM / "common" / "rest_client.py",
+    GETSTREAM / "common" / "async_rest_client.py",
+]
+REST_CLIENTS = sorted(GETSTREAM.glob("*/*rest_client.py"))
+
+GENERATED_HEADER = "# Code generated by GetStream internal OpenAPI code generator."
+DATACLASSES_JSON_MIXIN = "from dataclasses_json import DataClassJsonMixin\n"
+CODEC_MIXIN = "from getstream.codec import DataClassJsonMixin\n"
+STAR_IMPORT = "from getstream.models import *\n"
+LAZY_IMPORTS = (
+    "from __future__ import annotations\n"
+    "\n"
+    "from typing import TYPE_CHECKING, Dict, List, Optional\n"
+    "\n"
+    "from getstream import models\n"
+)
+ANNOTATION_IMPORTS = (
+    "\n"
+    "if TYPE_CHECKING:\n"
+    "    from datetime import datetime\n"
+    "\n"
+    "    from getstream.models import *\n"
+)
+LRU_CACHE_IMPORT = "from functools import lru_cache\n"
+EVENT_MAP = '''def _get_event_class(event_type: str):
+    """Map event type to event class."""
+    return _event_map().get(event_type)
+
+
+@lru_cache(maxsize=None)
+def _event_map() -> Dict[str, Any]:
+    # The event classes live in the generated models, which are only loaded
+    # once an event is actually parsed (verify-only callers never need them).
+{imports}
+
+{event_map}
+
+
+def __getattr__(name: str) -> Any:
+    # The event classes used to be imported into this module; keep
+    # ``from getstream.webhook import CallCreatedEvent`` working.
+    if not name.startswith("__"):
+        for event_class in _event_map().values():
+            if event_class.__name__ == name:
+                return event_class
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+'''
+
+
+def use_codec_mixin(source: str) -> str:
+    source = source.replace(DATACLASSES_JSON_MIXIN, CODEC_MIXIN)
+    if CODEC_MIXIN not in source:
+        raise SystemExit("generated models: DataClassJsonMixin import not found")
+    return source
+
+
+def move_models() -> None:
+    """Move freshly generated models out of the package ``__init__``. A
+    facade already in place means there is nothing new to move."""
+    if not MODELS.read_text().startswith(GENERATED_HEADER):
+        return
+    MODELS.replace(GENERATED_MODELS)
+    subprocess.run(
+        ["git", "checkout", "HEAD", "--", str(MODELS.relative_to(ROOT))],
+        cwd=ROOT,
+        check=True,
+    )
+
+
+def model_names(source: str) -> Set[str]:
+    """The classes and aliases the generated models module defines."""
+    names = set()
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            names.add(node.name)
+        elif isinstance(node, ast.Assign):
+            names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.add(node.target.id)
+    return names
+
+
+def _annotations(tree: ast.AST) -> Iterator[ast.AST]:
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            args = node.args
+            for arg in (
+                *args.posonlyargs,
+                *args.args,
+                *args.kwonlyargs,
+                args.vararg,
+                args.kwarg,
+            ):
+                if arg is not None and arg.annotation is not None:
+                    yield arg.annotation
+            if node.returns is not None:
+                yield node.returns
+        elif isinstance(node, ast.AnnAssign):
+            yield node.annotation
+
+
+def lazy_model_references(source: str, names: Set[str]) -> str:
+    """Rewrite a module that star-imports the models to use ``models.X``
+    wherever a model is needed at runtime. Annotations keep the bare names;
+    with ``from __future__ import annotations`` they are never evaluated."""
+    if STAR_IMPORT not in source.splitlines(keepends=True):
+        return source
+    tree = ast.parse(source)
+    in_annotations = {id(n) for a in _annotations(tree) for n in ast.walk(a)}
+    positions: List[Tuple[int, int]] = [
+        (node.lineno, node.col_offset)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name)
+        and isinstance(node.ctx, ast.Load)
+        and node.id in names
+        and id(node) not in in_annotations
+    ]
+    lines = source.splitlines(keepends=True)
+    for lineno, col in sorted(positions, reverse=True):
+        line = lines[lineno - 1].encode("utf-8")
+        lines[lineno - 1] = (line[:col] + b"models." + line[col:]).decode("utf-8")
+    source = "".join(lines)
+
+    header, sep, rest = source.partition("\n")
+    if not header.startswith(GENERATED_HEADER):
+        header, sep, rest = "", "", source
+    imports, _, body = rest.partition("\n\n")
+    imports = "".join(
+        line
+        for line in imports.splitlines(keepends=True)
+        if line.rstrip("\n") != STAR_IMPORT.rstrip("\n")
+    ).strip("\n")
+    return f"{header}{sep}{LAZY_IMPORTS}{imports}\n{ANNOTATION_IMPORTS}\n{body}"
+
+
+def _indent(lines: List[str]) -> str:
+    return "".join("    " + line if line.strip() else line for line in lines)
+
+
+def lazy_event_map(source: str) -> str:
+    """Move the webhook module's import of the event models into
+    ``_event_map``, which ``_get_event_class`` calls on the first parse."""
+    if "def _event_map(" in source:
+        return source
+    tree = ast.parse(source)
+    models_import = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom)
+        and node.level == 1
+        and node.module == "models"
+    )
+    get_event_class = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == "_get_event_class"
+    )
+    event_map = next(
+        stmt
+        for stmt in get_event_class.body
+        if isinstance(stmt, ast.Assign)
+        and [t.id for t in stmt.targets if isinstance(t, ast.Name)] == ["event_map"]
+    )
+    lines = source.splitlines(keepends=True)
+    dict_lines = lines[event_map.lineno - 1 : event_map.end_lineno]
+    dict_lines[0] = dict_lines[0].replace("event_map = ", "return ", 1)
+    replacement = EVENT_MAP.format(
+        imports=_indent(
+            lines[models_import.lineno - 1 : models_import.end_lineno]
+        ).rstrip("\n"),
+        event_map="".join(dict_lines).rstrip("\n"),
+    )
+    # replace the later node first so the earlier line numbers still hold
+    lines[get_event_class.lineno - 1 : get_event_class.end_lineno] = [replacement]
+    del lines[models_import.lineno - 1 : models_import.end_lineno]
+    typing = next(i for i, line in enumerate(lines) if line.startswith("from typing "))
+    lines.insert(typing, LRU_CACHE_IMPORT)
+    return "".join(lines)
+
+
+# responses that carry more than one list: the one a paginator yields
+PAGINATED_ITEMS = {
+    "query_call_session_participant_stats": "participants",
+    "query_moderation_rules": "rules",
+}
+# takes a `next` cursor but returns feed state, not a page of items
+NOT_PAGINATED = {"get_or_create_feed"}
+
+
+def _list_item(annotation: ast.expr) -> Optional[ast.expr]:
+    """``X`` for a ``List[X]`` or ``Optional[List[X]]`` field annotation,
+    which the generator may write as a string."""
+    if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+        annotation = ast.parse(annotation.value, mode="eval").body
+    if (
+        isinstance(annotation, ast.Subscript)
+        and isinstance(annotation.value, ast.Name)
+        and annotation.value.id == "Optional"
+    ):
+        return _list_item(annotation.slice)
+    if (
+        isinstance(annotation, ast.Subscript)
+        and isinstance(annotation.value, ast.Name)
+        and annotation.value.id == "List"
+    ):
+        return annotation.slice
+    return None
+
+
+def page_items(source: str) -> Dict[str, Dict[str, ast.expr]]:
+    """Response class -> its list fields (name -> item type), for every
+    generated model with a ``next`` cursor field."""
+    pages = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        fields = {
+            stmt.target.id: stmt.annotation
+            for stmt in node.body
+            if isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name)
+        }
+        if "next" not in fields:
+            continue
+        pages[node.name] = {
+            name: item
+            for name, annotation in fields.items()
+            if (item := _list_item(annotation)) is not None
+        }
+    return pages
+
+
+def _paginated(
+    method: ast.AST, pages: Dict[str, Dict[str, ast.expr]]
+) -> Optional[Tuple[str, ast.expr]]:
+    """The list field and item type ``method`` pages through, if it is a
+    cursor-paginated endpoint."""
+    if not isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return None
+    if method.name in NOT_PAGINATED or "next" not in {a.arg for a in method.args.args}:
+        return None
+    returns = method.returns
+    if not (
+        isinstance(returns, ast.Subscript)
+        and isinstance(returns.value, ast.Name)
+        and returns.value.id == "StreamResponse"
+        and isinstance(returns.slice, ast.Name)
+        and returns.slice.id in pages
+    ):
+        return None
+    lists = pages[returns.slice.id]
+    field = PAGINATED_ITEMS.get(method.name)
+    if field is None:
+        if len(lists) != 1:
+            return None
+        (field,) = lists
+    return field, lists[field]
+
+
+def _companion(method: ast.FunctionDef, field: str, item: ast.expr) -> str:
+    is_async = isinstance(method, ast.AsyncFunctionDef)
+    prefix, iterator, walk = (
+        ("aiter_", "AsyncIterator", "apaginate")
+        if is_async
+        else ("iter_", "Iterator", "paginate")
+    )
+    args = method.args.args[1:]
+    defaults = [None] * (len(args) - len(method.args.defaults)) + list(
+        method.args.defaults
+    )
+    params, forwarded = ["self"], []
+    for arg, default in zip(args, defaults):
+        if arg.arg in ("next", "prev"):
+            continue
+        param = f"{arg.arg}: {ast.unparse(arg.annotation)}"
+        if default is not None:
+            param += f" = {ast.unparse(default)}"
+        params.append(param)
+        forwarded.append(f"{arg.arg}={arg.arg}")
+    params.append("prefetch: bool = False")
+    call = [f"self.{method.name}", f'"{field}"', "prefetch=prefetch"]
+    return (
+        f"    def {prefix}{method.name}(\n"
+        + "".join(f"        {p},\n" for p in params)
+        + f"    ) -> {iterator}[{ast.unparse(item)}]:\n"
+        + f"        return {walk}(\n"
+        + "".join(f"            {a},\n" for a in call + forwarded)
+        + "        )\n"
+    )
+
+
+def _client_methods(tree: ast.Module) -> List[ast.AST]:
+    return [
+        stmt
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+        for stmt in node.body
+    ]
+
+
+def missing_paginators(
+    source: str, pages: Dict[str, Dict[str, ast.expr]]
+) -> List[Tuple[ast.AST, str, ast.expr]]:
+    """The paginated methods of a REST client without their companion, with
+    the list field and item type each one pages through."""
+    methods = _client_methods(ast.parse(source))
+    defined = {m.name for m in methods if isinstance(m, ast.FunctionDef)}
+    missing = []
+    for method in methods:
+        page = _paginated(method, pages)
+        prefix = "aiter_" if isinstance(method, ast.AsyncFunctionDef) else "iter_"
+        if page is not None and prefix + method.name not in defined:
+            missing.append((method, *page))
+    return missing
+
+
+def _add_import(source: str, line: str) -> str:
+    """Add a ``from getstream... import`` line in sorted position."""
+    lines = source.splitlines(keepends=True)
+    if line in lines:
+        return source
+    for i, existing in enumerate(lines):
+        if existing.startswith("from getstream") and existing > line:
+            lines.insert(i, line)
+            return "".join(lines)
+    raise SystemExit(f"no place for {line.strip()!r}")
+
+
+def _add_typing_name(source: str, name: str) -> str:
+    """Import ``name`` from typing, after the header of a generated module."""
+    lines = source.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        if line.startswith("from typing import "):
+            names = line[len("from typing import ") :].rstrip("\n").split(", ")
+            if name not in names:
+                names.insert(1, name)
+                lines[i] = "from typing import " + ", ".join(names) + "\n"
+            return "".join(lines)
+    header = 1 if lines and lines[0].startswith(GENERATED_HEADER) else 0
+    lines[header:header] = [f"from typing import {name}\n", "\n"]
+    return "".join(lines)
+
+
+def add_paginators(source: str, pages: Dict[str, Dict[str, ast.expr]]) -> str:
+    """Give every cursor-paginated method of a REST client its
+    ``iter_``/``aiter_`` companion, right after the method."""
+    missing = missing_paginators(source, pages)
+    if not missing:
+        return source
+    lines = source.splitlines(keepends=True)
+    for method, field, item in sorted(missing, key=lambda m: -m[0].end_lineno):
+        lines.insert(method.end_lineno, "\n" + _companion(method, field, item))
+    source = "".join(lines)
+    if isinstance(missing[0][0], ast.AsyncFunctionDef):
+        source = _add_typing_name(source, "AsyncIterator")
+        return _add_import(source, "from getstream.pagination import apaginate\n")
+    source = _add_typing_name(source, "Iterator")
+    return _add_import(source, "from getstream.pagination import paginate\n")
+
+
+def main() -> None:
+    move_models()
+    models_source = use_codec_mixin(GENERATED_MODELS.read_text())
+    GENERATED_MODELS.write_text(models_source)
+    names = model_names(models_source)
+    for path in COMMON_REST_CLIENTS:
+        path.write_text(lazy_model_references(path.read_text(), names))
+    WEBHOOK.write_text(lazy_event_map(WEBHOOK.read_text()))
+    pages = page_items(models_source)
+    for path in REST_CLIENTS:
+        path.write_text(add_paginators(path.read_text(), pages))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 import functools
+import importlib.util
 import uuid
 import pytest
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 from tests.fixtures import (
     client,
@@ -98,6 +100,16 @@ def channel(client: Stream, random_user):
         pass
 
 
+@pytest.fixture(scope="session")
+def postgenerate():
+    """scripts/postgenerate.py, which generate.sh runs after the generator."""
+    path = Path(__file__).resolve().parent.parent / "scripts" / "postgenerate.py"
+    spec = importlib.util.spec_from_file_location("postgenerate", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 @pytest.fixture(scope="session", autouse=True)
 def load_env():
     load_dotenv()
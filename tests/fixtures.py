@@ -1,4 +1,8 @@
+import copy
+import dataclasses
+import typing
 import uuid
+from datetime import datetime
 from typing import Dict
 from dotenv import load_dotenv
 import pytest
@@ -80,3 +84,38 @@ def get_feed(client: Stream):
         return client.feeds.feed(feed_type, feed_id, custom_data)
 
     return inner
+
+
+TS_NS = 1_700_000_000_123_456_000
+
+
+def sample_payload(cls, depth=0):
+    """A JSON object with every field of ``cls`` populated (nested models
+    included, down to a few levels) using the model's wire names."""
+    hints = typing.get_type_hints(cls)
+    out = {}
+    for f in dataclasses.fields(cls):
+        key = f.metadata["dataclasses_json"]["letter_case"](f.name)
+        value = _sample_value(hints[f.name], f, depth)
+        if value is not None:
+            out[key] = value
+    return out
+
+
+def _sample_value(tp, f, depth):
+    while hasattr(tp, "__supertype__"):
+        tp = tp.__supertype__
+    origin, args = typing.get_origin(tp), typing.get_args(tp)
+    if origin is typing.Union:
+        return _sample_value(args[0], f, depth)
+    if dataclasses.is_dataclass(tp):
+        return sample_payload(tp, depth + 1) if depth < 3 else None
+    if origin is list:
+        item = _sample_value(args[0], f, depth)
+        return [] if item is None else [item, copy.deepcopy(item)]
+    if origin is dict:
+        item = _sample_value(args[1], f, depth)
+        return {} if item is None else {"k": item}
+    if tp is datetime:
+        return TS_NS
+    return {str: "s", int: 7, float: 1.5, bool: True}.get(tp, {"x": 1})
@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, Stream
+from getstream.base import HTTP2_MAX_CONCURRENT_STREAMS
+from getstream.bulk import BULK_MAX_THREADS, BulkRun, resolve_concurrency
+from getstream.exceptions import StreamApiException
+
+
+class InFlight:
+    """MockTransport handler that records peak concurrency; user ids that
+    start with ``bad`` fail with HTTP 400."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.current = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _enter(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def _exit(self):
+        with self.lock:
+            self.current -= 1
+
+    def _response(self, request):
+        user_id = request.url.path.rsplit("/", 1)[-1]
+        if user_id.startswith("bad"):
+            return httpx.Response(
+                400,
+                json={
+                    "code": 4,
+                    "duration": "0ms",
+                    "message": "bad user",
+                    "more_info": "",
+                    "StatusCode": 400,
+                    "details": [],
+                },
+            )
+        return httpx.Response(200, json={"duration": "1ms", "user_id": user_id})
+
+    def __call__(self, request):
+        self._enter()
+        try:
+            time.sleep(self.delay)
+            return self._response(request)
+        finally:
+            self._exit()
+
+    async def handle_async(self, request):
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return self._response(request)
+        finally:
+            self._exit()
+
+
+def sync_client(handler, **kwargs):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def ops(client, ids):
+    return (lambda i=i: client.get(f"/api/v2/users/{i}") for i in ids)
+
+
+class TestBulk:
+    def test_ordered_results_and_bounded_concurrency(self):
+        handler = InFlight()
+        client = sync_client(handler)
+        run = client.bulk(ops(client, range(30)), concurrency=4)
+        results = list(run)
+        assert [r.index for r in results] == list(range(30))
+        assert [r.value.data["user_id"] for r in results] == [str(i) for i in range(30)]
+        assert 1 < handler.peak <= 4
+        assert run.stats.succeeded == 30 and run.stats.in_flight == 0
+
+    def test_errors_are_captured_per_item(self):
+        client = sync_client(InFlight(delay=0))
+        run = client.bulk(ops(client, ["a", "bad1", "b"]))
+        results = list(run)
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, StreamApiException)
+        with pytest.raises(StreamApiException):
+            results[1].result()
+        assert run.stats.failed == 1 and run.stats.succeeded == 2
+
+    def test_unordered_yields_as_completed(self):
+        client = sync_client(InFlight(delay=0))
+        results = list(client.bulk(ops(client, range(10)), ordered=False))
+        assert sorted(r.index for r in results) == list(range(10))
+
+    def test_operations_are_consumed_lazily(self):
+        client = sync_client(InFlight(delay=0))
+        pulled = []
+
+        def gen():
+            for i in range(100):
+                pulled.append(i)
+                yield lambda i=i: client.get(f"/api/v2/users/{i}")
+
+        run = client.bulk(gen(), concurrency=2)
+        it = iter(run)
+        next(it)
+        assert len(pulled) <= 5
+        it.close()
+
+    def test_concurrency_defaults_to_and_is_capped_by_the_pool(self):
+        client = Stream(api_key="key", api_secret="secret", max_conns_per_host=3)
+        assert client.bulk([]).stats.concurrency == 3
+        assert client.bulk([], concurrency=50).stats.concurrency == 3
+        assert client.bulk([], concurrency=2).stats.concurrency == 2
+        with pytest.raises(ValueError):
+            client.bulk([], concurrency=0)
+        client.close()
+
+    def test_caller_transport_takes_concurrency_as_is(self):
+        # httpx does not apply max_conns_per_host to a caller's transport
+        client = sync_client(InFlight(), max_conns_per_host=3)
+        assert client.bulk([]).stats.concurrency == 3
+        assert client.bulk([], concurrency=50).stats.concurrency == 50
+
+    def test_default_thread_count_is_capped_under_http2(self):
+        client = Stream(api_key="key", api_secret="secret", http2=True)
+        assert client.bulk([]).stats.concurrency == BULK_MAX_THREADS
+        # one multiplexed connection, whatever max_conns_per_host is
+        assert client.bulk([], concurrency=200).stats.concurrency == (
+            HTTP2_MAX_CONCURRENT_STREAMS
+        )
+        # async runs keep the connection's full stream capacity
+        assert resolve_concurrency(client, None) == HTTP2_MAX_CONCURRENT_STREAMS
+        client.close()
+
+    def test_stats(self):
+        client = sync_client(InFlight(delay=0.005))
+        run = client.bulk(ops(client, range(10)), concurrency=5)
+        for _ in run:
+            pass
+        stats = run.stats
+        assert stats.completed == 10
+        assert stats.throughput > 0
+        assert 0.005 <= stats.latency(0.5) <= stats.latency(0.99)
+        assert stats.latency_mean > 0
+
+    def test_single_use(self):
+        run = BulkRun([], concurrency=1)
+        list(run)
+        with pytest.raises(RuntimeError):
+            iter(run)
+
+
+class TestAsyncBulk:
+    async def test_ordered_results_and_bounded_concurrency(self):
+        handler = InFlight()
+        client = AsyncStream(
+            api_key="key",
+            api_secret="secret",
+            transport=httpx.MockTransport(handler.handle_async),
+        )
+        ids = [*range(10), "bad", *range(10, 20)]
+        run = client.bulk(
+            (lambda i=i: client.get(f"/api/v2/users/{i}") for i in ids),
+            concurrency=3,
+        )
+        results = [r async for r in run]
+        assert [r.index for r in results] == list(range(21))
+        assert [r.ok for r in results].count(False) == 1
+        assert not results[10].ok
+        assert 1 < handler.peak <= 3
+        assert run.stats.succeeded == 20 and run.stats.failed == 1
+        await client.aclose()
+
+    async def test_unordered(self):
+        handler = InFlight(delay=0)
+        client = AsyncStream(
+            api_key="key",
+            api_secret="secret",
+            transport=httpx.MockTransport(handler.handle_async),
+        )
+        run = client.bulk(
+            (lambda i=i: client.get(f"/api/v2/users/{i}") for i in range(10)),
+            ordered=False,
+        )
+        assert sorted([r.index async for r in run]) == list(range(10))
+        await client.aclose()
@@ -0,0 +1,288 @@
+import pickle
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, CacheConfig, Stream
+from getstream.cache import CacheBackend, MemoryCache, ResponseCache
+from getstream.exceptions import StreamApiException
+
+GET_APP = "getstream.api.common.get_app"
+ENABLED = CacheConfig(enabled=True)
+
+
+class Recorder:
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.status != 200:
+            return httpx.Response(
+                self.status,
+                json={
+                    "code": -1,
+                    "duration": "0ms",
+                    "message": "error",
+                    "more_info": "",
+                    "StatusCode": self.status,
+                    "details": [],
+                },
+            )
+        return httpx.Response(200, json={"duration": "1ms"})
+
+    def paths(self):
+        return [r.url.path for r in self.requests]
+
+
+def sync_client(handler, cache=ENABLED, **kwargs):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        cache=cache,
+        **kwargs,
+    )
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        CacheConfig(ttl=0)
+    with pytest.raises(ValueError):
+        CacheConfig(max_entries=0)
+    assert CacheConfig(endpoints=["get_app"]).endpoints == frozenset({"get_app"})
+
+
+def test_disabled_by_default():
+    handler = Recorder()
+    client = sync_client(handler, cache=None)
+    client.get_app()
+    client.get_app()
+    assert len(handler.requests) == 2
+    assert client.cache_stats() == {}
+
+
+def test_repeated_get_is_served_from_cache():
+    handler = Recorder()
+    client = sync_client(handler)
+    first = client.get_app()
+    second = client.get_app()
+    assert second is first
+    assert len(handler.requests) == 1
+    stats = client.cache_stats()[GET_APP]
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_sub_clients_share_the_cache():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.chat.list_channel_types()
+    client.chat.list_channel_types()
+    assert client.chat.response_cache is client.response_cache
+    assert len(handler.requests) == 1
+
+
+def test_path_params_are_part_of_the_key():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.chat.get_channel_type(name="messaging")
+    client.chat.get_channel_type(name="livestream")
+    client.chat.get_channel_type(name="messaging")
+    assert handler.paths() == [
+        "/api/v2/chat/channeltypes/messaging",
+        "/api/v2/chat/channeltypes/livestream",
+    ]
+
+
+def test_endpoints_outside_the_allow_list_are_not_cached():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.get_rate_limits()
+    client.get_rate_limits()
+    assert len(handler.requests) == 2
+
+    handler = Recorder()
+    client = sync_client(handler, cache=CacheConfig(enabled=True, endpoints={"x"}))
+    client.get_app()
+    client.get_app()
+    assert len(handler.requests) == 2
+
+
+def test_custom_allow_list_by_method_name():
+    handler = Recorder()
+    client = sync_client(
+        handler, cache=CacheConfig(enabled=True, endpoints={"get_rate_limits"})
+    )
+    client.get_rate_limits()
+    client.get_rate_limits()
+    assert len(handler.requests) == 1
+
+
+def test_mutation_through_the_client_invalidates():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.get_app()
+    client.update_app()
+    client.get_app()
+    assert [r.method for r in handler.requests] == ["GET", "PATCH", "GET"]
+
+
+def test_mutation_invalidates_related_endpoints_only():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.chat.list_channel_types()
+    client.chat.get_channel_type(name="messaging")
+    client.video.list_call_types()
+    client.chat.delete_channel_type(name="messaging")
+    client.chat.list_channel_types()
+    client.chat.get_channel_type(name="messaging")
+    client.video.list_call_types()
+    assert [r.method for r in handler.requests].count("GET") == 5
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda c: c.chat.create_channel_type(
+            automod="disabled",
+            automod_behavior="flag",
+            max_message_length=5000,
+            name="support",
+        ),
+        lambda c: c.chat.update_channel_type(
+            name="messaging",
+            automod="disabled",
+            automod_behavior="flag",
+            max_message_length=5000,
+        ),
+        lambda c: c.chat.delete_channel_type(name="messaging"),
+        lambda c: c.video.create_call_type(name="support"),
+        lambda c: c.video.update_call_type(name="default"),
+        lambda c: c.video.delete_call_type(name="default"),
+        lambda c: c.create_role(name="support"),
+        lambda c: c.delete_role(name="support"),
+    ],
+    ids=[
+        "create_channel_type",
+        "update_channel_type",
+        "delete_channel_type",
+        "create_call_type",
+        "update_call_type",
+        "delete_call_type",
+        "create_role",
+        "delete_role",
+    ],
+)
+def test_writes_embedded_in_get_app_invalidate_it(mutate):
+    # get_app returns the call types, channel configs and grants
+    handler = Recorder()
+    client = sync_client(handler)
+    client.get_app()
+    mutate(client)
+    client.get_app()
+    assert [r.method for r in handler.requests].count("GET") == 2
+
+
+def test_failed_responses_are_not_cached():
+    handler = Recorder(status=500)
+    client = sync_client(handler)
+    for _ in range(2):
+        with pytest.raises(StreamApiException):
+            client.get_app()
+    assert len(handler.requests) == 2
+
+
+def test_failed_mutation_still_invalidates():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.get_app()
+    handler.status = 500
+    with pytest.raises(StreamApiException):
+        client.update_app()
+    handler.status = 200
+    client.get_app()
+    assert [r.method for r in handler.requests] == ["GET", "PATCH", "GET"]
+
+
+def test_tokens_do_not_share_entries():
+    backend = MemoryCache()
+    config = CacheConfig(enabled=True, backend=backend)
+    handler = Recorder()
+    client = sync_client(handler, cache=config)
+    client.get_app()
+    Stream(
+        api_key="key",
+        token="user-token",
+        transport=httpx.MockTransport(handler),
+        cache=config,
+    ).get_app()
+    assert len(handler.requests) == 2
+    assert len(backend) == 2
+
+
+def test_memory_cache_ttl_and_lru(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("getstream.cache.time.monotonic", lambda: now[0])
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=10)  # evicts b, the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 10.0
+    assert cache.get("a") is None
+    cache.delete("c")
+    assert len(cache) == 0
+
+
+def test_custom_backend():
+    class PickleBackend(CacheBackend):
+        def __init__(self):
+            self.data = {}
+
+        def get(self, key):
+            raw = self.data.get(key)
+            return pickle.loads(raw) if raw is not None else None
+
+        def set(self, key, value, ttl):
+            self.data[key] = pickle.dumps(value)
+
+        def delete(self, key):
+            self.data.pop(key, None)
+
+    backend = PickleBackend()
+    handler = Recorder()
+    client = sync_client(handler, cache=CacheConfig(enabled=True, backend=backend))
+    client.get_app()
+    response = client.get_app()
+    assert response.data.duration == "1ms"
+    assert len(handler.requests) == 1
+    assert len(backend.data) == 1
+
+
+def test_keys_change_with_invalidation():
+    cache = ResponseCache(ENABLED)
+    client = sync_client(Recorder())
+    before = cache.key(client, GET_APP, "/api/v2/app", None, None)
+    cache.invalidate("getstream.api.common.update_app")
+    assert cache.key(client, GET_APP, "/api/v2/app", None, None) != before
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_the_cache():
+    handler = Recorder()
+    client = AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        cache=ENABLED,
+    )
+    first = await client.get_app()
+    assert await client.get_app() is first
+    await client.update_app()
+    await client.get_app()
+    assert [r.method for r in handler.requests] == ["GET", "PATCH", "GET"]
+    await client.aclose()
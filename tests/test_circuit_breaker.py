@@ -0,0 +1,231 @@
+import logging
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, CircuitBreakerConfig, RetryConfig, Stream
+from getstream.circuit_breaker import CircuitBreaker
+from getstream.exceptions import StreamApiException, StreamTransportException
+
+GET_APP = "getstream.api.common.get_app"
+OK = {"duration": "1ms"}
+
+# Opens after 2 failures out of at least 4 calls; never reopens by itself.
+CONFIG = CircuitBreakerConfig(
+    enabled=True, failure_rate=0.5, window_size=4, min_calls=4, open_duration=60
+)
+
+
+def api_error(status=503):
+    return httpx.Response(
+        status,
+        json={
+            "code": -1,
+            "duration": "0ms",
+            "message": "error",
+            "more_info": "",
+            "StatusCode": status,
+            "details": [],
+        },
+    )
+
+
+class Script:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        step = self.responses[min(self.calls, len(self.responses) - 1)]
+        self.calls += 1
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+def sync_client(handler, config=CONFIG, **kwargs):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        circuit_breaker=config,
+        **kwargs,
+    )
+
+
+def async_client(handler, config=CONFIG, **kwargs):
+    return AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        circuit_breaker=config,
+        **kwargs,
+    )
+
+
+def call(client):
+    try:
+        client.get_app()
+    except (StreamApiException, StreamTransportException) as exc:
+        return exc
+    return None
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        CircuitBreakerConfig(failure_rate=0)
+    with pytest.raises(ValueError):
+        CircuitBreakerConfig(slow_call_duration=0)
+    with pytest.raises(ValueError):
+        CircuitBreakerConfig(window_size=5, min_calls=6)
+    with pytest.raises(ValueError):
+        CircuitBreakerConfig(half_open_calls=0)
+
+
+def test_disabled_by_default():
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(Script([api_error()])),
+    )
+    assert client.breaker is None
+    assert client.chat.breaker is None
+
+
+def test_opens_on_error_rate_and_fails_fast():
+    ok = httpx.Response(200, json=OK)
+    handler = Script([ok, ok, api_error(), api_error()])
+    client = sync_client(handler)
+    for _ in range(4):
+        call(client)
+    assert client.breaker.state(GET_APP) == "open"
+
+    exc = call(client)
+    assert isinstance(exc, StreamTransportException)
+    assert exc.error_type == "circuit_open"
+    assert handler.calls == 4
+
+
+def test_client_errors_do_not_open_the_circuit():
+    client = sync_client(Script([api_error(404)]))
+    for _ in range(6):
+        call(client)
+    assert client.breaker.state(GET_APP) == "closed"
+
+
+def test_transport_errors_open_the_circuit():
+    handler = Script([httpx.ConnectError("refused")])
+    client = sync_client(handler)
+    for _ in range(4):
+        assert call(client).error_type == "connection_reset"
+    assert call(client).error_type == "circuit_open"
+    assert handler.calls == 4
+
+
+def test_slow_calls_count_as_failures(monkeypatch):
+    clock = iter(range(0, 1000, 2))
+    monkeypatch.setattr(
+        "getstream.circuit_breaker.time.perf_counter", lambda: next(clock)
+    )
+    config = CircuitBreakerConfig(
+        enabled=True, slow_call_duration=1.0, window_size=2, min_calls=2
+    )
+    client = sync_client(Script([httpx.Response(200, json=OK)]), config=config)
+    call(client)
+    call(client)
+    assert client.breaker.state(GET_APP) == "open"
+
+
+def test_half_open_probe_closes_or_reopens(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("getstream.circuit_breaker.time.monotonic", lambda: now[0])
+    handler = Script([api_error()] * 5 + [httpx.Response(200, json=OK)])
+    client = sync_client(handler)
+    for _ in range(4):
+        call(client)
+    assert client.breaker.state(GET_APP) == "open"
+
+    # probe fails: open again
+    now[0] = 61.0
+    assert isinstance(call(client), StreamApiException)
+    assert client.breaker.state(GET_APP) == "open"
+    assert call(client).error_type == "circuit_open"
+
+    # probe succeeds: closed
+    now[0] = 122.0
+    assert call(client) is None
+    assert client.breaker.state(GET_APP) == "closed"
+    assert handler.calls == 6
+
+
+def test_half_open_admits_limited_probes(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("getstream.circuit_breaker.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(CONFIG, logging.getLogger("test"))
+    for _ in range(4):
+        with pytest.raises(StreamTransportException):
+            with breaker.acquire(GET_APP):
+                raise StreamTransportException("timeout")
+    now[0] = 61.0
+    probe = breaker.acquire(GET_APP)
+    with pytest.raises(StreamTransportException) as info:
+        breaker.acquire(GET_APP)
+    assert info.value.error_type == "circuit_open"
+    with probe:
+        pass
+    assert breaker.state(GET_APP) == "closed"
+
+
+def test_open_circuit_is_not_retried(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda _s: None)
+    handler = Script([httpx.ConnectError("refused")])
+    client = sync_client(
+        handler, retry=RetryConfig(enabled=True, max_attempts=10, budget_ratio=None)
+    )
+    exc = call(client)
+    assert exc.error_type == "circuit_open"
+    # four failed attempts open the circuit, the fifth fails fast
+    assert handler.calls == 4
+
+
+def test_circuits_are_per_endpoint():
+    client = sync_client(Script([api_error()]))
+    for _ in range(4):
+        call(client)
+    assert client.breaker.state(GET_APP) == "open"
+    assert client.breaker.state("getstream.api.chat.get_channel_type") == "closed"
+
+
+def test_state_changes_are_logged(caplog):
+    caplog.set_level(logging.INFO, logger="getstream")
+    client = sync_client(Script([api_error()]))
+    for _ in range(4):
+        call(client)
+    records = [r for r in caplog.records if r.msg == "circuit_breaker.state_changed"]
+    assert len(records) == 1
+    record = records[0]
+    assert record.levelno == logging.WARNING
+    assert getattr(record, "stream.endpoint_name") == GET_APP
+    assert getattr(record, "circuit.state") == "open"
+    assert getattr(record, "circuit.previous_state") == "closed"
+    assert getattr(record, "circuit.failure_rate") == 1.0
+
+
+def test_sub_clients_share_the_breaker():
+    client = sync_client(Script([api_error()]))
+    assert client.video.breaker is client.breaker
+    assert client.clone_for_token("token").circuit_breaker is CONFIG
+
+
+@pytest.mark.asyncio
+async def test_async_opens_and_fails_fast():
+    handler = Script([api_error()])
+    client = async_client(handler)
+    for _ in range(4):
+        with pytest.raises(StreamApiException):
+            await client.get_app()
+    with pytest.raises(StreamTransportException) as info:
+        await client.get_app()
+    assert info.value.error_type == "circuit_open"
+    assert handler.calls == 4
+    await client.aclose()
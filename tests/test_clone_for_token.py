@@ -0,0 +1,198 @@
+import logging
+import time
+
+import httpx
+import pytest
+
+from getstream import (
+    AsyncStream,
+    CircuitBreakerConfig,
+    HedgeConfig,
+    RateLimitConfig,
+    RetryConfig,
+    Stream,
+)
+
+SECRET = "a-secret-long-enough-for-hs256-keys"
+
+
+class Recorder:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"duration": "1ms"})
+
+    @property
+    def tokens(self):
+        return [request.headers["Authorization"] for request in self.requests]
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def client(recorder):
+    client = Stream(
+        api_key="k", api_secret=SECRET, transport=httpx.MockTransport(recorder)
+    )
+    yield client
+    client.close()
+
+
+def test_clone_shares_the_pool(client):
+    clone = client.clone_for_token("user-token")
+    assert clone.client is client.client
+    assert clone.pool_monitor is client.pool_monitor
+    assert clone.token == "user-token"
+    assert client.token != "user-token"
+
+
+def test_requests_use_each_clients_token(client, recorder):
+    alice = client.clone_for_token("alice-token")
+    bob = client.clone_for_token("bob-token")
+    alice.get_app()
+    bob.get_app()
+    client.get_app()
+    alice.chat.query_channels(limit=1)
+    bob.video.get_call_type(name="default")
+    client.video.get_call_type(name="default")
+    assert recorder.tokens == [
+        "alice-token",
+        "bob-token",
+        client.token,
+        "alice-token",
+        "bob-token",
+        client.token,
+    ]
+
+
+def test_sub_clients_are_views_of_the_parents(client):
+    clone = client.clone_for_token("user-token")
+    assert clone.video.client is client.video.client
+    assert clone.video is not client.video
+    assert clone.video.token == "user-token"
+    assert clone.video.stream is clone
+    assert client.video.stream is client
+    assert clone.chat is clone.chat
+
+
+def test_clone_of_a_clone(client, recorder):
+    clone = client.clone_for_token("alice-token").clone_for_token("bob-token")
+    clone.video.get_call_type(name="default")
+    assert recorder.tokens == ["bob-token"]
+    assert clone.video.stream is clone
+
+
+def test_clone_cannot_mint_tokens(client):
+    clone = client.clone_for_token("user-token")
+    assert not clone.has_api_secret
+    with pytest.raises(ValueError):
+        clone.create_token("bob")
+
+
+def test_empty_token_raises(client):
+    with pytest.raises(ValueError):
+        client.clone_for_token("")
+
+
+def test_closing_the_clone_keeps_the_pool_open(client):
+    clone = client.clone_for_token("user-token")
+    clone.chat
+    clone.close()
+    assert not client.client.is_closed
+    client.get_app()
+
+
+def test_clone_does_not_log_initialized(client, caplog):
+    with caplog.at_level(logging.INFO, logger="getstream"):
+        client.clone_for_token("user-token")
+    assert "client.initialized" not in caplog.messages
+
+
+def test_clone_has_its_own_limits_and_failure_state():
+    client = Stream(
+        api_key="k",
+        api_secret=SECRET,
+        retry=RetryConfig(enabled=True, budget_ratio=0.1),
+        rate_limit=RateLimitConfig(enabled=True),
+        circuit_breaker=CircuitBreakerConfig(enabled=True),
+        hedge=HedgeConfig(enabled=True),
+    )
+    clone = client.clone_for_token("user-token")
+    for name in ("retry_budget", "rate_limiter", "breaker", "hedger"):
+        own = getattr(clone, name)
+        assert own is not None
+        assert own is not getattr(client, name)
+        assert getattr(clone.chat, name) is own
+        assert getattr(client.chat, name) is getattr(client, name)
+    assert clone.hedger._workers() is client.hedger._workers()
+    assert clone.codec_offload is client.codec_offload
+    client.close()
+
+
+def test_clones_have_separate_rate_limit_budgets():
+    # Stream reports a budget per user for user-token requests
+    remaining = {"alice-token": "0", "bob-token": "100"}
+    reset = str(int(time.time()) + 60)
+
+    def handler(request):
+        headers = {
+            "x-ratelimit-limit": "100",
+            "x-ratelimit-remaining": remaining[request.headers["Authorization"]],
+            "x-ratelimit-reset": reset,
+        }
+        return httpx.Response(200, json={"duration": "1ms"}, headers=headers)
+
+    client = Stream(
+        api_key="k",
+        api_secret=SECRET,
+        transport=httpx.MockTransport(handler),
+        rate_limit=RateLimitConfig(enabled=True, pace=False),
+    )
+    alice = client.clone_for_token("alice-token")
+    bob = client.clone_for_token("bob-token")
+    alice.get_app()
+    start = time.perf_counter()
+    bob.get_app()
+    bob.chat.query_channels(limit=1)
+    assert time.perf_counter() - start < 1
+    endpoint = "getstream.api.common.get_app"
+    assert alice.rate_limiter.reserve(endpoint) > 50
+    assert bob.rate_limiter.reserve(endpoint) == 0
+    assert client.rate_limiter.reserve(endpoint) == 0
+    client.close()
+
+
+def test_clones_do_not_share_cache_entries():
+    from getstream import CacheConfig
+
+    recorder = Recorder()
+    client = Stream(
+        api_key="k",
+        api_secret=SECRET,
+        transport=httpx.MockTransport(recorder),
+        cache=CacheConfig(enabled=True),
+    )
+    client.clone_for_token("alice-token").get_app()
+    client.clone_for_token("bob-token").get_app()
+    client.clone_for_token("alice-token").get_app()
+    assert recorder.tokens == ["alice-token", "bob-token"]
+
+
+@pytest.mark.asyncio
+async def test_async_clone(recorder):
+    client = AsyncStream(
+        api_key="k", api_secret=SECRET, transport=httpx.MockTransport(recorder)
+    )
+    async with client.clone_for_token("user-token") as clone:
+        assert clone.client is client.client
+        await clone.get_app()
+        await clone.video.get_call_type(name="default")
+    assert not client.client.is_closed
+    await client.get_app()
+    assert recorder.tokens == ["user-token", "user-token", client.token]
+    await client.aclose()
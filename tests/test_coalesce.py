@@ -0,0 +1,231 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, CacheConfig, CoalesceConfig, Stream
+from getstream.coalesce import SingleFlight
+from getstream.exceptions import StreamApiException
+
+GET_CALL = "getstream.api.video.get_call"
+ENABLED = CoalesceConfig(enabled=True)
+
+
+def error_response(status):
+    return httpx.Response(
+        status,
+        json={
+            "code": -1,
+            "duration": "0ms",
+            "message": "error",
+            "more_info": "",
+            "StatusCode": status,
+            "details": [],
+        },
+    )
+
+
+class Gate:
+    """Holds every request until ``release`` is set."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.release = threading.Event()
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.release.wait(5)
+        if self.status != 200:
+            return error_response(self.status)
+        return httpx.Response(200, json={"duration": "1ms"})
+
+
+class AsyncGate(Gate):
+    def __init__(self, status=200):
+        super().__init__(status)
+        self.event = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await self.event.wait()
+        if self.status != 200:
+            return error_response(self.status)
+        return httpx.Response(200, json={"duration": "1ms"})
+
+
+def sync_client(handler, coalesce=ENABLED, **kwargs):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        coalesce=coalesce,
+        **kwargs,
+    )
+
+
+def async_client(handler, coalesce=ENABLED, **kwargs):
+    return AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        coalesce=coalesce,
+        **kwargs,
+    )
+
+
+def run_concurrently(n, fn, gate):
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(fn) for _ in range(n)]
+        # let every thread reach the client before the response arrives
+        deadline = time.monotonic() + 2
+        while time.monotonic() < deadline and not gate.requests:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        gate.release.set()
+        return [f.result() for f in futures]
+
+
+def test_disabled_by_default():
+    gate = Gate()
+    client = sync_client(gate, coalesce=None)
+    run_concurrently(4, lambda: client.video.get_call(type="default", id="a"), gate)
+    assert len(gate.requests) == 4
+    assert client.coalesce_stats() == {}
+
+
+def test_concurrent_identical_gets_share_one_request():
+    gate = Gate()
+    client = sync_client(gate)
+    responses = run_concurrently(
+        8, lambda: client.video.get_call(type="default", id="a"), gate
+    )
+    assert len(gate.requests) == 1
+    assert all(r is responses[0] for r in responses)
+    stats = client.coalesce_stats()[GET_CALL]
+    assert (stats.requests, stats.coalesced) == (8, 7)
+    assert stats.coalesced_rate == 7 / 8
+
+
+def test_different_parameters_are_not_coalesced():
+    gate = Gate()
+    client = sync_client(gate)
+    ids = iter(["a", "b", "c"])
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            call_id = next(ids)
+        return client.video.get_call(type="default", id=call_id)
+
+    run_concurrently(3, call, gate)
+    assert len(gate.requests) == 3
+
+
+def test_sequential_gets_are_sent_each_time():
+    gate = Gate()
+    gate.release.set()
+    client = sync_client(gate)
+    client.video.get_call(type="default", id="a")
+    client.video.get_call(type="default", id="a")
+    assert len(gate.requests) == 2
+
+
+def test_error_is_shared():
+    gate = Gate(status=500)
+    client = sync_client(gate)
+
+    def call():
+        try:
+            client.video.get_call(type="default", id="a")
+        except StreamApiException as exc:
+            return exc
+
+    errors = run_concurrently(4, call, gate)
+    assert len(gate.requests) == 1
+    assert all(isinstance(e, StreamApiException) for e in errors)
+
+
+def test_endpoint_allow_list():
+    flights = SingleFlight(CoalesceConfig(enabled=True, endpoints={"get_call"}))
+    assert flights.applies("GET", GET_CALL)
+    assert not flights.applies("GET", "getstream.api.common.get_app")
+    assert not flights.applies("POST", GET_CALL)
+
+    gate = Gate()
+    client = sync_client(gate, coalesce=CoalesceConfig(enabled=True, endpoints={"x"}))
+    run_concurrently(3, lambda: client.video.get_call(type="default", id="a"), gate)
+    assert len(gate.requests) == 3
+
+
+def test_writes_are_never_coalesced():
+    gate = Gate()
+    client = sync_client(gate)
+    run_concurrently(3, lambda: client.update_app(), gate)
+    assert len(gate.requests) == 3
+
+
+def test_coalesced_response_fills_the_cache():
+    gate = Gate()
+    client = sync_client(gate, cache=CacheConfig(enabled=True))
+    run_concurrently(4, client.get_app, gate)
+    client.get_app()
+    assert len(gate.requests) == 1
+
+
+def test_sub_clients_share_flights():
+    client = sync_client(Gate())
+    assert client.video.single_flight is client.single_flight
+    assert client.chat.single_flight is client.single_flight
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_identical_gets_share_one_request():
+    gate = AsyncGate()
+    client = async_client(gate)
+    calls = [
+        asyncio.ensure_future(client.video.get_call(type="default", id="a"))
+        for _ in range(10)
+    ]
+    await asyncio.sleep(0.01)
+    gate.event.set()
+    responses = await asyncio.gather(*calls)
+    assert len(gate.requests) == 1
+    assert all(r is responses[0] for r in responses)
+    assert client.coalesce_stats()[GET_CALL].coalesced == 9
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_cancelling_one_waiter_keeps_the_request():
+    gate = AsyncGate()
+    client = async_client(gate)
+    first = asyncio.ensure_future(client.video.get_call(type="default", id="a"))
+    second = asyncio.ensure_future(client.video.get_call(type="default", id="a"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    gate.event.set()
+    response = await second
+    assert response.status_code() == 200
+    assert first.cancelled()
+    assert len(gate.requests) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_error_is_shared():
+    gate = AsyncGate(status=503)
+    client = async_client(gate)
+    calls = [
+        asyncio.ensure_future(client.video.get_call(type="default", id="a"))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    gate.event.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    assert all(isinstance(r, StreamApiException) for r in results)
+    assert len(gate.requests) == 1
+    await client.aclose()
@@ -0,0 +1,137 @@
+"""The compiled from_dict/to_dict in getstream.codec must match dataclasses_json."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import warnings
+from datetime import datetime, timezone
+
+import pytest
+from dataclasses_json import cfg
+from dataclasses_json.core import _asdict, _decode_dataclass
+
+from getstream import models
+from getstream.codec import DataClassJsonMixin, decoder_for
+from getstream.models import (
+    AIImageConfig,
+    ChannelResponse,
+    QueryChannelsResponse,
+    UserRequest,
+)
+from tests.fixtures import TS_NS, sample_payload
+
+MODELS = sorted(
+    name
+    for name in models.__all__
+    if dataclasses.is_dataclass(obj := getattr(models, name))
+    and obj.__module__ == "getstream.models._generated"
+)
+
+
+def _decode_both(cls, payload, infer_missing):
+    """(result, warnings) for the reflective and the compiled decoder."""
+    out = []
+    for decode in (
+        lambda: _decode_dataclass(cls, payload, infer_missing),
+        lambda: cls.from_dict(payload, infer_missing=infer_missing),
+    ):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                result = repr(decode())
+            except Exception as err:
+                result = (type(err), str(err))
+        out.append((result, [str(w.message) for w in caught]))
+    return out
+
+
+def test_models_use_compiled_mixin():
+    assert issubclass(ChannelResponse, DataClassJsonMixin)
+
+
+@pytest.mark.parametrize("name", MODELS)
+def test_generated_models_match_dataclasses_json(name):
+    cls = getattr(models, name)
+    payload = sample_payload(cls)
+    reflective, compiled = _decode_both(cls, payload, infer_missing=True)
+    assert compiled == reflective
+
+    obj = cls.from_dict(payload, infer_missing=True)
+    try:
+        expected = json.dumps(_asdict(obj))
+    except AttributeError:
+        # a few generated Dict[str, datetime] fields carry a scalar encoder
+        with pytest.raises(AttributeError):
+            obj.to_dict()
+    else:
+        assert json.dumps(obj.to_dict()) == expected
+        assert obj.to_json() == json.dumps(_asdict(obj))
+
+
+class TestDecode:
+    def test_renames_and_datetimes(self):
+        cfg_ = AIImageConfig.from_dict({"async": True, "enabled": False})
+        assert cfg_._async is True
+        channel = ChannelResponse.from_dict(sample_payload(ChannelResponse))
+        assert channel.created_at == datetime.fromtimestamp(
+            TS_NS / 1e9, tz=timezone.utc
+        )
+
+    def test_python_field_name_accepted_like_dataclasses_json(self):
+        for payload in ({"_async": True}, {"async": False, "_async": True}):
+            reflective, compiled = _decode_both(AIImageConfig, payload, False)
+            assert compiled == reflective
+
+    def test_missing_required_field(self):
+        payload = {"duration": "1ms"}
+        reflective, compiled = _decode_both(QueryChannelsResponse, payload, False)
+        assert compiled == reflective
+        assert compiled[0][0] is KeyError
+        reflective, compiled = _decode_both(QueryChannelsResponse, payload, True)
+        assert compiled == reflective
+        assert compiled[1]  # "Missing value of non-optional type ..." warning
+
+    def test_null_and_mistyped_values(self):
+        payload = {
+            "duration": 12,
+            "channels": [None, {"channel": None, "members": [None]}],
+        }
+        for infer_missing in (True, False):
+            reflective, compiled = _decode_both(
+                QueryChannelsResponse, payload, infer_missing
+            )
+            assert compiled == reflective
+
+    def test_instance_passes_through(self):
+        obj = UserRequest(id="u1")
+        assert UserRequest.from_dict(obj) is obj
+
+    def test_decoder_is_compiled_once(self):
+        assert decoder_for(ChannelResponse) is decoder_for(ChannelResponse)
+
+
+class TestEncode:
+    def test_matches_dataclasses_json(self):
+        obj = UserRequest(
+            id="u1", custom={"nested": [{"a": 1}, None]}, teams=["t1"], name=None
+        )
+        assert obj.to_dict() == _asdict(obj)
+        assert list(obj.to_dict()) == list(_asdict(obj))
+        assert obj.to_dict(encode_json=True) == _asdict(obj, encode_json=True)
+
+    def test_renamed_key_and_encoder(self):
+        assert AIImageConfig(_async=True).to_dict()["async"] is True
+        channel = ChannelResponse.from_dict(sample_payload(ChannelResponse))
+        assert channel.to_dict()["created_at"] == channel.created_at.isoformat()
+
+
+def test_global_config_falls_back_to_dataclasses_json():
+    cfg.global_config.encoders[str] = str.upper
+    try:
+        obj = UserRequest(id="u1", custom={"k": "v"})
+        assert obj.to_dict() == _asdict(obj)
+        assert obj.to_dict()["id"] == "U1"
+    finally:
+        del cfg.global_config.encoders[str]
+    assert UserRequest(id="u1").to_dict()["id"] == "u1"
@@ -0,0 +1,172 @@
+import gzip
+import json
+import logging
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, CompressionConfig, Stream
+from getstream.models import UserRequest
+
+ENABLED = CompressionConfig(enabled=True)
+
+
+class Recorder:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json={"duration": "1ms"})
+
+    def body(self, i=-1):
+        request = self.requests[i]
+        content = request.content
+        if request.headers.get("content-encoding") == "gzip":
+            content = gzip.decompress(content)
+        return json.loads(content)
+
+
+def users(n):
+    return [
+        UserRequest(id=f"user-{i}", name=f"User {i}", custom={"bio": "x" * 100})
+        for i in range(n)
+    ]
+
+
+def sync_client(handler, compression=ENABLED, **kwargs):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        compression=compression,
+        **kwargs,
+    )
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        CompressionConfig(min_bytes=-1)
+    with pytest.raises(ValueError):
+        CompressionConfig(level=0)
+    with pytest.raises(ValueError):
+        CompressionConfig(level=10)
+    assert CompressionConfig(endpoints=["update_users"]).endpoints == frozenset(
+        {"update_users"}
+    )
+
+
+def test_disabled_by_default():
+    handler = Recorder()
+    client = sync_client(handler, compression=None)
+    client.upsert_users(*users(50))
+    assert "content-encoding" not in handler.requests[0].headers
+    assert len(handler.body()["users"]) == 50
+
+
+def test_large_body_is_gzipped():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.upsert_users(*users(50))
+    request = handler.requests[0]
+    assert request.headers["content-encoding"] == "gzip"
+    assert request.headers["content-type"] == "application/json"
+    assert int(request.headers["content-length"]) == len(request.content)
+    assert set(handler.body()["users"]) == {f"user-{i}" for i in range(50)}
+    raw = len(gzip.decompress(request.content))
+    assert len(request.content) < raw / 5
+
+
+def test_small_body_is_sent_plain():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.upsert_users(UserRequest(id="ann"))
+    assert "content-encoding" not in handler.requests[0].headers
+    assert handler.body()["users"]["ann"]["id"] == "ann"
+
+
+def test_min_bytes_threshold():
+    handler = Recorder()
+    client = sync_client(
+        handler, compression=CompressionConfig(enabled=True, min_bytes=0)
+    )
+    client.upsert_users(UserRequest(id="ann"))
+    client.get_app()
+    assert handler.requests[0].headers["content-encoding"] == "gzip"
+    # requests without a JSON body are untouched
+    assert "content-encoding" not in handler.requests[1].headers
+
+
+def test_endpoint_allow_list():
+    handler = Recorder()
+    client = sync_client(
+        handler,
+        compression=CompressionConfig(enabled=True, min_bytes=0, endpoints={"x"}),
+    )
+    client.upsert_users(*users(50))
+    assert "content-encoding" not in handler.requests[0].headers
+
+    handler = Recorder()
+    client = sync_client(
+        handler,
+        compression=CompressionConfig(
+            enabled=True, min_bytes=0, endpoints={"update_users"}
+        ),
+    )
+    client.upsert_users(UserRequest(id="ann"))
+    client.update_app()
+    assert handler.requests[0].headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in handler.requests[1].headers
+
+
+def test_sub_clients_compress():
+    handler = Recorder()
+    client = sync_client(
+        handler, compression=CompressionConfig(enabled=True, min_bytes=0)
+    )
+    assert client.chat.compression is client.compression
+    client.chat.update_channel_type(
+        name="messaging",
+        automod="disabled",
+        automod_behavior="flag",
+        max_message_length=5000,
+    )
+    assert handler.requests[0].headers["content-encoding"] == "gzip"
+
+
+def test_user_http_client_is_compressed():
+    handler = Recorder()
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        compression=ENABLED,
+    )
+    client.upsert_users(*users(50))
+    assert handler.requests[0].headers["content-encoding"] == "gzip"
+
+
+@pytest.mark.parametrize("compression", [None, ENABLED])
+def test_initialized_event_reports_gzip(caplog, compression):
+    with caplog.at_level(logging.INFO, logger="getstream"):
+        sync_client(Recorder(), compression=compression)
+    (record,) = [r for r in caplog.records if r.getMessage() == "client.initialized"]
+    assert getattr(record, "stream.client.gzip_enabled") is (compression is not None)
+
+
+@pytest.mark.asyncio
+async def test_async_compresses_small_and_large_bodies():
+    handler = Recorder()
+    client = AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        compression=ENABLED,
+    )
+    # ~10 KiB encodes and compresses inline, ~300 KiB on the codec pool
+    await client.upsert_users(*users(50))
+    await client.upsert_users(*users(1500))
+    for i, n in enumerate([50, 1500]):
+        assert handler.requests[i].headers["content-encoding"] == "gzip"
+        assert len(handler.body(i)["users"]) == n
+    await client.aclose()
@@ -3,11 +3,21 @@ from datetime import datetime, timezone
 import json
 from typing import Dict, List, Optional
 import os
+from types import SimpleNamespace
 
+import httpx
 import pytest
 
 from getstream.models import GetCallResponse, OwnCapability, OwnCapabilityType
-from getstream.base import _strip_none
+from getstream import Stream, base
+from getstream import exceptions
+from getstream.exceptions import StreamApiException
+from getstream.base import (
+    _decode_json_body,
+    _encode_json_body,
+    _json_body_exceeds,
+    _strip_none,
+)
 from getstream.utils import (
     datetime_from_unix_ns,
     encode_datetime,
@@ -363,6 +373,123 @@ def test_strip_none_passthrough_scalars():
     assert _strip_none(True) is True
 
 
+ENCODE_CASES = [
+    {"a": 1, "b": None, "nested": {"c": None, "d": [1, None, {"e": None}]}},
+    {"text": 'héllo \u2028 "q" \n', "n": -1.5, "big": 10**20, "ok": False},
+    {1: "int key", 2.5: "float key", False: "bool key", None: "none key"},
+    {"tuple": (1, 2), "capability": OwnCapability.SEND_AUDIO, "empty": {}},
+    [None, {"a": None}],
+]
+
+
+@pytest.mark.parametrize("orjson", [base.orjson, None], ids=["orjson", "stdlib"])
+@pytest.mark.parametrize("payload", ENCODE_CASES)
+def test_encode_json_body_matches_stripped_dumps(monkeypatch, orjson, payload):
+    if orjson is None:
+        monkeypatch.setattr(base, "orjson", None)
+    elif base.orjson is None:
+        pytest.skip("orjson is not installed")
+    expected = json.dumps(
+        _strip_none(payload), ensure_ascii=False, separators=(",", ":")
+    )
+    assert _encode_json_body(payload) == expected.encode("utf-8")
+
+
+@pytest.mark.parametrize("orjson", [base.orjson, None], ids=["orjson", "stdlib"])
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"score": float("nan")},
+        {"scores": [1.0, float("inf")]},
+        {"nested": {"a": [None, float("-inf")]}},
+        {float("nan"): "key"},
+    ],
+)
+def test_encode_json_body_rejects_nan_and_infinity(monkeypatch, orjson, payload):
+    if orjson is None:
+        monkeypatch.setattr(base, "orjson", None)
+    elif base.orjson is None:
+        pytest.skip("orjson is not installed")
+    with pytest.raises(ValueError):
+        _encode_json_body(payload)
+
+
+def test_json_body_exceeds():
+    body = {"users": [{"id": "x" * 100, "name": None} for _ in range(10)]}
+    assert _json_body_exceeds(body, 500)
+    assert not _json_body_exceeds(body, 5000)
+    assert not _json_body_exceeds({}, 2)
+
+
+@pytest.mark.parametrize("orjson", [base.orjson, None], ids=["orjson", "stdlib"])
+def test_decode_json_body(monkeypatch, orjson):
+    if orjson is None:
+        monkeypatch.setattr(base, "orjson", None)
+    elif base.orjson is None:
+        pytest.skip("orjson is not installed")
+    assert _decode_json_body(b"") == ({}, None)
+    assert _decode_json_body(b'{"duration":"1ms","n":[1,2.5]}') == (
+        {"duration": "1ms", "n": [1, 2.5]},
+        None,
+    )
+    # accepted by json.loads, rejected by orjson
+    assert _decode_json_body(b'{"big":100000000000000000000}')[0] == {"big": 10**20}
+    payload, error = _decode_json_body(b"<html>bad gateway</html>")
+    assert payload is None and isinstance(error, ValueError)
+
+
+class TestSingleDecode:
+    """Each response body is decoded once, whether it succeeds, fails or
+    is logged."""
+
+    @pytest.fixture
+    def decodes(self, monkeypatch):
+        calls = []
+
+        def counting(content):
+            calls.append(content)
+            return _decode_json_body(content)
+
+        monkeypatch.setattr(base, "_decode_json_body", counting)
+        monkeypatch.setattr(
+            exceptions,
+            "json",
+            SimpleNamespace(loads=lambda *a: pytest.fail("decoded again")),
+        )
+        return calls
+
+    @staticmethod
+    def client(status, body):
+        return Stream(
+            api_key="key",
+            api_secret="secret",
+            log_bodies=True,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(status, json=body)
+            ),
+        )
+
+    def test_success(self, decodes):
+        response = self.client(200, {"duration": "1ms", "x": 1}).get("/api/v2/app")
+        assert response.data == {"duration": "1ms", "x": 1}
+        assert len(decodes) == 1
+
+    def test_error(self, decodes):
+        body = {
+            "code": 4,
+            "duration": "0ms",
+            "message": "bad request",
+            "more_info": "",
+            "StatusCode": 400,
+            "details": [],
+        }
+        with pytest.raises(StreamApiException) as exc_info:
+            self.client(400, body).get("/api/v2/app")
+        assert exc_info.value.code == 4
+        assert exc_info.value.message == "bad request"
+        assert len(decodes) == 1
+
+
 @pytest.mark.skip("fixture is not longer valid, skip for now")
 def test_get_call_response_from_dict():
     # Read the fixture file
@@ -0,0 +1,338 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, HedgeConfig, RateLimitConfig, Stream
+from getstream.base import HTTP2_MAX_CONCURRENT_STREAMS
+from getstream.exceptions import StreamTransportException
+from getstream.hedge import UNKNOWN_POOL_CAPACITY, Hedger
+
+OK = {"duration": "1ms"}
+GET_APP = "getstream.api.common.get_app"
+
+# Hedges the first slow request: a full token per request, short delay.
+EAGER = HedgeConfig(enabled=True, initial_delay=0.02, max_hedge_ratio=1.0)
+
+
+class SlowFirst:
+    """Answers the first request after ``stall`` seconds and the rest at
+    once."""
+
+    def __init__(self, stall=0.5):
+        self.stall = stall
+        self.calls = 0
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def _first(self, request):
+        with self._lock:
+            self.requests.append(request)
+            self.calls += 1
+            return self.calls == 1
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self._first(request):
+            time.sleep(self.stall)
+        return httpx.Response(200, json=OK)
+
+
+class AsyncSlowFirst(SlowFirst):
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self._first(request):
+            await asyncio.sleep(self.stall)
+        return httpx.Response(200, json=OK)
+
+
+def sync_client(handler, hedge=EAGER):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        hedge=hedge,
+    )
+
+
+def async_client(handler, hedge=EAGER):
+    return AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        hedge=hedge,
+    )
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        HedgeConfig(percentile=1.0)
+    with pytest.raises(ValueError):
+        HedgeConfig(initial_delay=-1)
+    with pytest.raises(ValueError):
+        HedgeConfig(min_samples=0)
+    with pytest.raises(ValueError):
+        HedgeConfig(max_hedge_ratio=1.5)
+    assert HedgeConfig(endpoints=["get_call"]).endpoints == frozenset({"get_call"})
+
+
+def test_disabled_by_default():
+    handler = SlowFirst(stall=0.05)
+    client = sync_client(handler, hedge=None)
+    client.get_app()
+    assert handler.calls == 1
+    assert client.hedger is None
+    assert client.hedge_stats() == {}
+
+
+def test_sync_slow_get_is_hedged_and_hedge_wins():
+    handler = SlowFirst()
+    client = sync_client(handler)
+    start = time.perf_counter()
+    response = client.get_app()
+    elapsed = time.perf_counter() - start
+
+    assert response.status_code() == 200
+    assert handler.calls == 2
+    assert elapsed < handler.stall
+    stats = client.hedge_stats()[GET_APP]
+    assert (stats.requests, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+    assert stats.hedge_rate == 1.0
+    assert stats.win_rate == 1.0
+    client.close()
+
+
+def test_hedge_repeats_client_request_id():
+    handler = SlowFirst()
+    client = sync_client(handler)
+    client.get_app()
+    ids = {r.headers["x-client-request-id"] for r in handler.requests}
+    assert len(ids) == 1
+
+
+def test_fast_get_is_not_hedged():
+    handler = SlowFirst(stall=0)
+    client = sync_client(handler)
+    client.get_app()
+    client.get_app()
+    assert handler.calls == 2
+    assert client.hedge_stats()[GET_APP].hedged == 0
+
+
+def test_post_is_never_hedged():
+    handler = SlowFirst(stall=0.1)
+    client = sync_client(handler)
+    client.update_app()
+    assert handler.calls == 1
+    assert client.hedge_stats() == {}
+
+
+def test_endpoint_allow_list():
+    hedger = Hedger(HedgeConfig(enabled=True, endpoints={"get_call"}))
+    assert hedger.applies("GET", "getstream.api.video.get_call")
+    assert hedger.applies("get", "get_call")
+    assert not hedger.applies("GET", "getstream.api.common.get_app")
+    assert not hedger.applies("POST", "getstream.api.video.get_call")
+
+    handler = SlowFirst(stall=0.1)
+    client = sync_client(
+        handler,
+        hedge=HedgeConfig(
+            enabled=True,
+            endpoints={"get_call"},
+            initial_delay=0.01,
+            max_hedge_ratio=1.0,
+        ),
+    )
+    client.get_app()
+    assert handler.calls == 1
+
+
+def test_hedge_budget_caps_hedges():
+    # 0.5 of a hedge per request: the first slow request has no token yet,
+    # the second has one.
+    hedger = Hedger(HedgeConfig(enabled=True, initial_delay=0.01, max_hedge_ratio=0.5))
+
+    def slow():
+        time.sleep(0.05)
+        return "done"
+
+    assert hedger.run_sync(GET_APP, slow) == "done"
+    assert hedger.run_sync(GET_APP, slow) == "done"
+    stats = hedger.stats()[GET_APP]
+    assert (stats.requests, stats.hedged) == (2, 1)
+    assert stats.hedge_rate == 0.5
+    hedger.shutdown()
+
+
+def test_delay_follows_percentile_after_min_samples():
+    hedger = Hedger(
+        HedgeConfig(
+            enabled=True,
+            initial_delay=0.5,
+            min_delay=0.001,
+            min_samples=10,
+            percentile=0.9,
+            max_hedge_ratio=0.0,
+        )
+    )
+    for _ in range(9):
+        hedger.run_sync(GET_APP, lambda: None)
+    assert hedger.stats()[GET_APP].delay == 0.5
+
+    hedger.run_sync(GET_APP, lambda: time.sleep(0.02))
+    delay = hedger.stats()[GET_APP].delay
+    assert 0.001 <= delay < 0.5
+    hedger.shutdown()
+
+
+def test_transport_error_on_primary_waits_for_hedge():
+    hedger = Hedger(EAGER)
+    calls = []
+
+    def attempt():
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.05)
+            raise StreamTransportException("connection_reset")
+        time.sleep(0.1)
+        return "hedge"
+
+    assert hedger.run_sync(GET_APP, attempt) == "hedge"
+    assert hedger.stats()[GET_APP].hedge_wins == 1
+    hedger.shutdown()
+
+
+def test_sync_hedging_does_not_cap_concurrency():
+    # no hedge fires; every GET must still be in flight at once
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    def handler(request):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.3)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200, json=OK)
+
+    client = sync_client(handler, hedge=HedgeConfig(enabled=True, initial_delay=5))
+    threads = [threading.Thread(target=client.get_app) for _ in range(64)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 64
+    assert client.hedge_stats()[GET_APP].hedged == 0
+    client.close()
+
+
+def test_sync_workers_follow_pool_capacity():
+    client = Stream(
+        api_key="key", api_secret="secret", max_conns_per_host=40, hedge=EAGER
+    )
+    assert client.hedger.max_workers == 80
+    client.close()
+    # HTTP/2 multiplexes one connection, whatever max_conns_per_host is
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        max_conns_per_host=40,
+        http2=True,
+        hedge=EAGER,
+    )
+    assert client.hedger.max_workers == 2 * HTTP2_MAX_CONCURRENT_STREAMS
+    client.close()
+    # a caller's transport or http_client has limits of its own
+    assert sync_client(SlowFirst()).hedger.max_workers == 2 * UNKNOWN_POOL_CAPACITY
+
+
+def test_duplicate_needs_admission():
+    hedger = Hedger(EAGER)
+
+    def slow():
+        time.sleep(0.05)
+        return "done"
+
+    assert hedger.run_sync(GET_APP, slow, admit=lambda: False) == "done"
+    assert hedger.stats()[GET_APP].hedged == 0
+    assert hedger.run_sync(GET_APP, slow, admit=lambda: True) == "done"
+    assert hedger.stats()[GET_APP].hedged == 1
+    hedger.shutdown()
+
+
+def test_duplicate_reserves_a_rate_limit_slot():
+    # the budget left after the first response covers the slow primary but
+    # not a duplicate, so it is not hedged
+    def handler(request):
+        headers = {
+            "x-ratelimit-limit": "100",
+            "x-ratelimit-remaining": "1",
+            "x-ratelimit-reset": str(int(time.time()) + 60),
+        }
+        if handler.calls == 1:
+            time.sleep(0.2)
+        handler.calls += 1
+        return httpx.Response(200, json=OK, headers=headers)
+
+    handler.calls = 0
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        hedge=EAGER,
+        rate_limit=RateLimitConfig(enabled=True, pace=False),
+    )
+    client.get_app()
+    client.get_app()
+    assert handler.calls == 2
+    assert client.hedge_stats()[GET_APP].hedged == 0
+    client.close()
+
+
+def test_sub_clients_share_the_hedger():
+    client = sync_client(SlowFirst())
+    assert client.video.hedger is client.hedger
+    assert client.chat.hedger is client.hedger
+
+
+def test_clone_for_token_keeps_hedge_config():
+    client = sync_client(SlowFirst())
+    clone = client.clone_for_token("user-token")
+    assert clone.hedge is EAGER
+    assert clone.hedger is not None
+
+
+@pytest.mark.asyncio
+async def test_async_slow_get_is_hedged_and_loser_cancelled():
+    handler = AsyncSlowFirst()
+    client = async_client(handler)
+    start = time.perf_counter()
+    response = await client.get_app()
+    elapsed = time.perf_counter() - start
+
+    assert response.status_code() == 200
+    assert handler.calls == 2
+    assert elapsed < handler.stall
+    stats = client.hedge_stats()[GET_APP]
+    assert (stats.hedged, stats.hedge_wins) == (1, 1)
+    await asyncio.sleep(0)  # let the cancelled primary unwind
+    pending = [
+        t
+        for t in asyncio.all_tasks()
+        if t is not asyncio.current_task() and not t.done()
+    ]
+    assert pending == []
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_fast_get_is_not_hedged():
+    handler = AsyncSlowFirst(stall=0)
+    client = async_client(handler)
+    await client.get_app()
+    assert handler.calls == 1
+    assert client.hedge_stats()[GET_APP].hedged == 0
+    await client.aclose()
@@ -0,0 +1,232 @@
+"""Tests for the opt-in HTTP/2 transport mode (``http2=True``)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import ssl
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, Stream
+from getstream.base import HTTP2_MAX_CONCURRENT_STREAMS
+
+pytest.importorskip("h2")
+trustme = pytest.importorskip("trustme")
+
+import h2.config  # noqa: E402
+import h2.connection  # noqa: E402
+import h2.events  # noqa: E402
+import h2.exceptions  # noqa: E402
+
+
+class _H2StandIn:
+    """Minimal TLS + ALPN ``h2`` server. Counts accepted TCP connections and
+    the peak number of streams open at once, and answers every request with a
+    small JSON body after ``delay`` seconds so concurrent requests overlap."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, delay: float = 0.05):
+        self.ssl_context = ssl_context
+        self.delay = delay
+        self.connections = 0
+        self.requests = 0
+        self.open_streams = 0
+        self.peak_open_streams = 0
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(
+            self._handle, "127.0.0.1", 0, ssl=self.ssl_context
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        pending = set()
+        try:
+            while True:
+                data = await reader.read(65535)
+                if not data:
+                    break
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        self.requests += 1
+                        self.open_streams += 1
+                        self.peak_open_streams = max(
+                            self.peak_open_streams, self.open_streams
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        task = asyncio.create_task(
+                            self._respond(conn, writer, event.stream_id)
+                        )
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                writer.write(conn.data_to_send())
+                await writer.drain()
+        except (ConnectionError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
+            writer.close()
+
+    async def _respond(self, conn, writer, stream_id):
+        await asyncio.sleep(self.delay)
+        body = json.dumps({"duration": "1.00ms"}).encode()
+        conn.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(body))),
+            ],
+        )
+        conn.send_data(stream_id, body, end_stream=True)
+        self.open_streams -= 1
+        writer.write(conn.data_to_send())
+        await writer.drain()
+
+
+@pytest.fixture
+def tls_ca(monkeypatch, tmp_path):
+    """A throwaway CA trusted by httpx via SSL_CERT_FILE for the test only."""
+    ca = trustme.CA()
+    ca_path = tmp_path / "ca.pem"
+    ca.cert_pem.write_to_path(str(ca_path))
+    monkeypatch.setenv("SSL_CERT_FILE", str(ca_path))
+    return ca
+
+
+def _server_context(ca) -> ssl.SSLContext:
+    ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    ca.issue_cert("127.0.0.1").configure_cert(ctx)
+    ctx.set_alpn_protocols(["h2"])
+    return ctx
+
+
+# ── client construction ──────────────────────────────────────────────
+
+
+class TestHttp2Construction:
+    def test_default_is_http1_only(self):
+        client = Stream(api_key="k", api_secret="s", base_url="http://test")
+        assert client.http2 is False
+        assert client.client._transport._pool._http2 is False
+        client.close()
+
+    def test_sync_opt_in_builds_http2_pool(self):
+        client = Stream(api_key="k", api_secret="s", base_url="http://test", http2=True)
+        assert client.http2 is True
+        assert client.client._transport._pool._http2 is True
+        # sub-clients share the top-level pool, so they multiplex too
+        assert client.chat.client is client.client
+        client.close()
+
+    async def test_async_opt_in_builds_http2_pool(self):
+        client = AsyncStream(
+            api_key="k", api_secret="s", base_url="http://test", http2=True
+        )
+        assert client.client._transport._pool._http2 is True
+        assert client.video.client is client.client
+        await client.aclose()
+
+    def test_env_fallback(self, monkeypatch):
+        monkeypatch.setenv("STREAM_HTTP2", "true")
+        client = Stream(api_key="k", api_secret="s", base_url="http://test")
+        assert client.http2 is True
+        client.close()
+
+    def test_forwarded_on_clone_and_as_async(self):
+        client = Stream(api_key="k", api_secret="s", base_url="http://test", http2=True)
+        assert client.clone_for_token("user-token").http2 is True
+        assert client.as_async().http2 is True
+
+    def test_missing_h2_raises_install_hint(self, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "h2":
+                raise ImportError("No module named 'h2'")
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        with pytest.raises(ImportError, match=r"getstream\[http2\]"):
+            Stream(api_key="k", api_secret="s", base_url="http://test", http2=True)
+
+
+class TestHttp2InfoLog:
+    def _init_record(self, caplog, **kwargs):
+        with caplog.at_level(logging.INFO, logger="getstream"):
+            Stream(api_key="k", api_secret="s", base_url="http://test", **kwargs)
+        infos = [r for r in caplog.records if r.getMessage() == "client.initialized"]
+        assert len(infos) == 1
+        return infos[0]
+
+    def test_http2_reported_when_enabled(self, caplog):
+        r = self._init_record(caplog, http2=True)
+        assert getattr(r, "stream.client.http2") is True
+        assert (
+            getattr(r, "stream.client.max_concurrent_streams_per_conn")
+            == HTTP2_MAX_CONCURRENT_STREAMS
+        )
+        # one multiplexed connection, not max_conns_per_host of them
+        assert (
+            getattr(r, "stream.client.max_concurrent_requests")
+            == HTTP2_MAX_CONCURRENT_STREAMS
+        )
+
+    def test_http1_reported_by_default(self, caplog):
+        r = self._init_record(caplog)
+        assert getattr(r, "stream.client.http2") is False
+        assert getattr(r, "stream.client.max_concurrent_streams_per_conn") == 1
+        assert getattr(r, "stream.client.max_concurrent_requests") == 5
+
+    def test_not_reported_when_transport_overrides(self, caplog):
+        r = self._init_record(
+            caplog,
+            http2=True,
+            transport=httpx.MockTransport(lambda req: httpx.Response(200, json={})),
+        )
+        assert getattr(r, "stream.client.http2") is False
+        assert getattr(r, "stream.client.max_concurrent_requests") is None
+
+
+# ── multiplexing against a local h2 stand-in ─────────────────────────
+
+
+async def test_concurrent_requests_share_one_connection(tls_ca):
+    server = _H2StandIn(_server_context(tls_ca))
+    await server.start()
+    client = AsyncStream(
+        api_key="k",
+        api_secret="s",
+        base_url=f"https://127.0.0.1:{server.port}",
+        http2=True,
+        max_conns_per_host=5,
+    )
+    try:
+        n = 20
+        responses = await asyncio.gather(*(client.get("/api/v2/app") for _ in range(n)))
+    finally:
+        await client.aclose()
+        await server.stop()
+
+    assert all(r.status_code() == 200 for r in responses)
+    assert server.requests == n
+    assert server.connections == 1
+    # the requests were genuinely in flight together, not serialized
+    assert server.peak_open_streams > 1
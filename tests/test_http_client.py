@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 
 import httpx
 import pytest
@@ -291,6 +292,93 @@ class TestAsyncTransport:
         await client.aclose()
         assert inner.is_closed
 
+    @pytest.mark.parametrize("size", [10, 100_000])
+    async def test_json_body_sent_compact_without_nones(self, size):
+        transport, captured = _capture_transport()
+        client = AsyncStream(
+            api_key="k", api_secret="s", base_url="http://test", transport=transport
+        )
+        body = {"users": [{"id": "u1", "name": "é" * size, "role": None}]}
+        await client.post("/api/v2/users", json=body)
+        request = captured[0]
+        assert request.headers["content-type"] == "application/json"
+        assert request.content == (
+            '{"users":[{"id":"u1","name":"' + "é" * size + '"}]}'
+        ).encode("utf-8")
+        # the caller's body is not modified
+        assert body["users"][0]["role"] is None
+        await client.aclose()
+
+
+class TestAsyncResponseParsing:
+    @staticmethod
+    def _client(**kwargs):
+        def handler(request):
+            return httpx.Response(200, json={"padding": "x" * 100}, request=request)
+
+        return AsyncStream(
+            api_key="k",
+            api_secret="s",
+            base_url="http://test",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+
+    @staticmethod
+    def _record_parse_threads(client, monkeypatch):
+        threads = []
+        parse = client._parse_response
+
+        def recording(response, data_type, *args):
+            threads.append(threading.current_thread().name)
+            return parse(response, data_type, *args)
+
+        monkeypatch.setattr(client, "_parse_response", recording)
+        return threads
+
+    async def test_small_responses_parse_inline(self, monkeypatch):
+        client = self._client()
+        threads = self._record_parse_threads(client, monkeypatch)
+        response = await client.get("/api/v2/app")
+        assert response.data["padding"] == "x" * 100
+        assert threads == [threading.current_thread().name]
+        assert client.codec_offload._executor is None
+        await client.aclose()
+
+    async def test_large_responses_use_the_dedicated_pool(self, monkeypatch):
+        client = self._client(inline_parse_max_bytes=50, parse_max_workers=2)
+        threads = self._record_parse_threads(client, monkeypatch)
+        await client.get("/api/v2/app")
+        assert threads[0].startswith("getstream-parse")
+        assert client.codec_offload._executor._max_workers == 2
+        await client.aclose()
+        assert client.codec_offload._executor is None
+
+    async def test_sub_clients_share_the_policy(self):
+        client = self._client(inline_parse_max_bytes=10)
+        assert client.chat.codec_offload is client.codec_offload
+        assert client.video.codec_offload is client.codec_offload
+        clone = client.clone_for_token("t")
+        assert clone.inline_parse_max_bytes == 10
+        assert clone.codec_offload is client.codec_offload
+        await clone.aclose()
+        await client.aclose()
+
+    def test_settings_forwarded_by_as_async(self):
+        client = Stream(
+            api_key="k", api_secret="s", inline_parse_max_bytes=0, parse_max_workers=8
+        )
+        async_client = client.as_async()
+        assert async_client.codec_offload.inline_max_bytes == 0
+        assert async_client.codec_offload.max_workers == 8
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"inline_parse_max_bytes": -1}, {"parse_max_workers": 0}]
+    )
+    def test_validation(self, kwargs):
+        with pytest.raises(ValueError):
+            AsyncStream(api_key="k", api_secret="s", **kwargs)
+
 
 # ── http_client (escape hatch) ───────────────────────────────────────
 
@@ -622,8 +710,9 @@ class TestResolvePoolKnobsExplicitZero:
 
 
 class TestPoolConfigForwardedOnClone:
-    """clone_for_token and as_async build fresh top-level clients; they must
-    carry the source client's pool config, not silently revert to defaults.
+    """clone_for_token shares the source client's pool and as_async builds a
+    fresh one; both must carry the source client's pool config, not silently
+    revert to defaults.
     """
 
     @pytest.fixture
@@ -0,0 +1,92 @@
+"""``import getstream`` must not load the generated models until they are used.
+
+Measured with ``python -X importtime`` in a fresh interpreter: it reports
+every module a piece of code imports and what each one cost.
+"""
+
+import subprocess
+import sys
+import textwrap
+from typing import Dict
+
+GENERATED = "getstream.models._generated"
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Module -> cumulative import time in microseconds, for the modules
+    ``code`` imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <nested module name>"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_does_not_load_models():
+    times = _import_times("import getstream")
+    assert "getstream" in times
+    assert GENERATED not in times
+
+
+def test_models_cost_more_than_the_rest_of_the_import():
+    # what loading the models lazily saves: they would be most of the import
+    times = _import_times(
+        """
+        import getstream
+        from getstream.models import UserRequest
+        """
+    )
+    assert times[GENERATED] > times["getstream"]
+
+
+def test_tokens_and_webhook_signatures_do_not_load_models():
+    times = _import_times(
+        """
+        from getstream import Stream
+        from getstream.webhook import verify_signature
+        client = Stream(api_key="key", api_secret="s" * 32)
+        client.create_token("user-1")
+        verify_signature(b"{}", "00", "secret")
+        """
+    )
+    assert GENERATED not in times
+
+
+def test_models_load_on_first_use():
+    times = _import_times(
+        f"""
+        import sys
+        from getstream import models
+        from getstream.models import UserRequest
+        from getstream.models import *
+        from getstream.webhook import CallCreatedEvent
+        assert UserRequest is models.UserRequest is sys.modules[{GENERATED!r}].UserRequest
+        assert "UserRequest" in models.__all__ and "UserRequest" in dir(models)
+        assert CallCreatedEvent is models.CallCreatedEvent
+        assert ChannelResponse.__name__ == "ChannelResponse"
+        """
+    )
+    assert GENERATED in times
+
+
+def test_sub_clients_import_on_access():
+    code = (
+        "from getstream import Stream\n"
+        'client = Stream(api_key="key", api_secret="s" * 32)\n'
+    )
+    times = _import_times(code)
+    assert "getstream.chat.client" not in times
+    assert GENERATED not in times
+    times = _import_times(code + "client.chat\n")
+    assert "getstream.chat.client" in times
+    assert GENERATED in times
@@ -0,0 +1,174 @@
+"""Tests for lazy, field-selective model decoding (``lazy_models=True``)."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import pickle
+from datetime import datetime
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, Stream
+from getstream import models
+from getstream.lazy import is_lazy, lazy_from_dict
+from getstream.models import (
+    AIImageConfig,
+    ChannelResponse,
+    ChannelStateResponseFields,
+    QueryChannelsResponse,
+)
+from tests.fixtures import TS_NS, sample_payload
+
+
+def channel_payload(cid="messaging:general"):
+    payload = sample_payload(ChannelResponse)
+    payload.update(cid=cid, created_at=TS_NS, updated_at=TS_NS, custom={"a": [1]})
+    return payload
+
+
+# ── lazy_from_dict ───────────────────────────────────────────────────
+
+
+class TestLazyFromDict:
+    def test_is_instance_of_model(self):
+        obj = lazy_from_dict(ChannelResponse, channel_payload())
+        assert isinstance(obj, ChannelResponse)
+        assert type(obj).__name__ == "ChannelResponse"
+        assert is_lazy(obj)
+        assert not is_lazy(ChannelResponse.from_dict(channel_payload()))
+
+    def test_fields_decode_on_first_access(self):
+        obj = lazy_from_dict(ChannelResponse, channel_payload())
+        assert "cid" not in vars(obj)
+        assert "created_at" not in vars(obj)
+        assert obj.cid == "messaging:general"
+        assert "cid" in vars(obj)
+        assert "created_at" not in vars(obj)
+
+    def test_nested_models_are_lazy(self):
+        payload = {
+            "duration": "1ms",
+            "channels": [{"channel": channel_payload(f"m:{i}")} for i in range(3)],
+        }
+        resp = lazy_from_dict(QueryChannelsResponse, payload)
+        state = resp.channels[1]
+        assert isinstance(state, ChannelStateResponseFields)
+        assert is_lazy(state)
+        assert "members" not in vars(state)
+        assert state.channel.cid == "m:1"
+        assert "created_at" not in vars(state.channel)
+
+    def test_matches_eager_decoding(self):
+        payload = {
+            "duration": "1ms",
+            "channels": [sample_payload(ChannelStateResponseFields)],
+        }
+        eager = QueryChannelsResponse.from_dict(payload, infer_missing=True)
+        lazy = lazy_from_dict(QueryChannelsResponse, payload)
+        assert lazy == eager
+        assert eager == lazy
+        assert lazy.to_dict() == eager.to_dict()
+        assert repr(lazy) == repr(eager)
+
+    def test_datetime_and_renamed_fields(self):
+        channel = lazy_from_dict(ChannelResponse, channel_payload())
+        assert isinstance(channel.created_at, datetime)
+        assert (
+            channel.created_at
+            == ChannelResponse.from_dict(channel_payload()).created_at
+        )
+
+        cfg = lazy_from_dict(AIImageConfig, {"async": True})
+        assert cfg._async is True
+        assert cfg.to_dict()["async"] is True
+
+    def test_missing_and_null_fields(self):
+        channel = lazy_from_dict(ChannelResponse, {"cid": "a:b", "team": None})
+        assert channel.team is None
+        assert channel.config is None
+        assert channel.created_at is None
+
+    def test_pickle_and_copy_materialize_the_model(self):
+        obj = lazy_from_dict(ChannelResponse, channel_payload())
+        for clone in (pickle.loads(pickle.dumps(obj)), copy.deepcopy(obj)):
+            assert type(clone) is ChannelResponse
+            assert clone == obj
+
+    def test_dataclasses_replace_and_asdict(self):
+        obj = lazy_from_dict(ChannelResponse, channel_payload())
+        assert dataclasses.asdict(obj)["cid"] == "messaging:general"
+        assert dataclasses.replace(obj, cid="x:y").cid == "x:y"
+
+    @pytest.mark.parametrize(
+        "name",
+        sorted(
+            n
+            for n in models.__all__
+            if n.endswith("Response") and dataclasses.is_dataclass(getattr(models, n))
+        )[::25],
+    )
+    def test_generated_models_round_trip(self, name):
+        cls = getattr(models, name)
+        payload = sample_payload(cls)
+        eager = cls.from_dict(payload, infer_missing=True)
+        lazy = lazy_from_dict(cls, payload)
+        assert lazy == eager
+        assert repr(lazy) == repr(eager)
+
+
+# ── client option ────────────────────────────────────────────────────
+
+
+def _transport():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"duration": "1ms", "channels": [{"channel": channel_payload()}]},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+class TestLazyModelsOption:
+    def _client(self, **kwargs):
+        return Stream(
+            api_key="k",
+            api_secret="s",
+            base_url="http://test",
+            transport=_transport(),
+            **kwargs,
+        )
+
+    def test_default_is_eager(self):
+        client = self._client()
+        assert client.lazy_models is False
+        resp = client.chat.query_channels(filter_conditions={})
+        assert not is_lazy(resp.data)
+        assert not is_lazy(resp.data.channels[0])
+
+    def test_opt_in_returns_lazy_models(self):
+        client = self._client(lazy_models=True)
+        resp = client.chat.query_channels(filter_conditions={})
+        assert isinstance(resp.data, QueryChannelsResponse)
+        assert is_lazy(resp.data)
+        assert resp.data.channels[0].channel.cid == "messaging:general"
+
+    def test_forwarded_on_clone_and_as_async(self):
+        client = self._client(lazy_models=True)
+        assert client.clone_for_token("user-token").lazy_models is True
+        assert client.as_async().lazy_models is True
+
+    async def test_async_opt_in(self):
+        client = AsyncStream(
+            api_key="k",
+            api_secret="s",
+            base_url="http://test",
+            transport=_transport(),
+            lazy_models=True,
+        )
+        resp = await client.chat.query_channels(filter_conditions={})
+        assert is_lazy(resp.data)
+        assert resp.data.channels[0].channel.cid == "messaging:general"
+        await client.aclose()
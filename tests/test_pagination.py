@@ -0,0 +1,147 @@
+"""Tests for the cursor paginators (``iter_*``/``aiter_*``)."""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, Stream
+from getstream.pagination import paginate
+
+PAGES = {None: ("c1", "c2"), "p2": ("c3",), "p3": ("c4", "c5")}
+NEXT = {None: "p2", "p2": "p3", "p3": None}
+
+
+def _handler(seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            cursor = request.url.params.get("next")
+            key = "comments"
+        else:
+            cursor = json.loads(request.content).get("next")
+            key = "calls"
+        seen.append(cursor)
+        if key == "calls":
+            items = [{"call": {"cid": f"default:{i}"}} for i in PAGES[cursor]]
+        else:
+            items = [{"id": i} for i in PAGES[cursor]]
+        return httpx.Response(
+            200, json={"duration": "1ms", key: items, "next": NEXT[cursor]}
+        )
+
+    return handler
+
+
+def _client(seen, cls=Stream):
+    return cls(
+        api_key="k",
+        api_secret="s",
+        base_url="http://test",
+        transport=httpx.MockTransport(_handler(seen)),
+    )
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestPaginate:
+    def test_yields_items_of_every_page(self):
+        seen = []
+        calls = _client(seen).video.iter_query_calls(limit=2)
+        assert [c.call.cid for c in calls] == [f"default:c{i}" for i in range(1, 6)]
+        assert seen == [None, "p2", "p3"]
+
+    def test_pages_are_fetched_on_demand(self):
+        seen = []
+        calls = _client(seen).video.iter_query_calls()
+        assert seen == []
+        next(calls)
+        next(calls)
+        assert seen == [None]
+        next(calls)
+        assert seen == [None, "p2"]
+
+    def test_prefetch_requests_next_page_early(self):
+        seen = []
+        calls = _client(seen).video.iter_query_calls(prefetch=True)
+        next(calls)
+        assert _wait_for(lambda: len(seen) == 2)
+        assert len(list(calls)) == 4
+        assert seen == [None, "p2", "p3"]
+
+    def test_query_param_cursor(self):
+        seen = []
+        comments = _client(seen).feeds.iter_get_comments(
+            object_id="a1", object_type="activity"
+        )
+        assert [c.id for c in comments] == ["c1", "c2", "c3", "c4", "c5"]
+        assert seen == [None, "p2", "p3"]
+
+    def test_starts_from_given_cursor(self):
+        seen = []
+        client = _client(seen)
+        calls = paginate(client.video.query_calls, "calls", next="p3")
+        assert len(list(calls)) == 2
+        assert seen == ["p3"]
+
+
+class TestAsyncPaginate:
+    @pytest.mark.parametrize("prefetch", [False, True])
+    async def test_yields_items_of_every_page(self, prefetch):
+        seen = []
+        client = _client(seen, AsyncStream)
+        cids = [
+            c.call.cid async for c in client.video.aiter_query_calls(prefetch=prefetch)
+        ]
+        assert cids == [f"default:c{i}" for i in range(1, 6)]
+        assert seen == [None, "p2", "p3"]
+        await client.aclose()
+
+    async def test_prefetch_is_cancelled_when_closed_early(self):
+        seen = []
+        client = _client(seen, AsyncStream)
+        calls = client.video.aiter_query_calls(prefetch=True)
+        await calls.__anext__()
+        await calls.aclose()
+        await asyncio.sleep(0)
+        assert seen == [None]
+        await client.aclose()
+
+
+@pytest.fixture(scope="module")
+def pages(postgenerate):
+    return postgenerate.page_items(postgenerate.GENERATED_MODELS.read_text())
+
+
+class TestGeneratedPaginators:
+    """The companions are emitted by scripts/postgenerate.py after every
+    regeneration; a client without them fails here."""
+
+    @pytest.mark.parametrize(
+        "client", ["chat", "common", "feeds", "moderation", "video"]
+    )
+    def test_every_cursor_endpoint_has_a_paginator(self, postgenerate, pages, client):
+        paths = [p for p in postgenerate.REST_CLIENTS if p.parent.name == client]
+        assert paths
+        for path in paths:
+            assert postgenerate.missing_paginators(path.read_text(), pages) == []
+
+    def test_missing_paginator_is_detected_and_restored(self, postgenerate, pages):
+        path = postgenerate.GETSTREAM / "video" / "async_rest_client.py"
+        source = path.read_text()
+        start = source.index("    def aiter_query_calls(")
+        end = source.index("\n\n", start) + 2
+        stripped = source[:start] + source[end:]
+        missing = postgenerate.missing_paginators(stripped, pages)
+        assert [(m.name, field) for m, field, _ in missing] == [
+            ("query_calls", "calls")
+        ]
+        restored = postgenerate.add_paginators(stripped, pages)
+        assert postgenerate.missing_paginators(restored, pages) == []
+        assert "    ) -> AsyncIterator[CallStateResponseFields]:\n" in restored
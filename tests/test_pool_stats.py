@@ -0,0 +1,177 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, Stream
+from getstream.base import StreamTransportException
+from getstream.pool import PoolMonitor
+
+HOLD = 0.1
+
+
+class SlowServer(ThreadingHTTPServer):
+    """Local HTTP/1.1 server; GETs wait on ``release`` when it is cleared."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.arrived = threading.Semaphore(0)
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.arrived.release()
+                server.release.wait(5)
+                body = b'{"duration": "1ms"}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                self.do_GET()
+
+            def log_message(self, *args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server():
+    server = SlowServer()
+    yield server
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_stats_before_any_request(server):
+    client = Stream(api_key="key", api_secret="secret", base_url=server.url)
+    stats = client.pool_stats()
+    assert (stats.active_connections, stats.idle_connections) == (0, 0)
+    assert stats.max_connections == client.max_conns_per_host
+    assert stats.requests == 0
+    assert stats.in_flight == {}
+    assert stats.pool_wait.mean_ms == 0.0
+    client.close()
+
+
+def test_pool_stats_after_requests(server):
+    client = Stream(api_key="key", api_secret="secret", base_url=server.url)
+    client.get_app()
+    client.video.get_call_type(name="default")
+    client.chat.query_channels(limit=1)
+    stats = client.pool_stats()
+    # one connection, opened by the first request and reused by the others
+    # (sub-clients included)
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.connect.count == 1
+    assert stats.tls.count == 0
+    assert stats.pool_wait.count == 3
+    assert stats.time_to_first_byte.count == 3
+    assert stats.time_to_first_byte.max_ms >= stats.time_to_first_byte.mean_ms > 0
+    assert (stats.active_connections, stats.idle_connections) == (0, 1)
+    assert stats.bytes_received == 3 * len(b'{"duration": "1ms"}')
+    assert stats.bytes_sent > 0
+    assert stats.in_flight == {}
+    client.close()
+
+
+def test_pool_stats_counts_requests_in_flight(server):
+    client = Stream(
+        api_key="key", api_secret="secret", base_url=server.url, max_conns_per_host=2
+    )
+    server.release.clear()
+    threads = [threading.Thread(target=client.get_app) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    # two requests reach the server; the third waits for a connection
+    assert server.arrived.acquire(timeout=5)
+    assert server.arrived.acquire(timeout=5)
+    deadline = time.monotonic() + 5
+    while client.pool_stats().in_flight != {"getstream.api.common.get_app": 3}:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+    stats = client.pool_stats()
+    assert (stats.active_connections, stats.idle_connections) == (2, 0)
+    time.sleep(HOLD)
+    server.release.set()
+    for thread in threads:
+        thread.join()
+    stats = client.pool_stats()
+    assert stats.in_flight == {}
+    assert stats.connections_opened == 2
+    # the third request waited for one of the two busy connections, which
+    # the server held for HOLD seconds
+    assert stats.pool_wait.count == 3
+    assert stats.pool_wait.max_ms >= HOLD * 1000 * 0.9
+    client.close()
+
+
+def test_failed_request_is_no_longer_in_flight():
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        base_url="http://127.0.0.1:9",
+        connect_timeout=0.5,
+    )
+    with pytest.raises(StreamTransportException):
+        client.get_app()
+    stats = client.pool_stats()
+    assert stats.requests == 1
+    assert stats.in_flight == {}
+    assert stats.bytes_received == 0
+    client.close()
+
+
+def test_mock_transport_reports_no_connections():
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"duration": "1ms"})
+        ),
+    )
+    client.get_app()
+    stats = client.pool_stats()
+    assert stats.active_connections is None
+    assert stats.idle_connections is None
+    assert stats.requests == 1
+    assert stats.time_to_first_byte.count == 0
+    client.close()
+
+
+def test_monitor_without_client():
+    stats = PoolMonitor().stats()
+    assert stats.active_connections is None
+    assert stats.max_connections is None
+
+
+@pytest.mark.asyncio
+async def test_async_pool_stats(server):
+    client = AsyncStream(api_key="key", api_secret="secret", base_url=server.url)
+    await client.get_app()
+    await client.video.get_call_type(name="default")
+    stats = client.pool_stats()
+    assert stats.requests == 2
+    assert stats.connections_opened == 1
+    assert stats.time_to_first_byte.count == 2
+    assert (stats.active_connections, stats.idle_connections) == (0, 1)
+    assert stats.in_flight == {}
+    await client.aclose()
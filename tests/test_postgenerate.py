@@ -0,0 +1,55 @@
+"""Tests for the rewrites scripts/postgenerate.py applies to generated code."""
+
+import ast
+import textwrap
+
+from getstream import models
+
+EAGER_WEBHOOK = textwrap.dedent(
+    '''\
+    # Code generated by GetStream internal OpenAPI code generator. DO NOT EDIT.
+
+    import json
+    from typing import Any, Dict
+    from .models import (
+        CustomEvent,
+        CallCreatedEvent,
+    )
+
+
+    def _get_event_class(event_type: str):
+        """Map event type to event class."""
+        event_map = {
+            "*": CustomEvent,
+            "call.created": CallCreatedEvent,
+        }
+        return event_map.get(event_type)
+    '''
+)
+
+
+def _top_level_model_imports(source):
+    return [
+        node
+        for node in ast.parse(source).body
+        if isinstance(node, ast.ImportFrom) and node.module == "models"
+    ]
+
+
+def test_webhook_imports_models_lazily(postgenerate):
+    source = postgenerate.WEBHOOK.read_text()
+    assert _top_level_model_imports(source) == []
+    assert postgenerate.lazy_event_map(source) == source
+
+
+def test_lazy_event_map_rewrites_the_generated_webhook(postgenerate):
+    source = postgenerate.lazy_event_map(EAGER_WEBHOOK)
+    assert _top_level_model_imports(source) == []
+    assert postgenerate.lazy_event_map(source) == source
+
+    namespace = {"__name__": "getstream._webhook_test", "__package__": "getstream"}
+    exec(compile(source, "<webhook>", "exec"), namespace)
+    assert "CallCreatedEvent" not in namespace
+    assert namespace["_get_event_class"]("call.created") is models.CallCreatedEvent
+    assert namespace["_get_event_class"]("call.ended") is None
+    assert namespace["__getattr__"]("CustomEvent") is models.CustomEvent
@@ -0,0 +1,165 @@
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, RateLimitConfig, Stream
+from getstream import rate_limit
+from getstream.rate_limit import RateLimitInfo, RateLimiter
+
+NOW = 1_000_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=NOW)
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def info(limit, remaining, reset):
+    return RateLimitInfo(
+        limit=limit,
+        remaining=remaining,
+        reset=datetime.fromtimestamp(reset, timezone.utc),
+    )
+
+
+class TestRateLimiter:
+    def test_unknown_endpoint_is_not_delayed(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True))
+        assert limiter.reserve("getstream.api.chat.query_channels") == 0.0
+
+    def test_paces_remaining_budget_over_window(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True))
+        limiter.update("ep", info(10, 4, NOW + 40))
+        assert [limiter.reserve("ep") for _ in range(4)] == [0, 10, 20, 30]
+        # spent: the fifth request waits for the next window
+        assert limiter.reserve("ep") == 40
+
+    def test_without_pacing_bursts_then_waits_for_reset(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True, pace=False))
+        limiter.update("ep", info(10, 2, NOW + 40))
+        assert [limiter.reserve("ep") for _ in range(3)] == [0, 0, 40]
+        # the next window is assumed to hold the full limit again
+        assert [limiter.reserve("ep") for _ in range(9)] == [40] * 9
+        assert limiter.reserve("ep") == 100
+
+    def test_headroom_is_left_unused(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True, pace=False, headroom=2))
+        limiter.update("ep", info(10, 3, NOW + 40))
+        assert [limiter.reserve("ep") for _ in range(2)] == [0, 40]
+
+    def test_try_reserve_only_takes_a_slot_available_now(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True, pace=False))
+        assert limiter.try_reserve("unknown")
+        limiter.update("ep", info(10, 1, NOW + 40))
+        assert limiter.try_reserve("ep")
+        assert not limiter.try_reserve("ep")
+        # the refused attempt booked nothing: the next window starts full
+        clock.value = NOW + 40
+        assert [limiter.try_reserve("ep") for _ in range(11)] == [True] * 10 + [False]
+
+    def test_try_reserve_respects_pacing(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True))
+        limiter.update("ep", info(10, 4, NOW + 40))
+        assert limiter.try_reserve("ep")
+        assert not limiter.try_reserve("ep")  # the next slot is 10s out
+        assert limiter.reserve("ep") == 10
+
+    def test_budgets_are_per_endpoint(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True, pace=False))
+        limiter.update("a", info(10, 0, NOW + 40))
+        assert limiter.reserve("a") == 40
+        assert limiter.reserve("b") == 0
+
+    def test_update_keeps_lowest_remaining_of_a_window(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True, pace=False))
+        limiter.update("ep", info(10, 1, NOW + 40))
+        # out-of-order response from earlier in the same window
+        limiter.update("ep", info(10, 5, NOW + 40))
+        assert [limiter.reserve("ep") for _ in range(2)] == [0, 40]
+        # a stale window is ignored, a newer one replaces the estimate
+        limiter.update("ep", info(10, 5, NOW - 20))
+        limiter.update("ep", info(10, 3, NOW + 200))
+        assert limiter.reserve("ep") == 0
+
+    def test_window_rolls_over_when_reset_passes(self, clock):
+        limiter = RateLimiter(RateLimitConfig(enabled=True, pace=False))
+        limiter.update("ep", info(10, 0, NOW + 40))
+        clock.value = NOW + 41
+        assert limiter.reserve("ep") == 0
+
+    def test_config_validation(self):
+        with pytest.raises(ValueError):
+            RateLimitConfig(headroom=-1)
+
+
+# ── client integration ─────────────────────────────────────────────
+
+
+def limited_transport(remaining):
+    reset = int(time.time()) + 30
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"duration": "1ms"},
+            headers={
+                "x-ratelimit-limit": "100",
+                "x-ratelimit-remaining": str(remaining),
+                "x-ratelimit-reset": str(reset),
+            },
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_disabled_by_default():
+    client = Stream(api_key="key", api_secret="secret")
+    assert client.rate_limiter is None
+    assert client.chat.rate_limiter is None
+
+
+def test_sub_clients_share_one_limiter(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("time.sleep", sleeps.append)
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=limited_transport(remaining=0),
+        rate_limit=RateLimitConfig(enabled=True),
+    )
+    assert client.chat.rate_limiter is client.rate_limiter
+    assert client.video.rate_limiter is client.rate_limiter
+    assert client.clone_for_token("t").rate_limit == client.rate_limit
+
+    client.get("/api/v2/app")
+    assert sleeps == []
+    client.get("/api/v2/app")
+    assert len(sleeps) == 1 and 25 < sleeps[0] <= 31
+    # another endpoint has its own budget
+    client.post("/api/v2/chat/channels")
+    assert len(sleeps) == 1
+
+
+async def test_async_client_waits(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("asyncio.sleep", fake_sleep)
+    client = AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=limited_transport(remaining=0),
+        rate_limit=RateLimitConfig(enabled=True),
+    )
+    assert client.chat.rate_limiter is client.rate_limiter
+    await client.get("/api/v2/app")
+    await client.get("/api/v2/app")
+    assert len(sleeps) == 1 and 25 < sleeps[0] <= 31
+    await client.aclose()
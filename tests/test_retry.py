@@ -30,8 +30,10 @@ class Counter:
     def __init__(self, responses):
         self.responses = responses
         self.calls = 0
+        self.requests = []
 
     def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
         step = self.responses[self.calls]
         self.calls += 1
         if isinstance(step, Exception):
@@ -298,6 +300,109 @@ def test_retry_config_validation():
         RetryConfig(max_attempts=0)
     with pytest.raises(ValueError):
         RetryConfig(max_backoff=-1.0)
+    with pytest.raises(ValueError):
+        RetryConfig(budget_ratio=-0.1)
+    with pytest.raises(ValueError):
+        RetryConfig(budget_burst=-1)
+
+
+# ── writes and the retry budget ─────────────────────────────────────
+
+WRITES = RetryConfig(enabled=True, max_attempts=3, max_backoff=0.001, retry_writes=True)
+
+
+def test_eligibility_matrix_with_writes():
+    transport = StreamTransportException("timeout")
+    for method in ("POST", "PUT", "PATCH", "DELETE", "post"):
+        assert _retry_eligible(WRITES, transport, method, 0)
+        assert not _retry_eligible(ENABLED, transport, method, 0)
+    assert not _retry_eligible(WRITES, transport, "OPTIONS", 0)
+    assert not _retry_eligible(WRITES, transport, "POST", 2)
+
+
+def test_write_retried_with_stable_client_request_id(monkeypatch):
+    counter = Counter(
+        [
+            httpx.ReadTimeout("timed out"),
+            httpx.Response(429, json=rate_limited_body()),
+            httpx.Response(200, json={"duration": "1ms"}),
+            httpx.Response(200, json={"duration": "1ms"}),
+        ]
+    )
+    client = sync_client(counter, retry=WRITES, monkeypatch=monkeypatch)
+    client.post("/api/v2/chat/channels/messaging/general/message", json={"a": 1})
+    assert counter.calls == 3
+    ids = {r.headers["x-client-request-id"] for r in counter.requests}
+    assert len(ids) == 1
+    assert all(r.content == b'{"a":1}' for r in counter.requests)
+    # the next request gets a fresh id
+    client.post("/api/v2/x", json={})
+    assert counter.requests[-1].headers["x-client-request-id"] not in ids
+
+
+def test_budget_stops_retries_once_spent(monkeypatch):
+    retry = RetryConfig(
+        enabled=True, max_attempts=3, max_backoff=0, budget_ratio=0, budget_burst=1
+    )
+    counter = Counter([httpx.ConnectError("reset")] * 4)
+    client = sync_client(counter, retry=retry, monkeypatch=monkeypatch)
+    with pytest.raises(StreamTransportException):
+        client.get("/api/v2/app")
+    # one retry from the single token, then the budget is spent
+    assert counter.calls == 2
+    with pytest.raises(StreamTransportException):
+        client.get("/api/v2/app")
+    assert counter.calls == 3
+
+
+def test_budget_refills_from_requests(monkeypatch):
+    retry = RetryConfig(
+        enabled=True, max_attempts=2, max_backoff=0, budget_ratio=0.5, budget_burst=1
+    )
+    ok = httpx.Response(200, json={})
+    counter = Counter(
+        [httpx.ConnectError("reset"), ok, ok, httpx.ConnectError("reset"), ok]
+    )
+    client = sync_client(counter, retry=retry, monkeypatch=monkeypatch)
+    client.get("/api/v2/app")  # spends the initial token
+    assert client.retry_budget.tokens < 1
+    client.get("/api/v2/app")  # deposits 0.5 (capped at 1 overall)
+    client.get("/api/v2/app")  # deposits 0.5 -> a whole token again
+    assert counter.calls == 5
+
+
+def test_budget_shared_with_sub_clients():
+    budgeted = RetryConfig(enabled=True, budget_ratio=0.1)
+    client = Stream(api_key="key", api_secret="secret", retry=budgeted)
+    assert client.retry_budget is not None
+    assert client.chat.retry_budget is client.retry_budget
+    assert client.video.retry_budget is client.retry_budget
+    assert Stream(api_key="key", api_secret="secret").retry_budget is None
+
+
+def test_budget_is_opt_in(monkeypatch):
+    # past the default budget_burst, every failure is still retried
+    retry = RetryConfig(enabled=True, max_attempts=2, max_backoff=0)
+    counter = Counter([httpx.ConnectError("reset")] * 24)
+    client = sync_client(counter, retry=retry, monkeypatch=monkeypatch)
+    assert client.retry_budget is None
+    for _ in range(12):
+        with pytest.raises(StreamTransportException):
+            client.get("/api/v2/app")
+    assert counter.calls == 24
+
+
+@pytest.mark.asyncio
+async def test_async_write_retried_with_stable_client_request_id(monkeypatch):
+    counter = Counter(
+        [httpx.ConnectError("reset"), httpx.Response(200, json={"duration": "1ms"})]
+    )
+    client = async_client(counter, retry=WRITES, monkeypatch=monkeypatch)
+    await client.put("/api/v2/users", json={"users": {}})
+    assert counter.calls == 2
+    ids = {r.headers["x-client-request-id"] for r in counter.requests}
+    assert len(ids) == 1
+    await client.aclose()
 
 
 # ── async ───────────────────────────────────────────────────────────
@@ -0,0 +1,132 @@
+import time
+
+import jwt
+import pytest
+
+from getstream import Stream, TokenCacheConfig
+from getstream.tokens import TokenCache, TokenMinter, token_key
+
+SECRET = "a-secret-long-enough-for-hs256-keys"
+ENABLED = TokenCacheConfig(enabled=True)
+
+
+def decode(token):
+    return jwt.decode(
+        token,
+        SECRET,
+        algorithms=["HS256"],
+        options={"verify_exp": False, "verify_iat": False},
+    )
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {},
+        {"iat": 1700000000, "user_id": "alice"},
+        {"iat": 1, "call_cids": ["default:c1"], "role": "admin", "user_id": "bob"},
+        {"user_id": "zoë", "exp": 1900000000},
+    ],
+)
+def test_minter_matches_pyjwt(claims):
+    assert TokenMinter(SECRET).mint(claims) == jwt.encode(
+        claims, SECRET, algorithm="HS256"
+    )
+
+
+def test_create_token_without_cache_mints_each_time(monkeypatch):
+    client = Stream(api_key="k", api_secret=SECRET)
+    first = client.create_token("alice", expiration=3600)
+    monkeypatch.setattr(time, "time", lambda: 2_000_000_000)
+    second = client.create_token("alice", expiration=3600)
+    assert first != second
+    assert decode(second)["exp"] == 2_000_000_000 + 3600
+
+
+def test_cache_reuses_token_per_claims():
+    client = Stream(api_key="k", api_secret=SECRET, token_cache=ENABLED)
+    token = client.create_token("alice", expiration=3600)
+    assert client.create_token("alice", expiration=3600) is token
+    assert client.create_token("alice", expiration=7200) != token
+    assert client.create_token("bob", expiration=3600) != token
+
+    call = client.create_call_token("alice", call_cids=["default:c1"], role="admin")
+    assert (
+        client.create_call_token("alice", call_cids=["default:c1"], role="admin")
+        is call
+    )
+    assert client.create_call_token("alice", call_cids=["default:c2"]) != call
+    assert decode(call)["call_cids"] == ["default:c1"]
+
+
+def test_cache_refreshes_before_expiry(monkeypatch):
+    client = Stream(
+        api_key="k",
+        api_secret=SECRET,
+        token_cache=TokenCacheConfig(enabled=True, refresh_margin=60),
+    )
+    now = int(time.time())
+    token = client.create_token("alice", expiration=3600)
+    monkeypatch.setattr(time, "time", lambda: now + 3600 - 61)
+    assert client.create_token("alice", expiration=3600) is token
+    monkeypatch.setattr(time, "time", lambda: now + 3600 - 60)
+    fresh = client.create_token("alice", expiration=3600)
+    assert fresh != token
+    assert decode(fresh)["exp"] == now + 2 * 3600 - 60
+
+
+def test_short_lived_tokens_are_not_cached():
+    client = Stream(
+        api_key="k",
+        api_secret=SECRET,
+        token_cache=TokenCacheConfig(enabled=True, refresh_margin=60),
+    )
+    client.create_token("alice", expiration=30)
+    assert len(client._token_cache) == 1  # the server token only
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TokenCache(TokenCacheConfig(enabled=True, max_entries=2))
+    keys = [token_key(user, None, None, None, None) for user in "abc"]
+    cache.put(keys[0], "a", None)
+    cache.put(keys[1], "b", None)
+    assert cache.get(keys[0]) == "a"
+    cache.put(keys[2], "c", None)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "a"
+    assert cache.get(keys[2]) == "c"
+
+
+def test_create_tokens():
+    client = Stream(api_key="k", api_secret=SECRET)
+    tokens = client.create_tokens(["alice", "bob"], expiration=600)
+    assert list(tokens) == ["alice", "bob"]
+    claims = {user_id: decode(token) for user_id, token in tokens.items()}
+    assert claims["alice"]["user_id"] == "alice"
+    assert claims["bob"]["user_id"] == "bob"
+    assert claims["alice"]["exp"] == claims["bob"]["exp"]
+    assert claims["alice"]["iat"] == claims["alice"]["exp"] - 605
+
+
+def test_create_tokens_uses_cache():
+    client = Stream(api_key="k", api_secret=SECRET, token_cache=ENABLED)
+    alice = client.create_token("alice")
+    assert client.create_tokens(["alice", "bob"])["alice"] is alice
+
+
+def test_create_tokens_rejects_empty_user_id():
+    client = Stream(api_key="k", api_secret=SECRET)
+    with pytest.raises(ValueError):
+        client.create_tokens(["alice", ""])
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        TokenCacheConfig(max_entries=0)
+    with pytest.raises(ValueError):
+        TokenCacheConfig(refresh_margin=-1)
+
+
+def test_as_async_keeps_token_cache():
+    client = Stream(api_key="k", api_secret=SECRET, token_cache=ENABLED)
+    assert client.as_async().token_cache is ENABLED
@@ -0,0 +1,240 @@
+import asyncio
+import io
+import json
+import os
+import tracemalloc
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, RetryConfig, Stream
+from getstream.models import OnlyUserID
+from getstream.uploads import UPLOAD_CHUNK_SIZE, AsyncMultipartStream, MultipartStream
+
+
+def parse_multipart(request: httpx.Request):
+    """``{name: (headers, body)}`` for each part of a multipart request."""
+    boundary = request.headers["content-type"].split("boundary=")[1].encode()
+    parts = {}
+    for raw in request.content.split(b"--" + boundary)[1:-1]:
+        head, _, body = raw[2:-2].partition(b"\r\n\r\n")
+        headers = dict(
+            line.split(": ", 1) for line in head.decode().split("\r\n") if line
+        )
+        name = headers["Content-Disposition"].split('name="')[1].split('"')[0]
+        parts[name] = (headers, body)
+    return parts
+
+
+class Recorder:
+    def __init__(self, fail_first=False):
+        self.requests = []
+        self.fail_first = fail_first
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        self.requests.append(request)
+        if self.fail_first and len(self.requests) == 1:
+            raise httpx.ConnectError("reset")
+        return httpx.Response(200, json={"duration": "1ms", "file": "https://x"})
+
+
+class DrainTransport(httpx.BaseTransport):
+    """Consumes the request body chunk by chunk without keeping it (unlike
+    ``MockTransport``, which reads the whole request first)."""
+
+    def __init__(self):
+        self.size = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for chunk in request.stream:
+            self.size += len(chunk)
+        return httpx.Response(200, json={"duration": "1ms", "file": "https://x"})
+
+
+def sync_client(handler, **kwargs):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def async_client(handler, **kwargs):
+    return AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def payload(tmp_path):
+    data = os.urandom(UPLOAD_CHUNK_SIZE * 2 + 123)
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(data)
+    return path, data
+
+
+def test_upload_from_path(payload):
+    path, data = payload
+    handler = Recorder()
+    client = sync_client(handler)
+    client.upload_file(file=str(path), user=OnlyUserID(id="ann"))
+    request = handler.requests[0]
+    assert int(request.headers["content-length"]) == len(request.content)
+    assert "transfer-encoding" not in request.headers
+    parts = parse_multipart(request)
+    assert json.loads(parts["user"][1]) == {"id": "ann"}
+    headers, body = parts["file"]
+    assert 'filename="clip.mp4"' in headers["Content-Disposition"]
+    assert headers["Content-Type"] == "video/mp4"
+    assert body == data
+
+
+def test_upload_reports_progress(payload):
+    path, data = payload
+    calls = []
+    client = sync_client(Recorder())
+    client.upload_file(
+        file=path, progress=lambda sent, total: calls.append((sent, total))
+    )
+    assert calls[0] == (0, len(data))
+    assert calls[-1] == (len(data), len(data))
+    assert len(calls) == 4
+    assert [sent for sent, _ in calls] == sorted(sent for sent, _ in calls)
+
+
+def test_upload_memory_does_not_grow_with_file_size(tmp_path):
+    path = tmp_path / "big.bin"
+    with open(path, "wb") as f:
+        for _ in range(32):
+            f.write(os.urandom(1024 * 1024))
+    transport = DrainTransport()
+    client = Stream(api_key="key", api_secret="secret", transport=transport)
+    tracemalloc.start()
+    try:
+        client.upload_file(file=str(path))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert transport.size > 32 * 1024 * 1024
+    assert peak < 4 * UPLOAD_CHUNK_SIZE + 1024 * 1024
+
+
+def test_upload_from_file_object(payload):
+    path, data = payload
+    handler = Recorder()
+    client = sync_client(handler)
+    with open(path, "rb") as f:
+        f.seek(10)
+        client.chat.upload_channel_file(type="messaging", id="general", file=f)
+        assert not f.closed
+    headers, body = parse_multipart(handler.requests[0])["file"]
+    assert 'filename="clip.mp4"' in headers["Content-Disposition"]
+    assert body == data[10:]
+
+
+def test_upload_from_bytes_with_file_name():
+    handler = Recorder()
+    client = sync_client(handler)
+    client.upload_image(file=b"\x89PNG...", file_name='a "b".png')
+    headers, body = parse_multipart(handler.requests[0])["file"]
+    assert 'filename="a %22b%22.png"' in headers["Content-Disposition"]
+    assert headers["Content-Type"] == "image/png"
+    assert body == b"\x89PNG..."
+
+
+def test_unseekable_source_is_sent_chunked():
+    class Pipe(io.RawIOBase):
+        def __init__(self, data):
+            self.buffer = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def read(self, size=-1):
+            return self.buffer.read(size)
+
+    calls = []
+    handler = Recorder()
+    client = sync_client(handler)
+    client.upload_file(
+        file=Pipe(b"x" * 1000), progress=lambda s, t: calls.append((s, t))
+    )
+    request = handler.requests[0]
+    assert request.headers["transfer-encoding"] == "chunked"
+    assert parse_multipart(request)["file"][1] == b"x" * 1000
+    assert calls[-1] == (1000, None)
+
+
+def test_retried_upload_resends_the_whole_file(payload):
+    path, data = payload
+    handler = Recorder(fail_first=True)
+    client = sync_client(
+        handler,
+        retry=RetryConfig(enabled=True, retry_writes=True, max_backoff=0.001),
+    )
+    client.upload_file(file=str(path))
+    assert len(handler.requests) == 2
+    assert parse_multipart(handler.requests[1])["file"][1] == data
+
+
+def test_sync_client_rejects_async_iterables():
+    async def chunks():
+        yield b"x"
+
+    with pytest.raises(TypeError):
+        MultipartStream(chunks())
+    with pytest.raises(TypeError):
+        MultipartStream(123)
+
+
+@pytest.mark.asyncio
+async def test_async_upload_from_path(payload):
+    path, data = payload
+    handler = Recorder()
+    client = async_client(handler)
+    calls = []
+    await client.chat.upload_channel_image(
+        channel_type="messaging",
+        id="general",
+        file=path,
+        progress=lambda sent, total: calls.append(sent),
+    )
+    request = handler.requests[0]
+    assert int(request.headers["content-length"]) == len(request.content)
+    assert parse_multipart(request)["file"][1] == data
+    assert calls[-1] == len(data)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_upload_from_async_iterator():
+    async def chunks():
+        for i in range(5):
+            await asyncio.sleep(0)
+            yield bytes([i]) * 100
+
+    handler = Recorder()
+    client = async_client(handler)
+    await client.upload_file(file=chunks(), file_name="report.pdf")
+    request = handler.requests[0]
+    assert request.headers["transfer-encoding"] == "chunked"
+    headers, body = parse_multipart(request)["file"]
+    assert headers["Content-Type"] == "application/pdf"
+    assert body == b"".join(bytes([i]) * 100 for i in range(5))
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_iterator_is_single_use():
+    async def chunks():
+        yield b"x"
+
+    body = AsyncMultipartStream(chunks())
+    assert [c async for c in body][1] == b"x"
+    with pytest.raises(httpx.StreamConsumed):
+        [c async for c in body]
@@ -0,0 +1,225 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from getstream import AsyncStream, Stream, UserBatchConfig
+from getstream.exceptions import StreamApiException
+from getstream.models import UserRequest
+
+ENABLED = UserBatchConfig(enabled=True, max_delay=0.05)
+
+
+class UsersEndpoint:
+    """Answers ``update_users`` by echoing the users it was sent."""
+
+    def __init__(self, status=200):
+        self.status = status
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        users = json.loads(request.content)["users"]
+        with self._lock:
+            self.batches.append(sorted(users))
+        if self.status != 200:
+            return httpx.Response(
+                self.status,
+                json={
+                    "code": -1,
+                    "duration": "0ms",
+                    "message": "error",
+                    "more_info": "",
+                    "StatusCode": self.status,
+                    "details": [],
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "duration": "1ms",
+                "membership_non_member_user_ids": None,
+                "users": {
+                    uid: {**user, "role": "user", "created_at": None}
+                    for uid, user in users.items()
+                },
+            },
+        )
+
+
+def sync_client(handler, user_batch=ENABLED):
+    return Stream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        user_batch=user_batch,
+    )
+
+
+def async_client(handler, user_batch=ENABLED):
+    return AsyncStream(
+        api_key="key",
+        api_secret="secret",
+        transport=httpx.MockTransport(handler),
+        user_batch=user_batch,
+    )
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        UserBatchConfig(max_delay=-1)
+    with pytest.raises(ValueError):
+        UserBatchConfig(max_batch_size=0)
+    with pytest.raises(ValueError):
+        UserBatchConfig(max_batch_size=101)
+
+
+def test_disabled_sends_each_user():
+    handler = UsersEndpoint()
+    client = sync_client(handler, user_batch=None)
+    user = client.create_user(name="Ann", id="ann")
+    assert user.id == "ann"
+    assert client.upsert_user(UserRequest(id="bob")).id == "bob"
+    assert client.submit_user(UserRequest(id="cid")).result().id == "cid"
+    assert handler.batches == [["ann"], ["bob"], ["cid"]]
+
+
+def test_concurrent_upserts_share_one_call():
+    handler = UsersEndpoint()
+    client = sync_client(handler)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        users = list(
+            pool.map(
+                lambda i: client.upsert_user(UserRequest(id=f"u{i}", name=str(i))),
+                range(8),
+            )
+        )
+    assert [u.id for u in users] == [f"u{i}" for i in range(8)]
+    assert [u.name for u in users] == [str(i) for i in range(8)]
+    assert len(handler.batches) == 1
+    client.close()
+
+
+def test_submit_resolves_each_future_with_its_user():
+    handler = UsersEndpoint()
+    client = sync_client(handler)
+    futures = [client.submit_user(UserRequest(id=f"u{i}")) for i in range(5)]
+    assert [f.result(timeout=5).id for f in futures] == [f"u{i}" for i in range(5)]
+    assert handler.batches == [[f"u{i}" for i in range(5)]]
+    client.close()
+
+
+def test_batches_split_at_max_batch_size():
+    handler = UsersEndpoint()
+    client = sync_client(
+        handler, user_batch=UserBatchConfig(enabled=True, max_delay=5, max_batch_size=3)
+    )
+    futures = [client.submit_user(UserRequest(id=f"u{i}")) for i in range(7)]
+    # two full batches go out without waiting for max_delay
+    for future in futures[:6]:
+        future.result(timeout=2)
+    client.close()
+    assert [len(batch) for batch in handler.batches] == [3, 3, 1]
+    assert futures[6].result().id == "u6"
+
+
+def test_flush_sends_now():
+    handler = UsersEndpoint()
+    client = sync_client(
+        handler, user_batch=UserBatchConfig(enabled=True, max_delay=60)
+    )
+    future = client.submit_user(UserRequest(id="ann"))
+    client.flush_users()
+    assert future.done()
+    assert future.result().id == "ann"
+    client.close()
+
+
+def test_close_flushes_and_rejects_new_users():
+    handler = UsersEndpoint()
+    client = sync_client(
+        handler, user_batch=UserBatchConfig(enabled=True, max_delay=60)
+    )
+    future = client.submit_user(UserRequest(id="ann"))
+    client.close()
+    assert future.result().id == "ann"
+    with pytest.raises(RuntimeError):
+        client.submit_user(UserRequest(id="bob"))
+
+
+def test_batch_error_reaches_every_caller():
+    handler = UsersEndpoint(status=500)
+    client = sync_client(handler)
+    futures = [client.submit_user(UserRequest(id=f"u{i}")) for i in range(3)]
+    for future in futures:
+        with pytest.raises(StreamApiException):
+            future.result(timeout=5)
+    assert len(handler.batches) == 1
+    client.close()
+
+
+def test_duplicate_user_in_batch_is_sent_once():
+    handler = UsersEndpoint()
+    client = sync_client(handler)
+    first = client.submit_user(UserRequest(id="ann", name="old"))
+    second = client.submit_user(UserRequest(id="ann", name="new"))
+    assert first.result(timeout=5).name == "new"
+    assert second.result(timeout=5).name == "new"
+    assert handler.batches == [["ann"]]
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_upserts_share_one_call():
+    handler = UsersEndpoint()
+    client = async_client(handler)
+    users = await asyncio.gather(
+        *(client.upsert_user(UserRequest(id=f"u{i}")) for i in range(10)),
+        client.create_user(name="Ann", id="ann"),
+    )
+    assert [u.id for u in users] == [f"u{i}" for i in range(10)] + ["ann"]
+    assert len(handler.batches) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_max_batch_size_dispatches_immediately():
+    handler = UsersEndpoint()
+    client = async_client(
+        handler,
+        user_batch=UserBatchConfig(enabled=True, max_delay=60, max_batch_size=2),
+    )
+    futures = [client.submit_user(UserRequest(id=f"u{i}")) for i in range(3)]
+    await asyncio.wait_for(asyncio.gather(*futures[:2]), timeout=2)
+    assert not futures[2].done()
+    await client.aclose()
+    assert futures[2].result().id == "u2"
+    assert [len(batch) for batch in handler.batches] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_error_reaches_every_caller():
+    handler = UsersEndpoint(status=503)
+    client = async_client(handler)
+    results = await asyncio.gather(
+        *(client.upsert_user(UserRequest(id=f"u{i}")) for i in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, StreamApiException) for r in results)
+    assert len(handler.batches) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_disabled_sends_each_user():
+    handler = UsersEndpoint()
+    client = async_client(handler, user_batch=None)
+    users = await asyncio.gather(
+        client.upsert_user(UserRequest(id="a")), client.submit_user(UserRequest(id="b"))
+    )
+    assert [u.id for u in users] == ["a", "b"]
+    assert len(handler.batches) == 2
+    await client.aclose()
@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from getstream import AsyncStream, Stream
+from getstream.pool import keep_alive_interval, warm_async, warm_sync
+
+# how long GET /slow takes to respond
+SLOW = 1.0
+# HEAD latency, so that warm-up requests sent together overlap as they do
+# against a remote server
+HEAD_DELAY = 0.05
+
+
+class CountingServer(ThreadingHTTPServer):
+    """Local HTTP/1.1 server counting the connections it accepts."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        self.connections = 0
+        self.heads = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_HEAD(self):
+                with server.lock:
+                    server.heads += 1
+                time.sleep(HEAD_DELAY)
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                if self.path.startswith("/slow"):
+                    time.sleep(SLOW)
+                body = b'{"duration": "1ms"}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server():
+    server = CountingServer()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def sync_client(server, **kwargs):
+    return Stream(api_key="key", api_secret="secret", base_url=server.url, **kwargs)
+
+
+def async_client(server, **kwargs):
+    return AsyncStream(
+        api_key="key", api_secret="secret", base_url=server.url, **kwargs
+    )
+
+
+def test_keep_alive_interval():
+    assert keep_alive_interval(55.0) == 50.0
+    assert keep_alive_interval(4.0) == 2.0
+
+
+def test_warmup_opens_n_connections(server):
+    client = sync_client(server, max_conns_per_host=5)
+    assert client.warmup(3) == 3
+    assert server.connections == 3
+    # the warmed connections serve the following requests
+    for _ in range(3):
+        client.get_app()
+    assert server.connections == 3
+    client.close()
+
+
+def test_warmup_defaults_to_and_is_capped_by_pool_size(server):
+    client = sync_client(server, max_conns_per_host=4)
+    assert client.warmup() == 4
+    assert client.warmup(10) == 4
+    assert server.connections == 4
+    assert client.warmup(0) == 0
+    with pytest.raises(ValueError):
+        client.warmup(-1)
+    client.close()
+
+
+def test_warmup_failures_are_counted_not_raised(caplog):
+    client = Stream(
+        api_key="key",
+        api_secret="secret",
+        base_url="http://127.0.0.1:9",
+        connect_timeout=0.5,
+    )
+    with caplog.at_level(logging.INFO, logger="getstream"):
+        assert client.warmup(2) == 0
+    (record,) = [r for r in caplog.records if r.getMessage() == "pool.warmed"]
+    assert getattr(record, "stream.pool.requested") == 2
+    assert getattr(record, "stream.pool.warmed") == 0
+    client.close()
+
+
+def test_keep_alive_refreshes_until_close(server):
+    client = sync_client(server, max_conns_per_host=2, idle_timeout=0.4)
+    client.warmup(keep_alive=True)
+    time.sleep(0.9)
+    # refreshed every 0.2s on the same two connections
+    assert server.heads >= 6
+    assert server.connections == 2
+    client.close()
+    heads = server.heads
+    time.sleep(0.3)
+    assert server.heads == heads
+
+
+def _wait_for_active(client, n):
+    deadline = time.monotonic() + 5
+    while client.pool_stats().active_connections != n:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_refresh_overlapping_a_slow_request_does_not_wait_for_it(server):
+    client = sync_client(server, max_conns_per_host=2)
+    client.warmup()
+    slow = threading.Thread(target=client.client.get, args=("/slow",))
+    slow.start()
+    _wait_for_active(client, 1)
+    heads = server.heads
+    start = time.perf_counter()
+    # only the idle connection is refreshed, and it is released at once
+    assert warm_sync(client.client, 2, logging.getLogger(), refresh=True) == 1
+    client.get_app()
+    assert time.perf_counter() - start < SLOW / 4
+    assert server.heads == heads + 1
+    slow.join()
+    assert server.connections == 2
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_refresh_overlapping_a_slow_request_does_not_wait_for_it(
+    server,
+):
+    client = async_client(server, max_conns_per_host=2)
+    await client.warmup()
+    slow = asyncio.ensure_future(client.client.get("/slow"))
+    deadline = time.monotonic() + 5
+    while client.pool_stats().active_connections != 1:
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.005)
+    heads = server.heads
+    start = time.perf_counter()
+    assert await warm_async(client.client, 2, logging.getLogger(), refresh=True) == 1
+    await client.get_app()
+    assert time.perf_counter() - start < SLOW / 4
+    assert server.heads == heads + 1
+    await slow
+    assert server.connections == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_opens_n_connections(server):
+    client = async_client(server, max_conns_per_host=5)
+    assert await client.warmup(4) == 4
+    assert server.connections == 4
+    await client.get_app()
+    assert server.connections == 4
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_keep_alive_stops_on_aclose(server):
+    client = async_client(server, max_conns_per_host=2, idle_timeout=0.4)
+    await client.warmup(keep_alive=True)
+    await client.warmup(keep_alive=True)  # replaces the first keep-alive
+    await asyncio.sleep(0.5)
+    assert server.heads >= 6
+    assert server.connections == 2
+    await client.aclose()
+    heads = server.heads
+    await asyncio.sleep(0.3)
+    assert server.heads == heads
@@ -0,0 +1,206 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import hmac
+import json
+import threading
+
+import pytest
+
+from getstream import AsyncStream, Stream
+from getstream.lazy import is_lazy
+from getstream.webhook import InvalidWebhookError, UnknownEvent, parse_sqs
+from getstream.webhook_batch import (
+    averify_and_parse_webhooks,
+    create_webhook_executor,
+    parse_sns_batch,
+    parse_sqs_batch,
+    verify_and_parse_webhooks,
+)
+
+SECRET = "a-secret-long-enough-for-hs256-keys"
+
+
+def delivery(event, secret=SECRET, compress=False):
+    body = json.dumps(event).encode("utf-8")
+    signature = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return (gzip.compress(body) if compress else body), signature
+
+
+def message_new(i):
+    return {
+        "type": "message.new",
+        "created_at": 1767225600000000000,
+        "cid": f"messaging:channel-{i}",
+        "message": {"id": f"message-{i}", "text": f"hello {i}"},
+    }
+
+
+DELIVERIES = [
+    delivery(message_new(0)),
+    delivery(message_new(1), compress=True),
+    delivery(message_new(2), secret="wrong-secret"),
+    (b"not json", hmac.new(SECRET.encode(), b"not json", hashlib.sha256).hexdigest()),
+    delivery({"type": "some.future_event", "created_at": "2026-01-01T00:00:00Z"}),
+    delivery(message_new(5)),
+]
+
+
+def check(results):
+    assert len(results) == len(DELIVERIES)
+    assert [type(r).__name__ for r in results] == [
+        "MessageNewEvent",
+        "MessageNewEvent",
+        "InvalidWebhookError",
+        "InvalidWebhookError",
+        "UnknownEvent",
+        "MessageNewEvent",
+    ]
+    assert results[0].message.id == "message-0"
+    assert results[1].message.id == "message-1"
+    assert results[5].cid == "messaging:channel-5"
+    assert str(results[2]) == InvalidWebhookError.SIGNATURE_MISMATCH
+    assert str(results[3]).startswith(InvalidWebhookError.INVALID_JSON)
+    assert isinstance(results[4], UnknownEvent)
+
+
+def test_inline():
+    check(verify_and_parse_webhooks(DELIVERIES, SECRET, chunk_size=4))
+
+
+def test_thread_pool():
+    with create_webhook_executor(2, processes=False) as executor:
+        check(
+            verify_and_parse_webhooks(
+                DELIVERIES, SECRET, executor=executor, chunk_size=1
+            )
+        )
+
+
+def test_process_pool():
+    with create_webhook_executor(2) as executor:
+        check(
+            verify_and_parse_webhooks(
+                DELIVERIES, SECRET, executor=executor, chunk_size=2
+            )
+        )
+
+
+def test_empty_batch():
+    assert verify_and_parse_webhooks([], SECRET) == []
+
+
+def test_chunk_size_validation():
+    with pytest.raises(ValueError):
+        verify_and_parse_webhooks(DELIVERIES, SECRET, chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_async_runs_off_the_loop(monkeypatch):
+    import getstream.webhook_batch as webhook_batch
+
+    loop_thread = threading.get_ident()
+    threads = set()
+    parse_chunk = webhook_batch._verify_and_parse_chunk
+
+    def record(chunk, secret):
+        threads.add(threading.get_ident())
+        return parse_chunk(chunk, secret)
+
+    monkeypatch.setattr(webhook_batch, "_verify_and_parse_chunk", record)
+    check(await averify_and_parse_webhooks(DELIVERIES, SECRET, chunk_size=2))
+    assert threads and loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_async_process_pool():
+    with create_webhook_executor(2) as executor:
+        check(await averify_and_parse_webhooks(DELIVERIES, SECRET, executor=executor))
+
+
+def test_stream_uses_its_secret():
+    client = Stream(api_key="k", api_secret=SECRET)
+    check(client.verify_and_parse_webhooks(DELIVERIES))
+
+
+@pytest.mark.asyncio
+async def test_async_stream_uses_its_secret():
+    client = AsyncStream(api_key="k", api_secret=SECRET)
+    results = client.verify_and_parse_webhooks(DELIVERIES, chunk_size=3)
+    assert asyncio.iscoroutine(results)
+    check(await results)
+    await client.aclose()
+
+
+def sqs_bodies():
+    events = [message_new(i) for i in range(4)]
+    raw = [json.dumps(event) for event in events]
+    return [
+        raw[0],
+        base64.b64encode(gzip.compress(raw[1].encode())).decode(),
+        base64.b64encode(raw[2].encode()).decode(),
+        # two gzip members, as gzip.decompress accepts
+        base64.b64encode(
+            gzip.compress(raw[3][:10].encode()) + gzip.compress(raw[3][10:].encode())
+        ).decode(),
+        base64.b64encode(b"\x1f\x8bnot gzip").decode(),
+        "not json",
+        json.dumps({"type": "some.future_event"}),
+    ]
+
+
+def check_sqs(results):
+    assert [type(r).__name__ for r in results[:4]] == ["MessageNewEvent"] * 4
+    assert [r.message.id for r in results[:4]] == [f"message-{i}" for i in range(4)]
+    assert str(results[4]).startswith(InvalidWebhookError.GZIP_FAILED)
+    assert str(results[5]).startswith(InvalidWebhookError.INVALID_JSON)
+    assert isinstance(results[6], UnknownEvent)
+
+
+@pytest.mark.parametrize("lazy_models", [False, True])
+def test_parse_sqs_batch(lazy_models):
+    bodies = sqs_bodies()
+    results = list(parse_sqs_batch(bodies, lazy_models=lazy_models))
+    check_sqs(results)
+    for body, result in zip(bodies, results):
+        try:
+            expected = parse_sqs(body)
+        except InvalidWebhookError as e:
+            assert str(result) == str(e)
+        else:
+            assert result == expected
+    assert all(is_lazy(r) for r in results[:4]) is lazy_models
+
+
+def test_parse_sqs_batch_is_lazy():
+    bodies = iter(sqs_bodies())
+    results = parse_sqs_batch(bodies)
+    assert next(results).message.id == "message-0"
+    assert len(list(bodies)) == len(sqs_bodies()) - 1
+
+
+@pytest.mark.parametrize("lazy_models", [False, True])
+def test_parse_sns_batch(lazy_models):
+    bodies = [
+        json.dumps({"Type": "Notification", "Message": body}) for body in sqs_bodies()
+    ]
+    bodies.append(sqs_bodies()[1])  # an extracted Message string
+    results = list(parse_sns_batch(bodies, lazy_models=lazy_models))
+    check_sqs(results)
+    assert results[-1].message.id == "message-1"
+
+
+def test_non_string_body_is_an_error():
+    [result] = parse_sqs_batch([b"{}"])
+    assert isinstance(result, InvalidWebhookError)
+    [result] = parse_sns_batch([b"{}"])
+    assert isinstance(result, InvalidWebhookError)
+
+
+def test_stream_batch_parsing_follows_lazy_models():
+    client = Stream(api_key="k", api_secret=SECRET, lazy_models=True)
+    [event] = client.parse_sqs_batch(sqs_bodies()[:1])
+    assert is_lazy(event)
+    [event] = Stream(api_key="k", api_secret=SECRET).parse_sns_batch(sqs_bodies()[:1])
+    assert not is_lazy(event)
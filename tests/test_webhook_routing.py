@@ -0,0 +1,174 @@
+import base64
+import gzip
+import hashlib
+import hmac
+import json
+from pathlib import Path
+
+import pytest
+
+from getstream import Stream
+from getstream.lazy import is_lazy
+from getstream.webhook import InvalidWebhookError, UnknownEvent, parse_event
+from getstream.webhook_routing import (
+    PeekedEvent,
+    peek_event,
+    peek_event_type,
+    peek_sns,
+    peek_sqs,
+    verify_and_peek_webhook,
+)
+
+FIXTURE_ROOT = Path(__file__).resolve().parent / "assets" / "webhooks"
+FIXTURE_SECRET = "test_secret_do_not_use_in_production"
+SECRET = "a-secret-long-enough-for-hs256-keys"
+
+EVENT = {
+    "cid": "messaging:general",
+    "message": {"id": "message-1", "text": "hello", "type": "regular"},
+    "channel": {"type": "messaging", "custom": {"type": "nested"}},
+    "type": "message.new",
+    "created_at": 1767225600000000000,
+}
+PAYLOAD = json.dumps(EVENT).encode("utf-8")
+
+
+def fixture_dirs():
+    return sorted(
+        d for d in FIXTURE_ROOT.iterdir() if d.is_dir() and d.name != "_invalid"
+    )
+
+
+@pytest.mark.parametrize("fixture_dir", fixture_dirs(), ids=lambda d: d.name)
+def test_fixtures_match_parse_event(fixture_dir):
+    body = (fixture_dir / "body.json").read_bytes()
+    signature = (fixture_dir / "signature.txt").read_text().strip()
+    assert peek_event_type(body) == fixture_dir.name
+    for peeked in (
+        peek_event(body),
+        verify_and_peek_webhook(
+            (fixture_dir / "body.gz").read_bytes(), signature, FIXTURE_SECRET
+        ),
+        peek_sqs((fixture_dir / "sqs_body.txt").read_text().strip()),
+        peek_sns((fixture_dir / "sns_notification.txt").read_text().strip()),
+    ):
+        assert peeked.type == fixture_dir.name
+        assert peeked.event == parse_event(body)
+
+
+def test_top_level_type_only():
+    # "type" keys inside earlier values are skipped over, not matched
+    assert peek_event_type(PAYLOAD) == "message.new"
+    assert peek_event_type(PAYLOAD.decode("utf-8")) == "message.new"
+    assert peek_event_type(gzip.compress(PAYLOAD)) == "message.new"
+    spaced = json.dumps(EVENT, indent=2, ensure_ascii=False)
+    assert peek_event_type(spaced) == "message.new"
+
+
+def test_nested_types_and_escapes_do_not_decode_the_rest():
+    # a real message.new: nested "type" keys and escaped text after the
+    # peeked keys. The malformed tail shows that it is never read.
+    event = {
+        "type": "message.new",
+        "cid": "messaging:general",
+        "message": {"type": "regular", "text": 'line 1\nl\u00edne "2"'},
+        "channel": {"type": "messaging"},
+    }
+    payload = json.dumps(event).encode("utf-8")
+    assert b"\\u00ed" in payload and b"\\n" in payload
+    truncated = payload[:-1] + b',"x": nope}'
+    assert peek_event_type(truncated) == "message.new"
+    assert peek_event(truncated, ("cid",)).fields == {"cid": "messaging:general"}
+    assert peek_event(payload).event == parse_event(payload)
+
+
+def test_duplicate_keys_keep_the_first_value():
+    # Stream never sends them; only the scanned part of the payload is read
+    payload = b'{"type":"a.b","cid":"a","type":"message.new","cid":"b"}'
+    peeked = peek_event(payload, ("cid",))
+    assert (peeked.type, peeked.fields) == ("a.b", {"cid": "a"})
+    assert parse_event(payload).type == "message.new"
+
+
+def test_fields():
+    peeked = peek_event(PAYLOAD, fields=("cid", "channel", "missing"))
+    assert peeked.type == "message.new"
+    assert peeked.fields == {"cid": "messaging:general", "channel": EVENT["channel"]}
+
+
+def test_event_is_decoded_on_first_access():
+    peeked = peek_event(PAYLOAD)
+    assert peeked.message.text == "hello"  # decodes the event
+    event = peeked.event
+    assert type(event).__name__ == "MessageNewEvent"
+    assert event is peeked.event
+    assert event == parse_event(PAYLOAD)
+    assert not is_lazy(event)
+    assert is_lazy(peek_event(PAYLOAD, lazy_models=True).event)
+
+
+def test_unknown_type():
+    peeked = peek_event(b'{"type":"some.future_event","x":1}')
+    assert peeked.type == "some.future_event"
+    assert isinstance(peeked.event, UnknownEvent)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"",
+        b"not json",
+        b"[]",
+        b"{}",
+        b'{"type":""}',
+        b'{"type":1}',
+        b'{"cid":"x"}',
+        b'{"cid":nope,"type":"message.new"}',
+        b'{"cid" "x"}',
+        b'{"cid":"x";"type":"message.new"}',
+        b'{"cid":"x",',
+        b"\xff\xfe",
+        b"\x1f\x8bnot gzip",
+    ],
+)
+def test_invalid_payloads_raise(payload):
+    with pytest.raises(InvalidWebhookError) as exc:
+        peek_event(payload)
+    assert str(exc.value).startswith(InvalidWebhookError.INVALID_JSON) or (
+        str(exc.value).startswith(InvalidWebhookError.GZIP_FAILED)
+    )
+
+
+def test_tail_is_only_checked_when_decoded():
+    peeked = peek_event(b'{"type":"message.new","cid": nope')
+    assert peeked.type == "message.new"
+    with pytest.raises(InvalidWebhookError):
+        peeked.event
+
+
+def test_verify_rejects_bad_signature():
+    signature = hmac.new(b"wrong-secret", PAYLOAD, hashlib.sha256).hexdigest()
+    with pytest.raises(InvalidWebhookError, match="signature mismatch"):
+        verify_and_peek_webhook(PAYLOAD, signature, SECRET)
+
+
+def test_sqs_and_sns_wire_formats():
+    compressed = base64.b64encode(gzip.compress(PAYLOAD)).decode("ascii")
+    for body in (PAYLOAD.decode("utf-8"), compressed):
+        assert peek_sqs(body, ("cid",)).fields == {"cid": "messaging:general"}
+        envelope = json.dumps({"Type": "Notification", "Message": body})
+        assert peek_sns(envelope).type == "message.new"
+    with pytest.raises(InvalidWebhookError):
+        peek_sqs(b"bytes")
+
+
+def test_stream_peeking_follows_lazy_models():
+    signature = hmac.new(SECRET.encode(), PAYLOAD, hashlib.sha256).hexdigest()
+    client = Stream(api_key="k", api_secret=SECRET, lazy_models=True)
+    peeked = client.verify_and_peek_webhook(PAYLOAD, signature, fields=("cid",))
+    assert isinstance(peeked, PeekedEvent)
+    assert peeked.fields == {"cid": "messaging:general"}
+    assert is_lazy(peeked.event)
+    peeked = Stream(api_key="k", api_secret=SECRET).peek_sqs(PAYLOAD.decode("utf-8"))
+    assert not is_lazy(peeked.event)
+    assert client.peek_sns(PAYLOAD.decode("utf-8")).type == "message.new"